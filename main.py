@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import shlex
 import shutil
@@ -27,6 +28,8 @@ from src.parser import Parser
 
 
 DEFAULT_CFLAGS = ["-std=c11"]
+# pkg-config modules that ship a CBLAS interface, in order of preference.
+BLAS_PKG_CONFIG_CANDIDATES = ("openblas", "blis", "flexiblas", "cblas")
 COMMANDS = {"init", "check", "build", "run", "test", "clean"}
 
 
@@ -199,9 +202,10 @@ def compile_c(
             flags.append(include_flag)
 
     # pthread is required at both compile and link time. When the standard
-    # Thread runtime is discovered, add the flag automatically.
+    # Thread runtime or the multi-threaded Tensor runtime is discovered, add
+    # the flag automatically.
     if any(
-        Path(source).name == "thread_backend.c"
+        Path(source).name in {"thread_backend.c", "tensor_runtime.c"}
         for source in runtime_sources
     ):
         if "-pthread" not in flags:
@@ -240,6 +244,54 @@ def compile_c(
             )
             if "-DOCEAN_TENSOR_ENABLE_OPENCL" not in flags:
                 flags.append("-DOCEAN_TENSOR_ENABLE_OPENCL")
+    # The Tensor runtime routes float matmul through CBLAS when built with
+    # OCEAN_TENSOR_ENABLE_BLAS.  It is opt-in (OCEAN_TENSOR_BLAS=1) so that a
+    # build's numerics and device_info() do not depend on which packages the
+    # machine happens to have; the first BLAS pkg-config knows about is used,
+    # and without one the built-in packed GEMM engine stays in place.
+    runtime_requires_blas = any(
+        "#include <cblas.h>" in Path(source).read_text(encoding="utf-8")
+        for source in runtime_sources
+    )
+    if (
+        runtime_requires_blas
+        and os.environ.get("OCEAN_TENSOR_BLAS", "0") == "1"
+        and shutil.which("pkg-config")
+    ):
+        for blas_package in BLAS_PKG_CONFIG_CANDIDATES:
+            blas_probe = subprocess.run(
+                ["pkg-config", "--exists", blas_package],
+                check=False,
+            )
+            if blas_probe.returncode != 0:
+                continue
+            blas_cflags = subprocess.run(
+                ["pkg-config", "--cflags", blas_package],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            blas_libs = subprocess.run(
+                ["pkg-config", "--libs", blas_package],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            flags.extend(
+                flag for flag in shlex.split(blas_cflags.stdout)
+                if flag not in flags
+            )
+            flags.extend(
+                flag for flag in shlex.split(blas_libs.stdout)
+                if not flag.startswith("-l") and flag not in flags
+            )
+            runtime_link_flags.extend(
+                flag for flag in shlex.split(blas_libs.stdout)
+                if flag.startswith("-l") and flag not in runtime_link_flags
+            )
+            if "-DOCEAN_TENSOR_ENABLE_BLAS" not in flags:
+                flags.append("-DOCEAN_TENSOR_ENABLE_BLAS")
+            break
     # A bare OpenMP pragma is otherwise accepted by some C compilers as an
     # ignored extension, silently changing a parallel program into a serial
     # one.  Derive the required compiler/linker flag from generated C unless
@@ -100,6 +100,7 @@ class CoreMixin:
         self.tensor_fast_access = {}
         self.tensor_fast_loop_bounds = {}
         self.tensor_fast_patterns = set()
+        self.tensor_fast_unswitches = 0
         self.openmp_collapse_remaining = 0
         # Expected type for a bare ``Tensor.zeros(...)``/``from_list(...)``
         # expression while lowering a declaration or assignment.  The
@@ -138,6 +139,7 @@ class CoreMixin:
         self.tensor_fast_access = {}
         self.tensor_fast_loop_bounds = {}
         self.tensor_fast_patterns = set()
+        self.tensor_fast_unswitches = 0
         self.openmp_collapse_remaining = 0
         self.device_tensor_expected_type = None
         self.known_c_types = set(KNOWN_C_TYPES)
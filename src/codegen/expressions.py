@@ -556,12 +556,14 @@ class ExpressionsMixin:
             )
 
         elif node_type == "list_literal":
-            # Keep the established constructor behavior for an empty list:
-            # calloc leaves the field NULL and later method initialization can
-            # replace it with a concrete list. Non-empty list fields need a
-            # dedicated owned-list initializer rather than a raw expression.
+            # An empty list field starts as a real empty list, so the
+            # constructor and later methods can append to it. Non-empty list
+            # fields need a dedicated owned-list initializer rather than a raw
+            # expression.
             if target_type.startswith("list[") and not ast.get("items"):
-                return ""
+                self.generate_list_struct(target_type)
+                struct_name = self.generate_list_struct_name(target_type)
+                return f"create_{struct_name}({INITIAL_LIST_CAPACITY})"
             raise RuntimeError(
                 f"list literal cannot initialize field '{target_name}' of type '{target_type}'"
             )
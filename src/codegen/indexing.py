@@ -406,24 +406,14 @@ class IndexingMixin:
             target_expr = variable
             if variable.startswith("self."):
                 target_expr = f"self->{variable[5:]}"
-            literal = ", ".join(f"(size_t)({index})" for index in index_exprs)
-            accessor = self.device_tensor_accessor_suffix(target_type)
-            if len(indices_ast) == 1:
-                current_expr = (
-                    f"ocean_tensor_get_flat_{accessor}({target_expr}->handle, "
-                    f"(size_t)({index_exprs[0]}))"
-                )
-            else:
-                current_expr = (
-                    f"ocean_tensor_get_nd_{accessor}({target_expr}->handle, "
-                    f"(const size_t[]){{{literal}}}, {len(index_exprs)})"
-                )
+            current_expr = self.generate_tensor_element_read(
+                target_expr, target_type, list(indices_ast), flat=len(indices_ast) == 1
+            )
             op_symbol = operator.replace("=", "")
             updated_expr = f"({current_expr} {op_symbol} {value_expr})"
             if len(indices_ast) == 1:
-                self.add_line(
-                    f"ocean_tensor_set_flat_{accessor}({target_expr}->handle, "
-                    f"(size_t)({index_exprs[0]}), {updated_expr});"
+                self.generate_tensor_flat_index_assignment(
+                    target_expr, target_type, indices_ast[0], updated_expr
                 )
             else:
                 self.generate_tensor_index_assignment(
@@ -487,10 +477,8 @@ class IndexingMixin:
                 py_type = var_info.get("py_type", "")
 
                 if self.is_device_tensor_type(py_type):
-                    accessor = self.device_tensor_accessor_suffix(py_type)
-                    return (
-                        f"ocean_tensor_get_flat_{accessor}({variable}->handle, "
-                        f"(size_t)({index_expr}))"
+                    return self.generate_tensor_element_read(
+                        variable, py_type, [index_ast], flat=True
                     )
                 if py_type.startswith("list["):
                     struct_name = self.generate_list_struct_name(py_type)
@@ -254,6 +254,12 @@ class OopMixin:
     ):
         self._constructing_class = class_name
         constructor_locals = []
+        self.enter_scope("function")
+        self.get_current_scope()["class_name"] = class_name
+        for param in (init_scope or {}).get("parameters", [])[1:]:
+            self.declare_variable(param.get("name", ""), param.get("type", "int"), is_parameter=True)
+        self_declared = False
+        scope_open = True
         try:
             for node in (init_scope or {}).get("graph", []):
                 node_kind = node.get("node")
@@ -277,11 +283,27 @@ class OopMixin:
                     else:
                         self.add_line(f"{c_type} {var_name} = 0;")
                     constructor_locals.append((var_name, var_type))
+                    # The constructor releases its locals below, so statement
+                    # lowering only borrows them.
+                    self.declare_variable(var_name, var_type, owns_reference=False)
                     continue
 
                 if node_kind == "attribute_assignment":
                     self._process_attribute_assignment_in_init(node, param_names)
+                    continue
+
+                if node_kind == "pass":
+                    continue
 
+                # Any other statement (calls, loops, element stores) is lowered
+                # like a method body with self aliasing the new object.
+                if not self_declared:
+                    self.add_line(f"{class_name}* self = obj;")
+                    self_declared = True
+                self.generate_graph_node(node)
+
+            self.exit_scope(emit_cleanup=True)
+            scope_open = False
             for var_name, var_type in reversed(constructor_locals):
                 kind = self.memory_kind_for_type(var_type)
                 if kind == self.MEMORY_ARC:
@@ -294,6 +316,8 @@ class OopMixin:
                     self.add_line(f"ocean_tensor_release({var_name});")
 
         finally:
+            if scope_open:
+                self.exit_scope(emit_cleanup=False)
             self._constructing_class = None
 
     def generate_all_methods(self, scopes: List[Dict]):
@@ -387,6 +411,33 @@ class OopMixin:
             self.add_empty_line()
             return
 
+        # Module.save()/load() walk parameters() the same way and get the
+        # same concrete-class implementation.
+        if method_name in ("save", "load") and origin_class == "Module":
+            c_return_type = self.map_type_to_c(return_type)
+            self.add_line(
+                f"{c_return_type} {class_name}_{method_name}("
+                f"{class_name}* self, char* path) {{"
+            )
+            self.indent_level += 1
+
+            list_type = "list[Parameter]"
+            self.generate_list_struct(list_type)
+            list_c_type = self.map_type_to_c(list_type)
+
+            self.add_line(
+                f"{list_c_type} parameters = "
+                f"{class_name}_parameters(self);"
+            )
+            self.add_line(f"{method_name}_parameters(parameters, path);")
+            self.add_line("ocean_release(parameters);")
+            self.add_line("return NULL;")
+
+            self.indent_level -= 1
+            self.add_line("}")
+            self.add_empty_line()
+            return
+
         # Генерируем сигнатуру
         param_decls = []
         for param in parameters:
@@ -402,6 +453,10 @@ class OopMixin:
 
         c_return_type = self.map_type_to_c(return_type)
         params_str = ", ".join(param_decls) if param_decls else "void"
+        call_args = ", ".join(
+            ["base_obj"]
+            + [param.get("name", "") for param in parameters if param.get("name") != "self"]
+        )
 
         self.add_line(f"{c_return_type} {class_name}_{method_name}({params_str}) {{")
         self.indent_level += 1
@@ -415,12 +470,12 @@ class OopMixin:
                 # Приводим self к типу родительского класса
                 self.add_line(f"// Вызов унаследованного метода из {origin_class}")
                 self.add_line(f"{origin_class}* base_obj = ({origin_class}*)self;")
-                self.add_line(f"return {origin_class}_{method_name}(base_obj);")
+                self.add_line(f"return {origin_class}_{method_name}({call_args});")
         else:
             if origin_class != class_name:
                 self.add_line(f"// Вызов унаследованного метода из {origin_class}")
                 self.add_line(f"{origin_class}* base_obj = ({origin_class}*)self;")
-                self.add_line(f"{origin_class}_{method_name}(base_obj);")
+                self.add_line(f"{origin_class}_{method_name}({call_args});")
 
         self.indent_level -= 1
         self.add_line("}")
@@ -7,15 +7,18 @@ from src.modules.constants import DEFAULT_C_IMPORTS, INITIAL_LIST_CAPACITY, KNOW
 from src.modules.logger import logger
 
 class StatementsMixin:
-    @staticmethod
-    def _normalize_loop_expression(value) -> str:
+    def _normalize_loop_expression(self, value) -> str:
         """Lower attribute references in range bounds to their C form."""
         text = str(value)
-        return re.sub(
-            r"\bself((?:\.[A-Za-z_][A-Za-z0-9_]*)+)",
-            lambda match: "self" + match.group(1).replace(".", "->"),
-            text,
-        )
+
+        def lower(match):
+            name = match.group(1)
+            info = self.get_variable_info(name)
+            if name != "self" and not (info and info.get("py_type") in self.class_types):
+                return match.group(0)
+            return name + match.group(2).replace(".", "->")
+
+        return re.sub(r"\b([A-Za-z_][A-Za-z0-9_]*)((?:\.[A-Za-z_][A-Za-z0-9_]*)+)", lower, text)
 
     def generate_break(self, node: Dict):
         """Release loop-local owners before transferring control."""
@@ -194,6 +197,25 @@ class StatementsMixin:
         collapse_count = self._openmp_collapse_count(openmp) if openmp else 1
         canonical_openmp_loop = bool(openmp) or self.openmp_collapse_remaining > 0
 
+        previous_bounds = self.tensor_fast_loop_bounds
+        previous_fast_access = self.tensor_fast_access
+        previous_fast_patterns = self.tensor_fast_patterns
+        self.tensor_fast_loop_bounds = dict(previous_bounds)
+        self.tensor_fast_loop_bounds[loop_var] = {
+            "start": str(start).strip(),
+            "stop": str(stop).strip(),
+            "step": str(step).strip(),
+        }
+        # OpenMP needs the loop statement right after its pragma (and collapsed
+        # loops perfectly nested), so those keep the checked Tensor accessors.
+        self.tensor_fast_access = {}
+        self.tensor_fast_patterns = set()
+        fast_guard = None
+        if not canonical_openmp_loop:
+            fast_guard = self.begin_tensor_fast_loop(loop_var, node.get("body", []))
+        loop_start = len(self.output)
+        unswitches = self.tensor_fast_unswitches
+
         # loop variable belongs to the loop's C declaration, not an owning object.
         if canonical_openmp_loop:
             try:
@@ -222,22 +244,21 @@ class StatementsMixin:
             self.openmp_collapse_remaining = collapse_count - 1
         elif self.openmp_collapse_remaining > 0:
             self.openmp_collapse_remaining -= 1
-        previous_bounds = self.tensor_fast_loop_bounds
-        self.tensor_fast_loop_bounds = dict(previous_bounds)
-        self.tensor_fast_loop_bounds[loop_var] = {
-            "start": str(start).strip(),
-            "stop": str(stop).strip(),
-            "step": str(step).strip(),
-        }
         try:
             for body_node in node.get("body", []):
                 self.generate_graph_node(body_node)
         finally:
             self.tensor_fast_loop_bounds = previous_bounds
+            self.tensor_fast_access = previous_fast_access
+            self.tensor_fast_patterns = previous_fast_patterns
             self.openmp_collapse_remaining = previous_collapse_remaining
         self.exit_scope()
         self.indent_level -= 1
         self.add_line("}")
+        # Only the innermost qualifying loop of a nest is duplicated; outer
+        # ones keep their hoisted guard, so code size stays linear in depth.
+        if fast_guard and self.tensor_fast_unswitches == unswitches:
+            self.unswitch_tensor_fast_loop(fast_guard, loop_start)
 
     def _format_openmp_pragma(self, metadata: Dict) -> str:
         """Render validated structured OpenMP metadata as one C pragma."""
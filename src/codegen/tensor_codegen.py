@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List
+import re
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.parsing.type_system import TENSOR_DTYPES
 
 
 class TensorCodegenMixin:
@@ -10,6 +14,33 @@ class TensorCodegenMixin:
     lowers constructors and indexed access for the public device-aware type.
     """
 
+    # Element C type and runtime dtype per typed accessor whose storage a
+    # range loop may index through a raw pointer.  float16 is stored as raw
+    # halves, so it always keeps the checked accessors.
+    _TENSOR_LOOP_ELEMENTS = {
+        "bool": ("bool", "bool"),
+        "i8": ("int8_t", "int8"),
+        "i16": ("int16_t", "int16"),
+        "i32": ("int32_t", "int32"),
+        "i64": ("int64_t", "int64"),
+        "u8": ("uint8_t", "uint8"),
+        "u16": ("uint16_t", "uint16"),
+        "u32": ("uint32_t", "uint32"),
+        "u64": ("uint64_t", "uint64"),
+        "f32": ("float", "float32"),
+        "f64": ("double", "float64"),
+    }
+    _TENSOR_INDEX_FORMS = {
+        "index_access",
+        "tensor_index_access",
+        "index_assignment",
+        "nested_index_assignment",
+        "augmented_index_assignment",
+        "SIMPLE_INDEX_ASSIGN",
+        "NESTED_INDEX_ASSIGN",
+        "AUGMENTED_INDEX_ASSIGN",
+    }
+
     def _generate_device_tensor_expression(self, ast: Dict, expected_type: str) -> str:
         previous = getattr(self, "device_tensor_expected_type", None)
         self.device_tensor_expected_type = expected_type
@@ -120,16 +151,26 @@ class TensorCodegenMixin:
             )
             return result_name
 
-        if method == "load_npy":
+        if method in ("load_npy", "load_npy_mmap"):
             if len(args) != 2:
-                raise RuntimeError("Tensor.load_npy expects path and device")
+                raise RuntimeError(f"Tensor.{method} expects path and device")
             path = generate_argument(args[0])
             device = generate_argument(args[1])
             return (
-                f"create_Tensor(ocean_tensor_load_npy_typed({path}, {device}, "
+                f"create_Tensor(ocean_tensor_{method}_typed({path}, {device}, "
                 f"\"{dtype}\"))"
             )
 
+        if method == "load_bin_mmap":
+            if len(args) != 2:
+                raise RuntimeError("Tensor.load_bin_mmap expects path and device")
+            path = generate_argument(args[0])
+            device = generate_argument(args[1])
+            return (
+                f"create_Tensor(ocean_tensor_load_bin_mmap({path}, \"{dtype}\", "
+                f"{device}))"
+            )
+
         return None
 
 
@@ -194,6 +235,60 @@ class TensorCodegenMixin:
                 f"{object_name}->handle, {name}, {len(axes)}))"
             )
 
+        if method in ("copy_from", "copy_to") and len(args) == 1:
+            buffer_ast = args[0]
+            buffer_name = buffer_ast.get("value") or buffer_ast.get("name")
+            buffer_info = (
+                self.get_variable_info(buffer_name)
+                if buffer_ast.get("type") == "variable" else None
+            )
+            buffer_type = self.strip_borrow_type(
+                buffer_info.get("py_type", "") if buffer_info else ""
+            )
+            if self.is_array_type(buffer_type):
+                element_type = self.array_element_type(buffer_type)
+                length = f"{self.array_struct_name(buffer_type)}_len({buffer_name})"
+            elif buffer_type.startswith("list["):
+                element_type = buffer_type[5:-1].strip()
+                self.generate_list_struct(buffer_type)
+                struct_name = self.generate_list_struct_name(buffer_type)
+                length = f"builtin_len_{struct_name}({buffer_name})"
+            else:
+                raise RuntimeError(
+                    f"Tensor.{method} expects a list[T] or array[T] variable"
+                )
+            if element_type not in TENSOR_DTYPES:
+                raise RuntimeError(
+                    f"Tensor.{method} expects numeric elements, got {element_type}"
+                )
+            return (
+                f"ocean_tensor_{method}_buffer({object_name}->handle, "
+                f"{buffer_name} ? {buffer_name}->data : NULL, "
+                f"(size_t)({length}), \"{element_type}\")"
+            )
+
+        if method == "to_list" and not args:
+            dtype = self.device_tensor_dtype(obj_type)
+            list_type = f"list[{dtype}]"
+            self.generate_list_struct(list_type)
+            struct_name = self.generate_list_struct_name(list_type)
+            suffix = self.temp_var_counter
+            self.temp_var_counter += 1
+            count_name = f"ocean_device_tensor_count_{suffix}"
+            result_name = f"ocean_device_tensor_list_{suffix}"
+            self.add_line(
+                f"int {count_name} = ocean_tensor_len({object_name}->handle);"
+            )
+            self.add_line(
+                f"{struct_name}* {result_name} = create_{struct_name}({count_name});"
+            )
+            self.add_line(f"{result_name}->size = {count_name};")
+            self.add_line(
+                f"ocean_tensor_copy_to_buffer({object_name}->handle, "
+                f"{result_name}->data, (size_t){count_name}, \"{dtype}\");"
+            )
+            return result_name
+
         return None
 
     def _tensor_list_types(self, source_type: str) -> List[str]:
@@ -213,6 +308,10 @@ class TensorCodegenMixin:
         rank = len(list_types)
         for list_type in list_types:
             self.generate_list_struct(list_type)
+        element_type = list_types[-1][5:-1].strip()
+        if element_type not in TENSOR_DTYPES:
+            raise RuntimeError("Tensor[T].from_list expects a typed numeric list")
+        c_element_type = self.map_type_to_c(element_type)
 
         suffix = self.temp_var_counter
         self.temp_var_counter += 1
@@ -220,6 +319,7 @@ class TensorCodegenMixin:
         strides_name = f"ocean_device_tensor_strides_{suffix}"
         data_name = f"ocean_device_tensor_data_{suffix}"
         offset_name = f"ocean_device_tensor_offset_{suffix}"
+        total_name = f"ocean_device_tensor_total_{suffix}"
         self.add_line(f"size_t {shape_name}[{rank}] = {{0}};")
 
         current_expr = source_name
@@ -247,26 +347,31 @@ class TensorCodegenMixin:
                 current_expr = child_name
 
         self.add_line(f"size_t {strides_name}[{rank}] = {{0}};")
-        self.add_line(f"size_t {offset_name} = 0;")
-        self.add_line(f"size_t ocean_device_tensor_total_{suffix} = 1;")
+        self.add_line(f"size_t {total_name} = 1;")
         self.add_line(
             f"for (size_t axis = 0; axis < {rank}; ++axis) "
-            f"ocean_device_tensor_total_{suffix} *= {shape_name}[axis];"
-        )
-        self.add_line(
-            f"{self.map_type_to_c(dtype)}* {data_name} = "
-            f"ocean_device_tensor_total_{suffix} ? "
-            f"({self.map_type_to_c(dtype)}*)malloc("
-            f"ocean_device_tensor_total_{suffix} * sizeof({self.map_type_to_c(dtype)})) : NULL;"
-        )
-        self.add_line(
-            f"if (ocean_device_tensor_total_{suffix} && !{data_name}) "
-            "ocean_tensor_fail(\"out of memory flattening Tensor list\");"
-        )
-
-        self._emit_tensor_list_flatten(
-            source_name, list_types, 0, data_name, offset_name, shape_name, suffix
+            f"{total_name} *= {shape_name}[axis];"
         )
+        # A flat list already holds its elements packed; nested lists are
+        # packed with one memcpy per innermost list.
+        if rank == 1:
+            self.add_line(
+                f"const {c_element_type}* {data_name} = "
+                f"{total_name} ? {source_name}->data : NULL;"
+            )
+        else:
+            self.add_line(f"size_t {offset_name} = 0;")
+            self.add_line(
+                f"{c_element_type}* {data_name} = {total_name} ? "
+                f"({c_element_type}*)malloc({total_name} * sizeof({c_element_type})) : NULL;"
+            )
+            self.add_line(
+                f"if ({total_name} && !{data_name}) "
+                "ocean_tensor_fail(\"out of memory flattening Tensor list\");"
+            )
+            self._emit_tensor_list_flatten(
+                source_name, list_types, 0, data_name, offset_name, shape_name, suffix
+            )
         for level in range(rank - 1, -1, -1):
             if level == rank - 1:
                 self.add_line(f"{strides_name}[{level}] = 1;")
@@ -277,14 +382,46 @@ class TensorCodegenMixin:
                 )
         device = self.generate_expression(device_ast)
         result_name = f"ocean_device_tensor_{suffix}"
-        self.add_line(
-            f"Tensor* {result_name} = create_Tensor(ocean_tensor_from_cpu_strided("
-            f"(const void*){data_name}, {shape_name}, {strides_name}, {rank}, "
-            f"\"{dtype}\", {device}));"
-        )
-        self.add_line(f"free({data_name});")
+        if self._tensor_dtype_name(element_type) == self._tensor_dtype_name(dtype):
+            self.add_line(
+                f"Tensor* {result_name} = create_Tensor(ocean_tensor_from_cpu_strided("
+                f"(const void*){data_name}, {shape_name}, {strides_name}, {rank}, "
+                f"\"{dtype}\", {device}));"
+            )
+        else:
+            self.add_line(
+                f"Tensor* {result_name} = create_Tensor(ocean_tensor_zeros_nd("
+                f"{shape_name}, {rank}, \"{dtype}\", {device}));"
+            )
+            self.add_line(
+                f"ocean_tensor_copy_from_buffer({result_name}->handle, "
+                f"{data_name}, {total_name}, \"{element_type}\");"
+            )
+        if rank > 1:
+            self.add_line(f"free({data_name});")
         return result_name
 
+    @staticmethod
+    def _tensor_dtype_name(py_type: str) -> str:
+        """Runtime dtype name of a scalar type, as ``ocean_tensor_parse_dtype`` reads it."""
+        aliases = {
+            "int": "int32",
+            "float": "float64",
+            "double": "float64",
+            "int8_t": "int8",
+            "int16_t": "int16",
+            "int32_t": "int32",
+            "int64_t": "int64",
+            "intptr_t": "int64",
+            "uint8_t": "uint8",
+            "uint16_t": "uint16",
+            "uint32_t": "uint32",
+            "uint64_t": "uint64",
+            "size_t": "uint64",
+            "uintptr_t": "uint64",
+        }
+        return aliases.get(py_type, py_type)
+
     def _emit_tensor_list_flatten(
         self,
         list_expr: str,
@@ -297,28 +434,36 @@ class TensorCodegenMixin:
     ) -> None:
         list_type = list_types[level]
         struct_name = self.generate_list_struct_name(list_type)
+        item_type = list_type[5:-1].strip()
+        if level == len(list_types) - 1:
+            length_name = f"ocean_device_tensor_row_{suffix}"
+            self.add_line(
+                f"size_t {length_name} = (size_t)builtin_len_{struct_name}({list_expr});"
+            )
+            self.add_line(
+                f"if ({length_name}) memcpy({data_name} + {offset_name}, "
+                f"{list_expr}->data, {length_name} * sizeof(*{data_name}));"
+            )
+            self.add_line(f"{offset_name} += {length_name};")
+            return
         index_name = f"ocean_device_tensor_index_{suffix}_{level}"
         self.add_line(
             f"for (int {index_name} = 0; {index_name} < "
             f"builtin_len_{struct_name}({list_expr}); ++{index_name}) {{"
         )
         self.indent_level += 1
-        item_type = list_type[5:-1].strip()
         item_expr = f"get_{struct_name}({list_expr}, {index_name})"
-        if level == len(list_types) - 1:
-            self.add_line(f"{data_name}[{offset_name}++] = {item_expr};")
-        else:
-            child_struct = self.generate_list_struct_name(item_type)
-            child_name = f"ocean_device_tensor_flatten_source_{suffix}_{level}"
-            self.add_line(f"{child_struct}* {child_name} = {item_expr};")
-            self.add_line(
-                f"ocean_tensor_validate_list_length("
-                f"builtin_len_{child_struct}({child_name}), {shape_name}[{level + 1}]);"
-            )
-            self._emit_tensor_list_flatten(
-                child_name, list_types, level + 1, data_name,
-                offset_name, shape_name, suffix
-            )
+        child_struct = self.generate_list_struct_name(item_type)
+        child_name = f"ocean_device_tensor_flatten_source_{suffix}_{level}"
+        self.add_line(f"{child_struct}* {child_name} = {item_expr};")
+        self.add_line(
+            f"ocean_tensor_validate_list_length("
+            f"builtin_len_{child_struct}({child_name}), {shape_name}[{level + 1}]);"
+        )
+        self._emit_tensor_list_flatten(
+            child_name, list_types, level + 1, data_name,
+            offset_name, shape_name, suffix
+        )
         self.indent_level -= 1
         self.add_line("}")
 
@@ -350,6 +495,246 @@ class TensorCodegenMixin:
             return None
         return [len(items), *first]
 
+    def _tensor_loop_index_key(self, ast) -> Optional[Tuple[str, object, int]]:
+        """Key of an index a range-loop prologue can bounds-check once.
+
+        Loop variables, optionally plus or minus an int literal, and
+        non-negative int literals qualify.
+        """
+        ast = getattr(ast, "raw", ast)
+        if not isinstance(ast, Mapping):
+            return None
+        offset = 0
+        if ast.get("type") == "binary_operation" and ast.get("operator") in {"ADD", "SUBTRACT"}:
+            right = getattr(ast.get("right"), "raw", ast.get("right"))
+            if not isinstance(right, Mapping):
+                return None
+            value = right.get("value")
+            if (
+                right.get("type") != "literal"
+                or not isinstance(value, int)
+                or isinstance(value, bool)
+            ):
+                return None
+            offset = value if ast["operator"] == "ADD" else -value
+            ast = getattr(ast.get("left"), "raw", ast.get("left"))
+            if not isinstance(ast, Mapping) or ast.get("type") != "variable":
+                return None
+        if ast.get("type") == "variable" and ast.get("name") in self.tensor_fast_loop_bounds:
+            return ("var", ast["name"], offset)
+        value = ast.get("value")
+        if (
+            ast.get("type") == "literal"
+            and isinstance(value, int)
+            and not isinstance(value, bool)
+            and value >= 0
+        ):
+            return ("int", value, 0)
+        return None
+
+    @staticmethod
+    def _tensor_loop_index_expr(key: Tuple[str, object, int]) -> str:
+        kind, value, offset = key
+        if offset > 0:
+            return f"({value} + {offset})"
+        if offset < 0:
+            return f"({value} - {-offset})"
+        return str(value)
+
+    def _scan_tensor_loop_body(
+        self, value, uses: Dict, names: set, assigned: set,
+        nested: bool = False, field: str = "",
+    ) -> None:
+        """Collect Tensor index patterns and every other name use of a loop body.
+
+        Index forms of nested loops are left to those loops, but their other
+        name uses still count, since they run while this loop's pointers live.
+        """
+        value = getattr(value, "raw", value)
+        if isinstance(value, Mapping):
+            form = value.get("type")
+            if form not in self._TENSOR_INDEX_FORMS:
+                form = value.get("node")
+            indexed = form in self._TENSOR_INDEX_FORMS and isinstance(value.get("variable"), str)
+            if indexed and not nested:
+                indices = value.get("indices") or [value.get("index")]
+                pattern = tuple(self._tensor_loop_index_key(index) for index in indices)
+                uses.setdefault(value["variable"], {})[pattern] = None
+            inner = nested or value.get("node") == "for_loop"
+            for key, item in value.items():
+                if key in {"content", "dependencies", "source_file"}:
+                    continue
+                if indexed and key == "variable":
+                    continue
+                self._scan_tensor_loop_body(item, uses, names, assigned, inner, key)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._scan_tensor_loop_body(item, uses, names, assigned, nested, field)
+        elif isinstance(value, str):
+            names.add(value)
+            if field in {"symbols", "target", "var_name", "loop_variable"}:
+                assigned.add(value)
+
+    def _tensor_loop_bound_check(
+        self, key: Tuple[str, object, int], extent: str, loop_var: str
+    ) -> str:
+        kind, value, offset = key
+        if kind == "int":
+            return f"(size_t){value} < {extent}"
+        if value != loop_var:
+            index = self._tensor_loop_index_expr(key)
+            return f"({index} >= 0 && (size_t){index} < {extent})"
+        bounds = self.tensor_fast_loop_bounds[loop_var]
+        first = self._tensor_loop_index_expr(("var", f"({bounds['start']})", offset))
+        last = self._tensor_loop_index_expr(("var", f"({bounds['stop']})", offset))
+        if int(bounds["step"]) > 0:
+            # Indices run from start + offset up to, excluding, stop + offset.
+            return (
+                f"(({bounds['start']}) >= ({bounds['stop']}) "
+                f"|| ({first} >= 0 && (size_t){last} <= {extent}))"
+            )
+        return (
+            f"(({bounds['start']}) <= ({bounds['stop']}) "
+            f"|| ({last} >= -1 && (size_t){first} < {extent}))"
+        )
+
+    def begin_tensor_fast_loop(self, loop_var: str, body) -> Optional[str]:
+        """Hoist the checks of direct Tensor indexing out of a range loop.
+
+        A Tensor qualifies when the body only indexes it, and only with loop
+        variables the body does not assign (optionally offset by an int
+        literal) and non-negative literals.
+        One prologue then checks that it is CPU storage of the static dtype
+        with a unit-stride last axis and that every index stays inside its
+        axis over the whole range.  Returns the guard selecting the
+        direct-pointer version of the loop, or None when nothing qualifies.
+        """
+        self.tensor_fast_access = {}
+        self.tensor_fast_patterns = set()
+        uses: Dict[str, Dict[Tuple, None]] = {}
+        names: set = set()
+        assigned: set = set()
+        self._scan_tensor_loop_body(body, uses, names, assigned)
+        # Bounds are re-evaluated by the prologue, so they must be pure
+        # arithmetic over names the body leaves alone.
+        bounds = self.tensor_fast_loop_bounds[loop_var]
+        range_checkable = bool(re.fullmatch(r"[+-]?[0-9]+", bounds["step"])) and all(
+            re.fullmatch(r"[A-Za-z0-9_\s+\-*()]+", bounds[key])
+            and not re.search(r"[A-Za-z0-9_]\s*\(", bounds[key])
+            and not set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", bounds[key])) & assigned
+            for key in ("start", "stop")
+        )
+
+        guard = f"ocean_tensor_loop_{self.temp_var_counter}"
+        prologue: List[str] = []
+        checks: List[str] = []
+        for variable, patterns in uses.items():
+            if variable in names or not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", variable):
+                continue
+            info = self.get_variable_info(variable)
+            py_type = self.strip_borrow_type(info.get("py_type", "")) if info else ""
+            if not self.is_device_tensor_type(py_type):
+                continue
+            element = self._TENSOR_LOOP_ELEMENTS.get(self.device_tensor_accessor_suffix(py_type))
+            keys = [key for pattern in patterns for key in pattern]
+            if not element or len({len(pattern) for pattern in patterns}) != 1:
+                continue
+            if any(
+                key is None
+                or (key[0] == "var" and key[1] in assigned)
+                or (key[0] == "var" and key[1] == loop_var and not range_checkable)
+                for key in keys
+            ):
+                continue
+
+            c_type, dtype = element
+            rank = len(next(iter(patterns)))
+            data = f"{guard}_{variable}"
+            prologue.append(f"size_t {data}_shape[{rank}], {data}_strides[{rank}];")
+            prologue.append(
+                f"{c_type} *{data} = ({c_type} *)ocean_tensor_loop_data("
+                f'{variable}->handle, {rank}, "{dtype}", {data}_shape, {data}_strides);'
+            )
+            for axis in range(rank - 1):
+                prologue.append(f"const size_t {data}_stride{axis} = {data}_strides[{axis}];")
+            checks.append(f"{data} != NULL")
+            for pattern in patterns:
+                for axis, key in enumerate(pattern):
+                    checks.append(
+                        self._tensor_loop_bound_check(key, f"{data}_shape[{axis}]", loop_var)
+                    )
+            self.tensor_fast_access[variable] = {"guard": guard, "data": data, "c_type": c_type}
+            self.tensor_fast_patterns.update((variable, pattern) for pattern in patterns)
+
+        if not self.tensor_fast_access:
+            return None
+        self.temp_var_counter += 1
+        for line in prologue:
+            self.add_line(line)
+        checks = list(dict.fromkeys(checks))
+        self.add_line(f"const bool {guard} =")
+        for index, check in enumerate(checks):
+            prefix = "    " if index == 0 else "    && "
+            suffix = ";" if index == len(checks) - 1 else ""
+            self.add_line(f"{prefix}{check}{suffix}")
+        return guard
+
+    def unswitch_tensor_fast_loop(self, guard: str, start: int) -> None:
+        """Emit the loop from ``start`` twice so the guard folds away in each copy."""
+        self.tensor_fast_unswitches += 1
+        loop = [f"    {line}" if line else line for line in self.output[start:]]
+        indent = self.indent()
+        self.output[start:] = [
+            f"{indent}if ({guard}) {{", *loop, f"{indent}}} else {{", *loop, f"{indent}}}"
+        ]
+
+    def _tensor_fast_element(self, variable: str, indices) -> Optional[Tuple[str, str, str]]:
+        """Guard, direct element lvalue and C type for a prologue-checked access."""
+        access = self.tensor_fast_access.get(variable)
+        if not access:
+            return None
+        pattern = tuple(self._tensor_loop_index_key(index) for index in indices)
+        if (variable, pattern) not in self.tensor_fast_patterns:
+            return None
+        data = access["data"]
+        terms = [
+            f"(size_t){self._tensor_loop_index_expr(key)} * {data}_stride{axis}"
+            for axis, key in enumerate(pattern)
+        ]
+        terms[-1] = f"(size_t){self._tensor_loop_index_expr(pattern[-1])}"
+        return access["guard"], f"{data}[{' + '.join(terms)}]", access["c_type"]
+
+    def generate_tensor_element_read(
+        self, target: str, py_type: str, indices: List[Dict], flat: bool = False
+    ) -> str:
+        """Read one element, directly when the enclosing loop checked the access."""
+        expressions = [self.generate_expression(index) for index in indices]
+        accessor = self.device_tensor_accessor_suffix(py_type)
+        if flat:
+            read = (
+                f"ocean_tensor_get_flat_{accessor}({target}->handle, "
+                f"(size_t)({expressions[0]}))"
+            )
+        else:
+            literal = ", ".join(f"(size_t)({index})" for index in expressions)
+            read = (
+                f"ocean_tensor_get_nd_{accessor}({target}->handle, "
+                f"(const size_t[]){{{literal}}}, {len(expressions)})"
+            )
+        fast = self._tensor_fast_element(target, indices)
+        if fast:
+            guard, element, _ = fast
+            return f"({guard} ? {element} : {read})"
+        return read
+
+    def _add_tensor_element_write(self, target: str, indices, write: str, value: str) -> None:
+        fast = self._tensor_fast_element(target, indices)
+        if fast:
+            guard, element, c_type = fast
+            self.add_line(f"if ({guard}) {element} = ({c_type})({value}); else {write}")
+            return
+        self.add_line(write)
+
     def generate_tensor_index_access(self, ast: Dict) -> str:
         variable = ast.get("variable", "")
         info = self.get_variable_info(variable)
@@ -359,30 +744,29 @@ class TensorCodegenMixin:
         py_type = self.strip_borrow_type(info.get("py_type", ""))
         if not self.is_device_tensor_type(py_type):
             raise RuntimeError("indexed access is supported only for Tensor[T]")
-        indices = [self.generate_expression(index) for index in ast.get("indices", [])]
+        indices = list(ast.get("indices", []))
         if not indices:
             raise RuntimeError("Tensor indexing expects at least one index")
-        literal = ", ".join(f"(size_t)({index})" for index in indices)
-        accessor = self.device_tensor_accessor_suffix(py_type)
-        return (
-            f"ocean_tensor_get_nd_{accessor}({variable}->handle, "
-            f"(const size_t[]){{{literal}}}, {len(indices)})"
-        )
+        return self.generate_tensor_element_read(variable, py_type, indices)
 
     def generate_tensor_index_assignment(
         self, variable: str, py_type: str, indices: Iterable[Dict], value: str
     ) -> None:
         if not self.is_device_tensor_type(py_type):
             raise RuntimeError("indexed assignment is supported only for Tensor[T]")
+        indices = list(indices)
         expressions = [self.generate_expression(index) for index in indices]
         if not expressions:
             raise RuntimeError("Tensor indexing expects at least one index")
         literal = ", ".join(f"(size_t)({index})" for index in expressions)
         accessor = self.device_tensor_accessor_suffix(py_type)
-        self.add_line(
+        self._add_tensor_element_write(
+            variable,
+            indices,
             f"ocean_tensor_set_nd_{accessor}({variable}->handle, "
             f"(const size_t[]){{{literal}}}, "
-            f"{len(expressions)}, {value});"
+            f"{len(expressions)}, {value});",
+            value,
         )
 
     def generate_tensor_flat_index_assignment(
@@ -392,7 +776,10 @@ class TensorCodegenMixin:
             raise RuntimeError("indexed assignment is supported only for Tensor[T]")
         index_expr = self.generate_expression(index)
         accessor = self.device_tensor_accessor_suffix(py_type)
-        self.add_line(
+        self._add_tensor_element_write(
+            variable,
+            [index],
             f"ocean_tensor_set_flat_{accessor}({variable}->handle, "
-            f"(size_t)({index_expr}), {value});"
+            f"(size_t)({index_expr}), {value});",
+            value,
         )
@@ -111,8 +111,31 @@ class Validator:
                             "ocean_tensor_zeros",
                             "ocean_tensor_zeros_nd",
                             "ocean_tensor_from_cpu_strided",
+                            "ocean_tensor_copy_from_buffer",
+                            "ocean_tensor_copy_to_buffer",
                             "ocean_tensor_load_npy",
                             "ocean_tensor_load_npy_typed",
+                            "ocean_tensor_load_npy_mmap",
+                            "ocean_tensor_load_npy_mmap_typed",
+                            "ocean_tensor_load_bin_mmap",
+                            "ocean_tensor_is_mapped",
+                            "ocean_tensor_madvise",
+                            "ocean_tensor_checkpoint_create",
+                            "ocean_tensor_checkpoint_open",
+                            "ocean_tensor_checkpoint_add",
+                            "ocean_tensor_checkpoint_save",
+                            "ocean_tensor_checkpoint_load",
+                            "ocean_tensor_checkpoint_contains",
+                            "ocean_tensor_checkpoint_get",
+                            "ocean_tensor_checkpoint_release",
+                            "ocean_tensor_loader_create",
+                            "ocean_tensor_loader_add_rows",
+                            "ocean_tensor_loader_add_windows",
+                            "ocean_tensor_loader_batches",
+                            "ocean_tensor_loader_next",
+                            "ocean_tensor_loader_get",
+                            "ocean_tensor_loader_wait_seconds",
+                            "ocean_tensor_loader_release",
                             "ocean_tensor_save_npy",
                             "ocean_tensor_get_flat",
                             "ocean_tensor_set_flat",
@@ -143,6 +166,14 @@ class Validator:
                             "ocean_tensor_len",
                             "ocean_tensor_copy",
                             "ocean_tensor_ternary_quantize",
+                            "ocean_tensor_ternary_pack",
+                            "ocean_tensor_ternary_scales",
+                            "ocean_tensor_int8_pack",
+                            "ocean_tensor_int8_scales",
+                            "ocean_tensor_matmul_ternary",
+                            "ocean_tensor_matmul_int8",
+                            "ocean_tensor_kv_cache_write",
+                            "ocean_tensor_scaled_dot_product_attention_cached",
                             "ocean_tensor_gelu",
                             "ocean_tensor_gelu_backward",
                             "ocean_tensor_copy_into",
@@ -150,6 +181,31 @@ class Validator:
                             "ocean_tensor_matmul",
                             "ocean_tensor_binary",
                             "ocean_tensor_scalar",
+                            "ocean_tensor_set_num_threads",
+                            "ocean_tensor_get_num_threads",
+                            "ocean_tensor_set_thread_parallelism",
+                            "ocean_tensor_accumulate_range",
+                            "ocean_tensor_unary",
+                            "ocean_tensor_set_cache_limit",
+                            "ocean_tensor_get_cache_limit",
+                            "ocean_tensor_empty_cache",
+                            "ocean_tensor_memory_live_bytes",
+                            "ocean_tensor_memory_peak_bytes",
+                            "ocean_tensor_memory_cached_bytes",
+                            "ocean_tensor_reset_peak_memory",
+                            "ocean_tensor_memory_window_peak_bytes",
+                            "ocean_tensor_reset_window_peak_memory",
+                            "ocean_tensor_memory_stats",
+                            "ocean_tensor_owns_storage",
+                            "ocean_tensor_alias",
+                            "ocean_tensor_shares_storage",
+                            "ocean_tensor_set_lazy_enabled",
+                            "ocean_tensor_lazy_enabled",
+                            "ocean_tensor_binary_into",
+                            "ocean_tensor_scalar_into",
+                            "ocean_tensor_relu",
+                            "ocean_tensor_relu_into",
+                            "ocean_tensor_gelu_into",
                             "ocean_tensor_reshape",
                             "ocean_tensor_reshape_2d",
                             "ocean_tensor_transpose",
@@ -191,6 +247,7 @@ class Validator:
                             "ocean_tensor_set_nd_f16",
                             "ocean_tensor_set_nd_f32",
                             "ocean_tensor_set_nd_f64",
+                            "ocean_tensor_loop_data",
                             "ocean_tensor_get_2d",
                             "ocean_tensor_set_2d",
                             "ocean_tensor_shape",
@@ -218,9 +275,32 @@ class Validator:
                             "ocean_autograd_has_grad",
                             "ocean_autograd_grad_copy",
                             "ocean_autograd_zero_grad",
+                            "ocean_autograd_clear_grad",
+                            "ocean_autograd_set_sparse_grad",
+                            "ocean_autograd_sparse_grad_rows",
+                            "ocean_autograd_sparse_grad_values",
                             "ocean_autograd_backward",
+                            "ocean_autograd_backward_peak_bytes",
+                            "ocean_autograd_capture_begin",
+                            "ocean_autograd_capture_end",
+                            "ocean_autograd_replay",
+                            "ocean_autograd_release_tape",
+                            "ocean_autograd_checkpoint_begin",
+                            "ocean_autograd_checkpoint_end",
+                            "ocean_autograd_data_parallel_create",
+                            "ocean_autograd_data_parallel_add_parameter",
+                            "ocean_autograd_data_parallel_add_replica",
+                            "ocean_autograd_data_parallel_set_context",
+                            "ocean_autograd_data_parallel_set_tape",
+                            "ocean_autograd_data_parallel_set_rows",
+                            "ocean_autograd_data_parallel_worker",
+                            "ocean_autograd_data_parallel_run",
+                            "ocean_autograd_data_parallel_replay",
+                            "ocean_autograd_data_parallel_release",
                             "ocean_autograd_set_grad_enabled",
                             "ocean_autograd_grad_enabled",
+                            "ocean_autograd_check_inplace",
+                            "ocean_autograd_check_out",
                             "ocean_autograd_binary",
                             "ocean_autograd_scalar",
                             "ocean_autograd_matmul",
@@ -230,11 +310,16 @@ class Validator:
                             "ocean_autograd_mse_loss",
                             "ocean_autograd_embedding",
                             "ocean_autograd_cross_entropy",
+                            "ocean_autograd_scaled_dot_product_attention",
                             "ocean_autograd_parameter_uniform",
                             "ocean_autograd_sgd_step",
                             "ocean_autograd_adamw_create",
                             "ocean_autograd_adamw_begin_step",
                             "ocean_autograd_adamw_step",
+                            "ocean_autograd_sgd_create",
+                            "ocean_autograd_optimizer_stage",
+                            "ocean_autograd_sgd_step_staged",
+                            "ocean_autograd_adamw_step_staged",
                             "ocean_autograd_exp",
                             "ocean_autograd_log",
                             "ocean_autograd_sqrt",
@@ -5331,6 +5331,12 @@ class Parser:
                 "is_contiguous", "contiguous", "item",
                 "requires_grad", "requires_grad_", "has_grad",
                 "grad", "zero_grad", "backward",
+                "add_", "sub_", "mul_", "div_",
+                "add_scalar_", "sub_scalar_", "mul_scalar_", "div_scalar_",
+                "relu_", "gelu_", "fill_", "copy_",
+                "add_out", "sub_out", "mul_out", "div_out",
+                "add_scalar_out", "sub_scalar_out", "mul_scalar_out",
+                "div_scalar_out", "relu_out", "gelu_out",
             }:
                 method_found = True
 
@@ -14,6 +14,16 @@ from typing import Any, Iterable
 
 from src.parsing.type_system import TypeParser, TypeSpec, infer_literal_shape
 
+# Tensor methods that write into an existing Tensor and return None.
+TENSOR_INPLACE_METHODS = frozenset({
+    "add_", "sub_", "mul_", "div_",
+    "add_scalar_", "sub_scalar_", "mul_scalar_", "div_scalar_",
+    "relu_", "gelu_", "fill_", "copy_",
+    "add_out", "sub_out", "mul_out", "div_out",
+    "add_scalar_out", "sub_scalar_out", "mul_scalar_out", "div_scalar_out",
+    "relu_out", "gelu_out",
+})
+
 
 @dataclass(frozen=True)
 class IRType:
@@ -460,6 +470,7 @@ class TypedIRBuilder:
                 "mean", "max", "min", "dtype", "is_contiguous", "item",
                 "requires_grad", "has_grad",
                 "requires_grad_", "zero_grad", "backward", "fill", "release",
+                *TENSOR_INPLACE_METHODS,
                 }:
                 method = ast.get("method")
                 if method == "sum":
@@ -477,7 +488,7 @@ class TypedIRBuilder:
                 if method in {
                     "set", "requires_grad_", "zero_grad",
                     "backward", "fill", "release"
-                }:
+                } or method in TENSOR_INPLACE_METHODS:
                     return IRType.parse("None")
                 return IRType.parse(object_type or "Tensor[float32]")
             return IRType.parse("any")
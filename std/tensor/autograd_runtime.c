@@ -2,6 +2,8 @@
 
 #include <math.h>
 
+#include <pthread.h>
+#include <stdatomic.h>
 #include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
@@ -31,16 +33,26 @@ enum {
     OCEAN_AUTOGRAD_EMBEDDING = 26,
     OCEAN_AUTOGRAD_CROSS_ENTROPY = 27,
     OCEAN_AUTOGRAD_GELU = 28,
+    OCEAN_AUTOGRAD_CHECKPOINT = 29,
+    OCEAN_AUTOGRAD_ATTENTION = 30,
 };
 
 typedef struct ocean_autograd_meta ocean_autograd_meta;
+typedef struct ocean_autograd_segment ocean_autograd_segment;
 
 typedef struct ocean_autograd_node {
     int operation;
     ocean_autograd_meta *left;
     ocean_autograd_meta *right;
+    /* Third input of ATTENTION nodes (the values). */
+    ocean_autograd_meta *extra;
     ocean_tensor_handle_t saved_left;
     ocean_tensor_handle_t saved_right;
+    ocean_tensor_handle_t saved_extra;
+    ocean_tensor_handle_t saved_output;
+    /* Per-row log-sum-exp: of saved_left for CROSS_ENTROPY nodes on CPU,
+       of the attention scores for ATTENTION nodes. */
+    ocean_tensor_handle_t saved_statistics;
     double scalar;
     int scalar_operation;
     int dim0;
@@ -48,6 +60,8 @@ typedef struct ocean_autograd_node {
     bool keepdim;
     int *axes;
     size_t axes_count;
+    /* CHECKPOINT nodes: the segment whose graph backward recomputes. */
+    ocean_autograd_segment *segment;
 } ocean_autograd_node;
 
 struct ocean_autograd_meta {
@@ -56,16 +70,128 @@ struct ocean_autograd_meta {
     bool requires_grad;
     bool leaf;
     ocean_tensor_handle_t grad;
+    /* Buffer parked by clear_grad() for the next backward() to refill. */
+    ocean_tensor_handle_t spare_grad;
+    /* Row-sparse gradient of an Embedding table (set_sparse_grad): the
+       first sparse_count slots of sparse_rows/sparse_values, laid out as
+       ocean_tensor_embedding_backward_rows describes.  `grad` stays NULL
+       while the gradient is sparse; a dense contribution densifies it. */
+    bool sparse_grad;
+    ocean_tensor_handle_t sparse_slots;
+    ocean_tensor_handle_t sparse_rows;
+    ocean_tensor_handle_t sparse_values;
+    size_t sparse_count;
     ocean_autograd_node *grad_fn;
     size_t ndim;
     size_t *shape;
     char *device;
+    /* Last backward() traversal that reached this entry. */
+    uint64_t visit_generation;
+    /* Produced while a tape was capturing; the tape owns it afterwards. */
+    bool captured;
+    /* 1 + index of the step that produced it in the open checkpoint. */
+    size_t segment_step;
+    /* Registry list, for shutdown. */
     ocean_autograd_meta *next;
+    ocean_autograd_meta *previous;
+    /* Chain within an ocean_autograd_index bucket. */
+    ocean_autograd_meta *bucket_next;
 };
 
-static ocean_autograd_meta *ocean_autograd_metas = NULL;
-static bool ocean_autograd_shutdown_registered = false;
-static bool ocean_autograd_grad_enabled_state = true;
+/* Autograd state is per thread.  Each thread builds and walks its own graph,
+   so data-parallel workers run forward/backward concurrently; a Tensor that
+   requires grad in one thread is untracked in the others. */
+static _Thread_local ocean_autograd_meta *ocean_autograd_metas = NULL;
+
+/*
+ * A tape is one captured training step.  Each entry keeps storage-sharing
+ * aliases of an operation's inputs and result, so replay() recomputes the
+ * result into the same buffer from whatever the inputs hold now.  `order`
+ * lists the non-leaf entries in the order the captured backward() ran them.
+ */
+typedef struct ocean_autograd_tape_entry {
+    ocean_autograd_meta *meta;
+    ocean_tensor_handle_t output;
+    ocean_tensor_handle_t left;
+    ocean_tensor_handle_t right;
+    ocean_tensor_handle_t extra;
+} ocean_autograd_tape_entry;
+
+typedef struct ocean_autograd_tape {
+    int id;
+    ocean_autograd_tape_entry *entries;
+    size_t count;
+    size_t capacity;
+    ocean_autograd_meta **order;
+    size_t order_count;
+    ocean_autograd_meta *output;
+    struct ocean_autograd_tape *next;
+} ocean_autograd_tape;
+
+static ocean_autograd_tape *ocean_autograd_tapes = NULL;
+static _Thread_local ocean_autograd_tape *ocean_autograd_capturing = NULL;
+static int ocean_autograd_next_tape_id = 1;
+static bool ocean_autograd_tape_shutdown_registered = false;
+
+/*
+ * A checkpointed segment keeps only a recipe of its forward pass: one step
+ * per recorded operation, with operands naming an earlier step or one of
+ * the segment's external inputs.  Externals are aliases of the Tensors the
+ * segment read from outside; `meta` is set for those that require grad.
+ */
+typedef struct ocean_autograd_segment_operand {
+    bool external;
+    size_t index;
+} ocean_autograd_segment_operand;
+
+typedef struct ocean_autograd_segment_step {
+    int operation;
+    double scalar;
+    int scalar_operation;
+    int dim0;
+    int dim1;
+    bool keepdim;
+    int *axes;
+    size_t axes_count;
+    size_t *shape;
+    size_t ndim;
+    bool binary;
+    bool ternary;
+    ocean_autograd_segment_operand left;
+    ocean_autograd_segment_operand right;
+    ocean_autograd_segment_operand extra;
+    /* Only valid while the segment is open. */
+    ocean_autograd_meta *meta;
+} ocean_autograd_segment_step;
+
+typedef struct ocean_autograd_segment_external {
+    ocean_tensor_handle_t value;
+    uint64_t identity;
+    ocean_autograd_meta *meta;
+} ocean_autograd_segment_external;
+
+struct ocean_autograd_segment {
+    ocean_autograd_segment_step *steps;
+    size_t step_count;
+    size_t step_capacity;
+    ocean_autograd_segment_external *externals;
+    size_t external_count;
+    size_t external_capacity;
+};
+
+static _Thread_local ocean_autograd_segment *ocean_autograd_checkpointing = NULL;
+
+/*
+ * Metadata is indexed by Tensor identity so every autograd op finds its
+ * operands in O(1) instead of scanning all live metadata.  Identities are
+ * unique for the life of the process; the handle pointer is compared too
+ * because a released handle's address can be reused.
+ */
+static _Thread_local ocean_autograd_meta **ocean_autograd_index = NULL;
+static _Thread_local size_t ocean_autograd_index_capacity = 0;
+static _Thread_local size_t ocean_autograd_meta_count = 0;
+static atomic_flag ocean_autograd_shutdown_registered = ATOMIC_FLAG_INIT;
+static _Thread_local bool ocean_autograd_grad_enabled_state = true;
 
 void ocean_autograd_set_grad_enabled(bool enabled) {
     ocean_autograd_grad_enabled_state = enabled;
@@ -120,18 +246,71 @@ static bool ocean_autograd_same_shape_meta(
     return true;
 }
 
+static size_t ocean_autograd_index_slot(uint64_t identity, size_t capacity) {
+    return (size_t)((identity * UINT64_C(0x9E3779B97F4A7C15)) >> 17)
+        & (capacity - 1);
+}
+
+static void ocean_autograd_index_insert(ocean_autograd_meta *meta) {
+    if (ocean_autograd_meta_count >= ocean_autograd_index_capacity) {
+        size_t capacity = ocean_autograd_index_capacity
+            ? ocean_autograd_index_capacity * 2 : 1024;
+        ocean_autograd_meta **index =
+            (ocean_autograd_meta **)calloc(capacity, sizeof(*index));
+        if (!index) ocean_tensor_fail("out of memory indexing autograd metadata");
+        for (size_t slot = 0; slot < ocean_autograd_index_capacity; ++slot) {
+            ocean_autograd_meta *entry = ocean_autograd_index[slot];
+            while (entry) {
+                ocean_autograd_meta *following = entry->bucket_next;
+                size_t target =
+                    ocean_autograd_index_slot(entry->tensor_identity, capacity);
+                entry->bucket_next = index[target];
+                index[target] = entry;
+                entry = following;
+            }
+        }
+        free(ocean_autograd_index);
+        ocean_autograd_index = index;
+        ocean_autograd_index_capacity = capacity;
+    }
+    size_t slot = ocean_autograd_index_slot(
+        meta->tensor_identity, ocean_autograd_index_capacity
+    );
+    meta->bucket_next = ocean_autograd_index[slot];
+    ocean_autograd_index[slot] = meta;
+    ++ocean_autograd_meta_count;
+}
+
+static void ocean_autograd_index_remove(ocean_autograd_meta *meta) {
+    ocean_autograd_meta **cursor = &ocean_autograd_index[
+        ocean_autograd_index_slot(meta->tensor_identity, ocean_autograd_index_capacity)
+    ];
+    while (*cursor) {
+        if (*cursor == meta) {
+            *cursor = meta->bucket_next;
+            meta->bucket_next = NULL;
+            --ocean_autograd_meta_count;
+            return;
+        }
+        cursor = &(*cursor)->bucket_next;
+    }
+}
+
 static ocean_autograd_meta *ocean_autograd_find(
     ocean_tensor_handle_t tensor
 ) {
     if (!ocean_autograd_grad_enabled_state) return NULL;
     if (!tensor) return NULL;
 
+    if (ocean_autograd_meta_count == 0) return NULL;
     uint64_t identity = ocean_tensor_identity(tensor);
 
     for (
-        ocean_autograd_meta *meta = ocean_autograd_metas;
+        ocean_autograd_meta *meta = ocean_autograd_index[
+            ocean_autograd_index_slot(identity, ocean_autograd_index_capacity)
+        ];
         meta;
-        meta = meta->next
+        meta = meta->bucket_next
     ) {
         if (
             meta->tensor == tensor
@@ -143,17 +322,53 @@ static ocean_autograd_meta *ocean_autograd_find(
     return NULL;
 }
 
+static void ocean_autograd_segment_free(ocean_autograd_segment *segment) {
+    if (!segment) return;
+    for (size_t index = 0; index < segment->step_count; ++index) {
+        free(segment->steps[index].axes);
+        free(segment->steps[index].shape);
+    }
+    for (size_t index = 0; index < segment->external_count; ++index) {
+        ocean_tensor_release(segment->externals[index].value);
+    }
+    free(segment->steps);
+    free(segment->externals);
+    free(segment);
+}
+
 static void ocean_autograd_node_free(ocean_autograd_node *node) {
     if (!node) return;
     ocean_tensor_release(node->saved_left);
     ocean_tensor_release(node->saved_right);
+    ocean_tensor_release(node->saved_extra);
+    ocean_tensor_release(node->saved_output);
+    ocean_tensor_release(node->saved_statistics);
     free(node->axes);
+    ocean_autograd_segment_free(node->segment);
     free(node);
 }
 
+/* Copy of an input kept for backward.  Inside a checkpointed segment nothing
+   is kept: the segment's backward recomputes its own graph. */
+static ocean_tensor_handle_t ocean_autograd_save(ocean_tensor_handle_t tensor) {
+    return ocean_autograd_checkpointing ? NULL : ocean_tensor_copy(tensor);
+}
+
+static void ocean_autograd_sparse_free(ocean_autograd_meta *meta) {
+    ocean_tensor_release(meta->sparse_slots);
+    ocean_tensor_release(meta->sparse_rows);
+    ocean_tensor_release(meta->sparse_values);
+    meta->sparse_slots = NULL;
+    meta->sparse_rows = NULL;
+    meta->sparse_values = NULL;
+    meta->sparse_count = 0;
+}
+
 static void ocean_autograd_meta_free(ocean_autograd_meta *meta) {
     if (!meta) return;
     ocean_tensor_release(meta->grad);
+    ocean_tensor_release(meta->spare_grad);
+    ocean_autograd_sparse_free(meta);
     ocean_autograd_node_free(meta->grad_fn);
     free(meta->shape);
     free(meta->device);
@@ -168,6 +383,10 @@ static void ocean_autograd_shutdown(void) {
         meta = next;
     }
     ocean_autograd_metas = NULL;
+    free(ocean_autograd_index);
+    ocean_autograd_index = NULL;
+    ocean_autograd_index_capacity = 0;
+    ocean_autograd_meta_count = 0;
 }
 
 static ocean_autograd_meta *ocean_autograd_get(
@@ -192,26 +411,29 @@ static ocean_autograd_meta *ocean_autograd_get(
     }
     meta->leaf = true;
     meta->next = ocean_autograd_metas;
+    if (ocean_autograd_metas) ocean_autograd_metas->previous = meta;
     ocean_autograd_metas = meta;
+    ocean_autograd_index_insert(meta);
 
-    if (!ocean_autograd_shutdown_registered) {
-        ocean_autograd_shutdown_registered = true;
+    if (!atomic_flag_test_and_set(&ocean_autograd_shutdown_registered)) {
         atexit(ocean_autograd_shutdown);
     }
     return meta;
 }
 
+/* Take `target` out of the registry without freeing it. */
+static void ocean_autograd_unlink_meta(ocean_autograd_meta *target) {
+    ocean_autograd_index_remove(target);
+    if (target->previous) target->previous->next = target->next;
+    else ocean_autograd_metas = target->next;
+    if (target->next) target->next->previous = target->previous;
+    target->next = NULL;
+    target->previous = NULL;
+}
+
 static void ocean_autograd_remove_meta(ocean_autograd_meta *target) {
-    ocean_autograd_meta **cursor = &ocean_autograd_metas;
-    while (*cursor) {
-        if (*cursor == target) {
-            *cursor = target->next;
-            target->next = NULL;
-            ocean_autograd_meta_free(target);
-            return;
-        }
-        cursor = &(*cursor)->next;
-    }
+    ocean_autograd_unlink_meta(target);
+    ocean_autograd_meta_free(target);
 }
 
 
@@ -227,6 +449,80 @@ static ocean_tensor_handle_t ocean_autograd_zeros_meta(
     );
 }
 
+/* Empties the row-sparse gradient; its buffers are kept for the next one. */
+static void ocean_autograd_sparse_reset(ocean_autograd_meta *meta) {
+    if (!meta->sparse_count) return;
+    ocean_tensor_embedding_rows_reset(meta->sparse_slots, meta->sparse_rows, meta->sparse_count);
+    meta->sparse_count = 0;
+}
+
+/* Moves a row-sparse gradient into the dense `grad`. */
+static void ocean_autograd_densify(ocean_autograd_meta *meta) {
+    if (!meta->sparse_count) return;
+    if (!meta->grad) {
+        if (meta->spare_grad && ocean_autograd_same_shape_meta(meta->spare_grad, meta)) {
+            meta->grad = meta->spare_grad;
+            meta->spare_grad = NULL;
+            ocean_tensor_fill(meta->grad, 0.0);
+        } else {
+            meta->grad = ocean_autograd_zeros_meta(meta);
+        }
+    }
+    ocean_tensor_scatter_add_rows(
+        meta->grad, meta->sparse_rows, meta->sparse_values, meta->sparse_count
+    );
+    ocean_autograd_sparse_reset(meta);
+}
+
+/*
+ * Adds an Embedding gradient to a table that keeps row-sparse gradients.
+ * Returns false when the gradient has to be dense instead.  The buffers
+ * grow to the most rows one step has touched (at most the whole table) and
+ * are reused afterwards.
+ */
+static bool ocean_autograd_accumulate_rows(
+    ocean_autograd_meta *meta,
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t indices
+) {
+    if (!meta->sparse_grad || meta->grad || !indices) return false;
+    size_t vocab = meta->shape[0];
+    size_t dim = meta->shape[1];
+    size_t needed = meta->sparse_count + ocean_tensor_size(indices);
+    if (needed > vocab) needed = vocab;
+
+    if (!meta->sparse_slots) {
+        size_t slot_shape[1] = {vocab};
+        meta->sparse_slots = ocean_tensor_zeros_nd(slot_shape, 1, "int64", "cpu");
+        ocean_tensor_fill(meta->sparse_slots, -1.0);
+    }
+    size_t capacity = meta->sparse_rows ? ocean_tensor_size(meta->sparse_rows) : 0;
+    if (capacity < needed) {
+        capacity = capacity * 2 > needed ? capacity * 2 : needed;
+        if (capacity > vocab) capacity = vocab;
+        size_t row_shape[1] = {capacity};
+        size_t value_shape[2] = {capacity, dim};
+        ocean_tensor_handle_t rows = ocean_tensor_zeros_nd(row_shape, 1, "int64", "cpu");
+        ocean_tensor_handle_t values = ocean_tensor_zeros_nd(value_shape, 2, "float32", "cpu");
+        if (meta->sparse_count) {
+            ocean_tensor_copy_range(rows, 0, meta->sparse_rows, 0, meta->sparse_count);
+            ocean_tensor_copy_range(
+                values, 0, meta->sparse_values, 0, meta->sparse_count * dim
+            );
+        }
+        ocean_tensor_release(meta->sparse_rows);
+        ocean_tensor_release(meta->sparse_values);
+        meta->sparse_rows = rows;
+        meta->sparse_values = values;
+    }
+
+    meta->sparse_count = ocean_tensor_embedding_backward_rows(
+        upstream, indices, meta->sparse_slots,
+        meta->sparse_rows, meta->sparse_values, meta->sparse_count
+    );
+    return true;
+}
+
 static void ocean_autograd_accumulate(
     ocean_autograd_meta *meta,
     ocean_tensor_handle_t contribution
@@ -236,18 +532,34 @@ static void ocean_autograd_accumulate(
         return;
     }
     if (!contribution) ocean_tensor_fail("null gradient contribution");
+    ocean_autograd_densify(meta);
+
+    /*
+     * Gradients are accumulated in place, so meta->grad must be a packed
+     * buffer no other handle can see.  A parked buffer from clear_grad() is
+     * refilled; otherwise the first contribution becomes the gradient, after
+     * a copy if it is a view sharing another Tensor's storage.
+     */
     if (!meta->grad) {
+        ocean_tensor_handle_t spare = meta->spare_grad;
+        if (spare && ocean_autograd_same_shape_meta(spare, meta)) {
+            ocean_tensor_copy_into(spare, contribution);
+            ocean_tensor_release(contribution);
+            meta->grad = spare;
+            meta->spare_grad = NULL;
+            return;
+        }
+        if (!ocean_tensor_owns_storage(contribution) ||
+            !ocean_tensor_is_contiguous(contribution)) {
+            ocean_tensor_handle_t owned = ocean_tensor_copy(contribution);
+            ocean_tensor_release(contribution);
+            contribution = owned;
+        }
         meta->grad = contribution;
         return;
     }
-    ocean_tensor_handle_t sum = ocean_tensor_binary(
-        meta->grad,
-        contribution,
-        OCEAN_AUTOGRAD_ADD
-    );
-    ocean_tensor_release(meta->grad);
+    ocean_tensor_binary_into(meta->grad, meta->grad, contribution, OCEAN_AUTOGRAD_ADD);
     ocean_tensor_release(contribution);
-    meta->grad = sum;
 }
 
 static ocean_tensor_handle_t ocean_autograd_sum_to_meta(
@@ -463,36 +775,7 @@ static ocean_tensor_handle_t ocean_autograd_relu_impl(
     ocean_tensor_handle_t tensor
 ) {
     ocean_autograd_require_float32(tensor);
-
-    char *device = ocean_tensor_device(tensor);
-    ocean_tensor_handle_t cpu = strcmp(device, "cpu") == 0
-        ? tensor
-        : ocean_tensor_to(tensor, "cpu");
-
-    size_t size = ocean_tensor_size(cpu);
-    float *data = size ? (float *)malloc(size * sizeof(float)) : NULL;
-    if (size && !data) {
-        if (cpu != tensor) ocean_tensor_release(cpu);
-        free(device);
-        ocean_tensor_fail("out of memory in ReLU");
-    }
-
-    for (size_t index = 0; index < size; ++index) {
-        float value = ocean_tensor_get_flat_f32(cpu, index);
-        data[index] = value > 0.0f ? value : 0.0f;
-    }
-
-    ocean_tensor_handle_t result = ocean_autograd_from_float_data_like(cpu, data);
-    if (strcmp(device, "cpu") != 0) {
-        ocean_tensor_handle_t moved = ocean_tensor_to(result, device);
-        ocean_tensor_release(result);
-        result = moved;
-    }
-
-    free(data);
-    free(device);
-    if (cpu != tensor) ocean_tensor_release(cpu);
-    return result;
+    return ocean_tensor_relu(tensor);
 }
 
 static ocean_tensor_handle_t ocean_autograd_relu_backward_impl(
@@ -554,15 +837,153 @@ static ocean_autograd_node *ocean_autograd_node_new(int operation) {
     return node;
 }
 
-static void ocean_autograd_attach(
+static void ocean_autograd_tape_record(
+    ocean_autograd_tape *tape,
+    ocean_autograd_meta *meta,
+    ocean_tensor_handle_t result,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t extra
+) {
+    if (strcmp(meta->device, "cpu") != 0) {
+        ocean_tensor_fail("tape capture supports CPU Tensors only");
+    }
+    if (tape->count == tape->capacity) {
+        size_t capacity = tape->capacity ? tape->capacity * 2 : 64;
+        ocean_autograd_tape_entry *grown = (ocean_autograd_tape_entry *)realloc(
+            tape->entries,
+            capacity * sizeof(*grown)
+        );
+        if (!grown) ocean_tensor_fail("out of memory recording autograd tape");
+        tape->entries = grown;
+        tape->capacity = capacity;
+    }
+    ocean_autograd_tape_entry *entry = &tape->entries[tape->count++];
+    entry->meta = meta;
+    entry->output = ocean_tensor_alias(result);
+    entry->left = ocean_tensor_alias(left);
+    entry->right = right ? ocean_tensor_alias(right) : NULL;
+    entry->extra = extra ? ocean_tensor_alias(extra) : NULL;
+    meta->captured = true;
+}
+
+static ocean_autograd_segment_operand ocean_autograd_segment_operand_for(
+    ocean_autograd_segment *segment,
+    ocean_tensor_handle_t tensor
+) {
+    ocean_autograd_segment_operand operand = {false, 0};
+    ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (meta && meta->segment_step) {
+        operand.index = meta->segment_step - 1;
+        return operand;
+    }
+
+    operand.external = true;
+    uint64_t identity = ocean_tensor_identity(tensor);
+    for (size_t index = 0; index < segment->external_count; ++index) {
+        if (segment->externals[index].identity == identity) {
+            operand.index = index;
+            return operand;
+        }
+    }
+    if (segment->external_count == segment->external_capacity) {
+        size_t capacity = segment->external_capacity ? segment->external_capacity * 2 : 16;
+        ocean_autograd_segment_external *grown = (ocean_autograd_segment_external *)realloc(
+            segment->externals,
+            capacity * sizeof(*grown)
+        );
+        if (!grown) ocean_tensor_fail("out of memory recording checkpoint");
+        segment->externals = grown;
+        segment->external_capacity = capacity;
+    }
+    ocean_autograd_segment_external *external =
+        &segment->externals[segment->external_count];
+    external->value = ocean_tensor_alias(tensor);
+    external->identity = identity;
+    external->meta = meta && meta->requires_grad ? meta : NULL;
+    operand.index = segment->external_count++;
+    return operand;
+}
+
+static void ocean_autograd_segment_record(
+    ocean_autograd_segment *segment,
+    ocean_autograd_meta *meta,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t extra
+) {
+    if (strcmp(meta->device, "cpu") != 0) {
+        ocean_tensor_fail("checkpointed segments support CPU Tensors only");
+    }
+    if (segment->step_count == segment->step_capacity) {
+        size_t capacity = segment->step_capacity ? segment->step_capacity * 2 : 32;
+        ocean_autograd_segment_step *grown = (ocean_autograd_segment_step *)realloc(
+            segment->steps,
+            capacity * sizeof(*grown)
+        );
+        if (!grown) ocean_tensor_fail("out of memory recording checkpoint");
+        segment->steps = grown;
+        segment->step_capacity = capacity;
+    }
+
+    const ocean_autograd_node *node = meta->grad_fn;
+    ocean_autograd_segment_step step = {0};
+    step.operation = node->operation;
+    step.scalar = node->scalar;
+    step.scalar_operation = node->scalar_operation;
+    step.dim0 = node->dim0;
+    step.dim1 = node->dim1;
+    step.keepdim = node->keepdim;
+    step.meta = meta;
+    if (node->axes_count) {
+        step.axes = (int *)malloc(node->axes_count * sizeof(int));
+        if (!step.axes) ocean_tensor_fail("out of memory recording checkpoint");
+        memcpy(step.axes, node->axes, node->axes_count * sizeof(int));
+        step.axes_count = node->axes_count;
+    }
+    if (node->operation == OCEAN_AUTOGRAD_RESHAPE) {
+        step.shape = ocean_autograd_shape_copy(meta->tensor, &step.ndim);
+    }
+    step.left = ocean_autograd_segment_operand_for(segment, left);
+    step.binary = right != NULL;
+    if (right) step.right = ocean_autograd_segment_operand_for(segment, right);
+    step.ternary = extra != NULL;
+    if (extra) step.extra = ocean_autograd_segment_operand_for(segment, extra);
+
+    segment->steps[segment->step_count++] = step;
+    meta->segment_step = segment->step_count;
+}
+
+/* `left`, `right` and `extra` are the operation's Tensor inputs (right and
+   extra may be NULL); a capturing tape keeps aliases of them to recompute
+   `result` on replay. */
+static void ocean_autograd_attach_ternary(
     ocean_tensor_handle_t result,
-    ocean_autograd_node *node
+    ocean_autograd_node *node,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t extra
 ) {
     ocean_autograd_meta *meta = ocean_autograd_get(result, true);
     meta->requires_grad = true;
     meta->leaf = false;
     ocean_autograd_node_free(meta->grad_fn);
     meta->grad_fn = node;
+    if (ocean_autograd_capturing) {
+        ocean_autograd_tape_record(ocean_autograd_capturing, meta, result, left, right, extra);
+    }
+    if (ocean_autograd_checkpointing) {
+        ocean_autograd_segment_record(ocean_autograd_checkpointing, meta, left, right, extra);
+    }
+}
+
+static void ocean_autograd_attach(
+    ocean_tensor_handle_t result,
+    ocean_autograd_node *node,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+) {
+    ocean_autograd_attach_ternary(result, node, left, right, NULL);
 }
 
 void ocean_autograd_set_requires_grad(
@@ -575,8 +996,12 @@ void ocean_autograd_set_requires_grad(
 
     if (!value) {
         ocean_tensor_release(meta->grad);
+        ocean_tensor_release(meta->spare_grad);
         meta->grad = NULL;
+        meta->spare_grad = NULL;
         meta->requires_grad = false;
+        meta->sparse_grad = false;
+        ocean_autograd_sparse_free(meta);
         return;
     }
 
@@ -592,24 +1017,125 @@ bool ocean_autograd_requires_grad(ocean_tensor_handle_t tensor) {
 
 bool ocean_autograd_has_grad(ocean_tensor_handle_t tensor) {
     ocean_autograd_meta *meta = ocean_autograd_find(tensor);
-    return meta && meta->grad != NULL;
+    return meta && (meta->grad != NULL || meta->sparse_count > 0);
 }
 
+/* A row-sparse gradient is returned as the dense Tensor it stands for. */
 ocean_tensor_handle_t ocean_autograd_grad_copy(
     ocean_tensor_handle_t tensor
 ) {
     ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (meta && !meta->grad && meta->sparse_count) {
+        ocean_tensor_handle_t dense = ocean_autograd_zeros_meta(meta);
+        ocean_tensor_scatter_add_rows(
+            dense, meta->sparse_rows, meta->sparse_values, meta->sparse_count
+        );
+        return dense;
+    }
     if (!meta || !meta->grad) {
         ocean_tensor_fail("Tensor has no gradient");
     }
     return ocean_tensor_copy(meta->grad);
 }
 
+void ocean_autograd_set_sparse_grad(ocean_tensor_handle_t tensor, bool enabled) {
+    ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (!meta || !meta->requires_grad || !meta->leaf) {
+        ocean_tensor_fail("sparse gradients need a leaf Tensor that requires grad");
+    }
+    if (!enabled) {
+        ocean_autograd_densify(meta);
+        ocean_autograd_sparse_free(meta);
+        meta->sparse_grad = false;
+        return;
+    }
+    if (meta->ndim != 2 || strcmp(meta->device, "cpu") != 0) {
+        ocean_tensor_fail("sparse gradients need a CPU [rows, dim] Tensor");
+    }
+    meta->sparse_grad = true;
+}
+
+static ocean_autograd_meta *ocean_autograd_find_sparse(ocean_tensor_handle_t tensor) {
+    ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (!meta || !meta->sparse_grad || meta->grad) {
+        ocean_tensor_fail("Tensor has no sparse gradient");
+    }
+    return meta;
+}
+
+ocean_tensor_handle_t ocean_autograd_sparse_grad_rows(ocean_tensor_handle_t tensor) {
+    ocean_autograd_meta *meta = ocean_autograd_find_sparse(tensor);
+    size_t shape[1] = {meta->sparse_count};
+    ocean_tensor_handle_t rows = ocean_tensor_zeros_nd(shape, 1, "int64", "cpu");
+    if (meta->sparse_count) {
+        ocean_tensor_copy_range(rows, 0, meta->sparse_rows, 0, meta->sparse_count);
+    }
+    return rows;
+}
+
+ocean_tensor_handle_t ocean_autograd_sparse_grad_values(ocean_tensor_handle_t tensor) {
+    ocean_autograd_meta *meta = ocean_autograd_find_sparse(tensor);
+    size_t shape[2] = {meta->sparse_count, meta->shape[1]};
+    ocean_tensor_handle_t values = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    if (meta->sparse_count) {
+        ocean_tensor_copy_range(
+            values, 0, meta->sparse_values, 0, meta->sparse_count * meta->shape[1]
+        );
+    }
+    return values;
+}
+
+static void ocean_autograd_park_grad(ocean_autograd_meta *meta) {
+    ocean_autograd_sparse_reset(meta);
+    if (!meta->grad) return;
+    ocean_tensor_release(meta->spare_grad);
+    meta->spare_grad = meta->grad;
+    meta->grad = NULL;
+}
+
+/* The gradient buffer outlives each step: zero_grad() clears it in place
+   and clear_grad() parks it, so backward() reallocates neither.  A
+   row-sparse gradient is emptied instead, and a dense one is parked so the
+   next backward() can go back to rows. */
 void ocean_autograd_zero_grad(ocean_tensor_handle_t tensor) {
     ocean_autograd_meta *meta = ocean_autograd_find(tensor);
     if (!meta) return;
-    ocean_tensor_release(meta->grad);
-    meta->grad = NULL;
+    if (meta->sparse_grad) {
+        ocean_autograd_park_grad(meta);
+        return;
+    }
+    if (!meta->grad) return;
+    ocean_tensor_fill(meta->grad, 0.0);
+}
+
+void ocean_autograd_clear_grad(ocean_tensor_handle_t tensor) {
+    ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (meta) ocean_autograd_park_grad(meta);
+}
+
+/* In-place and out= writes are not recorded on the tape.  Rejecting any
+   destination autograd tracks keeps recorded graphs and gradients
+   consistent; inputs saved for backward are copies and stay valid. */
+void ocean_autograd_check_inplace(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("in-place operation on null Tensor");
+    ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+    if (meta && (meta->requires_grad || meta->grad_fn)) {
+        ocean_tensor_fail(
+            "in-place operation on a Tensor that requires grad; "
+            "disable grad with Tensor.set_grad_enabled(false) first"
+        );
+    }
+}
+
+void ocean_autograd_check_out(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+) {
+    ocean_autograd_check_inplace(out);
+    if (ocean_autograd_requires_grad(left) || ocean_autograd_requires_grad(right)) {
+        ocean_tensor_fail("out= operations do not support autograd inputs");
+    }
 }
 
 ocean_tensor_handle_t ocean_autograd_binary(
@@ -634,12 +1160,12 @@ ocean_tensor_handle_t ocean_autograd_binary(
     node->right = right_grad ? right_meta : NULL;
 
     if (operation == OCEAN_AUTOGRAD_MUL || operation == OCEAN_AUTOGRAD_DIV) {
-        node->saved_left = ocean_tensor_copy(left);
-        node->saved_right = ocean_tensor_copy(right);
+        node->saved_left = ocean_autograd_save(left);
+        node->saved_right = ocean_autograd_save(right);
     }
 
 
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, left, right);
 
     return result;
 }
@@ -658,7 +1184,7 @@ ocean_tensor_handle_t ocean_autograd_scalar(
     node->left = parent;
     node->scalar = scalar;
     node->scalar_operation = operation;
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -679,9 +1205,9 @@ ocean_tensor_handle_t ocean_autograd_matmul(
     ocean_autograd_node *node = ocean_autograd_node_new(OCEAN_AUTOGRAD_MATMUL);
     node->left = left_grad ? left_meta : NULL;
     node->right = right_grad ? right_meta : NULL;
-    node->saved_left = ocean_tensor_copy(left);
-    node->saved_right = ocean_tensor_copy(right);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(left);
+    node->saved_right = ocean_autograd_save(right);
+    ocean_autograd_attach(result, node, left, right);
     return result;
 }
 
@@ -697,16 +1223,15 @@ ocean_tensor_handle_t ocean_autograd_relu(
 
     ocean_autograd_node *node = ocean_autograd_node_new(OCEAN_AUTOGRAD_RELU);
     node->left = parent;
-    node->saved_left = ocean_tensor_copy(tensor);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(tensor);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
-ocean_tensor_handle_t ocean_autograd_mse_loss(
+static ocean_tensor_handle_t ocean_autograd_mse_forward(
     ocean_tensor_handle_t prediction,
     ocean_tensor_handle_t target
 ) {
-
     ocean_autograd_require_float32(prediction);
     ocean_autograd_require_float32(target);
 
@@ -741,7 +1266,14 @@ ocean_tensor_handle_t ocean_autograd_mse_loss(
     free(device);
     ocean_tensor_release(difference);
     ocean_tensor_release(squared);
+    return result;
+}
 
+ocean_tensor_handle_t ocean_autograd_mse_loss(
+    ocean_tensor_handle_t prediction,
+    ocean_tensor_handle_t target
+) {
+    ocean_tensor_handle_t result = ocean_autograd_mse_forward(prediction, target);
 
     ocean_autograd_meta *prediction_meta = ocean_autograd_find(prediction);
     ocean_autograd_meta *target_meta = ocean_autograd_find(target);
@@ -758,12 +1290,12 @@ ocean_tensor_handle_t ocean_autograd_mse_loss(
     node->left = prediction_grad ? prediction_meta : NULL;
     node->right = target_grad ? target_meta : NULL;
 
-    node->saved_left = ocean_tensor_copy(prediction);
+    node->saved_left = ocean_autograd_save(prediction);
 
 
-    node->saved_right = ocean_tensor_copy(target);
+    node->saved_right = ocean_autograd_save(target);
 
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, prediction, target);
     return result;
 }
 
@@ -811,25 +1343,25 @@ ocean_tensor_handle_t ocean_autograd_reshape(
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_RESHAPE);
     node->left = parent;
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
 ocean_tensor_handle_t ocean_autograd_reshape_3d(ocean_tensor_handle_t tensor,int d0,int d1,int d2){
     ocean_tensor_handle_t out=ocean_tensor_reshape_3d(tensor,d0,d1,d2); ocean_autograd_meta *p=ocean_autograd_find(tensor); if(!p||!p->requires_grad)return out;
-    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_RESHAPE);n->left=p;ocean_autograd_attach(out,n);return out;
+    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_RESHAPE);n->left=p;ocean_autograd_attach(out,n,tensor,NULL);return out;
 }
 ocean_tensor_handle_t ocean_autograd_reshape_4d(ocean_tensor_handle_t tensor,int d0,int d1,int d2,int d3){
     ocean_tensor_handle_t out=ocean_tensor_reshape_4d(tensor,d0,d1,d2,d3); ocean_autograd_meta *p=ocean_autograd_find(tensor); if(!p||!p->requires_grad)return out;
-    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_RESHAPE);n->left=p;ocean_autograd_attach(out,n);return out;
+    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_RESHAPE);n->left=p;ocean_autograd_attach(out,n,tensor,NULL);return out;
 }
 ocean_tensor_handle_t ocean_autograd_transpose_dims(ocean_tensor_handle_t tensor,int dim0,int dim1){
     ocean_tensor_handle_t out=ocean_tensor_transpose_dims(tensor,dim0,dim1); ocean_autograd_meta *p=ocean_autograd_find(tensor); if(!p||!p->requires_grad)return out;
-    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_TRANSPOSE_DIMS);n->left=p;n->dim0=dim0;n->dim1=dim1;ocean_autograd_attach(out,n);return out;
+    ocean_autograd_node *n=ocean_autograd_node_new(OCEAN_AUTOGRAD_TRANSPOSE_DIMS);n->left=p;n->dim0=dim0;n->dim1=dim1;ocean_autograd_attach(out,n,tensor,NULL);return out;
 }
 static ocean_tensor_handle_t ocean_autograd_reduce_dim_v02(ocean_tensor_handle_t tensor,int dim,bool keepdim,bool mean){
     ocean_tensor_handle_t out=mean?ocean_tensor_mean_dim(tensor,dim,keepdim):ocean_tensor_sum_dim(tensor,dim,keepdim); ocean_autograd_meta *p=ocean_autograd_find(tensor); if(!p||!p->requires_grad)return out;
-    ocean_autograd_node *n=ocean_autograd_node_new(mean?OCEAN_AUTOGRAD_MEAN_DIM:OCEAN_AUTOGRAD_SUM_DIM);n->left=p;n->dim0=dim;n->keepdim=keepdim;ocean_autograd_attach(out,n);return out;
+    ocean_autograd_node *n=ocean_autograd_node_new(mean?OCEAN_AUTOGRAD_MEAN_DIM:OCEAN_AUTOGRAD_SUM_DIM);n->left=p;n->dim0=dim;n->keepdim=keepdim;ocean_autograd_attach(out,n,tensor,NULL);return out;
 }
 ocean_tensor_handle_t ocean_autograd_sum_dim(ocean_tensor_handle_t tensor,int dim,bool keepdim){return ocean_autograd_reduce_dim_v02(tensor,dim,keepdim,false);}
 ocean_tensor_handle_t ocean_autograd_mean_dim(ocean_tensor_handle_t tensor,int dim,bool keepdim){return ocean_autograd_reduce_dim_v02(tensor,dim,keepdim,true);}
@@ -859,80 +1391,19 @@ static ocean_tensor_handle_t ocean_autograd_unary_cpu_v03(
 ) {
     ocean_autograd_require_float32(tensor);
 
-    char *device = ocean_tensor_device(tensor);
-    ocean_tensor_handle_t cpu = strcmp(device, "cpu") == 0
-        ? tensor
-        : ocean_tensor_to(tensor, "cpu");
-
-    size_t size = ocean_tensor_size(cpu);
-    float *data = size ? (float *)malloc(size * sizeof(float)) : NULL;
-    if (size && !data) {
-        if (cpu != tensor) ocean_tensor_release(cpu);
-        free(device);
-        ocean_tensor_fail("out of memory in Tensor unary operation");
-    }
-
-    for (size_t index = 0; index < size; ++index) {
-        float value = ocean_tensor_get_flat_f32(cpu, index);
-        float result = 0.0f;
-
-        switch (operation) {
-            case OCEAN_AUTOGRAD_EXP:
-                result = expf(value);
-                break;
-            case OCEAN_AUTOGRAD_LOG:
-                if (!(value > 0.0f)) {
-                    free(data);
-                    if (cpu != tensor) ocean_tensor_release(cpu);
-                    free(device);
-                    ocean_tensor_fail("Tensor.log requires values > 0");
-                }
-                result = logf(value);
-                break;
-            case OCEAN_AUTOGRAD_SQRT:
-                if (value < 0.0f) {
-                    free(data);
-                    if (cpu != tensor) ocean_tensor_release(cpu);
-                    free(device);
-                    ocean_tensor_fail("Tensor.sqrt requires values >= 0");
-                }
-                result = sqrtf(value);
-                break;
-            case OCEAN_AUTOGRAD_POW:
-                result = powf(value, (float)scalar);
-                break;
-            case OCEAN_AUTOGRAD_GELU: {
-                const float coefficient = 0.7978845608028654f;
-                const float cubic = 0.044715f;
-                float value_squared = value * value;
-                float argument = coefficient * (
-                    value + cubic * value * value_squared
-                );
-                result = 0.5f * value * (1.0f + tanhf(argument));
-                break;
-            }
-            default:
-                free(data);
-                if (cpu != tensor) ocean_tensor_release(cpu);
-                free(device);
-                ocean_tensor_fail("invalid Tensor unary operation");
-        }
-        data[index] = result;
-    }
-
-    ocean_tensor_handle_t result =
-        ocean_autograd_from_float_data_like(cpu, data);
-
-    if (strcmp(device, "cpu") != 0) {
-        ocean_tensor_handle_t moved = ocean_tensor_to(result, device);
-        ocean_tensor_release(result);
-        result = moved;
+    switch (operation) {
+        case OCEAN_AUTOGRAD_EXP:
+            return ocean_tensor_unary(tensor, OCEAN_TENSOR_UNARY_EXP, 0.0);
+        case OCEAN_AUTOGRAD_LOG:
+            return ocean_tensor_unary(tensor, OCEAN_TENSOR_UNARY_LOG, 0.0);
+        case OCEAN_AUTOGRAD_SQRT:
+            return ocean_tensor_unary(tensor, OCEAN_TENSOR_UNARY_SQRT, 0.0);
+        case OCEAN_AUTOGRAD_POW:
+            return ocean_tensor_unary(tensor, OCEAN_TENSOR_UNARY_POW, scalar);
+        case OCEAN_AUTOGRAD_GELU:
+            return ocean_tensor_gelu(tensor);
     }
-
-    free(data);
-    if (cpu != tensor) ocean_tensor_release(cpu);
-    free(device);
-    return result;
+    ocean_tensor_fail("invalid Tensor unary operation");
 }
 
 static ocean_tensor_handle_t ocean_autograd_softmax_impl_v03(
@@ -1341,8 +1812,8 @@ ocean_tensor_handle_t ocean_autograd_exp(ocean_tensor_handle_t tensor) {
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_EXP);
     node->left = parent;
-    node->saved_left = ocean_tensor_copy(result);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(result);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1356,8 +1827,8 @@ ocean_tensor_handle_t ocean_autograd_log(ocean_tensor_handle_t tensor) {
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_LOG);
     node->left = parent;
-    node->saved_left = ocean_tensor_copy(tensor);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(tensor);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1371,8 +1842,8 @@ ocean_tensor_handle_t ocean_autograd_sqrt(ocean_tensor_handle_t tensor) {
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_SQRT);
     node->left = parent;
-    node->saved_left = ocean_tensor_copy(result);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(result);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1390,8 +1861,8 @@ ocean_tensor_handle_t ocean_autograd_pow(
         ocean_autograd_node_new(OCEAN_AUTOGRAD_POW);
     node->left = parent;
     node->scalar = exponent;
-    node->saved_left = ocean_tensor_copy(tensor);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(tensor);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1404,8 +1875,8 @@ ocean_tensor_handle_t ocean_autograd_gelu(ocean_tensor_handle_t tensor) {
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_GELU);
     node->left = parent;
-    node->saved_left = ocean_tensor_copy(tensor);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(tensor);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1423,8 +1894,8 @@ ocean_tensor_handle_t ocean_autograd_softmax(
         ocean_autograd_node_new(OCEAN_AUTOGRAD_SOFTMAX);
     node->left = parent;
     node->dim0 = dim;
-    node->saved_left = ocean_tensor_copy(result);
-    ocean_autograd_attach(result, node);
+    node->saved_left = ocean_autograd_save(result);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1451,9 +1922,9 @@ ocean_tensor_handle_t ocean_autograd_layer_norm(
      * destroyed before backward(), so parent->tensor is not a safe
      * lifetime anchor.  Keep an owned runtime copy on the grad node.
      */
-    node->saved_left = ocean_tensor_copy(tensor);
+    node->saved_left = ocean_autograd_save(tensor);
 
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1527,7 +1998,7 @@ ocean_tensor_handle_t ocean_autograd_permute(
     }
 
     free(seen);
-    ocean_autograd_attach(result, node);
+    ocean_autograd_attach(result, node, tensor, NULL);
     return result;
 }
 
@@ -1542,18 +2013,6 @@ static void ocean_autograd_require_int64_v04(
     if (!valid) ocean_tensor_fail(message);
 }
 
-static void ocean_autograd_contiguous_strides_v04(
-    const size_t *shape,
-    size_t ndim,
-    size_t *strides
-) {
-    if (!ndim) return;
-    strides[ndim - 1] = 1;
-    for (size_t i = ndim - 1; i > 0; --i) {
-        strides[i - 1] = strides[i] * shape[i];
-    }
-}
-
 static ocean_tensor_handle_t ocean_autograd_embedding_forward_v04(
     ocean_tensor_handle_t weight,
     ocean_tensor_handle_t indices
@@ -1577,15 +2036,18 @@ ocean_tensor_handle_t ocean_autograd_embedding(
     ocean_autograd_node *node =
         ocean_autograd_node_new(OCEAN_AUTOGRAD_EMBEDDING);
     node->left = weight_meta;
-    node->saved_right = ocean_tensor_copy(indices);
-    ocean_autograd_attach(result, node);
+    node->saved_right = ocean_autograd_save(indices);
+    ocean_autograd_attach(result, node, weight, indices);
     return result;
 }
 
+/* statistics_out receives what backward needs besides the logits: the
+   probabilities on GPU, the per-row log-normalizers of the fused kernel on
+   CPU. */
 static ocean_tensor_handle_t ocean_autograd_cross_entropy_forward_v04(
     ocean_tensor_handle_t logits,
     ocean_tensor_handle_t targets,
-    ocean_tensor_handle_t *probabilities_out
+    ocean_tensor_handle_t *statistics_out
 ) {
     ocean_autograd_require_float32(logits);
     ocean_autograd_require_int64_v04(
@@ -1629,154 +2091,20 @@ static ocean_tensor_handle_t ocean_autograd_cross_entropy_forward_v04(
         return ocean_tensor_cross_entropy_forward(
             logits,
             targets,
-            probabilities_out
+            statistics_out
         );
     }
     free(requested_device);
 
-    char *device = ocean_tensor_device(logits);
-    ocean_tensor_handle_t lc = strcmp(device, "cpu") == 0
-        ? logits
-        : ocean_tensor_to(logits, "cpu");
-
     char *target_device = ocean_tensor_device(targets);
     ocean_tensor_handle_t tc = strcmp(target_device, "cpu") == 0
         ? targets
         : ocean_tensor_to(targets, "cpu");
+    free(target_device);
 
-    size_t total = ocean_tensor_size(lc);
-    float *probabilities =
-        (float *)malloc(total * sizeof(float));
-    if (!probabilities) {
-        if (lc != logits) ocean_tensor_release(lc);
-        if (tc != targets) ocean_tensor_release(tc);
-        free(device);
-        free(target_device);
-        ocean_tensor_fail(
-            "out of memory in CrossEntropyLoss forward"
-        );
-    }
-
-    double total_loss = 0.0;
-
-    for (size_t example = 0; example < examples; ++example) {
-        size_t base = example * vocab;
-        float maximum = -INFINITY;
-
-        for (size_t cls = 0; cls < vocab; ++cls) {
-            float value =
-                ocean_tensor_get_flat_f32(lc, base + cls);
-            if (value > maximum) maximum = value;
-        }
-
-        double denominator = 0.0;
-        for (size_t cls = 0; cls < vocab; ++cls) {
-            float value =
-                ocean_tensor_get_flat_f32(lc, base + cls);
-            float exponential = expf(value - maximum);
-            probabilities[base + cls] = exponential;
-            denominator += (double)exponential;
-        }
-
-        int64_t target =
-            ocean_tensor_get_flat_i64(tc, example);
-        if (target < 0 || (uint64_t)target >= (uint64_t)vocab) {
-            free(probabilities);
-            if (lc != logits) ocean_tensor_release(lc);
-            if (tc != targets) ocean_tensor_release(tc);
-            free(device);
-            free(target_device);
-            ocean_tensor_fail(
-                "CrossEntropyLoss target is out of range"
-            );
-        }
-
-        float target_logit =
-            ocean_tensor_get_flat_f32(
-                lc,
-                base + (size_t)target
-            );
-        total_loss +=
-            log(denominator)
-            + (double)maximum
-            - (double)target_logit;
-
-        for (size_t cls = 0; cls < vocab; ++cls) {
-            probabilities[base + cls] =
-                (float)(
-                    (double)probabilities[base + cls]
-                    / denominator
-                );
-        }
-    }
-
-    size_t rank = (size_t)logits_rank;
-    size_t *shape = (size_t *)malloc(rank * sizeof(size_t));
-    size_t *strides = (size_t *)malloc(rank * sizeof(size_t));
-
-    if (!shape || !strides) {
-        free(shape);
-        free(strides);
-        free(probabilities);
-        if (lc != logits) ocean_tensor_release(lc);
-        if (tc != targets) ocean_tensor_release(tc);
-        free(device);
-        free(target_device);
-        ocean_tensor_fail(
-            "out of memory storing CrossEntropyLoss probabilities"
-        );
-    }
-
-    for (size_t axis = 0; axis < rank; ++axis) {
-        shape[axis] =
-            (size_t)ocean_tensor_shape(lc, (int)axis);
-    }
-    ocean_autograd_contiguous_strides_v04(
-        shape,
-        rank,
-        strides
-    );
-
-    ocean_tensor_handle_t probabilities_cpu =
-        ocean_tensor_from_cpu_strided(
-            probabilities,
-            shape,
-            strides,
-            rank,
-            "float32",
-            "cpu"
-        );
-    ocean_tensor_handle_t probabilities_result =
-        probabilities_cpu;
-
-    if (strcmp(device, "cpu") != 0) {
-        probabilities_result =
-            ocean_tensor_to(probabilities_cpu, device);
-        ocean_tensor_release(probabilities_cpu);
-    }
-
-    ocean_tensor_handle_t loss_cpu =
-        ocean_tensor_zeros(1, 1, "cpu");
-    ocean_tensor_fill(
-        loss_cpu,
-        total_loss / (double)examples
-    );
-    ocean_tensor_handle_t loss = loss_cpu;
-
-    if (strcmp(device, "cpu") != 0) {
-        loss = ocean_tensor_to(loss_cpu, device);
-        ocean_tensor_release(loss_cpu);
-    }
-
-    *probabilities_out = probabilities_result;
-
-    free(shape);
-    free(strides);
-    free(probabilities);
-    if (lc != logits) ocean_tensor_release(lc);
+    ocean_tensor_handle_t loss =
+        ocean_tensor_cross_entropy_fused(logits, tc, statistics_out);
     if (tc != targets) ocean_tensor_release(tc);
-    free(device);
-    free(target_device);
     return loss;
 }
 
@@ -1784,19 +2112,19 @@ ocean_tensor_handle_t ocean_autograd_cross_entropy(
     ocean_tensor_handle_t logits,
     ocean_tensor_handle_t targets
 ) {
-    ocean_tensor_handle_t probabilities = NULL;
+    ocean_tensor_handle_t statistics = NULL;
     ocean_tensor_handle_t result =
         ocean_autograd_cross_entropy_forward_v04(
             logits,
             targets,
-            &probabilities
+            &statistics
         );
 
     ocean_autograd_meta *logits_meta =
         ocean_autograd_find(logits);
 
     if (!logits_meta || !logits_meta->requires_grad) {
-        ocean_tensor_release(probabilities);
+        ocean_tensor_release(statistics);
         return result;
     }
 
@@ -1805,33 +2133,89 @@ ocean_tensor_handle_t ocean_autograd_cross_entropy(
             OCEAN_AUTOGRAD_CROSS_ENTROPY
         );
     node->left = logits_meta;
-    node->saved_left = probabilities;
-    node->saved_right = ocean_tensor_copy(targets);
-    ocean_autograd_attach(result, node);
+    char *device = ocean_tensor_device(logits);
+    bool on_cpu = strcmp(device, "cpu") == 0;
+    free(device);
+    if (ocean_autograd_checkpointing) {
+        ocean_tensor_release(statistics);
+    } else if (!on_cpu) {
+        node->saved_left = statistics;
+    } else {
+        /* Backward recomputes the probabilities from the logits. */
+        node->saved_left = ocean_autograd_save(logits);
+        node->saved_statistics = statistics;
+    }
+    node->saved_right = ocean_autograd_save(targets);
+    ocean_autograd_attach(result, node, logits, targets);
     return result;
 }
 
+ocean_tensor_handle_t ocean_autograd_scaled_dot_product_attention(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal
+) {
+    ocean_tensor_handle_t statistics = NULL;
+    ocean_tensor_handle_t result = ocean_tensor_scaled_dot_product_attention_forward(
+        q, k, v, causal, &statistics
+    );
+
+    ocean_autograd_meta *q_meta = ocean_autograd_find(q);
+    ocean_autograd_meta *k_meta = ocean_autograd_find(k);
+    ocean_autograd_meta *v_meta = ocean_autograd_find(v);
+    bool q_grad = q_meta && q_meta->requires_grad;
+    bool k_grad = k_meta && k_meta->requires_grad;
+    bool v_grad = v_meta && v_meta->requires_grad;
+
+    if (!q_grad && !k_grad && !v_grad) {
+        ocean_tensor_release(statistics);
+        return result;
+    }
+
+    ocean_autograd_node *node = ocean_autograd_node_new(OCEAN_AUTOGRAD_ATTENTION);
+    node->left = q_grad ? q_meta : NULL;
+    node->right = k_grad ? k_meta : NULL;
+    node->extra = v_grad ? v_meta : NULL;
+    node->dim0 = causal ? 1 : 0;
+    node->saved_left = ocean_autograd_save(q);
+    node->saved_right = ocean_autograd_save(k);
+    node->saved_extra = ocean_autograd_save(v);
+    node->saved_output = ocean_autograd_save(result);
+    if (ocean_autograd_checkpointing) {
+        ocean_tensor_release(statistics);
+    } else {
+        node->saved_statistics = statistics;
+    }
+    ocean_autograd_attach_ternary(result, node, q, k, v);
+    return result;
+}
+
+typedef struct ocean_autograd_topology_frame {
+    ocean_autograd_meta *meta;
+    bool expanded;
+} ocean_autograd_topology_frame;
+
 typedef struct ocean_autograd_topology {
     ocean_autograd_meta **items;
     size_t count;
     size_t capacity;
+    ocean_autograd_topology_frame *stack;
+    size_t depth;
+    size_t stack_capacity;
 } ocean_autograd_topology;
 
-static bool ocean_autograd_topology_contains(
-    const ocean_autograd_topology *topology,
-    const ocean_autograd_meta *meta
-) {
-    for (size_t index = 0; index < topology->count; ++index) {
-        if (topology->items[index] == meta) return true;
-    }
-    return false;
-}
+/*
+ * Each traversal takes a fresh generation, so marking a node visited is a
+ * single store and the marks never need clearing between backward() calls.
+ */
+static _Thread_local uint64_t ocean_autograd_generation = 0;
+static _Thread_local size_t ocean_autograd_backward_peak = 0;
 
 static void ocean_autograd_topology_push(
     ocean_autograd_topology *topology,
     ocean_autograd_meta *meta
 ) {
-    if (ocean_autograd_topology_contains(topology, meta)) return;
     if (topology->count == topology->capacity) {
         size_t capacity = topology->capacity ? topology->capacity * 2 : 16;
         ocean_autograd_meta **grown = (ocean_autograd_meta **)realloc(
@@ -1845,20 +2229,77 @@ static void ocean_autograd_topology_push(
     topology->items[topology->count++] = meta;
 }
 
-static void ocean_autograd_topology_visit(
+static void ocean_autograd_topology_stack_push(
     ocean_autograd_topology *topology,
-    ocean_autograd_meta *meta
+    ocean_autograd_meta *meta,
+    bool expanded
 ) {
-    if (!meta || ocean_autograd_topology_contains(topology, meta)) return;
+    if (topology->depth == topology->stack_capacity) {
+        size_t capacity = topology->stack_capacity ? topology->stack_capacity * 2 : 16;
+        ocean_autograd_topology_frame *grown = (ocean_autograd_topology_frame *)realloc(
+            topology->stack,
+            capacity * sizeof(*grown)
+        );
+        if (!grown) ocean_tensor_fail("out of memory building autograd graph");
+        topology->stack = grown;
+        topology->stack_capacity = capacity;
+    }
+    topology->stack[topology->depth].meta = meta;
+    topology->stack[topology->depth].expanded = expanded;
+    ++topology->depth;
+}
 
-    ocean_autograd_node *node = meta->grad_fn;
-    if (node) {
-        ocean_autograd_topology_visit(topology, node->left);
-        ocean_autograd_topology_visit(topology, node->right);
+/* Post-order depth-first walk: every input precedes the entries using it. */
+static void ocean_autograd_topology_visit(
+    ocean_autograd_topology *topology,
+    ocean_autograd_meta *root
+) {
+    uint64_t generation = ++ocean_autograd_generation;
+    ocean_autograd_topology_stack_push(topology, root, false);
+
+    while (topology->depth > 0) {
+        ocean_autograd_topology_frame frame = topology->stack[--topology->depth];
+        ocean_autograd_meta *meta = frame.meta;
+        if (frame.expanded) {
+            ocean_autograd_topology_push(topology, meta);
+            continue;
+        }
+        if (meta->visit_generation == generation) continue;
+        meta->visit_generation = generation;
+
+        ocean_autograd_topology_stack_push(topology, meta, true);
+        ocean_autograd_node *node = meta->grad_fn;
+        if (!node) continue;
+        /* Pushed right first so the left input is walked first. */
+        if (node->extra && node->extra->visit_generation != generation) {
+            ocean_autograd_topology_stack_push(topology, node->extra, false);
+        }
+        if (node->right && node->right->visit_generation != generation) {
+            ocean_autograd_topology_stack_push(topology, node->right, false);
+        }
+        if (node->left && node->left->visit_generation != generation) {
+            ocean_autograd_topology_stack_push(topology, node->left, false);
+        }
+        if (node->segment) {
+            for (size_t index = node->segment->external_count; index-- > 0;) {
+                ocean_autograd_meta *input = node->segment->externals[index].meta;
+                if (input && input->visit_generation != generation) {
+                    ocean_autograd_topology_stack_push(topology, input, false);
+                }
+            }
+        }
     }
-    ocean_autograd_topology_push(topology, meta);
 }
 
+static void ocean_autograd_run_backward(
+    ocean_autograd_meta *output,
+    ocean_autograd_tape *tape
+);
+static void ocean_autograd_checkpoint_backward(
+    ocean_autograd_node *node,
+    ocean_tensor_handle_t upstream
+);
+
 static void ocean_autograd_backward_node(ocean_autograd_meta *meta) {
     ocean_autograd_node *node = meta->grad_fn;
     ocean_tensor_handle_t upstream = meta->grad;
@@ -2011,7 +2452,8 @@ static void ocean_autograd_backward_node(ocean_autograd_meta *meta) {
         case OCEAN_AUTOGRAD_TRANSPOSE: { if(node->left)ocean_autograd_accumulate(node->left,ocean_tensor_transpose_dims(upstream,0,1)); break; }
         case OCEAN_AUTOGRAD_TRANSPOSE_DIMS: { if(node->left)ocean_autograd_accumulate(node->left,ocean_tensor_transpose_dims(upstream,node->dim0,node->dim1)); break; }
         case OCEAN_AUTOGRAD_EMBEDDING: {
-            if (node->left) {
+            if (node->left &&
+                !ocean_autograd_accumulate_rows(node->left, upstream, node->saved_right)) {
                 size_t vocab = node->left->shape[0];
                 size_t dim = node->left->shape[1];
                 ocean_tensor_handle_t contribution =
@@ -2031,158 +2473,20 @@ static void ocean_autograd_backward_node(ocean_autograd_meta *meta) {
 
         case OCEAN_AUTOGRAD_CROSS_ENTROPY: {
             if (node->left) {
-                ocean_tensor_handle_t probabilities =
-                    node->saved_left;
-                ocean_tensor_handle_t targets =
-                    node->saved_right;
-
-                char *probabilities_device =
-                    ocean_tensor_device(probabilities);
-                if (strcmp(probabilities_device, "cpu") != 0) {
-                    ocean_tensor_handle_t contribution =
-                        ocean_tensor_cross_entropy_backward(
-                            upstream,
-                            probabilities,
-                            targets
-                        );
-                    free(probabilities_device);
-                    ocean_autograd_accumulate(
-                        node->left,
-                        contribution
-                    );
-                    break;
-                }
-                free(probabilities_device);
-
-                int rank = ocean_tensor_ndim(probabilities);
-                size_t vocab =
-                    (size_t)ocean_tensor_shape(
-                        probabilities,
-                        rank - 1
-                    );
-                size_t examples =
-                    ocean_tensor_size(targets);
-                size_t total =
-                    ocean_tensor_size(probabilities);
-
-                char *device =
-                    ocean_tensor_device(probabilities);
-                ocean_tensor_handle_t pc =
-                    strcmp(device, "cpu") == 0
-                    ? probabilities
-                    : ocean_tensor_to(
-                        probabilities,
-                        "cpu"
-                    );
-
-                char *target_device =
-                    ocean_tensor_device(targets);
-                ocean_tensor_handle_t tc =
-                    strcmp(target_device, "cpu") == 0
-                    ? targets
-                    : ocean_tensor_to(targets, "cpu");
-
-                float *data = total
-                    ? (float *)malloc(
-                        total * sizeof(float)
+                /* CPU nodes keep the logits and their log-normalizers;
+                   GPU nodes keep the probabilities. */
+                ocean_tensor_handle_t contribution = node->saved_statistics
+                    ? ocean_tensor_cross_entropy_fused_backward(
+                        upstream,
+                        node->saved_left,
+                        node->saved_right,
+                        node->saved_statistics
                     )
-                    : NULL;
-                size_t *shape = (size_t *)malloc(
-                    (size_t)rank * sizeof(size_t)
-                );
-                size_t *strides = (size_t *)malloc(
-                    (size_t)rank * sizeof(size_t)
-                );
-
-                if (
-                    (total && !data)
-                    || !shape
-                    || !strides
-                ) {
-                    free(data);
-                    free(shape);
-                    free(strides);
-                    if (pc != probabilities) {
-                        ocean_tensor_release(pc);
-                    }
-                    if (tc != targets) {
-                        ocean_tensor_release(tc);
-                    }
-                    free(device);
-                    free(target_device);
-                    ocean_tensor_fail(
-                        "out of memory in CrossEntropyLoss backward"
-                    );
-                }
-
-                for (int axis = 0; axis < rank; ++axis) {
-                    shape[(size_t)axis] =
-                        (size_t)ocean_tensor_shape(
-                            pc,
-                            axis
-                        );
-                }
-                ocean_autograd_contiguous_strides_v04(
-                    shape,
-                    (size_t)rank,
-                    strides
-                );
-
-                float upstream_scale =
-                    ocean_tensor_get_flat_f32(upstream, 0)
-                    / (float)examples;
-
-                for (size_t example = 0; example < examples; ++example) {
-                    int64_t target =
-                        ocean_tensor_get_flat_i64(
-                            tc,
-                            example
-                        );
-                    size_t base = example * vocab;
-
-                    for (size_t cls = 0; cls < vocab; ++cls) {
-                        float gradient =
-                            ocean_tensor_get_flat_f32(
-                                pc,
-                                base + cls
-                            );
-                        if (cls == (size_t)target) {
-                            gradient -= 1.0f;
-                        }
-                        data[base + cls] =
-                            gradient * upstream_scale;
-                    }
-                }
-
-                ocean_tensor_handle_t cpu =
-                    ocean_tensor_from_cpu_strided(
-                        data,
-                        shape,
-                        strides,
-                        (size_t)rank,
-                        "float32",
-                        "cpu"
+                    : ocean_tensor_cross_entropy_backward(
+                        upstream,
+                        node->saved_left,
+                        node->saved_right
                     );
-                ocean_tensor_handle_t contribution = cpu;
-
-                if (strcmp(device, "cpu") != 0) {
-                    contribution =
-                        ocean_tensor_to(cpu, device);
-                    ocean_tensor_release(cpu);
-                }
-
-                free(data);
-                free(shape);
-                free(strides);
-                if (pc != probabilities) {
-                    ocean_tensor_release(pc);
-                }
-                if (tc != targets) {
-                    ocean_tensor_release(tc);
-                }
-                free(device);
-                free(target_device);
-
                 ocean_autograd_accumulate(
                     node->left,
                     contribution
@@ -2363,6 +2667,32 @@ static void ocean_autograd_backward_node(ocean_autograd_meta *meta) {
             break;
         }
 
+        case OCEAN_AUTOGRAD_CHECKPOINT:
+            ocean_autograd_checkpoint_backward(node, upstream);
+            break;
+
+        case OCEAN_AUTOGRAD_ATTENTION: {
+            ocean_tensor_handle_t grad_q = NULL;
+            ocean_tensor_handle_t grad_k = NULL;
+            ocean_tensor_handle_t grad_v = NULL;
+            ocean_tensor_scaled_dot_product_attention_backward(
+                upstream,
+                node->saved_left,
+                node->saved_right,
+                node->saved_extra,
+                node->saved_output,
+                node->saved_statistics,
+                node->dim0 != 0,
+                &grad_q,
+                &grad_k,
+                &grad_v
+            );
+            ocean_autograd_accumulate(node->left, grad_q);
+            ocean_autograd_accumulate(node->right, grad_k);
+            ocean_autograd_accumulate(node->extra, grad_v);
+            break;
+        }
+
         default:
             ocean_tensor_fail("unsupported autograd operation");
     }
@@ -2376,30 +2706,496 @@ void ocean_autograd_backward(ocean_tensor_handle_t tensor) {
     if (ocean_tensor_size(tensor) != 1) {
         ocean_tensor_fail("ML v0.1 backward() requires a scalar Tensor");
     }
+    if (ocean_autograd_checkpointing) {
+        ocean_tensor_fail("backward() cannot run inside a checkpointed segment");
+    }
+    ocean_autograd_tape *tape = ocean_autograd_capturing;
+    if (tape && tape->output) {
+        ocean_tensor_fail("a captured tape records at most one backward()");
+    }
 
+    ocean_tensor_reset_window_peak_memory();
     ocean_tensor_release(output->grad);
     output->grad = ocean_autograd_zeros_meta(output);
     ocean_tensor_fill(output->grad, 1.0);
+    ocean_autograd_run_backward(output, tape);
+    ocean_autograd_backward_peak = ocean_tensor_memory_window_peak_bytes();
+}
 
+/* Backward from `output`, whose gradient is already seeded. */
+static void ocean_autograd_run_backward(
+    ocean_autograd_meta *output,
+    ocean_autograd_tape *tape
+) {
     ocean_autograd_topology topology = {0};
     ocean_autograd_topology_visit(&topology, output);
 
-    for (size_t index = topology.count; index-- > 0;) {
-        ocean_autograd_backward_node(topology.items[index]);
+    if (tape) {
+        for (size_t index = 0; index < topology.count; ++index) {
+            ocean_autograd_meta *meta = topology.items[index];
+            if (!meta->leaf && !meta->captured) {
+                free(topology.items);
+                free(topology.stack);
+                ocean_tensor_fail(
+                    "backward() during tape capture reached an operation "
+                    "recorded before capture began"
+                );
+            }
+        }
+        tape->order = topology.count
+            ? (ocean_autograd_meta **)malloc(topology.count * sizeof(*tape->order))
+            : NULL;
+        if (topology.count && !tape->order) {
+            ocean_tensor_fail("out of memory recording autograd tape");
+        }
+        tape->output = output;
     }
 
     /*
      * Like PyTorch's default backward(), release the dynamic graph after use.
-     * Leaf metadata and leaf gradients survive for optimizer.step().
+     * In reverse topological order every consumer of an entry has already
+     * run, so its gradient is complete and nothing reads it or its saved
+     * inputs afterwards: they are freed as soon as the entry's own backward
+     * finishes.  Leaf metadata and leaf gradients survive for
+     * optimizer.step().  While a tape is capturing, the graph is kept for
+     * replay instead and each gradient buffer is parked for the next pass.
      */
-    for (size_t index = 0; index < topology.count; ++index) {
+    for (size_t index = topology.count; index-- > 0;) {
         ocean_autograd_meta *meta = topology.items[index];
-        if (!meta->leaf) {
+        ocean_autograd_backward_node(meta);
+        if (meta->leaf) continue;
+        if (tape) {
+            ocean_autograd_park_grad(meta);
+            tape->order[tape->order_count++] = meta;
+        } else {
             ocean_autograd_remove_meta(meta);
         }
     }
 
     free(topology.items);
+    free(topology.stack);
+}
+
+size_t ocean_autograd_backward_peak_bytes(void) {
+    return ocean_autograd_backward_peak;
+}
+
+static void ocean_autograd_tape_free(ocean_autograd_tape *tape) {
+    for (size_t index = 0; index < tape->count; ++index) {
+        ocean_autograd_tape_entry *entry = &tape->entries[index];
+        ocean_tensor_release(entry->output);
+        ocean_tensor_release(entry->left);
+        ocean_tensor_release(entry->right);
+        ocean_tensor_release(entry->extra);
+        /* Entries of an unfinished capture are still registered. */
+        if (tape == ocean_autograd_capturing) ocean_autograd_unlink_meta(entry->meta);
+        ocean_autograd_meta_free(entry->meta);
+    }
+    free(tape->entries);
+    free(tape->order);
+    free(tape);
+}
+
+static void ocean_autograd_tape_shutdown(void) {
+    ocean_autograd_tape *tape = ocean_autograd_tapes;
+    while (tape) {
+        ocean_autograd_tape *next = tape->next;
+        ocean_autograd_tape_free(tape);
+        tape = next;
+    }
+    ocean_autograd_tapes = NULL;
+    ocean_autograd_capturing = NULL;
+}
+
+static ocean_autograd_tape *ocean_autograd_find_tape(int id) {
+    for (ocean_autograd_tape *tape = ocean_autograd_tapes; tape; tape = tape->next) {
+        if (tape->id == id) return tape;
+    }
+    ocean_tensor_fail("autograd tape id is invalid");
+    return NULL;
+}
+
+int ocean_autograd_capture_begin(void) {
+    if (ocean_autograd_capturing) {
+        ocean_tensor_fail("an autograd tape is already being captured");
+    }
+    if (ocean_autograd_checkpointing) {
+        ocean_tensor_fail("a tape cannot be captured inside a checkpointed segment");
+    }
+    if (ocean_autograd_next_tape_id <= 0) {
+        ocean_tensor_fail("autograd tape id space exhausted");
+    }
+    ocean_autograd_tape *tape = (ocean_autograd_tape *)calloc(1, sizeof(*tape));
+    if (!tape) ocean_tensor_fail("out of memory creating autograd tape");
+
+    tape->id = ocean_autograd_next_tape_id++;
+    tape->next = ocean_autograd_tapes;
+    ocean_autograd_tapes = tape;
+    ocean_autograd_capturing = tape;
+
+    if (!ocean_autograd_tape_shutdown_registered) {
+        ocean_autograd_tape_shutdown_registered = true;
+        atexit(ocean_autograd_tape_shutdown);
+    }
+    return tape->id;
+}
+
+/* The tape takes its entries out of the registry: the Tensors they were
+   attached to become plain values and the graph belongs to replay(). */
+void ocean_autograd_capture_end(int tape_id) {
+    ocean_autograd_tape *tape = ocean_autograd_find_tape(tape_id);
+    if (tape != ocean_autograd_capturing) {
+        ocean_tensor_fail("autograd tape is not being captured");
+    }
+    for (size_t index = 0; index < tape->count; ++index) {
+        ocean_autograd_unlink_meta(tape->entries[index].meta);
+    }
+    ocean_autograd_capturing = NULL;
+}
+
+static void ocean_autograd_tape_store(
+    ocean_tensor_handle_t output,
+    ocean_tensor_handle_t result
+) {
+    ocean_tensor_copy_into(output, result);
+    ocean_tensor_release(result);
+}
+
+/* Recompute one recorded result in place, then refresh the inputs its
+   backward reads. */
+static void ocean_autograd_tape_forward(const ocean_autograd_tape_entry *entry) {
+    ocean_autograd_node *node = entry->meta->grad_fn;
+    ocean_tensor_handle_t output = entry->output;
+    ocean_tensor_handle_t left = entry->left;
+    ocean_tensor_handle_t right = entry->right;
+    ocean_tensor_handle_t extra = entry->extra;
+
+    switch (node->operation) {
+        case OCEAN_AUTOGRAD_ADD:
+        case OCEAN_AUTOGRAD_SUB:
+        case OCEAN_AUTOGRAD_MUL:
+        case OCEAN_AUTOGRAD_DIV:
+            ocean_tensor_binary_into(output, left, right, node->operation);
+            break;
+        case OCEAN_AUTOGRAD_SCALAR:
+            ocean_tensor_scalar_into(output, left, node->scalar, node->scalar_operation);
+            break;
+        case OCEAN_AUTOGRAD_MATMUL:
+            ocean_autograd_tape_store(output, ocean_tensor_matmul(left, right));
+            break;
+        case OCEAN_AUTOGRAD_RELU:
+            ocean_tensor_relu_into(output, left);
+            break;
+        case OCEAN_AUTOGRAD_GELU:
+            ocean_tensor_gelu_into(output, left);
+            break;
+        case OCEAN_AUTOGRAD_MSE:
+            ocean_autograd_tape_store(output, ocean_autograd_mse_forward(left, right));
+            break;
+        /* Views already read their input's storage; only copies made by
+           reshaping a strided input need recomputing. */
+        case OCEAN_AUTOGRAD_RESHAPE:
+            if (!ocean_tensor_shares_storage(output, left)) {
+                ocean_autograd_tape_store(output, ocean_tensor_reshape(
+                    left, entry->meta->shape, entry->meta->ndim
+                ));
+            }
+            break;
+        case OCEAN_AUTOGRAD_TRANSPOSE_DIMS:
+            if (!ocean_tensor_shares_storage(output, left)) {
+                ocean_autograd_tape_store(output, ocean_tensor_transpose_dims(
+                    left, node->dim0, node->dim1
+                ));
+            }
+            break;
+        case OCEAN_AUTOGRAD_PERMUTE:
+            if (!ocean_tensor_shares_storage(output, left)) {
+                ocean_autograd_tape_store(output, ocean_tensor_permute(
+                    left, node->axes, node->axes_count
+                ));
+            }
+            break;
+        case OCEAN_AUTOGRAD_SUM_DIM:
+            ocean_autograd_tape_store(output, ocean_tensor_sum_dim(left, node->dim0, node->keepdim));
+            break;
+        case OCEAN_AUTOGRAD_MEAN_DIM:
+            ocean_autograd_tape_store(output, ocean_tensor_mean_dim(left, node->dim0, node->keepdim));
+            break;
+        case OCEAN_AUTOGRAD_EXP:
+        case OCEAN_AUTOGRAD_LOG:
+        case OCEAN_AUTOGRAD_SQRT:
+        case OCEAN_AUTOGRAD_POW:
+            ocean_autograd_tape_store(output, ocean_autograd_unary_cpu_v03(
+                left, node->operation, node->scalar
+            ));
+            break;
+        case OCEAN_AUTOGRAD_SOFTMAX:
+            ocean_autograd_tape_store(output, ocean_autograd_softmax_impl_v03(left, node->dim0));
+            break;
+        case OCEAN_AUTOGRAD_LAYER_NORM:
+            ocean_autograd_tape_store(output, ocean_autograd_layer_norm_impl_v03(
+                left, node->dim0, node->scalar
+            ));
+            break;
+        case OCEAN_AUTOGRAD_EMBEDDING:
+            ocean_autograd_tape_store(output, ocean_autograd_embedding_forward_v04(left, right));
+            break;
+        case OCEAN_AUTOGRAD_CROSS_ENTROPY: {
+            /* CPU nodes refresh their log-normalizers here and their copy
+               of the logits below; GPU nodes keep only the probabilities. */
+            ocean_tensor_handle_t statistics = NULL;
+            ocean_autograd_tape_store(output, ocean_autograd_cross_entropy_forward_v04(
+                left, right, &statistics
+            ));
+            ocean_tensor_copy_into(
+                node->saved_statistics ? node->saved_statistics : node->saved_left,
+                statistics
+            );
+            ocean_tensor_release(statistics);
+            break;
+        }
+        case OCEAN_AUTOGRAD_ATTENTION: {
+            ocean_tensor_handle_t statistics = NULL;
+            ocean_autograd_tape_store(output, ocean_tensor_scaled_dot_product_attention_forward(
+                left, right, extra, node->dim0 != 0, &statistics
+            ));
+            ocean_tensor_copy_into(node->saved_statistics, statistics);
+            ocean_tensor_copy_into(node->saved_output, output);
+            ocean_tensor_release(statistics);
+            break;
+        }
+        default:
+            ocean_tensor_fail("unsupported autograd operation on tape");
+    }
+
+    switch (node->operation) {
+        case OCEAN_AUTOGRAD_CROSS_ENTROPY:
+            if (node->saved_statistics) ocean_tensor_copy_into(node->saved_left, left);
+            break;
+        case OCEAN_AUTOGRAD_EXP:
+        case OCEAN_AUTOGRAD_SQRT:
+        case OCEAN_AUTOGRAD_SOFTMAX:
+            ocean_tensor_copy_into(node->saved_left, output);
+            break;
+        default:
+            if (node->saved_left) ocean_tensor_copy_into(node->saved_left, left);
+    }
+    if (node->saved_right) ocean_tensor_copy_into(node->saved_right, right);
+    if (node->saved_extra) ocean_tensor_copy_into(node->saved_extra, extra);
+}
+
+/*
+ * Re-run a captured step: recorded results are recomputed into the buffers
+ * the capture allocated, then the recorded backward order runs over the
+ * kept graph.  No metadata, nodes or topology are built, and every non-leaf
+ * gradient refills the buffer it used last time.  Leaf gradients accumulate
+ * exactly as after backward().
+ */
+void ocean_autograd_replay(int tape_id) {
+    ocean_autograd_tape *tape = ocean_autograd_find_tape(tape_id);
+    if (ocean_autograd_capturing) {
+        ocean_tensor_fail("replay() cannot run while a tape is being captured");
+    }
+    for (size_t index = 0; index < tape->count; ++index) {
+        ocean_autograd_tape_forward(&tape->entries[index]);
+    }
+    if (!tape->output) return;
+
+    ocean_tensor_reset_window_peak_memory();
+    ocean_autograd_meta *output = tape->output;
+    output->grad = output->spare_grad
+        ? output->spare_grad : ocean_autograd_zeros_meta(output);
+    output->spare_grad = NULL;
+    ocean_tensor_fill(output->grad, 1.0);
+
+    for (size_t index = 0; index < tape->order_count; ++index) {
+        ocean_autograd_meta *meta = tape->order[index];
+        ocean_autograd_backward_node(meta);
+        ocean_autograd_park_grad(meta);
+    }
+    ocean_autograd_backward_peak = ocean_tensor_memory_window_peak_bytes();
+}
+
+void ocean_autograd_release_tape(int tape_id) {
+    ocean_autograd_tape *tape = ocean_autograd_find_tape(tape_id);
+    ocean_autograd_tape **link = &ocean_autograd_tapes;
+    while (*link != tape) link = &(*link)->next;
+    *link = tape->next;
+    bool capturing = tape == ocean_autograd_capturing;
+    ocean_autograd_tape_free(tape);
+    if (capturing) ocean_autograd_capturing = NULL;
+}
+
+void ocean_autograd_checkpoint_begin(void) {
+    if (ocean_autograd_checkpointing) {
+        ocean_tensor_fail("checkpointed segments cannot be nested");
+    }
+    if (ocean_autograd_capturing) {
+        ocean_tensor_fail("checkpointed segments cannot be captured on a tape");
+    }
+    ocean_autograd_segment *segment =
+        (ocean_autograd_segment *)calloc(1, sizeof(*segment));
+    if (!segment) ocean_tensor_fail("out of memory creating checkpoint");
+    ocean_autograd_checkpointing = segment;
+}
+
+/*
+ * Close the segment at `output`.  Every other entry recorded in it is freed
+ * now; `output` gets a single CHECKPOINT node that depends on the segment's
+ * external inputs.  Intermediates that escaped the segment become plain
+ * Tensors.
+ */
+void ocean_autograd_checkpoint_end(ocean_tensor_handle_t output) {
+    ocean_autograd_segment *segment = ocean_autograd_checkpointing;
+    if (!segment) ocean_tensor_fail("checkpoint_end() without checkpoint_begin()");
+    /* Nothing was recorded: grad is off or no input requires it. */
+    if (!segment->step_count) {
+        ocean_autograd_segment_free(segment);
+        ocean_autograd_checkpointing = NULL;
+        return;
+    }
+    ocean_autograd_meta *output_meta = output ? ocean_autograd_find(output) : NULL;
+    if (!output_meta || !output_meta->segment_step) {
+        ocean_tensor_fail("checkpoint output must be computed inside the segment");
+    }
+
+    size_t output_step = output_meta->segment_step - 1;
+    for (size_t index = 0; index < segment->step_count; ++index) {
+        ocean_autograd_segment_step *step = &segment->steps[index];
+        if (index != output_step) ocean_autograd_remove_meta(step->meta);
+        step->meta = NULL;
+        if (index > output_step) {
+            free(step->axes);
+            free(step->shape);
+        }
+    }
+    segment->step_count = output_step + 1;
+    ocean_autograd_checkpointing = NULL;
+
+    ocean_autograd_node *node = ocean_autograd_node_new(OCEAN_AUTOGRAD_CHECKPOINT);
+    node->segment = segment;
+    ocean_autograd_node_free(output_meta->grad_fn);
+    output_meta->grad_fn = node;
+    output_meta->segment_step = 0;
+}
+
+static ocean_tensor_handle_t ocean_autograd_segment_value(
+    const ocean_autograd_segment_operand *operand,
+    ocean_tensor_handle_t *inputs,
+    ocean_tensor_handle_t *values
+) {
+    return operand->external ? inputs[operand->index] : values[operand->index];
+}
+
+static ocean_tensor_handle_t ocean_autograd_segment_apply(
+    const ocean_autograd_segment_step *step,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t extra
+) {
+    switch (step->operation) {
+        case OCEAN_AUTOGRAD_ADD:
+        case OCEAN_AUTOGRAD_SUB:
+        case OCEAN_AUTOGRAD_MUL:
+        case OCEAN_AUTOGRAD_DIV:
+            return ocean_autograd_binary(left, right, step->operation);
+        case OCEAN_AUTOGRAD_SCALAR:
+            return ocean_autograd_scalar(left, step->scalar, step->scalar_operation);
+        case OCEAN_AUTOGRAD_MATMUL: return ocean_autograd_matmul(left, right);
+        case OCEAN_AUTOGRAD_RELU: return ocean_autograd_relu(left);
+        case OCEAN_AUTOGRAD_GELU: return ocean_autograd_gelu(left);
+        case OCEAN_AUTOGRAD_MSE: return ocean_autograd_mse_loss(left, right);
+        case OCEAN_AUTOGRAD_RESHAPE:
+            return ocean_autograd_reshape(left, step->shape, step->ndim);
+        case OCEAN_AUTOGRAD_TRANSPOSE_DIMS:
+            return ocean_autograd_transpose_dims(left, step->dim0, step->dim1);
+        case OCEAN_AUTOGRAD_PERMUTE:
+            return ocean_autograd_permute(left, step->axes, step->axes_count);
+        case OCEAN_AUTOGRAD_SUM_DIM:
+            return ocean_autograd_sum_dim(left, step->dim0, step->keepdim);
+        case OCEAN_AUTOGRAD_MEAN_DIM:
+            return ocean_autograd_mean_dim(left, step->dim0, step->keepdim);
+        case OCEAN_AUTOGRAD_EXP: return ocean_autograd_exp(left);
+        case OCEAN_AUTOGRAD_LOG: return ocean_autograd_log(left);
+        case OCEAN_AUTOGRAD_SQRT: return ocean_autograd_sqrt(left);
+        case OCEAN_AUTOGRAD_POW: return ocean_autograd_pow(left, step->scalar);
+        case OCEAN_AUTOGRAD_SOFTMAX: return ocean_autograd_softmax(left, step->dim0);
+        case OCEAN_AUTOGRAD_LAYER_NORM:
+            return ocean_autograd_layer_norm(left, step->dim0, step->scalar);
+        case OCEAN_AUTOGRAD_EMBEDDING: return ocean_autograd_embedding(left, right);
+        case OCEAN_AUTOGRAD_CROSS_ENTROPY: return ocean_autograd_cross_entropy(left, right);
+        case OCEAN_AUTOGRAD_ATTENTION:
+            return ocean_autograd_scaled_dot_product_attention(left, right, extra, step->dim0 != 0);
+        default:
+            ocean_tensor_fail("unsupported autograd operation in checkpoint");
+    }
+}
+
+/*
+ * Rebuild the segment's graph from its recipe over fresh leaf aliases of the
+ * external inputs, run backward through it from `upstream`, and pass each
+ * input gradient on to the entry that owns it.  The rebuilt graph lives
+ * only for this call.
+ */
+static void ocean_autograd_checkpoint_backward(
+    ocean_autograd_node *node,
+    ocean_tensor_handle_t upstream
+) {
+    ocean_autograd_segment *segment = node->segment;
+    bool grad_enabled = ocean_autograd_grad_enabled_state;
+    ocean_autograd_grad_enabled_state = true;
+
+    ocean_tensor_handle_t *inputs = (ocean_tensor_handle_t *)calloc(
+        segment->external_count + 1, sizeof(*inputs)
+    );
+    ocean_tensor_handle_t *values = (ocean_tensor_handle_t *)calloc(
+        segment->step_count, sizeof(*values)
+    );
+    if (!inputs || !values) ocean_tensor_fail("out of memory recomputing checkpoint");
+
+    for (size_t index = 0; index < segment->external_count; ++index) {
+        const ocean_autograd_segment_external *external = &segment->externals[index];
+        if (external->meta) {
+            inputs[index] = ocean_tensor_alias(external->value);
+            ocean_autograd_set_requires_grad(inputs[index], true);
+        } else {
+            inputs[index] = external->value;
+        }
+    }
+    for (size_t index = 0; index < segment->step_count; ++index) {
+        const ocean_autograd_segment_step *step = &segment->steps[index];
+        values[index] = ocean_autograd_segment_apply(
+            step,
+            ocean_autograd_segment_value(&step->left, inputs, values),
+            step->binary ? ocean_autograd_segment_value(&step->right, inputs, values) : NULL,
+            step->ternary ? ocean_autograd_segment_value(&step->extra, inputs, values) : NULL
+        );
+    }
+
+    ocean_autograd_meta *output = ocean_autograd_find(values[segment->step_count - 1]);
+    output->grad = ocean_tensor_copy(upstream);
+    ocean_autograd_run_backward(output, NULL);
+
+    for (size_t index = 0; index < segment->external_count; ++index) {
+        const ocean_autograd_segment_external *external = &segment->externals[index];
+        if (!external->meta) continue;
+        ocean_autograd_meta *local = ocean_autograd_find(inputs[index]);
+        if (local->grad) {
+            ocean_autograd_accumulate(external->meta, local->grad);
+            local->grad = NULL;
+        }
+        ocean_autograd_remove_meta(local);
+        ocean_tensor_release(inputs[index]);
+    }
+    /* Steps that did not reach the output were never visited by backward. */
+    for (size_t index = 0; index < segment->step_count; ++index) {
+        ocean_autograd_meta *meta = ocean_autograd_find(values[index]);
+        if (meta) ocean_autograd_remove_meta(meta);
+        ocean_tensor_release(values[index]);
+    }
+    free(inputs);
+    free(values);
+    ocean_autograd_grad_enabled_state = grad_enabled;
 }
 
 ocean_tensor_handle_t ocean_autograd_parameter_uniform(
@@ -2444,6 +3240,12 @@ void ocean_autograd_sgd_step(
     if (!meta || !meta->requires_grad || !meta->leaf) {
         ocean_tensor_fail("SGD expects a leaf Parameter");
     }
+    if (meta->sparse_count) {
+        ocean_tensor_sgd_update_rows(
+            tensor, meta->sparse_rows, meta->sparse_values, meta->sparse_count, learning_rate
+        );
+        return;
+    }
     if (!meta->grad) return;
 
     ocean_autograd_require_float32(tensor);
@@ -2460,10 +3262,36 @@ typedef struct ocean_adamw_parameter_state {
     struct ocean_adamw_parameter_state *next;
 } ocean_adamw_parameter_state;
 
+/* Step that last updated each row of a Parameter with row-sparse
+   gradients. */
+typedef struct ocean_adamw_row_state {
+    uint64_t tensor_identity;
+    ocean_tensor_handle_t last_steps;
+    struct ocean_adamw_row_state *next;
+} ocean_adamw_row_state;
+
+/*
+ * Optimizer state.  SGD optimizers share this registry for their staged
+ * Parameter list and never allocate moments.
+ *
+ * Multi-tensor steps stage every Parameter, then update them all in one
+ * pass.  CPU groups keep both AdamW moments in the single flat `moments`
+ * Tensor; `layout` records which Parameter identity owns each slot of it,
+ * and `offsets` where that slot starts.  The layout is rebuilt only when the
+ * staged Parameters differ from the previous step.
+ */
 typedef struct ocean_adamw_optimizer_state {
     int id;
     int step;
     ocean_adamw_parameter_state *parameters;
+    ocean_tensor_handle_t *staged;
+    size_t staged_count;
+    size_t staged_capacity;
+    uint64_t *layout;
+    size_t *offsets;
+    size_t layout_count;
+    ocean_tensor_handle_t moments;
+    ocean_adamw_row_state *row_states;
     struct ocean_adamw_optimizer_state *next;
 } ocean_adamw_optimizer_state;
 
@@ -2493,6 +3321,18 @@ static void ocean_adamw_shutdown(void) {
             parameter = next_parameter;
         }
 
+        ocean_adamw_row_state *rows = state->row_states;
+        while (rows) {
+            ocean_adamw_row_state *next_rows = rows->next;
+            ocean_tensor_release(rows->last_steps);
+            free(rows);
+            rows = next_rows;
+        }
+
+        ocean_tensor_release(state->moments);
+        free(state->staged);
+        free(state->layout);
+        free(state->offsets);
         free(state);
         state = next_state;
     }
@@ -2557,7 +3397,38 @@ static ocean_adamw_parameter_state *ocean_adamw_get_parameter_state(
     return state;
 }
 
-int ocean_autograd_adamw_create(void) {
+static ocean_adamw_row_state *ocean_adamw_find_row_state(
+    ocean_adamw_optimizer_state *optimizer,
+    ocean_tensor_handle_t tensor,
+    bool create
+) {
+    uint64_t identity = ocean_tensor_identity(tensor);
+    for (ocean_adamw_row_state *state = optimizer->row_states; state; state = state->next) {
+        if (state->tensor_identity == identity) return state;
+    }
+    if (!create) return NULL;
+
+    ocean_adamw_row_state *state = (ocean_adamw_row_state *)calloc(1, sizeof(*state));
+    if (!state) ocean_tensor_fail("out of memory creating AdamW row state");
+    size_t shape[1] = {(size_t)ocean_tensor_shape(tensor, 0)};
+    state->tensor_identity = identity;
+    state->last_steps = ocean_tensor_zeros_nd(shape, 1, "int64", "cpu");
+    state->next = optimizer->row_states;
+    optimizer->row_states = state;
+    return state;
+}
+
+/* A dense update moves every row, so each row is current again. */
+static void ocean_adamw_mark_rows(
+    ocean_adamw_optimizer_state *optimizer,
+    ocean_tensor_handle_t tensor,
+    int step
+) {
+    ocean_adamw_row_state *state = ocean_adamw_find_row_state(optimizer, tensor, false);
+    if (state) ocean_tensor_fill(state->last_steps, (double)step);
+}
+
+static int ocean_adamw_create_state(void) {
     if (ocean_adamw_next_id <= 0) {
         ocean_tensor_fail("AdamW optimizer id space exhausted");
     }
@@ -2581,6 +3452,28 @@ int ocean_autograd_adamw_create(void) {
     return state->id;
 }
 
+int ocean_autograd_adamw_create(void) {
+    return ocean_adamw_create_state();
+}
+
+static void ocean_adamw_validate_arguments(
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay
+) {
+    if (learning_rate < 0.0) ocean_tensor_fail("AdamW learning_rate must be non-negative");
+    if (beta1 < 0.0 || beta1 >= 1.0) ocean_tensor_fail("AdamW beta1 must be in [0, 1)");
+    if (beta2 < 0.0 || beta2 >= 1.0) ocean_tensor_fail("AdamW beta2 must be in [0, 1)");
+    if (epsilon <= 0.0) ocean_tensor_fail("AdamW epsilon must be positive");
+    if (weight_decay < 0.0) ocean_tensor_fail("AdamW weight_decay must be non-negative");
+}
+
+int ocean_autograd_sgd_create(void) {
+    return ocean_adamw_create_state();
+}
+
 int ocean_autograd_adamw_begin_step(int state_id) {
     ocean_adamw_optimizer_state *state =
         ocean_adamw_find_state(state_id);
@@ -2605,11 +3498,7 @@ void ocean_autograd_adamw_step(
 ) {
     /* AdamW GPU/CPU device-aware v0.2 */
     if (step <= 0) ocean_tensor_fail("AdamW step must be positive");
-    if (learning_rate < 0.0) ocean_tensor_fail("AdamW learning_rate must be non-negative");
-    if (beta1 < 0.0 || beta1 >= 1.0) ocean_tensor_fail("AdamW beta1 must be in [0, 1)");
-    if (beta2 < 0.0 || beta2 >= 1.0) ocean_tensor_fail("AdamW beta2 must be in [0, 1)");
-    if (epsilon <= 0.0) ocean_tensor_fail("AdamW epsilon must be positive");
-    if (weight_decay < 0.0) ocean_tensor_fail("AdamW weight_decay must be non-negative");
+    ocean_adamw_validate_arguments(learning_rate, beta1, beta2, epsilon, weight_decay);
 
     ocean_adamw_optimizer_state *optimizer =
         ocean_adamw_find_state(state_id);
@@ -2622,7 +3511,7 @@ void ocean_autograd_adamw_step(
     if (!meta || !meta->requires_grad || !meta->leaf) {
         ocean_tensor_fail("AdamW expects a leaf Parameter");
     }
-    if (!meta->grad) return;
+    if (!meta->grad && !meta->sparse_count) return;
 
     ocean_autograd_require_float32(tensor);
 
@@ -2636,6 +3525,18 @@ void ocean_autograd_adamw_step(
         ocean_tensor_fail("AdamW bias correction became invalid");
     }
 
+    if (meta->sparse_count) {
+        ocean_tensor_adamw_update_rows(
+            tensor, meta->sparse_rows, meta->sparse_values, meta->sparse_count,
+            parameter_state->first_moment, 0, parameter_state->second_moment, 0,
+            ocean_adamw_find_row_state(optimizer, tensor, true)->last_steps, step,
+            learning_rate, beta1, beta2, epsilon, weight_decay,
+            bias_correction1, bias_correction2
+        );
+        return;
+    }
+
+    ocean_adamw_mark_rows(optimizer, tensor, step);
     ocean_tensor_adamw_update(
         tensor,
         meta->grad,
@@ -2650,3 +3551,653 @@ void ocean_autograd_adamw_step(
         bias_correction2
     );
 }
+
+void ocean_autograd_optimizer_stage(int state_id, ocean_tensor_handle_t tensor) {
+    ocean_adamw_optimizer_state *optimizer = ocean_adamw_find_state(state_id);
+    if (!tensor) ocean_tensor_fail("optimizer cannot stage a null Parameter");
+    if (optimizer->staged_count == optimizer->staged_capacity) {
+        size_t capacity = optimizer->staged_capacity ? optimizer->staged_capacity * 2 : 16;
+        ocean_tensor_handle_t *grown = (ocean_tensor_handle_t *)realloc(
+            optimizer->staged,
+            capacity * sizeof(*grown)
+        );
+        if (!grown) ocean_tensor_fail("out of memory staging optimizer Parameters");
+        optimizer->staged = grown;
+        optimizer->staged_capacity = capacity;
+    }
+    optimizer->staged[optimizer->staged_count++] = tensor;
+}
+
+/* Collects the staged Parameters' gradients and reports whether they all
+   live on the CPU. */
+static bool ocean_optimizer_collect_gradients(
+    ocean_adamw_optimizer_state *optimizer,
+    ocean_tensor_handle_t *gradients,
+    const char *message
+) {
+    bool cpu = true;
+    for (size_t i = 0; i < optimizer->staged_count; ++i) {
+        ocean_tensor_handle_t tensor = optimizer->staged[i];
+        ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+        if (!meta || !meta->requires_grad || !meta->leaf) ocean_tensor_fail(message);
+        ocean_autograd_require_float32(tensor);
+        gradients[i] = meta->grad;
+        if (strcmp(meta->device, "cpu") != 0) cpu = false;
+    }
+    return cpu;
+}
+
+static ocean_tensor_handle_t *ocean_optimizer_gradient_buffer(
+    ocean_adamw_optimizer_state *optimizer
+) {
+    size_t count = optimizer->staged_count ? optimizer->staged_count : 1;
+    ocean_tensor_handle_t *gradients =
+        (ocean_tensor_handle_t *)malloc(count * sizeof(*gradients));
+    if (!gradients) ocean_tensor_fail("out of memory collecting optimizer gradients");
+    return gradients;
+}
+
+void ocean_autograd_sgd_step_staged(int state_id, double learning_rate) {
+    ocean_adamw_optimizer_state *optimizer = ocean_adamw_find_state(state_id);
+    ocean_tensor_handle_t *gradients = ocean_optimizer_gradient_buffer(optimizer);
+    bool cpu = ocean_optimizer_collect_gradients(
+        optimizer, gradients, "SGD expects a leaf Parameter"
+    );
+
+    if (cpu) {
+        ocean_tensor_sgd_update_many(
+            optimizer->staged, gradients, optimizer->staged_count, learning_rate
+        );
+        for (size_t i = 0; i < optimizer->staged_count; ++i) {
+            ocean_autograd_meta *meta = ocean_autograd_find(optimizer->staged[i]);
+            if (!meta->sparse_count) continue;
+            ocean_tensor_sgd_update_rows(
+                optimizer->staged[i], meta->sparse_rows, meta->sparse_values,
+                meta->sparse_count, learning_rate
+            );
+        }
+    } else {
+        for (size_t i = 0; i < optimizer->staged_count; ++i) {
+            ocean_autograd_sgd_step(optimizer->staged[i], learning_rate);
+        }
+    }
+
+    free(gradients);
+    optimizer->staged_count = 0;
+}
+
+static bool ocean_adamw_layout_matches(const ocean_adamw_optimizer_state *optimizer) {
+    if (!optimizer->moments || optimizer->layout_count != optimizer->staged_count) {
+        return false;
+    }
+    for (size_t i = 0; i < optimizer->staged_count; ++i) {
+        ocean_tensor_handle_t tensor = optimizer->staged[i];
+        if (optimizer->layout[i] != ocean_tensor_identity(tensor) ||
+            optimizer->offsets[i + 1] - optimizer->offsets[i] != ocean_tensor_size(tensor)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/* Lays the staged Parameters out in a new flat moment buffer.  Parameters
+   that were already in the previous layout keep their moments. */
+static void ocean_adamw_build_layout(ocean_adamw_optimizer_state *optimizer) {
+    size_t count = optimizer->staged_count;
+    uint64_t *layout = (uint64_t *)malloc((count ? count : 1) * sizeof(*layout));
+    size_t *offsets = (size_t *)malloc((count + 1) * sizeof(*offsets));
+    if (!layout || !offsets) {
+        free(layout);
+        free(offsets);
+        ocean_tensor_fail("out of memory building AdamW moment layout");
+    }
+
+    offsets[0] = 0;
+    for (size_t i = 0; i < count; ++i) {
+        layout[i] = ocean_tensor_identity(optimizer->staged[i]);
+        offsets[i + 1] = offsets[i] + ocean_tensor_size(optimizer->staged[i]);
+    }
+    size_t total = offsets[count];
+    size_t shape[1] = {2 * total};
+    ocean_tensor_handle_t moments = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+
+    if (optimizer->moments) {
+        size_t old_total = optimizer->offsets[optimizer->layout_count];
+        for (size_t i = 0; i < count; ++i) {
+            for (size_t j = 0; j < optimizer->layout_count; ++j) {
+                size_t size = offsets[i + 1] - offsets[i];
+                if (optimizer->layout[j] != layout[i] ||
+                    optimizer->offsets[j + 1] - optimizer->offsets[j] != size) {
+                    continue;
+                }
+                ocean_tensor_copy_range(
+                    moments, offsets[i], optimizer->moments, optimizer->offsets[j], size
+                );
+                ocean_tensor_copy_range(
+                    moments, total + offsets[i],
+                    optimizer->moments, old_total + optimizer->offsets[j], size
+                );
+                break;
+            }
+        }
+    }
+
+    ocean_tensor_release(optimizer->moments);
+    free(optimizer->layout);
+    free(optimizer->offsets);
+    optimizer->moments = moments;
+    optimizer->layout = layout;
+    optimizer->offsets = offsets;
+    optimizer->layout_count = count;
+}
+
+void ocean_autograd_adamw_step_staged(
+    int state_id,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay
+) {
+    ocean_adamw_validate_arguments(learning_rate, beta1, beta2, epsilon, weight_decay);
+    ocean_adamw_optimizer_state *optimizer = ocean_adamw_find_state(state_id);
+    int step = ocean_autograd_adamw_begin_step(state_id);
+
+    ocean_tensor_handle_t *gradients = ocean_optimizer_gradient_buffer(optimizer);
+    bool cpu = ocean_optimizer_collect_gradients(
+        optimizer, gradients, "AdamW expects a leaf Parameter"
+    );
+
+    double bias_correction1 = 1.0 - pow(beta1, (double)step);
+    double bias_correction2 = 1.0 - pow(beta2, (double)step);
+    if (bias_correction1 <= 0.0 || bias_correction2 <= 0.0) {
+        free(gradients);
+        ocean_tensor_fail("AdamW bias correction became invalid");
+    }
+
+    if (cpu) {
+        if (!ocean_adamw_layout_matches(optimizer)) ocean_adamw_build_layout(optimizer);
+        ocean_tensor_adamw_update_many(
+            optimizer->staged, gradients, optimizer->staged_count, optimizer->moments,
+            learning_rate, beta1, beta2, epsilon, weight_decay,
+            bias_correction1, bias_correction2
+        );
+        /* Row-sparse gradients update their rows of the same flat moments. */
+        size_t total = optimizer->offsets[optimizer->staged_count];
+        for (size_t i = 0; i < optimizer->staged_count; ++i) {
+            ocean_tensor_handle_t tensor = optimizer->staged[i];
+            ocean_autograd_meta *meta = ocean_autograd_find(tensor);
+            if (gradients[i]) {
+                ocean_adamw_mark_rows(optimizer, tensor, step);
+                continue;
+            }
+            if (!meta->sparse_count) continue;
+            ocean_tensor_adamw_update_rows(
+                tensor, meta->sparse_rows, meta->sparse_values, meta->sparse_count,
+                optimizer->moments, optimizer->offsets[i],
+                optimizer->moments, total + optimizer->offsets[i],
+                ocean_adamw_find_row_state(optimizer, tensor, true)->last_steps, step,
+                learning_rate, beta1, beta2, epsilon, weight_decay,
+                bias_correction1, bias_correction2
+            );
+        }
+    } else {
+        /* GPU Parameters keep per-Parameter moments on their device. */
+        for (size_t i = 0; i < optimizer->staged_count; ++i) {
+            ocean_autograd_adamw_step(
+                state_id, step, optimizer->staged[i],
+                learning_rate, beta1, beta2, epsilon, weight_decay
+            );
+        }
+    }
+
+    free(gradients);
+    optimizer->staged_count = 0;
+}
+
+/*
+ * Data-parallel training.  A group owns one persistent worker thread per
+ * model replica.  run() wakes every worker; each copies the master
+ * Parameters into its replica, computes the replica gradients over its
+ * share of the batch and publishes them.  After a barrier, worker w reduces
+ * slice w of every Parameter across all replicas straight into the master
+ * gradients, so the all-reduce is spread over the workers as well.
+ *
+ * A worker computes its gradients either by calling the step function on
+ * its context, building the graph in its own autograd state, or by
+ * replaying a tape captured for its replica on the main thread.  A tape's
+ * leaf entries live in the capturing thread's state, so the worker keeps
+ * their metadata instead of looking it up.
+ */
+typedef struct ocean_data_parallel_group ocean_data_parallel_group;
+
+typedef struct ocean_data_parallel_worker {
+    ocean_data_parallel_group *group;
+    int index;
+    pthread_t thread;
+    bool started;
+    /* Replicas have been marked as requiring grad in this worker's state. */
+    bool tracking;
+    void *context;
+    ocean_tensor_handle_t *replicas;
+    size_t replica_count;
+    size_t replica_capacity;
+    /* Replayed instead of calling the step function when nonzero. */
+    int tape_id;
+    ocean_autograd_meta **tape_metas;
+    /* Batch rows in this worker's shard; 0 until set_rows(). */
+    size_t rows;
+} ocean_data_parallel_worker;
+
+struct ocean_data_parallel_group {
+    int id;
+    int worker_count;
+    ocean_data_parallel_worker *workers;
+    ocean_tensor_handle_t *parameters;
+    size_t parameter_count;
+    size_t parameter_capacity;
+    /* Master gradient buffers written during a round. */
+    ocean_tensor_handle_t *targets;
+    /* Replica gradient of Parameter i from worker w at [i * workers + w]. */
+    ocean_tensor_handle_t *gradients;
+    /* Share of the batch each worker's mean gradient stands for. */
+    double *weights;
+    ocean_autograd_worker_fn_t function;
+    pthread_mutex_t lock;
+    pthread_cond_t wake;
+    pthread_cond_t done;
+    pthread_cond_t barrier;
+    uint64_t round;
+    uint64_t barrier_phase;
+    int arrived;
+    int finished;
+    bool stopping;
+    struct ocean_data_parallel_group *next;
+};
+
+static ocean_data_parallel_group *ocean_data_parallel_groups = NULL;
+static int ocean_data_parallel_next_id = 1;
+static _Thread_local int ocean_data_parallel_current_worker = -1;
+
+static ocean_data_parallel_group *ocean_data_parallel_find(int id) {
+    for (
+        ocean_data_parallel_group *group = ocean_data_parallel_groups;
+        group;
+        group = group->next
+    ) {
+        if (group->id == id) return group;
+    }
+    ocean_tensor_fail("data-parallel group id is invalid");
+    return NULL;
+}
+
+static ocean_data_parallel_worker *ocean_data_parallel_worker_at(
+    ocean_data_parallel_group *group,
+    int worker
+) {
+    if (worker < 0 || worker >= group->worker_count) {
+        ocean_tensor_fail("data-parallel worker index is out of range");
+    }
+    return &group->workers[worker];
+}
+
+static void ocean_data_parallel_barrier(ocean_data_parallel_group *group) {
+    pthread_mutex_lock(&group->lock);
+    uint64_t phase = group->barrier_phase;
+    if (++group->arrived == group->worker_count) {
+        group->arrived = 0;
+        ++group->barrier_phase;
+        pthread_cond_broadcast(&group->barrier);
+    } else {
+        while (phase == group->barrier_phase) {
+            pthread_cond_wait(&group->barrier, &group->lock);
+        }
+    }
+    pthread_mutex_unlock(&group->lock);
+}
+
+static void ocean_data_parallel_work(ocean_data_parallel_worker *worker) {
+    ocean_data_parallel_group *group = worker->group;
+    size_t workers = (size_t)group->worker_count;
+    size_t index = (size_t)worker->index;
+
+    bool taped = worker->tape_id != 0;
+
+    /* Last round's gradients are parked only now: every worker has finished
+       reading them, and backward() refills the same buffers. */
+    for (size_t i = 0; i < group->parameter_count; ++i) {
+        ocean_tensor_handle_t replica = worker->replicas[i];
+        ocean_autograd_meta *meta = taped
+            ? worker->tape_metas[i] : ocean_autograd_find(replica);
+        if (meta) ocean_autograd_park_grad(meta);
+        ocean_tensor_copy_into(replica, group->parameters[i]);
+        if (!taped && !worker->tracking) ocean_autograd_set_requires_grad(replica, true);
+    }
+    worker->tracking = true;
+
+    if (taped) ocean_autograd_replay(worker->tape_id);
+    else group->function(worker->context);
+
+    for (size_t i = 0; i < group->parameter_count; ++i) {
+        ocean_autograd_meta *meta = taped
+            ? worker->tape_metas[i] : ocean_autograd_find(worker->replicas[i]);
+        if (meta) ocean_autograd_densify(meta);
+        group->gradients[i * workers + index] = meta ? meta->grad : NULL;
+    }
+    ocean_data_parallel_barrier(group);
+
+    for (size_t i = 0; i < group->parameter_count; ++i) {
+        size_t size = ocean_tensor_size(group->targets[i]);
+        ocean_tensor_accumulate_range(
+            group->targets[i], &group->gradients[i * workers], workers, group->weights,
+            size * index / workers, size * (index + 1) / workers
+        );
+    }
+}
+
+static void *ocean_data_parallel_main(void *argument) {
+    ocean_data_parallel_worker *worker = (ocean_data_parallel_worker *)argument;
+    ocean_data_parallel_group *group = worker->group;
+    ocean_data_parallel_current_worker = worker->index;
+    /* Every core already runs a replica; kernels stay on this thread. */
+    ocean_tensor_set_thread_parallelism(false);
+
+    uint64_t seen = 0;
+    for (;;) {
+        pthread_mutex_lock(&group->lock);
+        while (group->round == seen && !group->stopping) {
+            pthread_cond_wait(&group->wake, &group->lock);
+        }
+        if (group->stopping) {
+            pthread_mutex_unlock(&group->lock);
+            break;
+        }
+        seen = group->round;
+        pthread_mutex_unlock(&group->lock);
+
+        ocean_data_parallel_work(worker);
+
+        pthread_mutex_lock(&group->lock);
+        if (++group->finished == group->worker_count) {
+            pthread_cond_signal(&group->done);
+        }
+        pthread_mutex_unlock(&group->lock);
+    }
+
+    ocean_autograd_shutdown();
+    return NULL;
+}
+
+int ocean_autograd_data_parallel_create(int workers) {
+    if (workers < 1) ocean_tensor_fail("data-parallel worker count must be positive");
+
+    ocean_data_parallel_group *group =
+        (ocean_data_parallel_group *)calloc(1, sizeof(*group));
+    ocean_data_parallel_worker *slots =
+        (ocean_data_parallel_worker *)calloc((size_t)workers, sizeof(*slots));
+    if (!group || !slots) {
+        free(group);
+        free(slots);
+        ocean_tensor_fail("out of memory creating data-parallel group");
+    }
+    for (int worker = 0; worker < workers; ++worker) {
+        slots[worker].group = group;
+        slots[worker].index = worker;
+    }
+    group->workers = slots;
+    group->worker_count = workers;
+    pthread_mutex_init(&group->lock, NULL);
+    pthread_cond_init(&group->wake, NULL);
+    pthread_cond_init(&group->done, NULL);
+    pthread_cond_init(&group->barrier, NULL);
+
+    group->id = ocean_data_parallel_next_id++;
+    group->next = ocean_data_parallel_groups;
+    ocean_data_parallel_groups = group;
+    return group->id;
+}
+
+static bool ocean_data_parallel_running(const ocean_data_parallel_group *group) {
+    return group->worker_count > 0 && group->workers[0].started;
+}
+
+void ocean_autograd_data_parallel_add_parameter(
+    int group_id,
+    ocean_tensor_handle_t parameter
+) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    if (!parameter) ocean_tensor_fail("data-parallel Parameter is null");
+    if (ocean_data_parallel_running(group)) {
+        ocean_tensor_fail("data-parallel Parameters cannot change after run()");
+    }
+    if (group->parameter_count == group->parameter_capacity) {
+        size_t capacity = group->parameter_capacity ? group->parameter_capacity * 2 : 16;
+        ocean_tensor_handle_t *parameters = (ocean_tensor_handle_t *)realloc(
+            group->parameters, capacity * sizeof(*parameters)
+        );
+        if (!parameters) ocean_tensor_fail("out of memory adding data-parallel Parameter");
+        group->parameters = parameters;
+        group->parameter_capacity = capacity;
+    }
+    group->parameters[group->parameter_count++] = parameter;
+}
+
+void ocean_autograd_data_parallel_add_replica(
+    int group_id,
+    int worker,
+    ocean_tensor_handle_t replica
+) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    ocean_data_parallel_worker *slot = ocean_data_parallel_worker_at(group, worker);
+    if (!replica) ocean_tensor_fail("data-parallel replica is null");
+    if (ocean_data_parallel_running(group)) {
+        ocean_tensor_fail("data-parallel Parameters cannot change after run()");
+    }
+    if (slot->replica_count == slot->replica_capacity) {
+        size_t capacity = slot->replica_capacity ? slot->replica_capacity * 2 : 16;
+        ocean_tensor_handle_t *replicas = (ocean_tensor_handle_t *)realloc(
+            slot->replicas, capacity * sizeof(*replicas)
+        );
+        if (!replicas) ocean_tensor_fail("out of memory adding data-parallel replica");
+        slot->replicas = replicas;
+        slot->replica_capacity = capacity;
+    }
+    slot->replicas[slot->replica_count++] = replica;
+}
+
+void ocean_autograd_data_parallel_set_context(int group_id, int worker, void *context) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    ocean_data_parallel_worker_at(group, worker)->context = context;
+}
+
+void ocean_autograd_data_parallel_set_rows(int group_id, int worker, size_t rows) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    ocean_data_parallel_worker *slot = ocean_data_parallel_worker_at(group, worker);
+    if (rows == 0) ocean_tensor_fail("data-parallel shard is empty");
+    slot->rows = rows;
+}
+
+void ocean_autograd_data_parallel_set_tape(int group_id, int worker, int tape_id) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    ocean_data_parallel_worker *slot = ocean_data_parallel_worker_at(group, worker);
+    ocean_autograd_find_tape(tape_id);
+    if (ocean_data_parallel_running(group)) {
+        ocean_tensor_fail("data-parallel tapes cannot change after run()");
+    }
+
+    ocean_autograd_meta **metas = (ocean_autograd_meta **)calloc(
+        slot->replica_count ? slot->replica_count : 1, sizeof(*metas)
+    );
+    if (!metas) ocean_tensor_fail("out of memory adding data-parallel tape");
+    for (size_t i = 0; i < slot->replica_count; ++i) {
+        metas[i] = ocean_autograd_find(slot->replicas[i]);
+        if (!metas[i] || !metas[i]->requires_grad) {
+            free(metas);
+            ocean_tensor_fail("a replayed replica's Parameters must require grad");
+        }
+    }
+    free(slot->tape_metas);
+    slot->tape_metas = metas;
+    slot->tape_id = tape_id;
+}
+
+int ocean_autograd_data_parallel_worker(void) {
+    return ocean_data_parallel_current_worker;
+}
+
+/* The master gradient a round reduces into.  A missing one is created (from
+   the parked buffer when there is one) as zeros; `created` reports that. */
+static ocean_tensor_handle_t ocean_data_parallel_target(
+    ocean_tensor_handle_t parameter,
+    bool *created
+) {
+    ocean_autograd_meta *meta = ocean_autograd_find(parameter);
+    if (!meta || !meta->requires_grad || !meta->leaf) {
+        ocean_tensor_fail("data-parallel Parameters must be leaf Tensors that require grad");
+    }
+    if (strcmp(meta->device, "cpu") != 0) {
+        ocean_tensor_fail("data-parallel training supports CPU Parameters only");
+    }
+    ocean_autograd_densify(meta);
+    *created = meta->grad == NULL;
+    if (meta->grad) return meta->grad;
+
+    if (meta->spare_grad && ocean_autograd_same_shape_meta(meta->spare_grad, meta)) {
+        meta->grad = meta->spare_grad;
+        meta->spare_grad = NULL;
+        ocean_tensor_fill(meta->grad, 0.0);
+    } else {
+        meta->grad = ocean_tensor_zeros_nd(meta->shape, meta->ndim, "float32", "cpu");
+    }
+    return meta->grad;
+}
+
+static void ocean_data_parallel_round(
+    ocean_data_parallel_group *group,
+    ocean_autograd_worker_fn_t function
+) {
+    if (ocean_data_parallel_current_worker >= 0) {
+        ocean_tensor_fail("data-parallel run() cannot be called from a worker");
+    }
+
+    size_t workers = (size_t)group->worker_count;
+    size_t count = group->parameter_count;
+    size_t rows = 0, sized = 0;
+    for (size_t w = 0; w < workers; ++w) {
+        ocean_data_parallel_worker *slot = &group->workers[w];
+        rows += slot->rows;
+        sized += slot->rows != 0;
+        if (!slot->tape_id && !function) {
+            ocean_tensor_fail("data-parallel replay() needs a tape for every worker");
+        }
+        if (slot->replica_count != count) {
+            ocean_tensor_fail("every data-parallel worker needs one replica per Parameter");
+        }
+        for (size_t i = 0; i < count; ++i) {
+            if (ocean_tensor_size(slot->replicas[i]) != ocean_tensor_size(group->parameters[i])) {
+                ocean_tensor_fail("data-parallel replica does not match its Parameter");
+            }
+        }
+    }
+
+    if (sized != 0 && sized != workers) {
+        ocean_tensor_fail("data-parallel set_rows() must be called for every worker");
+    }
+
+    if (!group->gradients && count > 0) {
+        group->targets = (ocean_tensor_handle_t *)calloc(count, sizeof(*group->targets));
+        group->gradients =
+            (ocean_tensor_handle_t *)calloc(count * workers, sizeof(*group->gradients));
+        group->weights = (double *)calloc(workers, sizeof(*group->weights));
+        if (!group->targets || !group->gradients || !group->weights) {
+            ocean_tensor_fail("out of memory preparing data-parallel gradients");
+        }
+    }
+    /* Each worker averages over its own shard, so an uneven split weights
+       the shard means by their rows; without row counts, shards are equal. */
+    for (size_t w = 0; group->weights && w < workers; ++w) {
+        group->weights[w] = sized
+            ? (double)group->workers[w].rows / (double)rows
+            : 1.0 / (double)workers;
+    }
+    bool *created = (bool *)calloc(count ? count : 1, sizeof(*created));
+    if (!created) ocean_tensor_fail("out of memory preparing data-parallel gradients");
+    for (size_t i = 0; i < count; ++i) {
+        group->targets[i] = ocean_data_parallel_target(group->parameters[i], &created[i]);
+    }
+
+    if (!ocean_data_parallel_running(group)) {
+        for (size_t w = 0; w < workers; ++w) {
+            ocean_data_parallel_worker *slot = &group->workers[w];
+            if (pthread_create(&slot->thread, NULL, ocean_data_parallel_main, slot) != 0) {
+                ocean_tensor_fail("could not start a data-parallel worker thread");
+            }
+            slot->started = true;
+        }
+    }
+
+    pthread_mutex_lock(&group->lock);
+    group->function = function;
+    group->finished = 0;
+    ++group->round;
+    pthread_cond_broadcast(&group->wake);
+    while (group->finished < group->worker_count) {
+        pthread_cond_wait(&group->done, &group->lock);
+    }
+    pthread_mutex_unlock(&group->lock);
+
+    /* A Parameter no replica produced a gradient for stays without one. */
+    for (size_t i = 0; i < count; ++i) {
+        if (!created[i]) continue;
+        bool reached = false;
+        for (size_t w = 0; w < workers && !reached; ++w) {
+            reached = group->gradients[i * workers + w] != NULL;
+        }
+        if (!reached) ocean_autograd_park_grad(ocean_autograd_find(group->parameters[i]));
+    }
+    free(created);
+}
+
+void ocean_autograd_data_parallel_run(
+    int group_id,
+    ocean_autograd_worker_fn_t function
+) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+    if (!function) ocean_tensor_fail("data-parallel step function is null");
+    ocean_data_parallel_round(group, function);
+}
+
+void ocean_autograd_data_parallel_replay(int group_id) {
+    ocean_data_parallel_round(ocean_data_parallel_find(group_id), NULL);
+}
+
+void ocean_autograd_data_parallel_release(int group_id) {
+    ocean_data_parallel_group *group = ocean_data_parallel_find(group_id);
+
+    pthread_mutex_lock(&group->lock);
+    group->stopping = true;
+    pthread_cond_broadcast(&group->wake);
+    pthread_mutex_unlock(&group->lock);
+    for (int worker = 0; worker < group->worker_count; ++worker) {
+        if (group->workers[worker].started) {
+            pthread_join(group->workers[worker].thread, NULL);
+        }
+        free(group->workers[worker].replicas);
+        free(group->workers[worker].tape_metas);
+    }
+
+    ocean_data_parallel_group **cursor = &ocean_data_parallel_groups;
+    while (*cursor != group) cursor = &(*cursor)->next;
+    *cursor = group->next;
+
+    pthread_mutex_destroy(&group->lock);
+    pthread_cond_destroy(&group->wake);
+    pthread_cond_destroy(&group->done);
+    pthread_cond_destroy(&group->barrier);
+    free(group->workers);
+    free(group->parameters);
+    free(group->targets);
+    free(group->gradients);
+    free(group->weights);
+    free(group);
+}
@@ -17,15 +17,60 @@ bool ocean_autograd_has_grad(
 ocean_tensor_handle_t ocean_autograd_grad_copy(
     ocean_tensor_handle_t tensor
 );
+/* zero_grad() fills an existing gradient with zeros in place; clear_grad()
+   makes it absent (has_grad() is false) but keeps the buffer for reuse. */
 void ocean_autograd_zero_grad(
     ocean_tensor_handle_t tensor
 );
+void ocean_autograd_clear_grad(
+    ocean_tensor_handle_t tensor
+);
+/* A CPU [rows, dim] leaf with sparse gradients enabled gets a row-sparse
+   gradient from Embedding lookups: only the rows a batch touched, and the
+   optimizers update only those rows.  grad_copy() still returns the dense
+   gradient; sparse_grad_rows()/sparse_grad_values() return the touched row
+   ids (int64 [n]) and their gradients (float32 [n, dim]).  zero_grad()
+   empties a sparse gradient.  Any other use of the table (a tied output
+   projection, say) makes that step's gradient dense. */
+void ocean_autograd_set_sparse_grad(ocean_tensor_handle_t tensor, bool enabled);
+ocean_tensor_handle_t ocean_autograd_sparse_grad_rows(ocean_tensor_handle_t tensor);
+ocean_tensor_handle_t ocean_autograd_sparse_grad_values(ocean_tensor_handle_t tensor);
 void ocean_autograd_backward(
     ocean_tensor_handle_t tensor
 );
+/* Highest live Tensor byte count reached during the calling thread's last
+   backward(), counting only that thread's allocations on top of the bytes
+   live when it started. */
+size_t ocean_autograd_backward_peak_bytes(void);
+
+/* Tape capture.  Operations recorded between capture_begin() and
+   capture_end(), plus at most one backward(), are kept on a tape.
+   replay() recomputes them from the current contents of the Tensors they
+   read (new batch data written in place, updated Parameters) and reruns the
+   backward pass without rebuilding the graph.  CPU Tensors only. */
+int ocean_autograd_capture_begin(void);
+void ocean_autograd_capture_end(int tape_id);
+void ocean_autograd_replay(int tape_id);
+void ocean_autograd_release_tape(int tape_id);
+
+/* Activation checkpointing.  Operations between checkpoint_begin() and
+   checkpoint_end(output) keep no saved inputs, and their intermediates are
+   dropped at checkpoint_end().  backward() recomputes the segment from its
+   external inputs when it reaches `output`.  CPU Tensors only. */
+void ocean_autograd_checkpoint_begin(void);
+void ocean_autograd_checkpoint_end(ocean_tensor_handle_t output);
 void ocean_autograd_set_grad_enabled(bool enabled);
 bool ocean_autograd_grad_enabled(void);
 
+/* Fail unless `tensor` may be written in place (it is not tracked by
+   autograd while grad is enabled); check_out also rejects grad inputs. */
+void ocean_autograd_check_inplace(ocean_tensor_handle_t tensor);
+void ocean_autograd_check_out(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+);
+
 ocean_tensor_handle_t ocean_autograd_binary(
     ocean_tensor_handle_t left,
     ocean_tensor_handle_t right,
@@ -62,6 +107,16 @@ ocean_tensor_handle_t ocean_autograd_cross_entropy(
     ocean_tensor_handle_t targets
 );
 
+/* Fused softmax(q k^T / sqrt(d)) v; see
+   ocean_tensor_scaled_dot_product_attention.  Backward recomputes the
+   attention probabilities from saved per-query log-sum-exps. */
+ocean_tensor_handle_t ocean_autograd_scaled_dot_product_attention(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal
+);
+
 ocean_tensor_handle_t ocean_autograd_parameter_uniform(
     int rows,
     int cols,
@@ -124,4 +179,52 @@ void ocean_autograd_adamw_step(
     double weight_decay
 );
 
+/* Multi-tensor optimizer steps.  stage() queues a Parameter for the next
+   *_step_staged() call, which updates every staged Parameter in one pass
+   and clears the queue.  adamw_step_staged() also advances the step count. */
+int ocean_autograd_sgd_create(void);
+void ocean_autograd_optimizer_stage(int state_id, ocean_tensor_handle_t tensor);
+void ocean_autograd_sgd_step_staged(int state_id, double learning_rate);
+void ocean_autograd_adamw_step_staged(
+    int state_id,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay
+);
+
+/* Data-parallel training.  A group runs one persistent worker thread per
+   model replica, each with its own autograd state.  Parameters and their
+   replicas are added in the same order.  run() copies the master Parameters
+   into every replica, calls function(context) on all workers at once, and
+   adds the mean of the replica gradients to the master gradients, as
+   backward() would.  replay() does the same with each worker replaying the
+   tape set for it, captured over its replica.  CPU float32 Parameters only. */
+typedef void *(*ocean_autograd_worker_fn_t)(void *context);
+int ocean_autograd_data_parallel_create(int workers);
+void ocean_autograd_data_parallel_add_parameter(
+    int group_id,
+    ocean_tensor_handle_t parameter
+);
+void ocean_autograd_data_parallel_add_replica(
+    int group_id,
+    int worker,
+    ocean_tensor_handle_t replica
+);
+void ocean_autograd_data_parallel_set_context(int group_id, int worker, void *context);
+/* Rows of the batch in a worker's shard.  Once set for every worker, the
+   shard gradients are weighted by rows / batch instead of averaged, so an
+   uneven split still yields the full-batch mean. */
+void ocean_autograd_data_parallel_set_rows(int group_id, int worker, size_t rows);
+void ocean_autograd_data_parallel_set_tape(int group_id, int worker, int tape_id);
+void ocean_autograd_data_parallel_run(
+    int group_id,
+    ocean_autograd_worker_fn_t function
+);
+void ocean_autograd_data_parallel_replay(int group_id);
+/* Index of the calling data-parallel worker, or -1 outside one. */
+int ocean_autograd_data_parallel_worker(void);
+void ocean_autograd_data_parallel_release(int group_id);
+
 #endif
@@ -11,6 +11,9 @@ typedef struct ocean_tensor_handle *ocean_tensor_handle_t;
 typedef enum ocean_tensor_backend_kind {
     OCEAN_TENSOR_BACKEND_CPU = 0,
     OCEAN_TENSOR_BACKEND_OPENCL = 1,
+    /* Serves "cpu" Tensors when built with OCEAN_TENSOR_ENABLE_BLAS: CPU
+       storage and kernels, with matmul delegated to the system CBLAS. */
+    OCEAN_TENSOR_BACKEND_BLAS = 2,
 } ocean_tensor_backend_kind;
 
 typedef struct ocean_tensor_backend_ops {
@@ -18,6 +21,10 @@ typedef struct ocean_tensor_backend_ops {
     const char *name;
     bool compiled;
     void (*allocate)(ocean_tensor_handle_t tensor);
+    /* Optional: allocate zero-filled storage.  Backends that can obtain
+       zeroed memory without writing it set this; otherwise the runtime
+       calls allocate followed by zero. */
+    void (*allocate_zeroed)(ocean_tensor_handle_t tensor);
     void (*zero)(ocean_tensor_handle_t tensor);
     void (*copy)(ocean_tensor_handle_t destination,
                  const ocean_tensor_handle_t source);
@@ -26,12 +33,28 @@ typedef struct ocean_tensor_backend_ops {
     void (*release)(ocean_tensor_handle_t tensor);
     ocean_tensor_handle_t (*matmul)(ocean_tensor_handle_t left,
                                     ocean_tensor_handle_t right);
+    /* Rank >= 2 matmul with broadcast batch axes; each flag swaps the two
+       trailing axes of its operand. */
+    ocean_tensor_handle_t (*batched_matmul)(ocean_tensor_handle_t left,
+                                            ocean_tensor_handle_t right,
+                                            bool transpose_left,
+                                            bool transpose_right);
     ocean_tensor_handle_t (*binary)(ocean_tensor_handle_t left,
                                     ocean_tensor_handle_t right,
                                     int operation);
     ocean_tensor_handle_t (*scalar)(ocean_tensor_handle_t tensor,
                                     double scalar,
                                     int operation);
+    /* Destination-passing variants used by in-place and out= operations.
+       `result` already has the broadcast shape and may alias an operand. */
+    void (*binary_into)(ocean_tensor_handle_t left,
+                        ocean_tensor_handle_t right,
+                        ocean_tensor_handle_t result,
+                        int operation);
+    void (*scalar_into)(ocean_tensor_handle_t tensor,
+                        ocean_tensor_handle_t result,
+                        double scalar,
+                        int operation);
     void (*fill)(ocean_tensor_handle_t tensor, double value);
 } ocean_tensor_backend_ops;
 
@@ -1,3 +1,5 @@
+#define _POSIX_C_SOURCE 200809L
+
 #include "std/tensor/tensor_runtime.h"
 #include "std/tensor/tensor_backend.h"
 
@@ -6,14 +8,26 @@
 #include <errno.h>
 #include <stdint.h>
 #include <math.h>
+#include <pthread.h>
+#include <stdatomic.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <time.h>
+#include <unistd.h>
 
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
 #include <CL/cl.h>
 #endif
 
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+#include <cblas.h>
+#include <limits.h>
+#endif
+
 typedef enum ocean_tensor_dtype {
     OCEAN_TENSOR_BOOL,
     OCEAN_TENSOR_INT8,
@@ -36,6 +50,21 @@ enum {
     OCEAN_TENSOR_DIV = 3,
 };
 
+/* CPU buffer shared between a Tensor and the views taken from it.  Handles
+   that were never viewed own their buffer directly and have no storage; the
+   first view moves the buffer into a storage record, and the buffer returns
+   to the cache when the last handle referencing it is released. */
+typedef struct ocean_tensor_storage {
+    atomic_size_t references;
+    void *data;
+    size_t bytes;
+    /* `data` is a private file mapping of `bytes` bytes that is unmapped
+       instead of returned to the cache. */
+    bool mapped;
+} ocean_tensor_storage;
+
+typedef struct ocean_tensor_lazy_node ocean_tensor_lazy_node;
+
 struct ocean_tensor_handle {
     uint64_t identity;
     ocean_tensor_backend_kind device;
@@ -45,7 +74,12 @@ struct ocean_tensor_handle {
     size_t size;
     size_t *shape;
     size_t *strides;
+    /* First element of this handle; views point into `storage->data`. */
     void *cpu_data;
+    ocean_tensor_storage *storage;
+    /* Recorded elementwise expression of a lazy Tensor; NULL once its data
+       exists. */
+    ocean_tensor_lazy_node *pending;
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
     cl_mem gpu_data;
 #endif
@@ -54,13 +88,15 @@ struct ocean_tensor_handle {
 #define OCEAN_TENSOR_CPU OCEAN_TENSOR_BACKEND_CPU
 #define OCEAN_TENSOR_GPU OCEAN_TENSOR_BACKEND_OPENCL
 
-static uint64_t ocean_tensor_next_identity = 1;
+static _Atomic uint64_t ocean_tensor_next_identity = 1;
 
 
 
 static const ocean_tensor_backend_ops *ocean_tensor_backend_for_device(
     ocean_tensor_backend_kind device
 );
+static void ocean_tensor_materialize(ocean_tensor_handle_t tensor);
+static void ocean_tensor_lazy_flush(void);
 static ocean_tensor_handle_t ocean_tensor_matmul_cpu(
     ocean_tensor_handle_t left,
     ocean_tensor_handle_t right
@@ -69,6 +105,30 @@ static ocean_tensor_handle_t ocean_tensor_matmul_opencl(
     ocean_tensor_handle_t left,
     ocean_tensor_handle_t right
 );
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_cpu(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+);
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_opencl(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+);
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+static ocean_tensor_handle_t ocean_tensor_matmul_blas(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+);
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_blas(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+);
+#endif
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
 static ocean_tensor_handle_t ocean_tensor_matmul_opencl_batched(
     ocean_tensor_handle_t left,
@@ -97,12 +157,44 @@ static ocean_tensor_handle_t ocean_tensor_scalar_opencl(
     double scalar,
     int operation
 );
+static void ocean_tensor_binary_cpu_into(
+    const ocean_tensor_handle_t left,
+    const ocean_tensor_handle_t right,
+    ocean_tensor_handle_t result,
+    int operation
+);
+static void ocean_tensor_binary_opencl_into(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t result,
+    int operation
+);
+static void ocean_tensor_scalar_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result,
+    double scalar,
+    int operation
+);
+static void ocean_tensor_scalar_opencl_into(
+    ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result,
+    double scalar,
+    int operation
+);
 static ocean_tensor_handle_t ocean_tensor_ternary_quantize_cpu(
     const ocean_tensor_handle_t tensor
 );
 static ocean_tensor_handle_t ocean_tensor_gelu_cpu(
     const ocean_tensor_handle_t tensor
 );
+static void ocean_tensor_gelu_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result
+);
+static void ocean_tensor_relu_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result
+);
 static ocean_tensor_handle_t ocean_tensor_gelu_backward_cpu(
     const ocean_tensor_handle_t upstream,
     const ocean_tensor_handle_t input
@@ -180,6 +272,10 @@ static void ocean_tensor_opencl_gelu(
     int key
 );
 #endif
+static long double ocean_tensor_read_scalar(
+    const ocean_tensor_handle_t tensor,
+    size_t index
+);
 static void ocean_tensor_write_scalar(
     const ocean_tensor_handle_t tensor,
     size_t index,
@@ -317,8 +413,8 @@ static ocean_tensor_handle_t ocean_tensor_alloc(
         (ocean_tensor_handle_t)calloc(1, sizeof(*tensor));
     if (!tensor) ocean_tensor_fail("out of memory allocating Tensor handle");
 
-    tensor->identity = ocean_tensor_next_identity++;
-    if (ocean_tensor_next_identity == 0) {
+    tensor->identity = atomic_fetch_add(&ocean_tensor_next_identity, 1);
+    if (tensor->identity == UINT64_MAX) {
         ocean_tensor_fail("Tensor identity counter overflow");
     }
 
@@ -363,8 +459,12 @@ static ocean_tensor_handle_t ocean_tensor_alloc_zeros(
     ocean_tensor_handle_t tensor = ocean_tensor_alloc(shape, ndim, dtype, device);
     const ocean_tensor_backend_ops *backend =
         ocean_tensor_backend_for_device((ocean_tensor_backend_kind)device);
-    backend->allocate(tensor);
-    backend->zero(tensor);
+    if (backend->allocate_zeroed) {
+        backend->allocate_zeroed(tensor);
+    } else {
+        backend->allocate(tensor);
+        backend->zero(tensor);
+    }
     return tensor;
 }
 
@@ -381,6 +481,321 @@ static ocean_tensor_handle_t ocean_tensor_alloc_uninitialized(
     return tensor;
 }
 
+/* Offset, relative to cpu_data, of the row-major `index`-th element of a
+   possibly strided handle. */
+static size_t ocean_tensor_strided_offset(
+    const ocean_tensor_handle_t tensor,
+    size_t index
+) {
+    size_t offset = 0;
+    for (size_t axis = tensor->ndim; axis-- > 0;) {
+        size_t extent = tensor->shape[axis];
+        offset += (extent ? index % extent : 0) * tensor->strides[axis];
+        index = extent ? index / extent : 0;
+    }
+    return offset;
+}
+
+static size_t ocean_tensor_flat_offset(
+    const ocean_tensor_handle_t tensor,
+    size_t index
+) {
+    return ocean_tensor_is_contiguous(tensor)
+        ? index : ocean_tensor_strided_offset(tensor, index);
+}
+
+/* Row-major element copy between two CPU handles of the same shape, either
+   of which may be a strided view.  Unit-stride rows move with one memcpy. */
+static void ocean_tensor_strided_copy(
+    ocean_tensor_handle_t destination,
+    const ocean_tensor_handle_t source
+) {
+    size_t ndim = source->ndim;
+    size_t item_size = source->item_size;
+    size_t inner = source->shape[ndim - 1];
+    if (source->size == 0 || inner == 0) return;
+
+    size_t *coordinates = (size_t *)calloc(ndim, sizeof(size_t));
+    if (!coordinates) ocean_tensor_fail("out of memory copying a Tensor view");
+
+    unsigned char *out = (unsigned char *)destination->cpu_data;
+    const unsigned char *in = (const unsigned char *)source->cpu_data;
+    size_t source_step = source->strides[ndim - 1];
+    size_t destination_step = destination->strides[ndim - 1];
+    size_t rows = source->size / inner;
+    size_t source_row = 0;
+    size_t destination_row = 0;
+
+    for (size_t row = 0; row < rows; ++row) {
+        if (source_step == 1 && destination_step == 1) {
+            memcpy(
+                out + destination_row * item_size,
+                in + source_row * item_size,
+                inner * item_size
+            );
+        } else {
+            for (size_t i = 0; i < inner; ++i) {
+                memcpy(
+                    out + (destination_row + i * destination_step) * item_size,
+                    in + (source_row + i * source_step) * item_size,
+                    item_size
+                );
+            }
+        }
+        for (size_t axis = ndim - 1; axis-- > 0;) {
+            source_row += source->strides[axis];
+            destination_row += destination->strides[axis];
+            if (++coordinates[axis] < source->shape[axis]) break;
+            source_row -= source->strides[axis] * source->shape[axis];
+            destination_row -= destination->strides[axis] * destination->shape[axis];
+            coordinates[axis] = 0;
+        }
+    }
+    free(coordinates);
+}
+
+/* New CPU handle over `source`'s buffer starting `offset` elements in.
+   Nothing is copied: writes through either handle are visible in the other.
+   NULL `strides` keeps the row-major strides of `shape`. */
+static ocean_tensor_handle_t ocean_tensor_view(
+    ocean_tensor_handle_t source,
+    const size_t *shape,
+    const size_t *strides,
+    size_t ndim,
+    size_t offset
+) {
+    ocean_tensor_materialize(source);
+    if (source->device != OCEAN_TENSOR_BACKEND_CPU) {
+        ocean_tensor_fail("Tensor views are only available on the CPU");
+    }
+    if (!source->storage) {
+        ocean_tensor_storage *storage =
+            (ocean_tensor_storage *)malloc(sizeof(*storage));
+        if (!storage) ocean_tensor_fail("out of memory allocating Tensor storage");
+        atomic_init(&storage->references, 1);
+        storage->data = source->cpu_data;
+        storage->bytes = ocean_tensor_bytes(source);
+        storage->mapped = false;
+        source->storage = storage;
+    }
+
+    ocean_tensor_handle_t view = ocean_tensor_alloc(
+        shape, ndim, source->dtype, OCEAN_TENSOR_BACKEND_CPU
+    );
+    if (strides) memcpy(view->strides, strides, ndim * sizeof(size_t));
+    view->cpu_data = view->size && source->cpu_data
+        ? (unsigned char *)source->cpu_data + offset * source->item_size
+        : source->cpu_data;
+    view->storage = source->storage;
+    atomic_fetch_add(&view->storage->references, 1);
+    return view;
+}
+
+/* `tensor` itself when its elements are packed row-major, otherwise a packed
+   copy that the caller releases. */
+static ocean_tensor_handle_t ocean_tensor_dense(ocean_tensor_handle_t tensor) {
+    ocean_tensor_materialize(tensor);
+    return ocean_tensor_is_contiguous(tensor)
+        ? tensor : ocean_tensor_contiguous(tensor);
+}
+
+/* Packed CPU data for kernels that walk cpu_data linearly; same ownership
+   rule as ocean_tensor_dense. */
+static ocean_tensor_handle_t ocean_tensor_host(ocean_tensor_handle_t tensor) {
+    ocean_tensor_materialize(tensor);
+    if (tensor->device != OCEAN_TENSOR_BACKEND_CPU) {
+        return ocean_tensor_to(tensor, "cpu");
+    }
+    return ocean_tensor_dense(tensor);
+}
+
+/* CPU worker threads.  Kernels split an index range into contiguous chunks;
+   the calling thread runs the first chunk itself and a persistent pool, grown
+   on demand and kept for the life of the process, runs the rest.  Workers
+   never start nested parallel regions, so a kernel called from a worker (or
+   from a user Thread while another owns the pool) stays single-threaded
+   instead of oversubscribing the machine. */
+#define OCEAN_TENSOR_MAX_THREADS 256
+
+typedef void (*ocean_tensor_parallel_fn)(
+    void *context,
+    size_t begin,
+    size_t end
+);
+
+typedef struct ocean_tensor_parallel_chunk {
+    ocean_tensor_parallel_fn function;
+    void *context;
+    size_t begin;
+    size_t end;
+} ocean_tensor_parallel_chunk;
+
+/* Workers park on `wake` between jobs.  A job publishes chunks[1..active)
+   and bumps generation; the caller waits on `done` until `remaining` drops
+   to zero.  `owner` lets one parallel_for at a time use the pool. */
+typedef struct ocean_tensor_pool {
+    pthread_mutex_t owner;
+    pthread_mutex_t lock;
+    pthread_cond_t wake;
+    pthread_cond_t done;
+    uint64_t generation;
+    size_t workers;
+    size_t active;
+    size_t remaining;
+    uint64_t seen[OCEAN_TENSOR_MAX_THREADS];
+    ocean_tensor_parallel_chunk chunks[OCEAN_TENSOR_MAX_THREADS];
+} ocean_tensor_pool;
+
+static ocean_tensor_pool ocean_tensor_workers = {
+    .owner = PTHREAD_MUTEX_INITIALIZER,
+    .lock = PTHREAD_MUTEX_INITIALIZER,
+    .wake = PTHREAD_COND_INITIALIZER,
+    .done = PTHREAD_COND_INITIALIZER,
+};
+
+static _Atomic int ocean_tensor_num_threads = 0;
+static _Thread_local bool ocean_tensor_in_parallel_region = false;
+
+static int ocean_tensor_default_num_threads(void) {
+    const char *configured = getenv("OCEAN_TENSOR_NUM_THREADS");
+    if (configured && *configured) {
+        char *end = NULL;
+        long value = strtol(configured, &end, 10);
+        if (end && *end == '\0' && value > 0) {
+            return value > OCEAN_TENSOR_MAX_THREADS
+                ? OCEAN_TENSOR_MAX_THREADS : (int)value;
+        }
+    }
+    long online = sysconf(_SC_NPROCESSORS_ONLN);
+    if (online < 1) return 1;
+    return online > OCEAN_TENSOR_MAX_THREADS
+        ? OCEAN_TENSOR_MAX_THREADS : (int)online;
+}
+
+void ocean_tensor_set_num_threads(int threads) {
+    if (threads < 0) ocean_tensor_fail("Tensor thread count must be non-negative");
+    /* Zero restores the OCEAN_TENSOR_NUM_THREADS / CPU-count default. */
+    atomic_store(&ocean_tensor_num_threads, threads == 0
+        ? ocean_tensor_default_num_threads()
+        : (threads > OCEAN_TENSOR_MAX_THREADS ? OCEAN_TENSOR_MAX_THREADS : threads));
+}
+
+int ocean_tensor_get_num_threads(void) {
+    int threads = atomic_load(&ocean_tensor_num_threads);
+    if (threads == 0) {
+        /* Racing first calls compute the same default. */
+        threads = ocean_tensor_default_num_threads();
+        atomic_store(&ocean_tensor_num_threads, threads);
+    }
+    return threads;
+}
+
+void ocean_tensor_set_thread_parallelism(bool enabled) {
+    ocean_tensor_in_parallel_region = !enabled;
+}
+
+static void *ocean_tensor_parallel_worker(void *argument) {
+    ocean_tensor_pool *pool = &ocean_tensor_workers;
+    size_t index = (size_t)(uintptr_t)argument;
+    ocean_tensor_in_parallel_region = true;
+
+    pthread_mutex_lock(&pool->lock);
+    uint64_t seen = pool->seen[index];
+    for (;;) {
+        while (pool->generation == seen) pthread_cond_wait(&pool->wake, &pool->lock);
+        seen = pool->generation;
+        if (index >= pool->active) continue;
+        ocean_tensor_parallel_chunk chunk = pool->chunks[index];
+        pthread_mutex_unlock(&pool->lock);
+        chunk.function(chunk.context, chunk.begin, chunk.end);
+        pthread_mutex_lock(&pool->lock);
+        if (--pool->remaining == 0) pthread_cond_signal(&pool->done);
+    }
+    return NULL;
+}
+
+/* Grows the pool to at least `workers` threads (slots 1..workers) and
+   returns how many are running; a thread that cannot start is not an error,
+   the job just uses fewer.  Called with `owner` held. */
+static size_t ocean_tensor_pool_reserve(ocean_tensor_pool *pool, size_t workers) {
+    pthread_mutex_lock(&pool->lock);
+    while (pool->workers < workers) {
+        size_t index = pool->workers + 1;
+        pool->seen[index] = pool->generation;
+        pthread_t thread;
+        if (pthread_create(&thread, NULL, ocean_tensor_parallel_worker,
+                (void *)(uintptr_t)index) != 0) {
+            break;
+        }
+        pthread_detach(thread);
+        pool->workers = index;
+    }
+    size_t running = pool->workers;
+    pthread_mutex_unlock(&pool->lock);
+    return running;
+}
+
+/* Run function over [0, count).  grain is the smallest chunk worth a thread
+   of its own; ranges below it run inline on the caller. */
+static void ocean_tensor_parallel_for(
+    size_t count,
+    size_t grain,
+    ocean_tensor_parallel_fn function,
+    void *context
+) {
+    if (count == 0) return;
+    if (grain == 0) grain = 1;
+    size_t threads = ocean_tensor_in_parallel_region
+        ? 1 : (size_t)ocean_tensor_get_num_threads();
+    size_t useful = (count + grain - 1) / grain;
+    if (threads > useful) threads = useful;
+    if (threads <= 1) {
+        function(context, 0, count);
+        return;
+    }
+
+    ocean_tensor_pool *pool = &ocean_tensor_workers;
+    if (pthread_mutex_trylock(&pool->owner) != 0) {
+        function(context, 0, count);
+        return;
+    }
+    size_t running = ocean_tensor_pool_reserve(pool, threads - 1);
+    if (threads > running + 1) threads = running + 1;
+    if (threads <= 1) {
+        pthread_mutex_unlock(&pool->owner);
+        function(context, 0, count);
+        return;
+    }
+
+    size_t base = count / threads;
+    size_t extra = count % threads;
+    size_t begin = 0;
+    pthread_mutex_lock(&pool->lock);
+    for (size_t thread = 0; thread < threads; ++thread) {
+        size_t length = base + (thread < extra ? 1 : 0);
+        pool->chunks[thread].function = function;
+        pool->chunks[thread].context = context;
+        pool->chunks[thread].begin = begin;
+        pool->chunks[thread].end = begin + length;
+        begin += length;
+    }
+    size_t first = pool->chunks[0].end;
+    pool->active = threads;
+    pool->remaining = threads - 1;
+    ++pool->generation;
+    pthread_cond_broadcast(&pool->wake);
+    pthread_mutex_unlock(&pool->lock);
+
+    ocean_tensor_in_parallel_region = true;
+    function(context, 0, first);
+    ocean_tensor_in_parallel_region = false;
+
+    pthread_mutex_lock(&pool->lock);
+    while (pool->remaining > 0) pthread_cond_wait(&pool->done, &pool->lock);
+    pthread_mutex_unlock(&pool->lock);
+    pthread_mutex_unlock(&pool->owner);
+}
+
 
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
 static const char *ocean_tensor_matmul_kernel_source =
@@ -1284,12 +1699,274 @@ static void ocean_tensor_gpu_read(
 }
 #endif
 
-static void ocean_tensor_cpu_allocate(ocean_tensor_handle_t tensor) {
-    size_t bytes = ocean_tensor_bytes(tensor);
-    tensor->cpu_data = bytes ? malloc(bytes) : NULL;
-    if (bytes && !tensor->cpu_data) {
+/* CPU storage cache.  Released blocks are kept in per-size-class free lists
+   and handed to the next Tensor of the same class instead of going back to
+   malloc.  The smallest class is 64 bytes; above it each power-of-two range
+   is split into four equal steps (80, 96, 112, 128, then 160, 192, 224, 256
+   and so on), so a block wastes at most 25% of its size.  The
+   cache never holds more than the configured limit; a block that does not
+   fit is freed immediately.  Address-sanitizer builds default to a zero
+   limit so use-after-free bugs are not hidden by recycled blocks. */
+#define OCEAN_TENSOR_CACHE_MIN_BYTES ((size_t)64)
+#define OCEAN_TENSOR_CACHE_SUBCLASSES 4
+#define OCEAN_TENSOR_CACHE_CLASSES (OCEAN_TENSOR_CACHE_SUBCLASSES * 64)
+#if defined(__SANITIZE_ADDRESS__)
+#define OCEAN_TENSOR_CACHE_DEFAULT_LIMIT ((size_t)0)
+#else
+#define OCEAN_TENSOR_CACHE_DEFAULT_LIMIT ((size_t)1 << 30)
+#endif
+
+typedef struct ocean_tensor_cache_block {
+    struct ocean_tensor_cache_block *next;
+} ocean_tensor_cache_block;
+
+static pthread_mutex_t ocean_tensor_cache_lock = PTHREAD_MUTEX_INITIALIZER;
+static ocean_tensor_cache_block *ocean_tensor_cache_bins[OCEAN_TENSOR_CACHE_CLASSES];
+static bool ocean_tensor_cache_configured = false;
+static size_t ocean_tensor_cache_limit = 0;
+static size_t ocean_tensor_memory_live = 0;
+static size_t ocean_tensor_memory_peak = 0;
+static size_t ocean_tensor_memory_cached = 0;
+/* The window is per thread: live bytes when it was reset plus the highest
+   net amount this thread has allocated since, so phases running on other
+   threads at the same time neither reset nor inflate it. */
+static _Thread_local size_t ocean_tensor_memory_window_base = 0;
+static _Thread_local ptrdiff_t ocean_tensor_memory_window_net = 0;
+static _Thread_local ptrdiff_t ocean_tensor_memory_window_peak = 0;
+
+/* Returns the class index for `bytes` and stores the class block size, or
+   returns OCEAN_TENSOR_CACHE_CLASSES for sizes too large to round up. */
+static size_t ocean_tensor_cache_class(size_t bytes, size_t *class_bytes) {
+    if (bytes <= OCEAN_TENSOR_CACHE_MIN_BYTES) {
+        *class_bytes = OCEAN_TENSOR_CACHE_MIN_BYTES;
+        return 0;
+    }
+    if (bytes > SIZE_MAX / 2) {
+        *class_bytes = bytes;
+        return OCEAN_TENSOR_CACHE_CLASSES;
+    }
+    size_t shift = 6;
+    while ((bytes - 1) >> (shift + 1)) ++shift;
+    size_t base = (size_t)1 << shift;
+    size_t step = base / OCEAN_TENSOR_CACHE_SUBCLASSES;
+    size_t sub = (bytes - base + step - 1) / step;
+    *class_bytes = base + sub * step;
+    return 1 + (shift - 6) * OCEAN_TENSOR_CACHE_SUBCLASSES + (sub - 1);
+}
+
+/* Inverse of ocean_tensor_cache_class: the block size of class `index`. */
+static size_t ocean_tensor_cache_class_bytes(size_t index) {
+    if (index == 0) return OCEAN_TENSOR_CACHE_MIN_BYTES;
+    size_t base = (size_t)1 << (6 + (index - 1) / OCEAN_TENSOR_CACHE_SUBCLASSES);
+    size_t sub = 1 + (index - 1) % OCEAN_TENSOR_CACHE_SUBCLASSES;
+    return base + sub * (base / OCEAN_TENSOR_CACHE_SUBCLASSES);
+}
+
+/* Accepts a plain byte count with an optional K, M or G suffix. */
+static size_t ocean_tensor_cache_parse_limit(const char *text, size_t fallback) {
+    char *end = NULL;
+    unsigned long long value = strtoull(text, &end, 10);
+    if (end == text) return fallback;
+    unsigned long long scale = 1;
+    switch (*end) {
+        case 'k': case 'K': scale = 1ULL << 10; ++end; break;
+        case 'm': case 'M': scale = 1ULL << 20; ++end; break;
+        case 'g': case 'G': scale = 1ULL << 30; ++end; break;
+        default: break;
+    }
+    if (*end != '\0' && *end != 'B' && *end != 'b') return fallback;
+    if (value > (unsigned long long)SIZE_MAX / scale) return SIZE_MAX;
+    return (size_t)(value * scale);
+}
+
+/* Caller holds the cache lock. */
+static void ocean_tensor_cache_configure_locked(void) {
+    if (ocean_tensor_cache_configured) return;
+    ocean_tensor_cache_configured = true;
+    const char *text = getenv("OCEAN_TENSOR_CACHE_LIMIT");
+    ocean_tensor_cache_limit = text
+        ? ocean_tensor_cache_parse_limit(text, OCEAN_TENSOR_CACHE_DEFAULT_LIMIT)
+        : OCEAN_TENSOR_CACHE_DEFAULT_LIMIT;
+}
+
+/* Caller holds the cache lock.  Unlinks blocks, largest classes first, until
+   the cache fits in `limit` and returns them for freeing outside the lock. */
+static ocean_tensor_cache_block *ocean_tensor_cache_trim_locked(size_t limit) {
+    ocean_tensor_cache_block *evicted = NULL;
+    for (size_t index = OCEAN_TENSOR_CACHE_CLASSES;
+         index-- > 0 && ocean_tensor_memory_cached > limit;) {
+        while (ocean_tensor_cache_bins[index] &&
+               ocean_tensor_memory_cached > limit) {
+            ocean_tensor_cache_block *block = ocean_tensor_cache_bins[index];
+            ocean_tensor_cache_bins[index] = block->next;
+            ocean_tensor_memory_cached -= ocean_tensor_cache_class_bytes(index);
+            block->next = evicted;
+            evicted = block;
+        }
+    }
+    return evicted;
+}
+
+static void ocean_tensor_cache_free_list(ocean_tensor_cache_block *block) {
+    while (block) {
+        ocean_tensor_cache_block *next = block->next;
+        free(block);
+        block = next;
+    }
+}
+
+static void *ocean_tensor_cache_acquire(size_t bytes, bool zeroed) {
+    size_t class_bytes = 0;
+    size_t index = ocean_tensor_cache_class(bytes, &class_bytes);
+
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_block *block = NULL;
+    if (index < OCEAN_TENSOR_CACHE_CLASSES && ocean_tensor_cache_bins[index]) {
+        block = ocean_tensor_cache_bins[index];
+        ocean_tensor_cache_bins[index] = block->next;
+        ocean_tensor_memory_cached -= class_bytes;
+    }
+    ocean_tensor_memory_live += class_bytes;
+    if (ocean_tensor_memory_live > ocean_tensor_memory_peak) {
+        ocean_tensor_memory_peak = ocean_tensor_memory_live;
+    }
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    ocean_tensor_memory_window_net += (ptrdiff_t)class_bytes;
+    if (ocean_tensor_memory_window_net > ocean_tensor_memory_window_peak) {
+        ocean_tensor_memory_window_peak = ocean_tensor_memory_window_net;
+    }
+
+    if (block) {
+        if (zeroed) memset(block, 0, bytes);
+        return block;
+    }
+
+    /* Fresh blocks come from calloc when zeroes are needed: large requests
+       are served by new zero pages, which are then never written twice. */
+    void *data = zeroed ? calloc(1, class_bytes) : malloc(class_bytes);
+    if (!data) {
+        ocean_tensor_empty_cache();
+        data = zeroed ? calloc(1, class_bytes) : malloc(class_bytes);
+    }
+    if (!data) {
+        pthread_mutex_lock(&ocean_tensor_cache_lock);
+        ocean_tensor_memory_live -= class_bytes;
+        pthread_mutex_unlock(&ocean_tensor_cache_lock);
+        ocean_tensor_memory_window_net -= (ptrdiff_t)class_bytes;
         ocean_tensor_fail("out of memory allocating CPU Tensor");
     }
+    return data;
+}
+
+static void ocean_tensor_cache_release(void *data, size_t bytes) {
+    size_t class_bytes = 0;
+    size_t index = ocean_tensor_cache_class(bytes, &class_bytes);
+
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_configure_locked();
+    ocean_tensor_memory_live -= class_bytes;
+    bool keep = index < OCEAN_TENSOR_CACHE_CLASSES &&
+        class_bytes <= ocean_tensor_cache_limit &&
+        ocean_tensor_memory_cached <= ocean_tensor_cache_limit - class_bytes;
+    if (keep) {
+        ocean_tensor_cache_block *block = (ocean_tensor_cache_block *)data;
+        block->next = ocean_tensor_cache_bins[index];
+        ocean_tensor_cache_bins[index] = block;
+        ocean_tensor_memory_cached += class_bytes;
+    }
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    ocean_tensor_memory_window_net -= (ptrdiff_t)class_bytes;
+
+    if (!keep) free(data);
+}
+
+void ocean_tensor_set_cache_limit(size_t bytes) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_configured = true;
+    ocean_tensor_cache_limit = bytes;
+    ocean_tensor_cache_block *evicted = ocean_tensor_cache_trim_locked(bytes);
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_free_list(evicted);
+}
+
+size_t ocean_tensor_get_cache_limit(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_configure_locked();
+    size_t limit = ocean_tensor_cache_limit;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    return limit;
+}
+
+void ocean_tensor_empty_cache(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_block *evicted = ocean_tensor_cache_trim_locked(0);
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    ocean_tensor_cache_free_list(evicted);
+}
+
+size_t ocean_tensor_memory_live_bytes(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    size_t value = ocean_tensor_memory_live;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    return value;
+}
+
+size_t ocean_tensor_memory_peak_bytes(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    size_t value = ocean_tensor_memory_peak;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    return value;
+}
+
+size_t ocean_tensor_memory_cached_bytes(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    size_t value = ocean_tensor_memory_cached;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+    return value;
+}
+
+void ocean_tensor_reset_peak_memory(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    ocean_tensor_memory_peak = ocean_tensor_memory_live;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+}
+
+size_t ocean_tensor_memory_window_peak_bytes(void) {
+    return ocean_tensor_memory_window_base + (size_t)ocean_tensor_memory_window_peak;
+}
+
+void ocean_tensor_reset_window_peak_memory(void) {
+    ocean_tensor_memory_window_base = ocean_tensor_memory_live_bytes();
+    ocean_tensor_memory_window_net = 0;
+    ocean_tensor_memory_window_peak = 0;
+}
+
+char *ocean_tensor_memory_stats(void) {
+    pthread_mutex_lock(&ocean_tensor_cache_lock);
+    size_t live = ocean_tensor_memory_live;
+    size_t peak = ocean_tensor_memory_peak;
+    size_t cached = ocean_tensor_memory_cached;
+    pthread_mutex_unlock(&ocean_tensor_cache_lock);
+
+    char buffer[128];
+    int length = snprintf(
+        buffer, sizeof(buffer), "live=%zu peak=%zu cached=%zu",
+        live, peak, cached
+    );
+    char *result = (char *)malloc((size_t)length + 1);
+    if (!result) ocean_tensor_fail("out of memory formatting memory stats");
+    memcpy(result, buffer, (size_t)length + 1);
+    return result;
+}
+
+static void ocean_tensor_cpu_allocate(ocean_tensor_handle_t tensor) {
+    size_t bytes = ocean_tensor_bytes(tensor);
+    tensor->cpu_data = bytes ? ocean_tensor_cache_acquire(bytes, false) : NULL;
+}
+
+static void ocean_tensor_cpu_allocate_zeroed(ocean_tensor_handle_t tensor) {
+    size_t bytes = ocean_tensor_bytes(tensor);
+    tensor->cpu_data = bytes ? ocean_tensor_cache_acquire(bytes, true) : NULL;
 }
 
 static void ocean_tensor_cpu_zero(ocean_tensor_handle_t tensor) {
@@ -1301,6 +1978,11 @@ static void ocean_tensor_cpu_copy(
     ocean_tensor_handle_t destination,
     const ocean_tensor_handle_t source
 ) {
+    if (!ocean_tensor_is_contiguous(destination) ||
+        !ocean_tensor_is_contiguous(source)) {
+        ocean_tensor_strided_copy(destination, source);
+        return;
+    }
     size_t bytes = ocean_tensor_bytes(source);
     if (bytes) memcpy(destination->cpu_data, source->cpu_data, bytes);
 }
@@ -1309,6 +1991,16 @@ static void ocean_tensor_cpu_read(
     const ocean_tensor_handle_t tensor,
     void *host_data
 ) {
+    if (!ocean_tensor_is_contiguous(tensor)) {
+        ocean_tensor_handle_t packed = ocean_tensor_alloc(
+            tensor->shape, tensor->ndim, tensor->dtype, tensor->device
+        );
+        packed->cpu_data = host_data;
+        ocean_tensor_strided_copy(packed, tensor);
+        packed->cpu_data = NULL;
+        ocean_tensor_release(packed);
+        return;
+    }
     size_t bytes = ocean_tensor_bytes(tensor);
     if (bytes) memcpy(host_data, tensor->cpu_data, bytes);
 }
@@ -1317,12 +2009,39 @@ static void ocean_tensor_cpu_write(
     ocean_tensor_handle_t tensor,
     const void *host_data
 ) {
+    if (!ocean_tensor_is_contiguous(tensor)) {
+        ocean_tensor_handle_t packed = ocean_tensor_alloc(
+            tensor->shape, tensor->ndim, tensor->dtype, tensor->device
+        );
+        packed->cpu_data = (void *)host_data;
+        ocean_tensor_strided_copy(tensor, packed);
+        packed->cpu_data = NULL;
+        ocean_tensor_release(packed);
+        return;
+    }
     size_t bytes = ocean_tensor_bytes(tensor);
     if (bytes) memcpy(tensor->cpu_data, host_data, bytes);
 }
 
+/* Drops one reference; the last one unmaps or recycles the buffer. */
+static void ocean_tensor_storage_release(ocean_tensor_storage *storage) {
+    if (atomic_fetch_sub(&storage->references, 1) != 1) return;
+    if (storage->mapped) {
+        munmap(storage->data, storage->bytes);
+    } else if (storage->data) {
+        ocean_tensor_cache_release(storage->data, storage->bytes);
+    }
+    free(storage);
+}
+
 static void ocean_tensor_cpu_release(ocean_tensor_handle_t tensor) {
-    free(tensor->cpu_data);
+    ocean_tensor_storage *storage = tensor->storage;
+    if (storage) {
+        ocean_tensor_storage_release(storage);
+    } else if (tensor->cpu_data) {
+        ocean_tensor_cache_release(tensor->cpu_data, ocean_tensor_bytes(tensor));
+    }
+    tensor->storage = NULL;
     tensor->cpu_data = NULL;
 }
 
@@ -1396,16 +2115,44 @@ static const ocean_tensor_backend_ops ocean_tensor_cpu_backend = {
     .name = "cpu",
     .compiled = true,
     .allocate = ocean_tensor_cpu_allocate,
+    .allocate_zeroed = ocean_tensor_cpu_allocate_zeroed,
     .zero = ocean_tensor_cpu_zero,
     .copy = ocean_tensor_cpu_copy,
     .read = ocean_tensor_cpu_read,
     .write = ocean_tensor_cpu_write,
     .release = ocean_tensor_cpu_release,
     .matmul = ocean_tensor_matmul_cpu,
+    .batched_matmul = ocean_tensor_batched_matmul_cpu,
+    .binary = ocean_tensor_binary_cpu,
+    .scalar = ocean_tensor_scalar_cpu,
+    .binary_into = ocean_tensor_binary_cpu_into,
+    .scalar_into = ocean_tensor_scalar_cpu_into,
+    .fill = ocean_tensor_fill_cpu,
+};
+
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+/* Same storage and elementwise kernels as the CPU table; only matmul is
+   routed to CBLAS, and it falls back to the built-in engine itself. */
+static const ocean_tensor_backend_ops ocean_tensor_blas_backend = {
+    .kind = OCEAN_TENSOR_BACKEND_BLAS,
+    .name = "blas",
+    .compiled = true,
+    .allocate = ocean_tensor_cpu_allocate,
+    .allocate_zeroed = ocean_tensor_cpu_allocate_zeroed,
+    .zero = ocean_tensor_cpu_zero,
+    .copy = ocean_tensor_cpu_copy,
+    .read = ocean_tensor_cpu_read,
+    .write = ocean_tensor_cpu_write,
+    .release = ocean_tensor_cpu_release,
+    .matmul = ocean_tensor_matmul_blas,
+    .batched_matmul = ocean_tensor_batched_matmul_blas,
     .binary = ocean_tensor_binary_cpu,
     .scalar = ocean_tensor_scalar_cpu,
+    .binary_into = ocean_tensor_binary_cpu_into,
+    .scalar_into = ocean_tensor_scalar_cpu_into,
     .fill = ocean_tensor_fill_cpu,
 };
+#endif
 
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
 static const ocean_tensor_backend_ops ocean_tensor_opencl_backend = {
@@ -1419,8 +2166,11 @@ static const ocean_tensor_backend_ops ocean_tensor_opencl_backend = {
     .write = ocean_tensor_gpu_write,
     .release = ocean_tensor_opencl_release,
     .matmul = ocean_tensor_matmul_opencl,
+    .batched_matmul = ocean_tensor_batched_matmul_opencl,
     .binary = ocean_tensor_binary_opencl,
     .scalar = ocean_tensor_scalar_opencl,
+    .binary_into = ocean_tensor_binary_opencl_into,
+    .scalar_into = ocean_tensor_scalar_opencl_into,
     .fill = ocean_tensor_fill_opencl,
 };
 #else
@@ -1435,8 +2185,11 @@ static const ocean_tensor_backend_ops ocean_tensor_opencl_backend = {
     .write = ocean_tensor_gpu_write_unavailable,
     .release = ocean_tensor_gpu_release_unavailable,
     .matmul = ocean_tensor_matmul_opencl,
+    .batched_matmul = ocean_tensor_batched_matmul_opencl,
     .binary = ocean_tensor_binary_opencl,
     .scalar = ocean_tensor_scalar_opencl,
+    .binary_into = ocean_tensor_binary_opencl_into,
+    .scalar_into = ocean_tensor_scalar_opencl_into,
     .fill = ocean_tensor_fill_opencl,
 };
 #endif
@@ -1444,7 +2197,13 @@ static const ocean_tensor_backend_ops ocean_tensor_opencl_backend = {
 static const ocean_tensor_backend_ops *ocean_tensor_backend_for_device(
     ocean_tensor_backend_kind device
 ) {
-    if (device == OCEAN_TENSOR_BACKEND_CPU) return &ocean_tensor_cpu_backend;
+    if (device == OCEAN_TENSOR_BACKEND_CPU) {
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+        return &ocean_tensor_blas_backend;
+#else
+        return &ocean_tensor_cpu_backend;
+#endif
+    }
     if (device == OCEAN_TENSOR_BACKEND_OPENCL) return &ocean_tensor_opencl_backend;
     ocean_tensor_fail("invalid Tensor backend device");
     return &ocean_tensor_cpu_backend;
@@ -1552,6 +2311,82 @@ ocean_tensor_handle_t ocean_tensor_from_cpu_strided(
     return result;
 }
 
+/* Converts `count` packed elements between two host buffers. */
+static void ocean_tensor_convert_buffer(
+    void *destination,
+    ocean_tensor_dtype destination_dtype,
+    const void *source,
+    ocean_tensor_dtype source_dtype,
+    size_t count
+) {
+    if (destination_dtype == source_dtype) {
+        memcpy(destination, source, count * ocean_tensor_dtype_size(source_dtype));
+        return;
+    }
+    /* Only cpu_data and dtype are read by the scalar accessors. */
+    struct ocean_tensor_handle from;
+    struct ocean_tensor_handle to;
+    memset(&from, 0, sizeof(from));
+    memset(&to, 0, sizeof(to));
+    from.cpu_data = (void *)source;
+    from.dtype = source_dtype;
+    to.cpu_data = destination;
+    to.dtype = destination_dtype;
+    for (size_t index = 0; index < count; ++index) {
+        ocean_tensor_write_scalar(&to, index, ocean_tensor_read_scalar(&from, index));
+    }
+}
+
+void ocean_tensor_copy_from_buffer(
+    ocean_tensor_handle_t tensor,
+    const void *data,
+    size_t count,
+    const char *dtype
+) {
+    if (!tensor) ocean_tensor_fail("Tensor.copy_from received a null Tensor");
+    ocean_tensor_lazy_flush();
+    if (count != tensor->size) {
+        ocean_tensor_fail("Tensor.copy_from element count does not match the Tensor");
+    }
+    if (count == 0) return;
+    if (!data) ocean_tensor_fail("Tensor.copy_from received null data");
+    ocean_tensor_dtype source_dtype = ocean_tensor_parse_dtype(dtype);
+    if (
+        tensor->device == OCEAN_TENSOR_CPU
+        && ocean_tensor_is_contiguous(tensor)
+    ) {
+        ocean_tensor_convert_buffer(
+            tensor->cpu_data, tensor->dtype, data, source_dtype, count
+        );
+        return;
+    }
+    ocean_tensor_handle_t host = ocean_tensor_alloc_uninitialized(
+        tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_convert_buffer(host->cpu_data, host->dtype, data, source_dtype, count);
+    ocean_tensor_copy_into(tensor, host);
+    ocean_tensor_release(host);
+}
+
+void ocean_tensor_copy_to_buffer(
+    ocean_tensor_handle_t tensor,
+    void *data,
+    size_t count,
+    const char *dtype
+) {
+    if (!tensor) ocean_tensor_fail("Tensor.copy_to received a null Tensor");
+    ocean_tensor_lazy_flush();
+    if (count != tensor->size) {
+        ocean_tensor_fail("Tensor.copy_to element count does not match the Tensor");
+    }
+    if (count == 0) return;
+    if (!data) ocean_tensor_fail("Tensor.copy_to received null data");
+    ocean_tensor_dtype destination_dtype = ocean_tensor_parse_dtype(dtype);
+    ocean_tensor_handle_t host = ocean_tensor_host(tensor);
+    ocean_tensor_convert_buffer(data, destination_dtype, host->cpu_data, host->dtype, count);
+    if (host != tensor) ocean_tensor_release(host);
+}
+
 
 static void ocean_tensor_fill_cpu(
     ocean_tensor_handle_t tensor,
@@ -1559,6 +2394,17 @@ static void ocean_tensor_fill_cpu(
 ) {
     if (tensor->size == 0) return;
 
+    if (!ocean_tensor_is_contiguous(tensor)) {
+        for (size_t i = 0; i < tensor->size; ++i) {
+            ocean_tensor_write_scalar(
+                tensor,
+                ocean_tensor_strided_offset(tensor, i),
+                (long double)value
+            );
+        }
+        return;
+    }
+
     if (value == 0.0) {
         memset(tensor->cpu_data, 0, ocean_tensor_bytes(tensor));
         return;
@@ -1594,9 +2440,318 @@ static void ocean_tensor_fill_cpu(
 }
 
 
-ocean_tensor_handle_t ocean_tensor_copy(ocean_tensor_handle_t tensor) {
-    if (!tensor) ocean_tensor_fail("cannot copy a null Tensor");
-    ocean_tensor_handle_t result = ocean_tensor_alloc(
+/* ================= Lazy elementwise fusion ================= */
+
+/* With lazy mode on, float32 CPU elementwise operations (binary ops on
+   equal shapes, scalar ops, relu, gelu) return a pending handle that only
+   records the operation.  Pending handles chain into an expression DAG whose
+   leaves are views of materialized inputs.  The first consumer that reads
+   element data compiles the DAG into one program and evaluates it block by
+   block, so a chain like x * w + b -> gelu makes one pass over memory and one
+   allocation instead of three of each.  Writes into any Tensor first
+   materialize every pending handle, because a leaf may alias the written
+   storage. */
+#define OCEAN_TENSOR_LAZY_MAX_NODES 64
+#define OCEAN_TENSOR_LAZY_BLOCK 1024
+#define OCEAN_TENSOR_LAZY_GRAIN 16
+
+enum {
+    OCEAN_TENSOR_LAZY_LEAF = 0,
+    OCEAN_TENSOR_LAZY_BINARY = 1,
+    OCEAN_TENSOR_LAZY_SCALAR = 2,
+    OCEAN_TENSOR_LAZY_RELU = 3,
+    OCEAN_TENSOR_LAZY_GELU = 4,
+};
+
+struct ocean_tensor_lazy_node {
+    size_t references;
+    int kind;
+    int operation;
+    float scalar;
+    /* Tree size including shared subexpressions; bounds the program size. */
+    size_t nodes;
+    struct ocean_tensor_lazy_node *left;
+    struct ocean_tensor_lazy_node *right;
+    ocean_tensor_handle_t leaf;
+};
+
+typedef struct ocean_tensor_lazy_instruction {
+    int kind;
+    int operation;
+    float scalar;
+    size_t left;
+    size_t right;
+    const float *data;
+} ocean_tensor_lazy_instruction;
+
+typedef struct ocean_tensor_lazy_program {
+    ocean_tensor_lazy_instruction instructions[OCEAN_TENSOR_LAZY_MAX_NODES];
+    const ocean_tensor_lazy_node *nodes[OCEAN_TENSOR_LAZY_MAX_NODES];
+    size_t count;
+    size_t size;
+    float *output;
+} ocean_tensor_lazy_program;
+
+/* Lazy mode and its pending list are per thread: a thread only records and
+   flushes its own expressions. */
+static _Thread_local bool ocean_tensor_lazy_enabled_state = false;
+static _Thread_local ocean_tensor_handle_t *ocean_tensor_lazy_pending = NULL;
+static _Thread_local size_t ocean_tensor_lazy_pending_count = 0;
+static _Thread_local size_t ocean_tensor_lazy_pending_capacity = 0;
+
+void ocean_tensor_set_lazy_enabled(bool enabled) {
+    ocean_tensor_lazy_enabled_state = enabled;
+}
+
+bool ocean_tensor_lazy_enabled(void) {
+    return ocean_tensor_lazy_enabled_state;
+}
+
+static void ocean_tensor_lazy_node_release(ocean_tensor_lazy_node *node) {
+    if (!node || --node->references > 0) return;
+    ocean_tensor_lazy_node_release(node->left);
+    ocean_tensor_lazy_node_release(node->right);
+    ocean_tensor_release(node->leaf);
+    free(node);
+}
+
+static void ocean_tensor_lazy_forget(ocean_tensor_handle_t tensor) {
+    for (size_t i = 0; i < ocean_tensor_lazy_pending_count; ++i) {
+        if (ocean_tensor_lazy_pending[i] == tensor) {
+            ocean_tensor_lazy_pending[i] =
+                ocean_tensor_lazy_pending[--ocean_tensor_lazy_pending_count];
+            return;
+        }
+    }
+}
+
+static size_t ocean_tensor_lazy_compile(
+    ocean_tensor_lazy_program *program,
+    const ocean_tensor_lazy_node *node
+) {
+    for (size_t i = 0; i < program->count; ++i) {
+        if (program->nodes[i] == node) return i;
+    }
+    ocean_tensor_lazy_instruction instruction = {
+        .kind = node->kind,
+        .operation = node->operation,
+        .scalar = node->scalar,
+    };
+    if (node->kind == OCEAN_TENSOR_LAZY_LEAF) {
+        instruction.data = (const float *)node->leaf->cpu_data;
+    } else {
+        instruction.left = ocean_tensor_lazy_compile(program, node->left);
+        if (node->right) {
+            instruction.right = ocean_tensor_lazy_compile(program, node->right);
+        }
+    }
+    if (program->count == OCEAN_TENSOR_LAZY_MAX_NODES) {
+        ocean_tensor_fail("lazy Tensor expression is too large");
+    }
+    program->nodes[program->count] = node;
+    program->instructions[program->count] = instruction;
+    return program->count++;
+}
+
+static void ocean_tensor_lazy_run_blocks(void *context, size_t begin, size_t end) {
+    const ocean_tensor_lazy_program *program =
+        (const ocean_tensor_lazy_program *)context;
+    float *scratch = (float *)malloc(
+        program->count * OCEAN_TENSOR_LAZY_BLOCK * sizeof(float)
+    );
+    if (!scratch) ocean_tensor_fail("out of memory evaluating a lazy Tensor");
+    const float *values[OCEAN_TENSOR_LAZY_MAX_NODES];
+    const float coefficient = 0.7978845608028654f;
+    const float cubic = 0.044715f;
+
+    for (size_t block = begin; block < end; ++block) {
+        size_t start = block * OCEAN_TENSOR_LAZY_BLOCK;
+        size_t length = program->size - start < OCEAN_TENSOR_LAZY_BLOCK
+            ? program->size - start : OCEAN_TENSOR_LAZY_BLOCK;
+
+        for (size_t k = 0; k < program->count; ++k) {
+            const ocean_tensor_lazy_instruction *instruction =
+                &program->instructions[k];
+            if (instruction->kind == OCEAN_TENSOR_LAZY_LEAF) {
+                values[k] = instruction->data + start;
+                continue;
+            }
+            /* The root is compiled last and writes straight into the result. */
+            float *out = k + 1 == program->count
+                ? program->output + start
+                : scratch + k * OCEAN_TENSOR_LAZY_BLOCK;
+            const float *a = values[instruction->left];
+            const float *b = values[instruction->right];
+            float s = instruction->scalar;
+
+            switch (instruction->kind) {
+                case OCEAN_TENSOR_LAZY_BINARY:
+                    switch (instruction->operation) {
+                        case OCEAN_TENSOR_ADD:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] + b[i];
+                            break;
+                        case OCEAN_TENSOR_SUB:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] - b[i];
+                            break;
+                        case OCEAN_TENSOR_MUL:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] * b[i];
+                            break;
+                        case OCEAN_TENSOR_DIV:
+                            for (size_t i = 0; i < length; ++i) {
+                                if (b[i] == 0.0f) {
+                                    ocean_tensor_fail("Tensor division by zero");
+                                }
+                                out[i] = a[i] / b[i];
+                            }
+                            break;
+                    }
+                    break;
+                case OCEAN_TENSOR_LAZY_SCALAR:
+                    switch (instruction->operation) {
+                        case OCEAN_TENSOR_ADD:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] + s;
+                            break;
+                        case OCEAN_TENSOR_SUB:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] - s;
+                            break;
+                        case OCEAN_TENSOR_MUL:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] * s;
+                            break;
+                        case OCEAN_TENSOR_DIV:
+                            for (size_t i = 0; i < length; ++i) out[i] = a[i] / s;
+                            break;
+                    }
+                    break;
+                case OCEAN_TENSOR_LAZY_RELU:
+                    for (size_t i = 0; i < length; ++i) {
+                        out[i] = a[i] > 0.0f ? a[i] : 0.0f;
+                    }
+                    break;
+                case OCEAN_TENSOR_LAZY_GELU:
+                    for (size_t i = 0; i < length; ++i) {
+                        float value = a[i];
+                        float value_squared = value * value;
+                        float argument = coefficient * (
+                            value + cubic * value * value_squared
+                        );
+                        out[i] = 0.5f * value * (1.0f + tanhf(argument));
+                    }
+                    break;
+            }
+            values[k] = out;
+        }
+    }
+    free(scratch);
+}
+
+static void ocean_tensor_materialize(ocean_tensor_handle_t tensor) {
+    if (!tensor || !tensor->pending) return;
+    ocean_tensor_lazy_node *root = tensor->pending;
+    tensor->pending = NULL;
+    ocean_tensor_lazy_forget(tensor);
+
+    ocean_tensor_backend_for_device(tensor->device)->allocate(tensor);
+    ocean_tensor_lazy_program *program =
+        (ocean_tensor_lazy_program *)malloc(sizeof(*program));
+    if (!program) ocean_tensor_fail("out of memory compiling a lazy Tensor");
+    program->count = 0;
+    program->size = tensor->size;
+    program->output = (float *)tensor->cpu_data;
+    ocean_tensor_lazy_compile(program, root);
+
+    size_t blocks = (tensor->size + OCEAN_TENSOR_LAZY_BLOCK - 1)
+        / OCEAN_TENSOR_LAZY_BLOCK;
+    ocean_tensor_parallel_for(
+        blocks, OCEAN_TENSOR_LAZY_GRAIN, ocean_tensor_lazy_run_blocks, program
+    );
+    free(program);
+    ocean_tensor_lazy_node_release(root);
+}
+
+static void ocean_tensor_lazy_flush(void) {
+    while (ocean_tensor_lazy_pending_count > 0) {
+        ocean_tensor_materialize(
+            ocean_tensor_lazy_pending[ocean_tensor_lazy_pending_count - 1]
+        );
+    }
+}
+
+static bool ocean_tensor_lazy_accepts(const ocean_tensor_handle_t tensor) {
+    return ocean_tensor_lazy_enabled_state
+        && tensor->device == OCEAN_TENSOR_CPU
+        && tensor->dtype == OCEAN_TENSOR_FLOAT32
+        && tensor->size != 0;
+}
+
+/* Expression node for an operand: the operand's own pending expression,
+   or a leaf holding a view that keeps the operand's storage alive. */
+static ocean_tensor_lazy_node *ocean_tensor_lazy_operand(
+    ocean_tensor_handle_t tensor
+) {
+    /* Two operands of at most MAX/2 - 1 nodes keep the result in bounds. */
+    if (tensor->pending &&
+        tensor->pending->nodes >= OCEAN_TENSOR_LAZY_MAX_NODES / 2) {
+        ocean_tensor_materialize(tensor);
+    }
+    if (tensor->pending) {
+        ++tensor->pending->references;
+        return tensor->pending;
+    }
+    ocean_tensor_lazy_node *node =
+        (ocean_tensor_lazy_node *)calloc(1, sizeof(*node));
+    if (!node) ocean_tensor_fail("out of memory recording a lazy Tensor");
+    node->references = 1;
+    node->kind = OCEAN_TENSOR_LAZY_LEAF;
+    node->nodes = 1;
+    node->leaf = ocean_tensor_is_contiguous(tensor)
+        ? ocean_tensor_view(tensor, tensor->shape, tensor->strides, tensor->ndim, 0)
+        : ocean_tensor_contiguous(tensor);
+    return node;
+}
+
+static ocean_tensor_handle_t ocean_tensor_lazy_record(
+    const ocean_tensor_handle_t shape_source,
+    int kind,
+    int operation,
+    double scalar,
+    ocean_tensor_lazy_node *left,
+    ocean_tensor_lazy_node *right
+) {
+    ocean_tensor_lazy_node *node =
+        (ocean_tensor_lazy_node *)calloc(1, sizeof(*node));
+    if (!node) ocean_tensor_fail("out of memory recording a lazy Tensor");
+    node->references = 1;
+    node->kind = kind;
+    node->operation = operation;
+    node->scalar = (float)scalar;
+    node->left = left;
+    node->right = right;
+    node->nodes = 1 + left->nodes + (right ? right->nodes : 0);
+
+    if (ocean_tensor_lazy_pending_count == ocean_tensor_lazy_pending_capacity) {
+        size_t capacity = ocean_tensor_lazy_pending_capacity
+            ? ocean_tensor_lazy_pending_capacity * 2 : 16;
+        ocean_tensor_handle_t *pending = (ocean_tensor_handle_t *)realloc(
+            ocean_tensor_lazy_pending, capacity * sizeof(*pending)
+        );
+        if (!pending) ocean_tensor_fail("out of memory recording a lazy Tensor");
+        ocean_tensor_lazy_pending = pending;
+        ocean_tensor_lazy_pending_capacity = capacity;
+    }
+
+    ocean_tensor_handle_t result = ocean_tensor_alloc(
+        shape_source->shape, shape_source->ndim, OCEAN_TENSOR_FLOAT32,
+        OCEAN_TENSOR_CPU
+    );
+    result->pending = node;
+    ocean_tensor_lazy_pending[ocean_tensor_lazy_pending_count++] = result;
+    return result;
+}
+
+ocean_tensor_handle_t ocean_tensor_copy(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("cannot copy a null Tensor");
+    ocean_tensor_materialize(tensor);
+    ocean_tensor_handle_t result = ocean_tensor_alloc(
         tensor->shape, tensor->ndim, tensor->dtype, tensor->device
     );
     const ocean_tensor_backend_ops *backend =
@@ -1610,6 +2765,7 @@ ocean_tensor_handle_t ocean_tensor_ternary_quantize(
     ocean_tensor_handle_t tensor
 ) {
     if (!tensor) ocean_tensor_fail("Tensor.ternary_quantize on null handle");
+    ocean_tensor_materialize(tensor);
     if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
         ocean_tensor_fail("Tensor.ternary_quantize currently requires float32");
     }
@@ -1645,9 +2801,18 @@ ocean_tensor_handle_t ocean_tensor_gelu(ocean_tensor_handle_t tensor) {
     if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
         ocean_tensor_fail("Tensor.gelu currently requires float32");
     }
+    if (ocean_tensor_lazy_accepts(tensor)) {
+        return ocean_tensor_lazy_record(
+            tensor, OCEAN_TENSOR_LAZY_GELU, 0, 0.0,
+            ocean_tensor_lazy_operand(tensor), NULL
+        );
+    }
 
     if (tensor->device == OCEAN_TENSOR_CPU) {
-        return ocean_tensor_gelu_cpu(tensor);
+        ocean_tensor_handle_t source = ocean_tensor_dense(tensor);
+        ocean_tensor_handle_t result = ocean_tensor_gelu_cpu(source);
+        if (source != tensor) ocean_tensor_release(source);
+        return result;
     }
 
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
@@ -1672,10 +2837,131 @@ ocean_tensor_handle_t ocean_tensor_gelu(ocean_tensor_handle_t tensor) {
 #endif
 }
 
+/* Shared validation for destination-passing operations: `out` must match the
+   source dtype and device and already have the result shape. */
+static bool ocean_tensor_destination_matches(
+    const ocean_tensor_handle_t out,
+    const ocean_tensor_handle_t source,
+    const size_t *shape,
+    size_t ndim
+) {
+    if (!out) ocean_tensor_fail("Tensor operation received a null destination");
+    if (out->dtype != source->dtype) {
+        ocean_tensor_fail("Tensor operation destination dtype mismatch");
+    }
+    if (out->device != source->device) {
+        ocean_tensor_fail("Tensor operation destination device mismatch");
+    }
+    if (out->ndim != ndim) return false;
+    for (size_t axis = 0; axis < ndim; ++axis) {
+        if (out->shape[axis] != shape[axis]) return false;
+    }
+    return true;
+}
+
+/* Kernels write their results linearly, so a strided `out` view receives
+   them through a packed scratch Tensor that ocean_tensor_finish_destination
+   scatters back into the view. */
+static ocean_tensor_handle_t ocean_tensor_packed_destination(
+    ocean_tensor_handle_t out
+) {
+    if (ocean_tensor_is_contiguous(out)) return out;
+    return ocean_tensor_alloc_uninitialized(
+        out->shape, out->ndim, out->dtype, out->device
+    );
+}
+
+static void ocean_tensor_finish_destination(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t packed
+) {
+    if (packed == out) return;
+    ocean_tensor_copy_into(out, packed);
+    ocean_tensor_release(packed);
+}
+
+void ocean_tensor_gelu_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t tensor
+) {
+    if (!tensor) ocean_tensor_fail("Tensor.gelu on null handle");
+    ocean_tensor_lazy_flush();
+    if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_fail("Tensor.gelu currently requires float32");
+    }
+    if (!ocean_tensor_destination_matches(out, tensor, tensor->shape, tensor->ndim)) {
+        ocean_tensor_fail("Tensor operation destination shape mismatch");
+    }
+
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        ocean_tensor_handle_t source = ocean_tensor_dense(tensor);
+        ocean_tensor_handle_t target = ocean_tensor_packed_destination(out);
+        ocean_tensor_gelu_cpu_into(source, target);
+        ocean_tensor_finish_destination(out, target);
+        if (source != tensor) ocean_tensor_release(source);
+        return;
+    }
+
+#ifdef OCEAN_TENSOR_ENABLE_OPENCL
+    if (tensor->size != 0) {
+        ocean_tensor_opencl_gelu(
+            tensor,
+            NULL,
+            out,
+            OCEAN_TENSOR_OPENCL_KERNEL_GELU_FLOAT32
+        );
+    }
+#else
+    ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
+#endif
+}
+
+void ocean_tensor_relu_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t tensor
+) {
+    if (!tensor) ocean_tensor_fail("Tensor.relu on null handle");
+    ocean_tensor_lazy_flush();
+    if (!ocean_tensor_destination_matches(out, tensor, tensor->shape, tensor->ndim)) {
+        ocean_tensor_fail("Tensor operation destination shape mismatch");
+    }
+
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        ocean_tensor_handle_t source = ocean_tensor_dense(tensor);
+        ocean_tensor_handle_t target = ocean_tensor_packed_destination(out);
+        ocean_tensor_relu_cpu_into(source, target);
+        ocean_tensor_finish_destination(out, target);
+        if (source != tensor) ocean_tensor_release(source);
+        return;
+    }
+
+    ocean_tensor_handle_t cpu = ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_relu_cpu_into(cpu, cpu);
+    ocean_tensor_copy_into(out, cpu);
+    ocean_tensor_release(cpu);
+}
+
+ocean_tensor_handle_t ocean_tensor_relu(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("Tensor.relu on null handle");
+    if (ocean_tensor_lazy_accepts(tensor)) {
+        return ocean_tensor_lazy_record(
+            tensor, OCEAN_TENSOR_LAZY_RELU, 0, 0.0,
+            ocean_tensor_lazy_operand(tensor), NULL
+        );
+    }
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        tensor->shape, tensor->ndim, tensor->dtype, tensor->device
+    );
+    ocean_tensor_relu_into(result, tensor);
+    return result;
+}
+
 ocean_tensor_handle_t ocean_tensor_gelu_backward(
     ocean_tensor_handle_t upstream,
     ocean_tensor_handle_t input
 ) {
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(input);
     if (!upstream || !input) {
         ocean_tensor_fail("Tensor.gelu backward requires non-null tensors");
     }
@@ -1728,6 +3014,8 @@ ocean_tensor_handle_t ocean_tensor_embedding_forward(
     ocean_tensor_handle_t weight,
     ocean_tensor_handle_t indices
 ) {
+    ocean_tensor_materialize(weight);
+    ocean_tensor_materialize(indices);
     if (!weight || !indices) {
         ocean_tensor_fail("Embedding.forward requires non-null tensors");
     }
@@ -1844,6 +3132,8 @@ ocean_tensor_handle_t ocean_tensor_embedding_backward(
     size_t vocab,
     size_t dim
 ) {
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(indices);
     if (!upstream || !indices) {
         ocean_tensor_fail("Embedding.backward requires non-null tensors");
     }
@@ -1953,6 +3243,150 @@ ocean_tensor_handle_t ocean_tensor_embedding_backward(
     return result;
 }
 
+static void ocean_tensor_require_sparse_rows(
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t values,
+    size_t count
+) {
+    if (!rows || !values) ocean_tensor_fail("sparse gradient rows are null");
+    ocean_tensor_materialize(rows);
+    ocean_tensor_materialize(values);
+    if (rows->device != OCEAN_TENSOR_CPU || values->device != OCEAN_TENSOR_CPU ||
+        rows->dtype != OCEAN_TENSOR_INT64 || values->dtype != OCEAN_TENSOR_FLOAT32 ||
+        !ocean_tensor_is_contiguous(rows) || !ocean_tensor_is_contiguous(values) ||
+        values->ndim != 2 || values->shape[0] != rows->size) {
+        ocean_tensor_fail(
+            "sparse gradient rows must be contiguous CPU int64 [n] and float32 [n, dim] Tensors"
+        );
+    }
+    if (count > rows->size) ocean_tensor_fail("sparse gradient row count is out of range");
+}
+
+size_t ocean_tensor_embedding_backward_rows(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t indices,
+    ocean_tensor_handle_t slots,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t values,
+    size_t count
+) {
+    if (!upstream || !indices || !slots) {
+        ocean_tensor_fail("Embedding.backward requires non-null tensors");
+    }
+    ocean_tensor_require_sparse_rows(rows, values, count);
+    ocean_tensor_materialize(slots);
+    if (upstream->device != OCEAN_TENSOR_CPU || indices->device != OCEAN_TENSOR_CPU ||
+        slots->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_fail("sparse Embedding gradients require CPU Tensors");
+    }
+    if (upstream->dtype != OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_fail("Embedding gradient must be Tensor[float32]");
+    }
+    if (indices->dtype != OCEAN_TENSOR_INT64 || slots->dtype != OCEAN_TENSOR_INT64 ||
+        !ocean_tensor_is_contiguous(slots)) {
+        ocean_tensor_fail("Embedding indices must be Tensor[int64]");
+    }
+    size_t dim = values->shape[1];
+    if (upstream->ndim != indices->ndim + 1 || upstream->shape[indices->ndim] != dim ||
+        (dim != 0 && indices->size > SIZE_MAX / dim) || upstream->size != indices->size * dim) {
+        ocean_tensor_fail("Embedding gradient shape does not match indices");
+    }
+
+    ocean_tensor_handle_t packed_upstream = ocean_tensor_dense(upstream);
+    ocean_tensor_handle_t packed_indices = ocean_tensor_dense(indices);
+    const float *source = (const float *)packed_upstream->cpu_data;
+    const int64_t *tokens = (const int64_t *)packed_indices->cpu_data;
+    int64_t *slot_of = (int64_t *)slots->cpu_data;
+    int64_t *row_of = (int64_t *)rows->cpu_data;
+    float *target = (float *)values->cpu_data;
+    size_t vocab = slots->size;
+
+    /* Upstream rows are added in position order, as the dense kernel does,
+       so a row's sum is bit-identical to the dense gradient's. */
+    for (size_t position = 0; position < indices->size; ++position) {
+        int64_t token = tokens[position];
+        if (token < 0 || (uint64_t)token >= (uint64_t)vocab) {
+            if (packed_upstream != upstream) ocean_tensor_release(packed_upstream);
+            if (packed_indices != indices) ocean_tensor_release(packed_indices);
+            ocean_tensor_fail("Embedding token id is out of range");
+        }
+        int64_t slot = slot_of[token];
+        if (slot < 0) {
+            if (count == rows->size) {
+                if (packed_upstream != upstream) ocean_tensor_release(packed_upstream);
+                if (packed_indices != indices) ocean_tensor_release(packed_indices);
+                ocean_tensor_fail("sparse Embedding gradient capacity exceeded");
+            }
+            slot = (int64_t)count++;
+            slot_of[token] = slot;
+            row_of[slot] = token;
+            memset(target + (size_t)slot * dim, 0, dim * sizeof(float));
+        }
+        float *row = target + (size_t)slot * dim;
+        const float *update = source + position * dim;
+        for (size_t feature = 0; feature < dim; ++feature) row[feature] += update[feature];
+    }
+
+    if (packed_upstream != upstream) ocean_tensor_release(packed_upstream);
+    if (packed_indices != indices) ocean_tensor_release(packed_indices);
+    return count;
+}
+
+void ocean_tensor_embedding_rows_reset(
+    ocean_tensor_handle_t slots,
+    ocean_tensor_handle_t rows,
+    size_t count
+) {
+    if (!slots || !rows) ocean_tensor_fail("sparse gradient rows are null");
+    ocean_tensor_lazy_flush();
+    ocean_tensor_materialize(slots);
+    ocean_tensor_materialize(rows);
+    if (slots->dtype != OCEAN_TENSOR_INT64 || rows->dtype != OCEAN_TENSOR_INT64 ||
+        slots->device != OCEAN_TENSOR_CPU || rows->device != OCEAN_TENSOR_CPU ||
+        !ocean_tensor_is_contiguous(slots) || !ocean_tensor_is_contiguous(rows) ||
+        count > rows->size) {
+        ocean_tensor_fail("sparse gradient rows must be contiguous CPU int64 Tensors");
+    }
+    int64_t *slot_of = (int64_t *)slots->cpu_data;
+    const int64_t *row_of = (const int64_t *)rows->cpu_data;
+    for (size_t i = 0; i < count; ++i) {
+        if (row_of[i] < 0 || (uint64_t)row_of[i] >= (uint64_t)slots->size) {
+            ocean_tensor_fail("sparse gradient row is out of range");
+        }
+        slot_of[row_of[i]] = -1;
+    }
+}
+
+void ocean_tensor_scatter_add_rows(
+    ocean_tensor_handle_t destination,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t values,
+    size_t count
+) {
+    ocean_tensor_require_sparse_rows(rows, values, count);
+    if (!destination) ocean_tensor_fail("cannot scatter into a null Tensor");
+    ocean_tensor_lazy_flush();
+    ocean_tensor_materialize(destination);
+    size_t dim = values->shape[1];
+    if (destination->device != OCEAN_TENSOR_CPU ||
+        destination->dtype != OCEAN_TENSOR_FLOAT32 ||
+        !ocean_tensor_is_contiguous(destination) || destination->ndim != 2 ||
+        destination->shape[1] != dim) {
+        ocean_tensor_fail("scatter_add_rows requires a contiguous CPU float32 [rows, dim] Tensor");
+    }
+    float *target = (float *)destination->cpu_data;
+    const int64_t *row_of = (const int64_t *)rows->cpu_data;
+    const float *source = (const float *)values->cpu_data;
+    for (size_t i = 0; i < count; ++i) {
+        if (row_of[i] < 0 || (uint64_t)row_of[i] >= (uint64_t)destination->shape[0]) {
+            ocean_tensor_fail("sparse gradient row is out of range");
+        }
+        float *row = target + (size_t)row_of[i] * dim;
+        const float *update = source + i * dim;
+        for (size_t feature = 0; feature < dim; ++feature) row[feature] += update[feature];
+    }
+}
+
 static void ocean_tensor_validate_cross_entropy_shapes(
     const ocean_tensor_handle_t logits,
     const ocean_tensor_handle_t targets
@@ -1992,6 +3426,8 @@ ocean_tensor_handle_t ocean_tensor_cross_entropy_forward(
     ocean_tensor_handle_t targets,
     ocean_tensor_handle_t *probabilities_out
 ) {
+    ocean_tensor_materialize(logits);
+    ocean_tensor_materialize(targets);
     if (!probabilities_out) {
         ocean_tensor_fail(
             "CrossEntropyLoss forward requires a probabilities output"
@@ -2108,6 +3544,9 @@ ocean_tensor_handle_t ocean_tensor_cross_entropy_backward(
     ocean_tensor_handle_t probabilities,
     ocean_tensor_handle_t targets
 ) {
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(probabilities);
+    ocean_tensor_materialize(targets);
     ocean_tensor_validate_cross_entropy_shapes(probabilities, targets);
     if (!upstream || upstream->dtype != OCEAN_TENSOR_FLOAT32 ||
         upstream->size != 1) {
@@ -2201,10 +3640,212 @@ ocean_tensor_handle_t ocean_tensor_cross_entropy_backward(
     return result;
 }
 
+/*
+ * Fused CrossEntropyLoss.  A row's logits are streamed in blocks of
+ * OCEAN_TENSOR_CROSS_ENTROPY_CHUNK classes that stay in L1: each block's
+ * maximum and exponential sum are folded into a running (maximum, sum)
+ * pair, rescaling the sum whenever the maximum grows.  Only the row's
+ * log-sum-exp is kept, and backward recomputes each probability from it.
+ * Rows are independent and split across the worker threads; per-row losses
+ * are summed afterwards in row order, so the result does not depend on the
+ * thread count.
+ */
+#define OCEAN_TENSOR_CROSS_ENTROPY_CHUNK 1024
+/* Logits per worker task; a task always takes whole rows. */
+#define OCEAN_TENSOR_CROSS_ENTROPY_GRAIN 32768
+
+typedef struct ocean_tensor_cross_entropy_context {
+    const float *logits;
+    const int64_t *targets;
+    size_t vocab;
+    double *log_normalizers;
+    double *row_losses;
+    float *gradient;
+    float scale;
+} ocean_tensor_cross_entropy_context;
+
+static double ocean_tensor_log_sum_exp_f32(const float *row, size_t vocab) {
+    float maximum = -INFINITY;
+    double sum = 0.0;
+    for (size_t start = 0; start < vocab; start += OCEAN_TENSOR_CROSS_ENTROPY_CHUNK) {
+        size_t stop = start + OCEAN_TENSOR_CROSS_ENTROPY_CHUNK < vocab
+            ? start + OCEAN_TENSOR_CROSS_ENTROPY_CHUNK : vocab;
+        float block_maximum = -INFINITY;
+        for (size_t cls = start; cls < stop; ++cls) {
+            if (row[cls] > block_maximum) block_maximum = row[cls];
+        }
+        double block_sum = 0.0;
+        for (size_t cls = start; cls < stop; ++cls) {
+            block_sum += (double)expf(row[cls] - block_maximum);
+        }
+        if (block_maximum > maximum) {
+            sum = sum * exp((double)maximum - (double)block_maximum) + block_sum;
+            maximum = block_maximum;
+        } else {
+            sum += block_sum * exp((double)block_maximum - (double)maximum);
+        }
+    }
+    return (double)maximum + log(sum);
+}
+
+static void ocean_tensor_cross_entropy_forward_chunk(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_cross_entropy_context *context =
+        (const ocean_tensor_cross_entropy_context *)raw;
+    for (size_t row = begin; row < end; ++row) {
+        const float *values = context->logits + row * context->vocab;
+        double log_normalizer = ocean_tensor_log_sum_exp_f32(values, context->vocab);
+        context->log_normalizers[row] = log_normalizer;
+        context->row_losses[row] =
+            log_normalizer - (double)values[(size_t)context->targets[row]];
+    }
+}
+
+static void ocean_tensor_cross_entropy_backward_chunk(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_cross_entropy_context *context =
+        (const ocean_tensor_cross_entropy_context *)raw;
+    size_t vocab = context->vocab;
+    for (size_t row = begin; row < end; ++row) {
+        const float *values = context->logits + row * vocab;
+        float *gradient = context->gradient + row * vocab;
+        double log_normalizer = context->log_normalizers[row];
+        for (size_t cls = 0; cls < vocab; ++cls) {
+            gradient[cls] = expf((float)((double)values[cls] - log_normalizer)) * context->scale;
+        }
+        gradient[(size_t)context->targets[row]] -= context->scale;
+    }
+}
+
+/* Packs the operands of a fused CrossEntropyLoss call and checks targets. */
+static void ocean_tensor_cross_entropy_operands(
+    ocean_tensor_handle_t logits,
+    ocean_tensor_handle_t targets,
+    ocean_tensor_handle_t *packed_logits,
+    ocean_tensor_handle_t *packed_targets
+) {
+    ocean_tensor_materialize(logits);
+    ocean_tensor_materialize(targets);
+    ocean_tensor_validate_cross_entropy_shapes(logits, targets);
+    if (logits->device != OCEAN_TENSOR_CPU || targets->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_fail("fused CrossEntropyLoss requires CPU Tensors");
+    }
+    size_t vocab = logits->shape[logits->ndim - 1];
+    *packed_logits = ocean_tensor_dense(logits);
+    *packed_targets = ocean_tensor_dense(targets);
+    const int64_t *classes = (const int64_t *)(*packed_targets)->cpu_data;
+    for (size_t row = 0; row < targets->size; ++row) {
+        if (classes[row] < 0 || (uint64_t)classes[row] >= (uint64_t)vocab) {
+            if (*packed_logits != logits) ocean_tensor_release(*packed_logits);
+            if (*packed_targets != targets) ocean_tensor_release(*packed_targets);
+            ocean_tensor_fail("CrossEntropyLoss target is out of range");
+        }
+    }
+}
+
+static size_t ocean_tensor_cross_entropy_grain(size_t vocab) {
+    size_t grain = OCEAN_TENSOR_CROSS_ENTROPY_GRAIN / vocab;
+    return grain ? grain : 1;
+}
+
+ocean_tensor_handle_t ocean_tensor_cross_entropy_fused(
+    ocean_tensor_handle_t logits,
+    ocean_tensor_handle_t targets,
+    ocean_tensor_handle_t *log_normalizers_out
+) {
+    ocean_tensor_handle_t packed_logits = NULL;
+    ocean_tensor_handle_t packed_targets = NULL;
+    ocean_tensor_cross_entropy_operands(logits, targets, &packed_logits, &packed_targets);
+
+    size_t rows = targets->size;
+    size_t row_shape[1] = {rows};
+    ocean_tensor_handle_t log_normalizers = ocean_tensor_alloc_uninitialized(
+        row_shape, 1, OCEAN_TENSOR_FLOAT64, OCEAN_TENSOR_CPU
+    );
+    double *row_losses = (double *)malloc(rows * sizeof(double));
+    if (!row_losses) {
+        ocean_tensor_release(log_normalizers);
+        if (packed_logits != logits) ocean_tensor_release(packed_logits);
+        if (packed_targets != targets) ocean_tensor_release(packed_targets);
+        ocean_tensor_fail("out of memory in CrossEntropyLoss forward");
+    }
+
+    ocean_tensor_cross_entropy_context context = {
+        .logits = (const float *)packed_logits->cpu_data,
+        .targets = (const int64_t *)packed_targets->cpu_data,
+        .vocab = logits->shape[logits->ndim - 1],
+        .log_normalizers = (double *)log_normalizers->cpu_data,
+        .row_losses = row_losses,
+    };
+    ocean_tensor_parallel_for(
+        rows, ocean_tensor_cross_entropy_grain(context.vocab),
+        ocean_tensor_cross_entropy_forward_chunk, &context
+    );
+
+    double total_loss = 0.0;
+    for (size_t row = 0; row < rows; ++row) total_loss += row_losses[row];
+    free(row_losses);
+    if (packed_logits != logits) ocean_tensor_release(packed_logits);
+    if (packed_targets != targets) ocean_tensor_release(packed_targets);
+
+    ocean_tensor_handle_t loss = ocean_tensor_zeros(1, 1, "cpu");
+    ocean_tensor_fill(loss, total_loss / (double)rows);
+    if (log_normalizers_out) *log_normalizers_out = log_normalizers;
+    else ocean_tensor_release(log_normalizers);
+    return loss;
+}
+
+ocean_tensor_handle_t ocean_tensor_cross_entropy_fused_backward(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t logits,
+    ocean_tensor_handle_t targets,
+    ocean_tensor_handle_t log_normalizers
+) {
+    if (!upstream || !log_normalizers) {
+        ocean_tensor_fail("CrossEntropyLoss backward requires non-null tensors");
+    }
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(log_normalizers);
+    if (upstream->dtype != OCEAN_TENSOR_FLOAT32 || upstream->size != 1 ||
+        upstream->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_fail("CrossEntropyLoss backward requires a float32 scalar upstream");
+    }
+    ocean_tensor_handle_t packed_logits = NULL;
+    ocean_tensor_handle_t packed_targets = NULL;
+    ocean_tensor_cross_entropy_operands(logits, targets, &packed_logits, &packed_targets);
+    size_t rows = targets->size;
+    if (log_normalizers->dtype != OCEAN_TENSOR_FLOAT64 ||
+        log_normalizers->device != OCEAN_TENSOR_CPU ||
+        !ocean_tensor_is_contiguous(log_normalizers) || log_normalizers->size != rows) {
+        if (packed_logits != logits) ocean_tensor_release(packed_logits);
+        if (packed_targets != targets) ocean_tensor_release(packed_targets);
+        ocean_tensor_fail("CrossEntropyLoss log-normalizers must be a CPU float64 Tensor [rows]");
+    }
+
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        logits->shape, logits->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_cross_entropy_context context = {
+        .logits = (const float *)packed_logits->cpu_data,
+        .targets = (const int64_t *)packed_targets->cpu_data,
+        .vocab = logits->shape[logits->ndim - 1],
+        .log_normalizers = (double *)log_normalizers->cpu_data,
+        .gradient = (float *)result->cpu_data,
+        .scale = ocean_tensor_get_flat_f32(upstream, 0) / (float)rows,
+    };
+    ocean_tensor_parallel_for(
+        rows, ocean_tensor_cross_entropy_grain(context.vocab),
+        ocean_tensor_cross_entropy_backward_chunk, &context
+    );
+
+    if (packed_logits != logits) ocean_tensor_release(packed_logits);
+    if (packed_targets != targets) ocean_tensor_release(packed_targets);
+    return result;
+}
+
 void ocean_tensor_copy_into(
     ocean_tensor_handle_t destination,
     ocean_tensor_handle_t source
 ) {
+    ocean_tensor_lazy_flush();
     if (!destination || !source) {
         ocean_tensor_fail("Tensor.copy_into requires non-null tensors");
     }
@@ -2231,6 +3872,12 @@ void ocean_tensor_copy_into(
     }
 
     if (destination->device == OCEAN_TENSOR_CPU) {
+        if (!ocean_tensor_is_contiguous(destination)) {
+            ocean_tensor_handle_t packed = ocean_tensor_to(source, "cpu");
+            ocean_tensor_strided_copy(destination, packed);
+            ocean_tensor_release(packed);
+            return;
+        }
         ocean_tensor_backend_for_device(source->device)->read(
             source,
             destination->cpu_data
@@ -2239,10 +3886,12 @@ void ocean_tensor_copy_into(
     }
 
     if (source->device == OCEAN_TENSOR_CPU) {
+        ocean_tensor_handle_t packed = ocean_tensor_dense(source);
         ocean_tensor_backend_for_device(destination->device)->write(
             destination,
-            source->cpu_data
+            packed->cpu_data
         );
+        if (packed != source) ocean_tensor_release(packed);
         return;
     }
 
@@ -2254,6 +3903,7 @@ ocean_tensor_handle_t ocean_tensor_to(
     const char *device
 ) {
     if (!tensor) ocean_tensor_fail("cannot move a null Tensor");
+    ocean_tensor_materialize(tensor);
     int target = ocean_tensor_parse_device(device);
     if ((ocean_tensor_backend_kind)target == tensor->device) {
         return ocean_tensor_copy(tensor);
@@ -2270,7 +3920,9 @@ ocean_tensor_handle_t ocean_tensor_to(
     if (target == OCEAN_TENSOR_CPU) {
         source_backend->read(tensor, result->cpu_data);
     } else {
-        target_backend->write(result, tensor->cpu_data);
+        ocean_tensor_handle_t packed = ocean_tensor_dense(tensor);
+        target_backend->write(result, packed->cpu_data);
+        if (packed != tensor) ocean_tensor_release(packed);
     }
     return result;
 }
@@ -2462,225 +4114,415 @@ static size_t ocean_tensor_broadcast_offset(
     return offset;
 }
 
-static ocean_tensor_handle_t ocean_tensor_binary_cpu(
-    const ocean_tensor_handle_t left,
-    const ocean_tensor_handle_t right,
-    int operation
-) {
-    size_t *shape = NULL;
-    size_t ndim = 0;
-    ocean_tensor_broadcast_shape(left, right, &shape, &ndim);
-    if (shape == NULL || ndim == 0) {
-        ocean_tensor_fail(
-            "Tensor broadcast produced invalid metadata"
-        );
-    }
+/* Elementwise kernels split their range over the CPU worker pool once it is
+   large enough to pay for starting the threads.  Contiguous float loops are
+   marked for vectorization; the result may alias an operand element for
+   element, which never creates a loop-carried dependence. */
+#define OCEAN_TENSOR_ELEMENTWISE_GRAIN 32768
 
+#if defined(__clang__)
+#define OCEAN_TENSOR_SIMD _Pragma("clang loop vectorize(assume_safety)")
+#elif defined(__GNUC__)
+#define OCEAN_TENSOR_SIMD _Pragma("GCC ivdep")
+#else
+#define OCEAN_TENSOR_SIMD
+#endif
 
-    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
-        shape, ndim, left->dtype, OCEAN_TENSOR_CPU
-    );
-
-    bool same_shape = left->ndim == right->ndim && left->ndim == ndim;
-    if (same_shape) {
-        for (size_t axis = 0; axis < ndim; ++axis) {
-            if (left->shape[axis] != right->shape[axis]) {
-                same_shape = false;
-                break;
-            }
-        }
+typedef struct ocean_tensor_elementwise_context {
+    ocean_tensor_handle_t left;
+    ocean_tensor_handle_t right;
+    ocean_tensor_handle_t result;
+    int operation;
+    double scalar;
+    /* Row-broadcast kernels: row length, and how far each operand advances
+       per row (0 for the operand that repeats). */
+    size_t inner;
+    size_t left_step;
+    size_t right_step;
+} ocean_tensor_elementwise_context;
+
+static void ocean_tensor_binary_f32(
+    float *out, const float *a, const float *b, size_t size, int operation
+) {
+    switch (operation) {
+        case OCEAN_TENSOR_ADD:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] + b[i];
+            break;
+        case OCEAN_TENSOR_SUB:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] - b[i];
+            break;
+        case OCEAN_TENSOR_MUL:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] * b[i];
+            break;
+        case OCEAN_TENSOR_DIV:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] / b[i];
+            break;
     }
+}
 
-    if (same_shape && left->dtype == OCEAN_TENSOR_FLOAT32) {
-        const float *restrict a = (const float *)left->cpu_data;
-        const float *restrict b = (const float *)right->cpu_data;
-        float *restrict out = (float *)result->cpu_data;
-        size_t size = result->size;
-
-        switch (operation) {
-            case OCEAN_TENSOR_ADD:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] + b[i];
-                break;
-            case OCEAN_TENSOR_SUB:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] - b[i];
-                break;
-            case OCEAN_TENSOR_MUL:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] * b[i];
-                break;
-            case OCEAN_TENSOR_DIV:
-                for (size_t i = 0; i < size; ++i) {
-                    if (b[i] == 0.0f) {
-                        free(shape);
-                        ocean_tensor_release(result);
-                        ocean_tensor_fail("Tensor division by zero");
-                    }
-                    out[i] = a[i] / b[i];
-                }
-                break;
-            default:
-                free(shape);
-                ocean_tensor_release(result);
-                ocean_tensor_fail("invalid Tensor binary operation");
-        }
-
-        free(shape);
-        return result;
+static void ocean_tensor_binary_f64(
+    double *out, const double *a, const double *b, size_t size, int operation
+) {
+    switch (operation) {
+        case OCEAN_TENSOR_ADD:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] + b[i];
+            break;
+        case OCEAN_TENSOR_SUB:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] - b[i];
+            break;
+        case OCEAN_TENSOR_MUL:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] * b[i];
+            break;
+        case OCEAN_TENSOR_DIV:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = a[i] / b[i];
+            break;
     }
+}
 
-    if (same_shape && left->dtype == OCEAN_TENSOR_FLOAT64) {
-        const double *restrict a = (const double *)left->cpu_data;
-        const double *restrict b = (const double *)right->cpu_data;
-        double *restrict out = (double *)result->cpu_data;
-        size_t size = result->size;
+static void ocean_tensor_scalar_f32(
+    float *out, const float *input, float s, size_t size, int operation
+) {
+    switch (operation) {
+        case OCEAN_TENSOR_ADD:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] + s;
+            break;
+        case OCEAN_TENSOR_SUB:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] - s;
+            break;
+        case OCEAN_TENSOR_MUL:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] * s;
+            break;
+        case OCEAN_TENSOR_DIV:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] / s;
+            break;
+    }
+}
 
-        switch (operation) {
-            case OCEAN_TENSOR_ADD:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] + b[i];
-                break;
-            case OCEAN_TENSOR_SUB:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] - b[i];
-                break;
-            case OCEAN_TENSOR_MUL:
-                for (size_t i = 0; i < size; ++i) out[i] = a[i] * b[i];
-                break;
-            case OCEAN_TENSOR_DIV:
-                for (size_t i = 0; i < size; ++i) {
-                    if (b[i] == 0.0) {
-                        free(shape);
-                        ocean_tensor_release(result);
-                        ocean_tensor_fail("Tensor division by zero");
-                    }
-                    out[i] = a[i] / b[i];
-                }
-                break;
-            default:
-                free(shape);
-                ocean_tensor_release(result);
-                ocean_tensor_fail("invalid Tensor binary operation");
-        }
+static void ocean_tensor_scalar_f64(
+    double *out, const double *input, double s, size_t size, int operation
+) {
+    switch (operation) {
+        case OCEAN_TENSOR_ADD:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] + s;
+            break;
+        case OCEAN_TENSOR_SUB:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] - s;
+            break;
+        case OCEAN_TENSOR_MUL:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] * s;
+            break;
+        case OCEAN_TENSOR_DIV:
+            OCEAN_TENSOR_SIMD
+            for (size_t i = 0; i < size; ++i) out[i] = input[i] / s;
+            break;
+    }
+}
 
-        free(shape);
-        return result;
+static void ocean_tensor_binary_flat_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_elementwise_context *c =
+        (const ocean_tensor_elementwise_context *)context;
+    if (c->result->dtype == OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_binary_f32(
+            (float *)c->result->cpu_data + begin,
+            (const float *)c->left->cpu_data + begin,
+            (const float *)c->right->cpu_data + begin,
+            end - begin, c->operation
+        );
+        return;
+    }
+    if (c->result->dtype == OCEAN_TENSOR_FLOAT64) {
+        ocean_tensor_binary_f64(
+            (double *)c->result->cpu_data + begin,
+            (const double *)c->left->cpu_data + begin,
+            (const double *)c->right->cpu_data + begin,
+            end - begin, c->operation
+        );
+        return;
+    }
+    for (size_t linear = begin; linear < end; ++linear) {
+        ocean_tensor_write_scalar(
+            c->result,
+            linear,
+            ocean_tensor_apply_binary(
+                ocean_tensor_read_scalar(c->left, linear),
+                ocean_tensor_read_scalar(c->right, linear),
+                c->operation
+            )
+        );
     }
+}
 
-    if (same_shape) {
-        for (size_t linear = 0; linear < result->size; ++linear) {
-            ocean_tensor_write_scalar(
-                result,
-                linear,
-                ocean_tensor_apply_binary(
-                    ocean_tensor_read_scalar(left, linear),
-                    ocean_tensor_read_scalar(right, linear),
-                    operation
-                )
+static void ocean_tensor_binary_rows_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_elementwise_context *c =
+        (const ocean_tensor_elementwise_context *)context;
+    for (size_t row = begin; row < end; ++row) {
+        size_t out_offset = row * c->inner;
+        size_t left_offset = row * c->left_step;
+        size_t right_offset = row * c->right_step;
+        if (c->result->dtype == OCEAN_TENSOR_FLOAT32) {
+            ocean_tensor_binary_f32(
+                (float *)c->result->cpu_data + out_offset,
+                (const float *)c->left->cpu_data + left_offset,
+                (const float *)c->right->cpu_data + right_offset,
+                c->inner, c->operation
+            );
+        } else {
+            ocean_tensor_binary_f64(
+                (double *)c->result->cpu_data + out_offset,
+                (const double *)c->left->cpu_data + left_offset,
+                (const double *)c->right->cpu_data + right_offset,
+                c->inner, c->operation
             );
         }
-        free(shape);
-        return result;
     }
+}
 
-    for (size_t linear = 0; linear < result->size; ++linear) {
+static void ocean_tensor_binary_broadcast_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_elementwise_context *c =
+        (const ocean_tensor_elementwise_context *)context;
+    const size_t *shape = c->result->shape;
+    size_t ndim = c->result->ndim;
+    for (size_t linear = begin; linear < end; ++linear) {
         size_t left_index = ocean_tensor_broadcast_offset(
-            left, shape, ndim, linear
+            c->left, shape, ndim, linear
         );
         size_t right_index = ocean_tensor_broadcast_offset(
-            right, shape, ndim, linear
+            c->right, shape, ndim, linear
         );
         ocean_tensor_write_scalar(
-            result,
+            c->result,
             linear,
             ocean_tensor_apply_binary(
-                ocean_tensor_read_scalar(left, left_index),
-                ocean_tensor_read_scalar(right, right_index),
-                operation
+                ocean_tensor_read_scalar(c->left, left_index),
+                ocean_tensor_read_scalar(c->right, right_index),
+                c->operation
             )
         );
     }
-
-    free(shape);
-    return result;
 }
 
+static void ocean_tensor_scalar_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_elementwise_context *c =
+        (const ocean_tensor_elementwise_context *)context;
+    if (c->result->dtype == OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_scalar_f32(
+            (float *)c->result->cpu_data + begin,
+            (const float *)c->left->cpu_data + begin,
+            (float)c->scalar, end - begin, c->operation
+        );
+        return;
+    }
+    if (c->result->dtype == OCEAN_TENSOR_FLOAT64) {
+        ocean_tensor_scalar_f64(
+            (double *)c->result->cpu_data + begin,
+            (const double *)c->left->cpu_data + begin,
+            c->scalar, end - begin, c->operation
+        );
+        return;
+    }
+    for (size_t i = begin; i < end; ++i) {
+        ocean_tensor_write_scalar(
+            c->result,
+            i,
+            ocean_tensor_apply_binary(
+                ocean_tensor_read_scalar(c->left, i),
+                (long double)c->scalar,
+                c->operation
+            )
+        );
+    }
+}
 
-static ocean_tensor_handle_t ocean_tensor_scalar_cpu(
+static bool ocean_tensor_shape_equals(
     const ocean_tensor_handle_t tensor,
-    double scalar,
-    int operation
+    const size_t *shape,
+    size_t ndim
 ) {
-    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
-        tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
-    );
-    size_t size = tensor->size;
+    if (tensor->ndim != ndim) return false;
+    for (size_t axis = 0; axis < ndim; ++axis) {
+        if (tensor->shape[axis] != shape[axis]) return false;
+    }
+    return true;
+}
 
-    if (tensor->dtype == OCEAN_TENSOR_FLOAT32) {
-        const float *restrict input = (const float *)tensor->cpu_data;
-        float *restrict out = (float *)result->cpu_data;
-        float s = (float)scalar;
+/* Row length when `operand` repeats a trailing block of `result`, such as a
+   [cols] or [1, cols] bias added to [rows, cols]; 0 otherwise. */
+static size_t ocean_tensor_broadcast_row(
+    const ocean_tensor_handle_t operand,
+    const ocean_tensor_handle_t result
+) {
+    size_t lead = 0;
+    while (lead < operand->ndim && operand->shape[lead] == 1) ++lead;
+    size_t trailing = operand->ndim - lead;
+    if (trailing == 0 || trailing > result->ndim) return 0;
+    for (size_t axis = 0; axis < trailing; ++axis) {
+        if (operand->shape[lead + axis] !=
+            result->shape[result->ndim - trailing + axis]) {
+            return 0;
+        }
+    }
+    return operand->size;
+}
 
-        switch (operation) {
-            case OCEAN_TENSOR_ADD:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] + s;
-                break;
-            case OCEAN_TENSOR_SUB:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] - s;
-                break;
-            case OCEAN_TENSOR_MUL:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] * s;
-                break;
-            case OCEAN_TENSOR_DIV:
-                if (s == 0.0f) {
-                    ocean_tensor_release(result);
-                    ocean_tensor_fail("Tensor division by zero");
-                }
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] / s;
-                break;
-            default:
-                ocean_tensor_release(result);
-                ocean_tensor_fail("invalid Tensor binary operation");
+static bool ocean_tensor_floating_contains_zero(const ocean_tensor_handle_t tensor) {
+    if (tensor->dtype == OCEAN_TENSOR_FLOAT32) {
+        const float *data = (const float *)tensor->cpu_data;
+        for (size_t i = 0; i < tensor->size; ++i) {
+            if (data[i] == 0.0f) return true;
         }
-        return result;
+        return false;
+    }
+    const double *data = (const double *)tensor->cpu_data;
+    for (size_t i = 0; i < tensor->size; ++i) {
+        if (data[i] == 0.0) return true;
     }
+    return false;
+}
 
-    if (tensor->dtype == OCEAN_TENSOR_FLOAT64) {
-        const double *restrict input = (const double *)tensor->cpu_data;
-        double *restrict out = (double *)result->cpu_data;
+/* The *_into kernels write into a caller-provided result whose shape is the
+   broadcast shape of the operands.  The result may be one of the operands
+   (in-place update), so the element loops must not assume non-aliasing. */
+static void ocean_tensor_binary_cpu_into(
+    const ocean_tensor_handle_t left,
+    const ocean_tensor_handle_t right,
+    ocean_tensor_handle_t result,
+    int operation
+) {
+    if (operation < OCEAN_TENSOR_ADD || operation > OCEAN_TENSOR_DIV) {
+        ocean_tensor_fail("invalid Tensor binary operation");
+    }
+    ocean_tensor_elementwise_context context = {
+        .left = left,
+        .right = right,
+        .result = result,
+        .operation = operation,
+    };
+    bool floating = left->dtype == OCEAN_TENSOR_FLOAT32 ||
+        left->dtype == OCEAN_TENSOR_FLOAT64;
+    bool left_full = ocean_tensor_shape_equals(left, result->shape, result->ndim);
+    bool right_full = ocean_tensor_shape_equals(right, result->shape, result->ndim);
 
-        switch (operation) {
-            case OCEAN_TENSOR_ADD:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] + scalar;
-                break;
-            case OCEAN_TENSOR_SUB:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] - scalar;
-                break;
-            case OCEAN_TENSOR_MUL:
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] * scalar;
-                break;
-            case OCEAN_TENSOR_DIV:
-                if (scalar == 0.0) {
-                    ocean_tensor_release(result);
-                    ocean_tensor_fail("Tensor division by zero");
-                }
-                for (size_t i = 0; i < size; ++i) out[i] = input[i] / scalar;
-                break;
-            default:
-                ocean_tensor_release(result);
-                ocean_tensor_fail("invalid Tensor binary operation");
+    if (floating && operation == OCEAN_TENSOR_DIV &&
+        ocean_tensor_floating_contains_zero(right)) {
+        ocean_tensor_fail("Tensor division by zero");
+    }
+
+    if (left_full && right_full) {
+        ocean_tensor_parallel_for(
+            result->size, OCEAN_TENSOR_ELEMENTWISE_GRAIN,
+            ocean_tensor_binary_flat_chunk, &context
+        );
+        return;
+    }
+
+    if (floating && left_full && right->size == 1) {
+        context.scalar = left->dtype == OCEAN_TENSOR_FLOAT32
+            ? (double)((const float *)right->cpu_data)[0]
+            : ((const double *)right->cpu_data)[0];
+        ocean_tensor_parallel_for(
+            result->size, OCEAN_TENSOR_ELEMENTWISE_GRAIN,
+            ocean_tensor_scalar_chunk, &context
+        );
+        return;
+    }
+
+    if (floating && result->size != 0) {
+        size_t inner = 0;
+        if (left_full && (inner = ocean_tensor_broadcast_row(right, result)) != 0) {
+            context.left_step = inner;
+        } else if (right_full &&
+                   (inner = ocean_tensor_broadcast_row(left, result)) != 0) {
+            context.right_step = inner;
+        }
+        if (inner != 0) {
+            context.inner = inner;
+            size_t grain = OCEAN_TENSOR_ELEMENTWISE_GRAIN / inner;
+            ocean_tensor_parallel_for(
+                result->size / inner, grain ? grain : 1,
+                ocean_tensor_binary_rows_chunk, &context
+            );
+            return;
         }
-        return result;
     }
 
-    for (size_t i = 0; i < size; ++i) {
-        ocean_tensor_write_scalar(
-            result,
-            i,
-            ocean_tensor_apply_binary(
-                ocean_tensor_read_scalar(tensor, i),
-                (long double)scalar,
-                operation
-            )
+    ocean_tensor_parallel_for(
+        result->size, OCEAN_TENSOR_ELEMENTWISE_GRAIN,
+        ocean_tensor_binary_broadcast_chunk, &context
+    );
+}
+
+static ocean_tensor_handle_t ocean_tensor_binary_cpu(
+    const ocean_tensor_handle_t left,
+    const ocean_tensor_handle_t right,
+    int operation
+) {
+    size_t *shape = NULL;
+    size_t ndim = 0;
+    ocean_tensor_broadcast_shape(left, right, &shape, &ndim);
+    if (shape == NULL || ndim == 0) {
+        ocean_tensor_fail(
+            "Tensor broadcast produced invalid metadata"
         );
     }
 
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        shape, ndim, left->dtype, OCEAN_TENSOR_CPU
+    );
+    free(shape);
+    ocean_tensor_binary_cpu_into(left, right, result, operation);
+    return result;
+}
+
+static void ocean_tensor_scalar_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result,
+    double scalar,
+    int operation
+) {
+    if (operation < OCEAN_TENSOR_ADD || operation > OCEAN_TENSOR_DIV) {
+        ocean_tensor_fail("invalid Tensor binary operation");
+    }
+    if (operation == OCEAN_TENSOR_DIV && (
+            (tensor->dtype == OCEAN_TENSOR_FLOAT32 && (float)scalar == 0.0f) ||
+            (tensor->dtype == OCEAN_TENSOR_FLOAT64 && scalar == 0.0))) {
+        ocean_tensor_fail("Tensor division by zero");
+    }
+    ocean_tensor_elementwise_context context = {
+        .left = tensor,
+        .result = result,
+        .operation = operation,
+        .scalar = scalar,
+    };
+    ocean_tensor_parallel_for(
+        tensor->size, OCEAN_TENSOR_ELEMENTWISE_GRAIN,
+        ocean_tensor_scalar_chunk, &context
+    );
+}
+
+static ocean_tensor_handle_t ocean_tensor_scalar_cpu(
+    const ocean_tensor_handle_t tensor,
+    double scalar,
+    int operation
+) {
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_scalar_cpu_into(tensor, result, scalar, operation);
     return result;
 }
 
@@ -2715,12 +4557,10 @@ static ocean_tensor_handle_t ocean_tensor_ternary_quantize_cpu(
     return result;
 }
 
-static ocean_tensor_handle_t ocean_tensor_gelu_cpu(
-    const ocean_tensor_handle_t tensor
+static void ocean_tensor_gelu_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result
 ) {
-    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
-        tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
-    );
     const float *input = (const float *)tensor->cpu_data;
     float *output = (float *)result->cpu_data;
     const float coefficient = 0.7978845608028654f;
@@ -2733,9 +4573,45 @@ static ocean_tensor_handle_t ocean_tensor_gelu_cpu(
         );
         output[index] = 0.5f * value * (1.0f + tanhf(argument));
     }
+}
+
+static ocean_tensor_handle_t ocean_tensor_gelu_cpu(
+    const ocean_tensor_handle_t tensor
+) {
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_gelu_cpu_into(tensor, result);
     return result;
 }
 
+static void ocean_tensor_relu_cpu_into(
+    const ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result
+) {
+    size_t size = tensor->size;
+    if (tensor->dtype == OCEAN_TENSOR_FLOAT32) {
+        const float *input = (const float *)tensor->cpu_data;
+        float *output = (float *)result->cpu_data;
+        for (size_t index = 0; index < size; ++index) {
+            output[index] = input[index] > 0.0f ? input[index] : 0.0f;
+        }
+        return;
+    }
+    if (tensor->dtype == OCEAN_TENSOR_FLOAT64) {
+        const double *input = (const double *)tensor->cpu_data;
+        double *output = (double *)result->cpu_data;
+        for (size_t index = 0; index < size; ++index) {
+            output[index] = input[index] > 0.0 ? input[index] : 0.0;
+        }
+        return;
+    }
+    for (size_t index = 0; index < size; ++index) {
+        long double value = ocean_tensor_read_scalar(tensor, index);
+        ocean_tensor_write_scalar(result, index, value > 0.0L ? value : 0.0L);
+    }
+}
+
 static ocean_tensor_handle_t ocean_tensor_gelu_backward_cpu(
     const ocean_tensor_handle_t upstream,
     const ocean_tensor_handle_t input
@@ -2968,7 +4844,6 @@ static ocean_tensor_handle_t ocean_tensor_cross_entropy_backward_cpu(
 }
 
 
-#ifdef OCEAN_TENSOR_ENABLE_OPENCL
 static int ocean_tensor_same_shape(
     const ocean_tensor_handle_t left,
     const ocean_tensor_handle_t right
@@ -2980,6 +4855,7 @@ static int ocean_tensor_same_shape(
     return 1;
 }
 
+#ifdef OCEAN_TENSOR_ENABLE_OPENCL
 static void ocean_tensor_opencl_binary(
     const ocean_tensor_handle_t left,
     const ocean_tensor_handle_t right,
@@ -3723,9 +5599,21 @@ ocean_tensor_handle_t ocean_tensor_binary(
     if (left->device != right->device) {
         ocean_tensor_fail("Tensor operation requires matching devices");
     }
-    return ocean_tensor_backend_for_device(left->device)->binary(
-        left, right, operation
-    );
+    if (ocean_tensor_lazy_accepts(left) && ocean_tensor_same_shape(left, right)) {
+        ocean_tensor_lazy_node *left_node = ocean_tensor_lazy_operand(left);
+        ocean_tensor_lazy_node *right_node = ocean_tensor_lazy_operand(right);
+        return ocean_tensor_lazy_record(
+            left, OCEAN_TENSOR_LAZY_BINARY, operation, 0.0, left_node, right_node
+        );
+    }
+    ocean_tensor_handle_t packed_left = ocean_tensor_dense(left);
+    ocean_tensor_handle_t packed_right = ocean_tensor_dense(right);
+    ocean_tensor_handle_t result = ocean_tensor_backend_for_device(
+        left->device
+    )->binary(packed_left, packed_right, operation);
+    if (packed_left != left) ocean_tensor_release(packed_left);
+    if (packed_right != right) ocean_tensor_release(packed_right);
+    return result;
 }
 
 static ocean_tensor_handle_t ocean_tensor_scalar_opencl(
@@ -3773,21 +5661,223 @@ ocean_tensor_handle_t ocean_tensor_scalar(
     if (operation == OCEAN_TENSOR_DIV && scalar == 0.0) {
         ocean_tensor_fail("Tensor division by zero");
     }
-    return ocean_tensor_backend_for_device(tensor->device)->scalar(
-        tensor, scalar, operation
-    );
+    if (ocean_tensor_lazy_accepts(tensor)) {
+        return ocean_tensor_lazy_record(
+            tensor, OCEAN_TENSOR_LAZY_SCALAR, operation, scalar,
+            ocean_tensor_lazy_operand(tensor), NULL
+        );
+    }
+    ocean_tensor_handle_t packed = ocean_tensor_dense(tensor);
+    ocean_tensor_handle_t result = ocean_tensor_backend_for_device(
+        tensor->device
+    )->scalar(packed, scalar, operation);
+    if (packed != tensor) ocean_tensor_release(packed);
+    return result;
 }
 
-ocean_tensor_handle_t ocean_tensor_reshape(
-    ocean_tensor_handle_t tensor,
-    const size_t *shape,
-    size_t ndim
-) {
-    if (!tensor || !shape) {
-        ocean_tensor_fail("Tensor reshape received null metadata");
-    }
-    if (ocean_tensor_elements_from_shape(shape, ndim) != tensor->size) {
-        ocean_tensor_fail("Tensor reshape must preserve the number of elements");
+static void ocean_tensor_unary_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_elementwise_context *c =
+        (const ocean_tensor_elementwise_context *)context;
+    const float *input = (const float *)c->left->cpu_data;
+    float *out = (float *)c->result->cpu_data;
+    switch (c->operation) {
+        case OCEAN_TENSOR_UNARY_EXP:
+            for (size_t i = begin; i < end; ++i) out[i] = expf(input[i]);
+            break;
+        case OCEAN_TENSOR_UNARY_LOG:
+            for (size_t i = begin; i < end; ++i) {
+                if (!(input[i] > 0.0f)) {
+                    ocean_tensor_fail("Tensor.log requires values > 0");
+                }
+                out[i] = logf(input[i]);
+            }
+            break;
+        case OCEAN_TENSOR_UNARY_SQRT:
+            for (size_t i = begin; i < end; ++i) {
+                if (input[i] < 0.0f) {
+                    ocean_tensor_fail("Tensor.sqrt requires values >= 0");
+                }
+                out[i] = sqrtf(input[i]);
+            }
+            break;
+        case OCEAN_TENSOR_UNARY_POW: {
+            float exponent = (float)c->scalar;
+            for (size_t i = begin; i < end; ++i) out[i] = powf(input[i], exponent);
+            break;
+        }
+    }
+}
+
+ocean_tensor_handle_t ocean_tensor_unary(
+    ocean_tensor_handle_t tensor,
+    int operation,
+    double scalar
+) {
+    if (!tensor) ocean_tensor_fail("Tensor unary operation on null handle");
+    if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_fail("Tensor unary operations currently require float32");
+    }
+    if (operation < OCEAN_TENSOR_UNARY_EXP || operation > OCEAN_TENSOR_UNARY_POW) {
+        ocean_tensor_fail("invalid Tensor unary operation");
+    }
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        cpu->shape, cpu->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_elementwise_context context = {
+        .left = cpu,
+        .result = result,
+        .operation = operation,
+        .scalar = scalar,
+    };
+    ocean_tensor_parallel_for(
+        cpu->size, OCEAN_TENSOR_ELEMENTWISE_GRAIN,
+        ocean_tensor_unary_chunk, &context
+    );
+    if (cpu != tensor) ocean_tensor_release(cpu);
+    return ocean_tensor_restore_device(tensor, result);
+}
+
+static void ocean_tensor_binary_opencl_into(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t result,
+    int operation
+) {
+#ifdef OCEAN_TENSOR_ENABLE_OPENCL
+    if ((left->dtype == OCEAN_TENSOR_FLOAT32 || left->dtype == OCEAN_TENSOR_INT32) &&
+        ocean_tensor_same_shape(left, right)) {
+        if (operation == OCEAN_TENSOR_DIV && ocean_tensor_contains_zero(right)) {
+            ocean_tensor_fail("Tensor division by zero");
+        }
+        cl_kernel kernel = ocean_tensor_opencl_get_kernel(
+            left->dtype == OCEAN_TENSOR_INT32
+                ? OCEAN_TENSOR_OPENCL_KERNEL_BINARY_INT32
+                : OCEAN_TENSOR_OPENCL_KERNEL_BINARY_FLOAT32
+        );
+        ocean_tensor_opencl_binary(left, right, result, operation, kernel);
+        return;
+    }
+    ocean_tensor_handle_t computed = ocean_tensor_binary_opencl(
+        left, right, operation
+    );
+    ocean_tensor_opencl_backend.copy(result, computed);
+    ocean_tensor_release(computed);
+#else
+    (void)left;
+    (void)right;
+    (void)result;
+    (void)operation;
+    ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
+#endif
+}
+
+static void ocean_tensor_scalar_opencl_into(
+    ocean_tensor_handle_t tensor,
+    ocean_tensor_handle_t result,
+    double scalar,
+    int operation
+) {
+#ifdef OCEAN_TENSOR_ENABLE_OPENCL
+    if (tensor->dtype == OCEAN_TENSOR_FLOAT32 || tensor->dtype == OCEAN_TENSOR_INT32) {
+        cl_kernel kernel = ocean_tensor_opencl_get_kernel(
+            tensor->dtype == OCEAN_TENSOR_INT32
+                ? OCEAN_TENSOR_OPENCL_KERNEL_SCALAR_INT32
+                : OCEAN_TENSOR_OPENCL_KERNEL_SCALAR_FLOAT32
+        );
+        ocean_tensor_opencl_scalar(
+            tensor, result, scalar, operation, kernel,
+            tensor->dtype == OCEAN_TENSOR_INT32
+        );
+        return;
+    }
+    ocean_tensor_handle_t computed = ocean_tensor_scalar_opencl(
+        tensor, scalar, operation
+    );
+    ocean_tensor_opencl_backend.copy(result, computed);
+    ocean_tensor_release(computed);
+#else
+    (void)tensor;
+    (void)result;
+    (void)scalar;
+    (void)operation;
+    ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
+#endif
+}
+
+void ocean_tensor_binary_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    int operation
+) {
+    if (!left || !right) ocean_tensor_fail("Tensor operation on null handle");
+    ocean_tensor_lazy_flush();
+    if (left->dtype != right->dtype) {
+        ocean_tensor_fail("Tensor operation requires matching dtypes");
+    }
+    if (left->device != right->device) {
+        ocean_tensor_fail("Tensor operation requires matching devices");
+    }
+    size_t *shape = NULL;
+    size_t ndim = 0;
+    ocean_tensor_broadcast_shape(left, right, &shape, &ndim);
+    bool matches = ocean_tensor_destination_matches(out, left, shape, ndim);
+    free(shape);
+    if (!matches) {
+        ocean_tensor_fail("Tensor operation destination shape mismatch");
+    }
+    ocean_tensor_handle_t packed_left = ocean_tensor_dense(left);
+    ocean_tensor_handle_t packed_right = ocean_tensor_dense(right);
+    ocean_tensor_handle_t target = ocean_tensor_packed_destination(out);
+    ocean_tensor_backend_for_device(out->device)->binary_into(
+        packed_left, packed_right, target, operation
+    );
+    ocean_tensor_finish_destination(out, target);
+    if (packed_left != left) ocean_tensor_release(packed_left);
+    if (packed_right != right) ocean_tensor_release(packed_right);
+}
+
+void ocean_tensor_scalar_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t tensor,
+    double scalar,
+    int operation
+) {
+    if (!tensor) ocean_tensor_fail("Tensor scalar operation on null handle");
+    ocean_tensor_lazy_flush();
+    if (operation == OCEAN_TENSOR_DIV && scalar == 0.0) {
+        ocean_tensor_fail("Tensor division by zero");
+    }
+    if (!ocean_tensor_destination_matches(out, tensor, tensor->shape, tensor->ndim)) {
+        ocean_tensor_fail("Tensor operation destination shape mismatch");
+    }
+    ocean_tensor_handle_t packed = ocean_tensor_dense(tensor);
+    ocean_tensor_handle_t target = ocean_tensor_packed_destination(out);
+    ocean_tensor_backend_for_device(out->device)->scalar_into(
+        packed, target, scalar, operation
+    );
+    ocean_tensor_finish_destination(out, target);
+    if (packed != tensor) ocean_tensor_release(packed);
+}
+
+ocean_tensor_handle_t ocean_tensor_reshape(
+    ocean_tensor_handle_t tensor,
+    const size_t *shape,
+    size_t ndim
+) {
+    ocean_tensor_materialize(tensor);
+    if (!tensor || !shape) {
+        ocean_tensor_fail("Tensor reshape received null metadata");
+    }
+    if (ocean_tensor_elements_from_shape(shape, ndim) != tensor->size) {
+        ocean_tensor_fail("Tensor reshape must preserve the number of elements");
+    }
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        ocean_tensor_handle_t packed = ocean_tensor_dense(tensor);
+        ocean_tensor_handle_t view = ocean_tensor_view(packed, shape, NULL, ndim, 0);
+        if (packed != tensor) ocean_tensor_release(packed);
+        return view;
     }
 
     ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
@@ -3829,12 +5919,19 @@ static ocean_tensor_handle_t ocean_tensor_restore_device(
 }
 
 ocean_tensor_handle_t ocean_tensor_row(ocean_tensor_handle_t tensor, int row) {
+    ocean_tensor_materialize(tensor);
     if (!tensor || tensor->ndim != 2) {
         ocean_tensor_fail("Tensor row() currently expects a 2D Tensor");
     }
     if (row < 0 || (size_t)row >= tensor->shape[0]) {
         ocean_tensor_fail("Tensor row index out of bounds");
     }
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        return ocean_tensor_view(
+            tensor, &tensor->shape[1], &tensor->strides[1], 1,
+            (size_t)row * tensor->strides[0]
+        );
+    }
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
         ? tensor : ocean_tensor_to(tensor, "cpu");
     size_t shape[1] = {tensor->shape[1]};
@@ -3855,12 +5952,19 @@ ocean_tensor_handle_t ocean_tensor_row(ocean_tensor_handle_t tensor, int row) {
 }
 
 ocean_tensor_handle_t ocean_tensor_column(ocean_tensor_handle_t tensor, int column) {
+    ocean_tensor_materialize(tensor);
     if (!tensor || tensor->ndim != 2) {
         ocean_tensor_fail("Tensor column() currently expects a 2D Tensor");
     }
     if (column < 0 || (size_t)column >= tensor->shape[1]) {
         ocean_tensor_fail("Tensor column index out of bounds");
     }
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        return ocean_tensor_view(
+            tensor, &tensor->shape[0], &tensor->strides[0], 1,
+            (size_t)column * tensor->strides[1]
+        );
+    }
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
         ? tensor : ocean_tensor_to(tensor, "cpu");
     size_t shape[1] = {tensor->shape[0]};
@@ -3888,6 +5992,7 @@ ocean_tensor_handle_t ocean_tensor_slice(
     int step
 ) {
     if (!tensor) ocean_tensor_fail("Tensor slice() received a null Tensor");
+    ocean_tensor_materialize(tensor);
     if (axis < 0 || (size_t)axis >= tensor->ndim) {
         ocean_tensor_fail("Tensor slice axis out of bounds");
     }
@@ -3902,6 +6007,23 @@ ocean_tensor_handle_t ocean_tensor_slice(
     shape[axis] = start == stop
         ? 0 : ((size_t)(stop - start) + (size_t)step - 1) / (size_t)step;
 
+    if (tensor->device == OCEAN_TENSOR_CPU) {
+        size_t *strides = (size_t *)malloc(tensor->ndim * sizeof(size_t));
+        if (!strides) {
+            free(shape);
+            ocean_tensor_fail("out of memory allocating Tensor slice strides");
+        }
+        memcpy(strides, tensor->strides, tensor->ndim * sizeof(size_t));
+        strides[axis] *= (size_t)step;
+        ocean_tensor_handle_t view = ocean_tensor_view(
+            tensor, shape, strides, tensor->ndim,
+            (size_t)start * tensor->strides[axis]
+        );
+        free(strides);
+        free(shape);
+        return view;
+    }
+
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
         ? tensor : ocean_tensor_to(tensor, "cpu");
     ocean_tensor_handle_t cpu_result = ocean_tensor_alloc_zeros(
@@ -3933,8 +6055,8 @@ ocean_tensor_handle_t ocean_tensor_slice(
 
 double ocean_tensor_sum(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor sum on null handle");
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_materialize(tensor);
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     long double result = 0.0L;
     for (size_t index = 0; index < cpu->size; ++index) {
         result += ocean_tensor_read_scalar(cpu, index);
@@ -3951,9 +6073,9 @@ double ocean_tensor_mean(ocean_tensor_handle_t tensor) {
 
 double ocean_tensor_max(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor max on null handle");
+    ocean_tensor_materialize(tensor);
     if (tensor->size == 0) ocean_tensor_fail("Tensor max on an empty Tensor");
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     long double result = ocean_tensor_read_scalar(cpu, 0);
     for (size_t index = 1; index < cpu->size; ++index) {
         long double value = ocean_tensor_read_scalar(cpu, index);
@@ -3965,9 +6087,9 @@ double ocean_tensor_max(ocean_tensor_handle_t tensor) {
 
 double ocean_tensor_min(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor min on null handle");
+    ocean_tensor_materialize(tensor);
     if (tensor->size == 0) ocean_tensor_fail("Tensor min on an empty Tensor");
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     long double result = ocean_tensor_read_scalar(cpu, 0);
     for (size_t index = 1; index < cpu->size; ++index) {
         long double value = ocean_tensor_read_scalar(cpu, index);
@@ -3988,24 +6110,47 @@ double ocean_tensor_item(ocean_tensor_handle_t tensor) {
     return ocean_tensor_get_flat(tensor, 0);
 }
 
+/* Indexed by ocean_tensor_dtype. */
+static const char *const ocean_tensor_dtype_names[] = {
+    "bool", "int8", "int16", "int32", "int64", "uint8",
+    "uint16", "uint32", "uint64", "float16", "float32", "float64"
+};
+
 char *ocean_tensor_dtype_name(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor dtype on null handle");
-    static const char *names[] = {
-        "bool", "int8", "int16", "int32", "int64", "uint8",
-        "uint16", "uint32", "uint64", "float16", "float32", "float64"
-    };
-    const char *name = names[tensor->dtype];
+    const char *name = ocean_tensor_dtype_names[tensor->dtype];
     char *result = (char *)malloc(strlen(name) + 1);
     if (!result) ocean_tensor_fail("out of memory copying Tensor dtype");
     strcpy(result, name);
     return result;
 }
 
+bool ocean_tensor_owns_storage(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("Tensor owns_storage on null handle");
+    /* GPU Tensors and pending lazy results never share a buffer. */
+    if (tensor->device != OCEAN_TENSOR_BACKEND_CPU || !tensor->storage) return true;
+    return atomic_load(&tensor->storage->references) == 1;
+}
+
+ocean_tensor_handle_t ocean_tensor_alias(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("Tensor alias on null handle");
+    return ocean_tensor_view(tensor, tensor->shape, tensor->strides, tensor->ndim, 0);
+}
+
+bool ocean_tensor_shares_storage(ocean_tensor_handle_t left, ocean_tensor_handle_t right) {
+    if (!left || !right) ocean_tensor_fail("Tensor shares_storage on null handle");
+    if (left == right) return true;
+    return left->storage && left->storage == right->storage;
+}
+
 bool ocean_tensor_is_contiguous(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor is_contiguous on null handle");
     size_t expected = 1;
     for (size_t axis = tensor->ndim; axis-- > 0;) {
-        if (tensor->strides[axis] != expected) return false;
+        /* The stride of a length-1 axis is never used to address data. */
+        if (tensor->shape[axis] != 1 && tensor->strides[axis] != expected) {
+            return false;
+        }
         if (tensor->shape[axis] != 0 && expected > SIZE_MAX / tensor->shape[axis]) {
             return false;
         }
@@ -4016,21 +6161,14 @@ bool ocean_tensor_is_contiguous(ocean_tensor_handle_t tensor) {
 
 ocean_tensor_handle_t ocean_tensor_contiguous(ocean_tensor_handle_t tensor) {
     if (!tensor) ocean_tensor_fail("Tensor contiguous on null handle");
-    if (ocean_tensor_is_contiguous(tensor)) return ocean_tensor_copy(tensor);
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor : ocean_tensor_to(tensor, "cpu");
-    ocean_tensor_handle_t result = ocean_tensor_alloc_zeros(
-        cpu->shape, cpu->ndim, cpu->dtype, OCEAN_TENSOR_CPU
-    );
-    for (size_t index = 0; index < cpu->size; ++index) {
-        ocean_tensor_write_scalar(result, index, ocean_tensor_read_scalar(cpu, index));
-    }
-    if (cpu != tensor) ocean_tensor_release(cpu);
-    return ocean_tensor_restore_device(tensor, result);
+    /* Copies always come out packed row-major; the backend copy gathers
+       strided views element by element. */
+    return ocean_tensor_copy(tensor);
 }
 
 void ocean_tensor_fill(ocean_tensor_handle_t tensor, double value) {
     if (!tensor) ocean_tensor_fail("Tensor fill on null handle");
+    ocean_tensor_lazy_flush();
     ocean_tensor_backend_for_device(tensor->device)->fill(tensor, value);
 }
 
@@ -4168,6 +6306,7 @@ double ocean_tensor_get_nd(
     size_t ndim
 ) {
     if (!tensor) ocean_tensor_fail("Tensor get received a null Tensor");
+    ocean_tensor_materialize(tensor);
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
         ? tensor : ocean_tensor_to(tensor, "cpu");
     size_t offset = ocean_tensor_index_offset(cpu, indices, ndim);
@@ -4178,10 +6317,13 @@ double ocean_tensor_get_nd(
 
 double ocean_tensor_get_flat(ocean_tensor_handle_t tensor, size_t index) {
     if (!tensor) ocean_tensor_fail("Tensor get received a null Tensor");
+    ocean_tensor_materialize(tensor);
     if (index >= tensor->size) ocean_tensor_fail("Tensor flat index is out of bounds");
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
         ? tensor : ocean_tensor_to(tensor, "cpu");
-    double result = (double)ocean_tensor_read_scalar(cpu, index);
+    double result = (double)ocean_tensor_read_scalar(
+        cpu, ocean_tensor_flat_offset(cpu, index)
+    );
     if (cpu != tensor) ocean_tensor_release(cpu);
     return result;
 }
@@ -4190,9 +6332,12 @@ static void ocean_tensor_set_flat_long_double(
     ocean_tensor_handle_t tensor, size_t index, long double value
 ) {
     if (!tensor) ocean_tensor_fail("Tensor set received a null Tensor");
+    ocean_tensor_lazy_flush();
     if (index >= tensor->size) ocean_tensor_fail("Tensor flat index is out of bounds");
     if (tensor->device == OCEAN_TENSOR_CPU) {
-        ocean_tensor_write_scalar(tensor, index, value);
+        ocean_tensor_write_scalar(
+            tensor, ocean_tensor_flat_offset(tensor, index), value
+        );
         return;
     }
     ocean_tensor_handle_t cpu = ocean_tensor_to(tensor, "cpu");
@@ -4241,6 +6386,7 @@ void ocean_tensor_set_nd(
     double value
 ) {
     if (!tensor) ocean_tensor_fail("Tensor set received a null Tensor");
+    ocean_tensor_lazy_flush();
     if (tensor->device == OCEAN_TENSOR_CPU) {
         size_t offset = ocean_tensor_index_offset(tensor, indices, ndim);
         ocean_tensor_write_scalar(tensor, offset, (long double)value);
@@ -4266,12 +6412,15 @@ c_type ocean_tensor_get_flat_##name( \
     ocean_tensor_handle_t tensor, size_t index \
 ) { \
     if (!tensor) ocean_tensor_fail("Tensor get received a null Tensor"); \
+    ocean_tensor_materialize(tensor); \
     if (index >= tensor->size) { \
         ocean_tensor_fail("Tensor flat index is out of bounds"); \
     } \
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU \
         ? tensor : ocean_tensor_to(tensor, "cpu"); \
-    c_type result = (c_type)ocean_tensor_read_scalar(cpu, index); \
+    c_type result = (c_type)ocean_tensor_read_scalar( \
+        cpu, ocean_tensor_flat_offset(cpu, index) \
+    ); \
     if (cpu != tensor) ocean_tensor_release(cpu); \
     return result; \
 }
@@ -4298,6 +6447,7 @@ c_type ocean_tensor_get_nd_##name( \
     size_t ndim \
 ) { \
     if (!tensor) ocean_tensor_fail("Tensor get received a null Tensor"); \
+    ocean_tensor_materialize(tensor); \
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU \
         ? tensor : ocean_tensor_to(tensor, "cpu"); \
     size_t offset = ocean_tensor_index_offset(cpu, indices, ndim); \
@@ -4328,6 +6478,7 @@ static void ocean_tensor_set_nd_long_double(
     long double value
 ) {
     if (!tensor) ocean_tensor_fail("Tensor set received a null Tensor");
+    ocean_tensor_lazy_flush();
 
     if (tensor->device == OCEAN_TENSOR_CPU) {
         size_t offset = ocean_tensor_index_offset(tensor, indices, ndim);
@@ -4378,6 +6529,27 @@ OCEAN_DEFINE_TYPED_SET_ND(f64, double)
 
 #undef OCEAN_DEFINE_TYPED_SET_ND
 
+void *ocean_tensor_loop_data(
+    ocean_tensor_handle_t tensor,
+    size_t rank,
+    const char *dtype,
+    size_t *shape,
+    size_t *strides
+) {
+    memset(shape, 0, rank * sizeof(size_t));
+    memset(strides, 0, rank * sizeof(size_t));
+    if (!tensor || rank == 0 || tensor->ndim != rank) return NULL;
+    /* The per-element setters flush before every write; one flush up front
+       keeps pending results from observing the loop's direct writes. */
+    ocean_tensor_lazy_flush();
+    if (tensor->device != OCEAN_TENSOR_CPU || !tensor->cpu_data) return NULL;
+    if (tensor->dtype != ocean_tensor_parse_dtype(dtype)) return NULL;
+    if (tensor->strides[rank - 1] != 1 && tensor->shape[rank - 1] > 1) return NULL;
+    memcpy(shape, tensor->shape, rank * sizeof(size_t));
+    memcpy(strides, tensor->strides, rank * sizeof(size_t));
+    return tensor->cpu_data;
+}
+
 double ocean_tensor_get_2d(ocean_tensor_handle_t tensor, int row, int col) {
     if (row < 0 || col < 0) ocean_tensor_fail("Tensor get index is out of bounds");
     size_t indices[2] = {(size_t)row, (size_t)col};
@@ -4392,157 +6564,1539 @@ void ocean_tensor_set_2d(
     ocean_tensor_set_nd(tensor, indices, 2, value);
 }
 
-static ocean_tensor_handle_t ocean_tensor_matmul_cpu(
-    ocean_tensor_handle_t left,
-    ocean_tensor_handle_t right
-) {
-    size_t shape[2] = {left->shape[0], right->shape[1]};
-    ocean_tensor_handle_t result = ocean_tensor_alloc_zeros(
-        shape, 2, left->dtype, OCEAN_TENSOR_CPU
-    );
-
-    bool left_contiguous =
-        left->strides[1] == 1 && left->strides[0] == left->shape[1];
-    bool right_contiguous =
-        right->strides[1] == 1 && right->strides[0] == right->shape[1];
-
-    if (left_contiguous && right_contiguous) {
-        size_t rows = left->shape[0];
-        size_t inner = left->shape[1];
-        size_t cols = right->shape[1];
+/* ================= CPU GEMM engine ================= */
+/*
+ * C = op(A) x op(B) for float32/float64 in the style of BLIS/GotoBLAS:
+ * A is packed into MR-row slivers (an MC x KC block that stays in L2), B
+ * into NR-column slivers (a KC x NC panel), and a register-blocked
+ * microkernel produces MR x NR tiles of C.  Operands are read through
+ * element strides, so transposed and broadcast batch operands are packed
+ * directly and never copied first.  Work is split across threads by
+ * (batch, row tile, column tile); every task owns disjoint rows/columns of
+ * C and its own packing buffers, so no synchronization is needed.
+ */
+#define OCEAN_TENSOR_GEMM_MR 4
+#define OCEAN_TENSOR_GEMM_MC 64
+#define OCEAN_TENSOR_GEMM_KC 256
+#define OCEAN_TENSOR_GEMM_NC 256
+/* Below this many multiply-adds thread start-up costs more than it saves. */
+#define OCEAN_TENSOR_GEMM_PARALLEL_WORK ((size_t)1 << 18)
+
+typedef struct ocean_tensor_gemm_problem {
+    const void *a;
+    const void *b;
+    void *c;
+    size_t m;
+    size_t n;
+    size_t k;
+    size_t a_row_stride;
+    size_t a_col_stride;
+    size_t b_row_stride;
+    size_t b_col_stride;
+    const size_t *a_offsets;
+    const size_t *b_offsets;
+    size_t row_tiles;
+    size_t col_tiles;
+} ocean_tensor_gemm_problem;
+
+#define OCEAN_TENSOR_DEFINE_GEMM(name, c_type, nr) \
+static void ocean_tensor_gemm_pack_a_##name( \
+    const c_type *a, size_t row_stride, size_t col_stride, \
+    size_t rows, size_t depth, c_type *restrict packed \
+) { \
+    for (size_t row0 = 0; row0 < rows; row0 += OCEAN_TENSOR_GEMM_MR) { \
+        size_t valid = rows - row0 < OCEAN_TENSOR_GEMM_MR \
+            ? rows - row0 : OCEAN_TENSOR_GEMM_MR; \
+        for (size_t p = 0; p < depth; ++p) { \
+            for (size_t i = 0; i < OCEAN_TENSOR_GEMM_MR; ++i) { \
+                *packed++ = i < valid \
+                    ? a[(row0 + i) * row_stride + p * col_stride] : (c_type)0; \
+            } \
+        } \
+    } \
+} \
+\
+static void ocean_tensor_gemm_pack_b_##name( \
+    const c_type *b, size_t row_stride, size_t col_stride, \
+    size_t depth, size_t cols, c_type *restrict packed \
+) { \
+    for (size_t col0 = 0; col0 < cols; col0 += (nr)) { \
+        size_t valid = cols - col0 < (nr) ? cols - col0 : (nr); \
+        for (size_t p = 0; p < depth; ++p) { \
+            const c_type *source = b + p * row_stride + col0 * col_stride; \
+            for (size_t j = 0; j < (nr); ++j) { \
+                *packed++ = j < valid ? source[j * col_stride] : (c_type)0; \
+            } \
+        } \
+    } \
+} \
+\
+static void ocean_tensor_gemm_kernel_##name( \
+    size_t depth, const c_type *restrict a, const c_type *restrict b, \
+    c_type *restrict c, size_t ldc, size_t rows, size_t cols, \
+    bool accumulate \
+) { \
+    /* MR is 4: one accumulator row per packed A row keeps every row in \
+       vector registers for the whole depth loop. */ \
+    c_type acc0[(nr)] = {0}, acc1[(nr)] = {0}; \
+    c_type acc2[(nr)] = {0}, acc3[(nr)] = {0}; \
+    for (size_t p = 0; p < depth; ++p) { \
+        const c_type *restrict ap = a + p * OCEAN_TENSOR_GEMM_MR; \
+        const c_type *restrict bp = b + p * (nr); \
+        c_type a0 = ap[0], a1 = ap[1], a2 = ap[2], a3 = ap[3]; \
+        for (size_t j = 0; j < (nr); ++j) { \
+            c_type bv = bp[j]; \
+            acc0[j] += a0 * bv; \
+            acc1[j] += a1 * bv; \
+            acc2[j] += a2 * bv; \
+            acc3[j] += a3 * bv; \
+        } \
+    } \
+    c_type *acc[OCEAN_TENSOR_GEMM_MR] = {acc0, acc1, acc2, acc3}; \
+    for (size_t i = 0; i < rows; ++i) { \
+        c_type *restrict c_row = c + i * ldc; \
+        if (accumulate) { \
+            for (size_t j = 0; j < cols; ++j) c_row[j] += acc[i][j]; \
+        } else { \
+            for (size_t j = 0; j < cols; ++j) c_row[j] = acc[i][j]; \
+        } \
+    } \
+} \
+\
+static void ocean_tensor_gemm_tasks_##name( \
+    void *context, size_t begin, size_t end \
+) { \
+    const ocean_tensor_gemm_problem *problem = \
+        (const ocean_tensor_gemm_problem *)context; \
+    size_t depth_block = problem->k < OCEAN_TENSOR_GEMM_KC \
+        ? problem->k : OCEAN_TENSOR_GEMM_KC; \
+    size_t a_capacity = ((OCEAN_TENSOR_GEMM_MC + OCEAN_TENSOR_GEMM_MR - 1) \
+        / OCEAN_TENSOR_GEMM_MR) * OCEAN_TENSOR_GEMM_MR * depth_block; \
+    size_t b_capacity = ((OCEAN_TENSOR_GEMM_NC + (nr) - 1) / (nr)) \
+        * (nr) * depth_block; \
+    c_type *a_pack = (c_type *)malloc(a_capacity * sizeof(c_type)); \
+    c_type *b_pack = (c_type *)malloc(b_capacity * sizeof(c_type)); \
+    if (!a_pack || !b_pack) { \
+        free(a_pack); \
+        free(b_pack); \
+        ocean_tensor_fail("out of memory allocating matmul packing buffers"); \
+    } \
+    size_t tiles_per_matrix = problem->row_tiles * problem->col_tiles; \
+    for (size_t task = begin; task < end; ++task) { \
+        size_t batch = task / tiles_per_matrix; \
+        size_t tile = task % tiles_per_matrix; \
+        size_t row0 = (tile / problem->col_tiles) * OCEAN_TENSOR_GEMM_MC; \
+        size_t col0 = (tile % problem->col_tiles) * OCEAN_TENSOR_GEMM_NC; \
+        size_t rows = problem->m - row0 < OCEAN_TENSOR_GEMM_MC \
+            ? problem->m - row0 : OCEAN_TENSOR_GEMM_MC; \
+        size_t cols = problem->n - col0 < OCEAN_TENSOR_GEMM_NC \
+            ? problem->n - col0 : OCEAN_TENSOR_GEMM_NC; \
+        const c_type *a = (const c_type *)problem->a \
+            + problem->a_offsets[batch] + row0 * problem->a_row_stride; \
+        const c_type *b = (const c_type *)problem->b \
+            + problem->b_offsets[batch] + col0 * problem->b_col_stride; \
+        c_type *c = (c_type *)problem->c \
+            + batch * problem->m * problem->n + row0 * problem->n + col0; \
+        for (size_t p0 = 0; p0 < problem->k; p0 += OCEAN_TENSOR_GEMM_KC) { \
+            size_t depth = problem->k - p0 < OCEAN_TENSOR_GEMM_KC \
+                ? problem->k - p0 : OCEAN_TENSOR_GEMM_KC; \
+            ocean_tensor_gemm_pack_a_##name( \
+                a + p0 * problem->a_col_stride, \
+                problem->a_row_stride, problem->a_col_stride, \
+                rows, depth, a_pack \
+            ); \
+            ocean_tensor_gemm_pack_b_##name( \
+                b + p0 * problem->b_row_stride, \
+                problem->b_row_stride, problem->b_col_stride, \
+                depth, cols, b_pack \
+            ); \
+            for (size_t j = 0; j < cols; j += (nr)) { \
+                for (size_t i = 0; i < rows; i += OCEAN_TENSOR_GEMM_MR) { \
+                    ocean_tensor_gemm_kernel_##name( \
+                        depth, a_pack + i * depth, b_pack + j * depth, \
+                        c + i * problem->n + j, problem->n, \
+                        rows - i < OCEAN_TENSOR_GEMM_MR \
+                            ? rows - i : OCEAN_TENSOR_GEMM_MR, \
+                        cols - j < (nr) ? cols - j : (nr), \
+                        p0 > 0 \
+                    ); \
+                } \
+            } \
+        } \
+    } \
+    free(a_pack); \
+    free(b_pack); \
+}
 
-        if (rows == 0 || inner == 0 || cols == 0) return result;
+OCEAN_TENSOR_DEFINE_GEMM(f32, float, 16)
+OCEAN_TENSOR_DEFINE_GEMM(f64, double, 8)
 
-        const size_t block_rows = 32;
-        const size_t block_inner = 64;
-        const size_t block_cols = 128;
+#undef OCEAN_TENSOR_DEFINE_GEMM
 
-        if (left->dtype == OCEAN_TENSOR_FLOAT32) {
-            const float *restrict a = (const float *)left->cpu_data;
-            const float *restrict b = (const float *)right->cpu_data;
-            float *restrict c = (float *)result->cpu_data;
-
-            if (rows < 16 || inner < 32 || cols < 64) {
-                for (size_t row = 0; row < rows; ++row) {
-                    float *restrict c_row = c + row * cols;
-                    const float *restrict a_row = a + row * inner;
-
-                    for (size_t k = 0; k < inner; ++k) {
-                        float av = a_row[k];
-                        const float *restrict b_row = b + k * cols;
-                        for (size_t col = 0; col < cols; ++col) {
-                            c_row[col] += av * b_row[col];
-                        }
+/*
+ * Fused scaled dot-product attention over q [..., Tq, d], k [..., Tk, d] and
+ * v [..., Tk, dv], FlashAttention style.  A task owns one head and a tile of
+ * OCEAN_TENSOR_ATTENTION_ROWS query rows.  It walks the keys in blocks of
+ * OCEAN_TENSOR_ATTENTION_BLOCK, scores each block against the tile in a
+ * small scratch buffer, and folds it into a running maximum, sum and output
+ * per row.  Only the output and one log-sum-exp per row reach memory, so a
+ * head costs O(T) instead of the O(T^2) of a materialized score matrix.
+ * With `causal`, query i sees keys j <= i + Tk - Tq: the queries are the
+ * last Tq positions of the sequence.
+ *
+ * Backward recomputes the probabilities from the log-sum-exp in two passes
+ * that each own their output rows: one over query tiles for dq, one over key
+ * tiles for dk and dv.  Nothing is accumulated across threads, so results
+ * do not depend on the thread count.
+ */
+#define OCEAN_TENSOR_ATTENTION_ROWS 32
+#define OCEAN_TENSOR_ATTENTION_BLOCK 64
+
+typedef struct ocean_tensor_attention_problem {
+    const float *q;
+    const float *k;
+    const float *v;
+    const float *output;
+    const float *upstream;
+    float *result;
+    float *log_sum_exp;
+    float *delta;
+    float *grad_q;
+    float *grad_k;
+    float *grad_v;
+    size_t heads;
+    size_t queries;
+    size_t keys;
+    /* Key rows per head in k and v: more than `keys` for a KV cache. */
+    size_t key_capacity;
+    size_t depth;
+    size_t value_depth;
+    size_t offset;
+    size_t tiles;
+    bool causal;
+    float scale;
+} ocean_tensor_attention_problem;
+
+/* Causal tiles grow more expensive along the sequence; alternating tiles
+   from both ends keeps contiguous task ranges evenly loaded. */
+static size_t ocean_tensor_attention_tile(size_t task, size_t tiles) {
+    return task % 2 == 0 ? task / 2 : tiles - 1 - task / 2;
+}
+
+/* Copies rows [count x width] into a [width x BLOCK] column block. */
+static void ocean_tensor_attention_transpose(
+    const float *rows,
+    size_t count,
+    size_t width,
+    float *restrict block
+) {
+    for (size_t c = 0; c < width; ++c) {
+        float *column = block + c * OCEAN_TENSOR_ATTENTION_BLOCK;
+        for (size_t j = 0; j < count; ++j) column[j] = rows[j * width + c];
+    }
+}
+
+/* c = scale * a b (+ c when accumulating) for a [rows x depth] and
+   b [depth x cols].  Register tiles of 4 x 16, as in the matmul kernel. */
+static void ocean_tensor_attention_gemm(
+    size_t rows,
+    size_t cols,
+    size_t depth,
+    const float *restrict a,
+    size_t lda,
+    const float *restrict b,
+    size_t ldb,
+    float *restrict c,
+    size_t ldc,
+    float scale,
+    bool accumulate
+) {
+    for (size_t r0 = 0; r0 < rows; r0 += 4) {
+        size_t tile_rows = rows - r0 < 4 ? rows - r0 : 4;
+        for (size_t j0 = 0; j0 < cols; j0 += 16) {
+            size_t tile_cols = cols - j0 < 16 ? cols - j0 : 16;
+            float acc[4][16] = {{0}};
+            if (tile_rows == 4 && tile_cols == 16) {
+                for (size_t p = 0; p < depth; ++p) {
+                    const float *bp = b + p * ldb + j0;
+                    float a0 = a[r0 * lda + p];
+                    float a1 = a[(r0 + 1) * lda + p];
+                    float a2 = a[(r0 + 2) * lda + p];
+                    float a3 = a[(r0 + 3) * lda + p];
+                    for (size_t j = 0; j < 16; ++j) {
+                        float bv = bp[j];
+                        acc[0][j] += a0 * bv;
+                        acc[1][j] += a1 * bv;
+                        acc[2][j] += a2 * bv;
+                        acc[3][j] += a3 * bv;
                     }
                 }
-                return result;
-            }
-
-            for (size_t row0 = 0; row0 < rows; row0 += block_rows) {
-                size_t row_end = row0 + block_rows < rows
-                    ? row0 + block_rows : rows;
-
-                for (size_t k0 = 0; k0 < inner; k0 += block_inner) {
-                    size_t k_end = k0 + block_inner < inner
-                        ? k0 + block_inner : inner;
-
-                    for (size_t col0 = 0; col0 < cols; col0 += block_cols) {
-                        size_t col_end = col0 + block_cols < cols
-                            ? col0 + block_cols : cols;
-
-                        for (size_t row = row0; row < row_end; ++row) {
-                            float *restrict c_row = c + row * cols;
-                            const float *restrict a_row = a + row * inner;
-
-                            for (size_t k = k0; k < k_end; ++k) {
-                                float av = a_row[k];
-                                const float *restrict b_row = b + k * cols;
-
-                                for (size_t col = col0; col < col_end; ++col) {
-                                    c_row[col] += av * b_row[col];
-                                }
-                            }
-                        }
+            } else {
+                for (size_t p = 0; p < depth; ++p) {
+                    const float *bp = b + p * ldb + j0;
+                    for (size_t i = 0; i < tile_rows; ++i) {
+                        float ai = a[(r0 + i) * lda + p];
+                        for (size_t j = 0; j < tile_cols; ++j) acc[i][j] += ai * bp[j];
                     }
                 }
             }
-            return result;
+            for (size_t i = 0; i < tile_rows; ++i) {
+                float *out = c + (r0 + i) * ldc + j0;
+                if (accumulate) {
+                    for (size_t j = 0; j < tile_cols; ++j) out[j] += scale * acc[i][j];
+                } else {
+                    for (size_t j = 0; j < tile_cols; ++j) out[j] = scale * acc[i][j];
+                }
+            }
         }
+    }
+}
 
-        if (left->dtype == OCEAN_TENSOR_FLOAT64) {
-            const double *restrict a = (const double *)left->cpu_data;
-            const double *restrict b = (const double *)right->cpu_data;
-            double *restrict c = (double *)result->cpu_data;
+static float *ocean_tensor_attention_scratch(size_t count) {
+    float *scratch = (float *)malloc(count * sizeof(float));
+    if (!scratch) ocean_tensor_fail("out of memory in scaled_dot_product_attention");
+    return scratch;
+}
 
-            if (rows < 16 || inner < 32 || cols < 64) {
-                for (size_t row = 0; row < rows; ++row) {
-                    double *restrict c_row = c + row * cols;
-                    const double *restrict a_row = a + row * inner;
+/* Keys of a [first_key, first_key + count) block visible to query `query`. */
+static size_t ocean_tensor_attention_visible(
+    const ocean_tensor_attention_problem *problem,
+    size_t query,
+    size_t first_key,
+    size_t count
+) {
+    if (!problem->causal) return count;
+    size_t limit = query + problem->offset + 1;
+    if (limit <= first_key) return 0;
+    return limit - first_key < count ? limit - first_key : count;
+}
+
+static void ocean_tensor_attention_forward_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_attention_problem *problem =
+        (const ocean_tensor_attention_problem *)raw;
+    const size_t block = OCEAN_TENSOR_ATTENTION_BLOCK;
+    size_t depth = problem->depth;
+    size_t value_depth = problem->value_depth;
+    float *scratch = ocean_tensor_attention_scratch(
+        depth * block + OCEAN_TENSOR_ATTENTION_ROWS * (block + value_depth + 2)
+    );
+    float *key_block = scratch;
+    float *scores = key_block + depth * block;
+    float *accumulated = scores + OCEAN_TENSOR_ATTENTION_ROWS * block;
+    float *maximum = accumulated + OCEAN_TENSOR_ATTENTION_ROWS * value_depth;
+    float *sum = maximum + OCEAN_TENSOR_ATTENTION_ROWS;
+
+    for (size_t task = begin; task < end; ++task) {
+        size_t head = task / problem->tiles;
+        size_t q0 = ocean_tensor_attention_tile(task % problem->tiles, problem->tiles)
+            * OCEAN_TENSOR_ATTENTION_ROWS;
+        size_t rows = problem->queries - q0 < OCEAN_TENSOR_ATTENTION_ROWS
+            ? problem->queries - q0 : OCEAN_TENSOR_ATTENTION_ROWS;
+        const float *q = problem->q + (head * problem->queries + q0) * depth;
+        const float *k = problem->k + head * problem->key_capacity * depth;
+        const float *v = problem->v + head * problem->key_capacity * value_depth;
+        size_t key_end = problem->keys;
+        if (problem->causal && q0 + rows + problem->offset < key_end) {
+            key_end = q0 + rows + problem->offset;
+        }
 
-                    for (size_t k = 0; k < inner; ++k) {
-                        double av = a_row[k];
-                        const double *restrict b_row = b + k * cols;
-                        for (size_t col = 0; col < cols; ++col) {
-                            c_row[col] += av * b_row[col];
-                        }
-                    }
+        for (size_t r = 0; r < rows; ++r) {
+            maximum[r] = -INFINITY;
+            sum[r] = 0.0f;
+        }
+        memset(accumulated, 0, rows * value_depth * sizeof(float));
+
+        for (size_t j0 = 0; j0 < key_end; j0 += block) {
+            size_t count = key_end - j0 < block ? key_end - j0 : block;
+            ocean_tensor_attention_transpose(k + j0 * depth, count, depth, key_block);
+            ocean_tensor_attention_gemm(
+                rows, count, depth, q, depth, key_block, block,
+                scores, block, problem->scale, false
+            );
+            /* Scores become weights exp(s - running maximum) in place. */
+            for (size_t r = 0; r < rows; ++r) {
+                float *score = scores + r * block;
+                size_t visible = ocean_tensor_attention_visible(problem, q0 + r, j0, count);
+                float block_maximum = -INFINITY;
+                for (size_t j = 0; j < visible; ++j) {
+                    if (score[j] > block_maximum) block_maximum = score[j];
+                }
+                float next = block_maximum > maximum[r] ? block_maximum : maximum[r];
+                float correction = visible ? expf(maximum[r] - next) : 1.0f;
+                if (correction != 1.0f) {
+                    float *out = accumulated + r * value_depth;
+                    for (size_t c = 0; c < value_depth; ++c) out[c] *= correction;
                 }
-                return result;
+                float total = sum[r] * correction;
+                for (size_t j = 0; j < visible; ++j) {
+                    score[j] = expf(score[j] - next);
+                    total += score[j];
+                }
+                for (size_t j = visible; j < count; ++j) score[j] = 0.0f;
+                sum[r] = total;
+                maximum[r] = next;
             }
+            ocean_tensor_attention_gemm(
+                rows, value_depth, count, scores, block, v + j0 * value_depth, value_depth,
+                accumulated, value_depth, 1.0f, true
+            );
+        }
 
-            for (size_t row0 = 0; row0 < rows; row0 += block_rows) {
-                size_t row_end = row0 + block_rows < rows
-                    ? row0 + block_rows : rows;
-
-                for (size_t k0 = 0; k0 < inner; k0 += block_inner) {
-                    size_t k_end = k0 + block_inner < inner
-                        ? k0 + block_inner : inner;
-
-                    for (size_t col0 = 0; col0 < cols; col0 += block_cols) {
-                        size_t col_end = col0 + block_cols < cols
-                            ? col0 + block_cols : cols;
-
-                        for (size_t row = row0; row < row_end; ++row) {
-                            double *restrict c_row = c + row * cols;
-                            const double *restrict a_row = a + row * inner;
-
-                            for (size_t k = k0; k < k_end; ++k) {
-                                double av = a_row[k];
-                                const double *restrict b_row = b + k * cols;
-
-                                for (size_t col = col0; col < col_end; ++col) {
-                                    c_row[col] += av * b_row[col];
-                                }
-                            }
-                        }
-                    }
-                }
+        float *result = problem->result + (head * problem->queries + q0) * value_depth;
+        for (size_t r = 0; r < rows; ++r) {
+            float inverse = 1.0f / sum[r];
+            for (size_t c = 0; c < value_depth; ++c) {
+                result[r * value_depth + c] = accumulated[r * value_depth + c] * inverse;
             }
-            return result;
+            problem->log_sum_exp[head * problem->queries + q0 + r] = maximum[r] + logf(sum[r]);
         }
     }
+    free(scratch);
+}
+
+/* dq, one query tile per task; also records delta_i = dot(dO_i, O_i). */
+static void ocean_tensor_attention_query_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_attention_problem *problem =
+        (const ocean_tensor_attention_problem *)raw;
+    const size_t block = OCEAN_TENSOR_ATTENTION_BLOCK;
+    size_t depth = problem->depth;
+    size_t value_depth = problem->value_depth;
+    float *scratch = ocean_tensor_attention_scratch(
+        (depth + value_depth) * block + OCEAN_TENSOR_ATTENTION_ROWS * (2 * block + depth)
+    );
+    float *key_block = scratch;
+    float *value_block = key_block + depth * block;
+    float *scores = value_block + value_depth * block;
+    float *products = scores + OCEAN_TENSOR_ATTENTION_ROWS * block;
+    float *gradient = products + OCEAN_TENSOR_ATTENTION_ROWS * block;
+
+    for (size_t task = begin; task < end; ++task) {
+        size_t head = task / problem->tiles;
+        size_t q0 = ocean_tensor_attention_tile(task % problem->tiles, problem->tiles)
+            * OCEAN_TENSOR_ATTENTION_ROWS;
+        size_t rows = problem->queries - q0 < OCEAN_TENSOR_ATTENTION_ROWS
+            ? problem->queries - q0 : OCEAN_TENSOR_ATTENTION_ROWS;
+        size_t first = head * problem->queries + q0;
+        const float *q = problem->q + first * depth;
+        const float *upstream = problem->upstream + first * value_depth;
+        const float *output = problem->output + first * value_depth;
+        const float *k = problem->k + head * problem->keys * depth;
+        const float *v = problem->v + head * problem->keys * value_depth;
+        size_t key_end = problem->keys;
+        if (problem->causal && q0 + rows + problem->offset < key_end) {
+            key_end = q0 + rows + problem->offset;
+        }
 
-    for (size_t row = 0; row < left->shape[0]; ++row) {
-        for (size_t col = 0; col < right->shape[1]; ++col) {
-            long double sum = 0.0L;
-
-            for (size_t k = 0; k < left->shape[1]; ++k) {
-                size_t left_index =
-                    row * left->strides[0] + k * left->strides[1];
-                size_t right_index =
-                    k * right->strides[0] + col * right->strides[1];
-
-                sum += ocean_tensor_read_scalar(left, left_index)
-                    * ocean_tensor_read_scalar(right, right_index);
+        for (size_t r = 0; r < rows; ++r) {
+            float delta = 0.0f;
+            for (size_t c = 0; c < value_depth; ++c) {
+                delta += upstream[r * value_depth + c] * output[r * value_depth + c];
             }
-
-            ocean_tensor_write_scalar(
-                result,
-                row * result->strides[0] + col * result->strides[1],
-                sum
+            problem->delta[first + r] = delta;
+        }
+        memset(gradient, 0, rows * depth * sizeof(float));
+
+        for (size_t j0 = 0; j0 < key_end; j0 += block) {
+            size_t count = key_end - j0 < block ? key_end - j0 : block;
+            ocean_tensor_attention_transpose(k + j0 * depth, count, depth, key_block);
+            ocean_tensor_attention_transpose(v + j0 * value_depth, count, value_depth, value_block);
+            ocean_tensor_attention_gemm(
+                rows, count, depth, q, depth, key_block, block,
+                scores, block, problem->scale, false
+            );
+            ocean_tensor_attention_gemm(
+                rows, count, value_depth, upstream, value_depth, value_block, block,
+                products, block, 1.0f, false
+            );
+            /* Scores become dS = P * (dP - delta) in place. */
+            for (size_t r = 0; r < rows; ++r) {
+                float *score = scores + r * block;
+                const float *product = products + r * block;
+                size_t visible = ocean_tensor_attention_visible(problem, q0 + r, j0, count);
+                float log_sum_exp = problem->log_sum_exp[first + r];
+                float delta = problem->delta[first + r];
+                for (size_t j = 0; j < visible; ++j) {
+                    score[j] = expf(score[j] - log_sum_exp) * (product[j] - delta);
+                }
+                for (size_t j = visible; j < count; ++j) score[j] = 0.0f;
+            }
+            ocean_tensor_attention_gemm(
+                rows, depth, count, scores, block, k + j0 * depth, depth,
+                gradient, depth, 1.0f, true
             );
         }
-    }
+
+        float *grad_q = problem->grad_q + first * depth;
+        for (size_t index = 0; index < rows * depth; ++index) {
+            grad_q[index] = gradient[index] * problem->scale;
+        }
+    }
+    free(scratch);
+}
+
+/* dk and dv, one key tile per task. */
+static void ocean_tensor_attention_key_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_attention_problem *problem =
+        (const ocean_tensor_attention_problem *)raw;
+    const size_t block = OCEAN_TENSOR_ATTENTION_BLOCK;
+    size_t depth = problem->depth;
+    size_t value_depth = problem->value_depth;
+    size_t key_tiles = (problem->keys + OCEAN_TENSOR_ATTENTION_ROWS - 1)
+        / OCEAN_TENSOR_ATTENTION_ROWS;
+    float *scratch = ocean_tensor_attention_scratch(
+        (depth + value_depth) * block
+        + OCEAN_TENSOR_ATTENTION_ROWS * (2 * block + depth + value_depth)
+    );
+    float *query_block = scratch;
+    float *upstream_block = query_block + depth * block;
+    float *scores = upstream_block + value_depth * block;
+    float *products = scores + OCEAN_TENSOR_ATTENTION_ROWS * block;
+    float *key_gradient = products + OCEAN_TENSOR_ATTENTION_ROWS * block;
+    float *value_gradient = key_gradient + OCEAN_TENSOR_ATTENTION_ROWS * depth;
+
+    for (size_t task = begin; task < end; ++task) {
+        size_t head = task / key_tiles;
+        size_t k0 = ocean_tensor_attention_tile(task % key_tiles, key_tiles)
+            * OCEAN_TENSOR_ATTENTION_ROWS;
+        size_t rows = problem->keys - k0 < OCEAN_TENSOR_ATTENTION_ROWS
+            ? problem->keys - k0 : OCEAN_TENSOR_ATTENTION_ROWS;
+        size_t base = head * problem->queries;
+        const float *k = problem->k + (head * problem->keys + k0) * depth;
+        const float *v = problem->v + (head * problem->keys + k0) * value_depth;
+        const float *q = problem->q + base * depth;
+        const float *upstream = problem->upstream + base * value_depth;
+        /* The first query that sees key j is j - offset. */
+        size_t query_start = problem->causal && k0 > problem->offset ? k0 - problem->offset : 0;
+
+        memset(key_gradient, 0, rows * depth * sizeof(float));
+        memset(value_gradient, 0, rows * value_depth * sizeof(float));
+
+        for (size_t i0 = query_start; i0 < problem->queries; i0 += block) {
+            size_t count = problem->queries - i0 < block ? problem->queries - i0 : block;
+            ocean_tensor_attention_transpose(q + i0 * depth, count, depth, query_block);
+            ocean_tensor_attention_transpose(
+                upstream + i0 * value_depth, count, value_depth, upstream_block
+            );
+            ocean_tensor_attention_gemm(
+                rows, count, depth, k, depth, query_block, block,
+                scores, block, problem->scale, false
+            );
+            ocean_tensor_attention_gemm(
+                rows, count, value_depth, v, value_depth, upstream_block, block,
+                products, block, 1.0f, false
+            );
+            /* Scores become P and products become dS = P * (dP - delta). */
+            for (size_t r = 0; r < rows; ++r) {
+                float *score = scores + r * block;
+                float *product = products + r * block;
+                size_t first = 0;
+                if (problem->causal && k0 + r > i0 + problem->offset) {
+                    first = k0 + r - i0 - problem->offset;
+                    if (first > count) first = count;
+                }
+                for (size_t i = 0; i < first; ++i) {
+                    score[i] = 0.0f;
+                    product[i] = 0.0f;
+                }
+                for (size_t i = first; i < count; ++i) {
+                    size_t query = base + i0 + i;
+                    score[i] = expf(score[i] - problem->log_sum_exp[query]);
+                    product[i] = score[i] * (product[i] - problem->delta[query]);
+                }
+            }
+            ocean_tensor_attention_gemm(
+                rows, value_depth, count, scores, block, upstream + i0 * value_depth, value_depth,
+                value_gradient, value_depth, 1.0f, true
+            );
+            ocean_tensor_attention_gemm(
+                rows, depth, count, products, block, q + i0 * depth, depth,
+                key_gradient, depth, 1.0f, true
+            );
+        }
+
+        float *grad_k = problem->grad_k + (head * problem->keys + k0) * depth;
+        float *grad_v = problem->grad_v + (head * problem->keys + k0) * value_depth;
+        for (size_t index = 0; index < rows * depth; ++index) {
+            grad_k[index] = key_gradient[index] * problem->scale;
+        }
+        memcpy(grad_v, value_gradient, rows * value_depth * sizeof(float));
+    }
+    free(scratch);
+}
+
+/* Validates q/k/v, fills the shape fields of `problem`, and returns packed
+   copies of any non-contiguous operand through `packed`. */
+static void ocean_tensor_attention_prepare(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal,
+    ocean_tensor_attention_problem *problem,
+    ocean_tensor_handle_t packed[3]
+) {
+    if (!q || !k || !v) {
+        ocean_tensor_fail("scaled_dot_product_attention requires non-null Tensors");
+    }
+    ocean_tensor_handle_t operands[3] = {q, k, v};
+    for (int index = 0; index < 3; ++index) {
+        ocean_tensor_materialize(operands[index]);
+        if (operands[index]->dtype != OCEAN_TENSOR_FLOAT32) {
+            ocean_tensor_fail("scaled_dot_product_attention requires float32 Tensors");
+        }
+        if (operands[index]->device != OCEAN_TENSOR_CPU) {
+            ocean_tensor_fail("scaled_dot_product_attention requires CPU Tensors");
+        }
+    }
+    size_t ndim = q->ndim;
+    if (ndim < 2 || k->ndim != ndim || v->ndim != ndim) {
+        ocean_tensor_fail("scaled_dot_product_attention expects q [..., Tq, d], k [..., Tk, d], v [..., Tk, dv]");
+    }
+    size_t heads = 1;
+    for (size_t axis = 0; axis + 2 < ndim; ++axis) {
+        if (k->shape[axis] != q->shape[axis] || v->shape[axis] != q->shape[axis]) {
+            ocean_tensor_fail("scaled_dot_product_attention batch dimensions must match");
+        }
+        heads *= q->shape[axis];
+    }
+    if (k->shape[ndim - 1] != q->shape[ndim - 1] || v->shape[ndim - 2] != k->shape[ndim - 2]) {
+        ocean_tensor_fail("scaled_dot_product_attention expects q [..., Tq, d], k [..., Tk, d], v [..., Tk, dv]");
+    }
+
+    memset(problem, 0, sizeof(*problem));
+    problem->heads = heads;
+    problem->queries = q->shape[ndim - 2];
+    problem->keys = k->shape[ndim - 2];
+    problem->key_capacity = problem->keys;
+    problem->depth = q->shape[ndim - 1];
+    problem->value_depth = v->shape[ndim - 1];
+    if (!problem->depth || (problem->queries && !problem->keys)) {
+        ocean_tensor_fail("scaled_dot_product_attention requires non-empty keys and features");
+    }
+    if (causal && problem->keys < problem->queries) {
+        ocean_tensor_fail("causal scaled_dot_product_attention requires at least as many keys as queries");
+    }
+    problem->causal = causal;
+    problem->offset = problem->keys - problem->queries;
+    problem->tiles = (problem->queries + OCEAN_TENSOR_ATTENTION_ROWS - 1)
+        / OCEAN_TENSOR_ATTENTION_ROWS;
+    problem->scale = 1.0f / sqrtf((float)problem->depth);
+
+    for (int index = 0; index < 3; ++index) packed[index] = ocean_tensor_dense(operands[index]);
+    problem->q = (const float *)packed[0]->cpu_data;
+    problem->k = (const float *)packed[1]->cpu_data;
+    problem->v = (const float *)packed[2]->cpu_data;
+}
+
+static void ocean_tensor_attention_release(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    ocean_tensor_handle_t packed[3]
+) {
+    if (packed[0] != q) ocean_tensor_release(packed[0]);
+    if (packed[1] != k) ocean_tensor_release(packed[1]);
+    if (packed[2] != v) ocean_tensor_release(packed[2]);
+}
+
+/* Tiles worth a thread of their own: about OCEAN_TENSOR_GEMM_PARALLEL_WORK
+   multiply-adds. */
+#define OCEAN_TENSOR_ATTENTION_LANES 16
+
+/* Single-query decoding: one query row per head against contiguous key
+   rows, so scores are dot products rather than a tiled GEMM. */
+static void ocean_tensor_attention_decode_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_attention_problem *problem =
+        (const ocean_tensor_attention_problem *)raw;
+    size_t depth = problem->depth;
+    size_t value_depth = problem->value_depth;
+    size_t keys = problem->keys;
+    float *scores = ocean_tensor_attention_scratch(keys);
+
+    for (size_t head = begin; head < end; ++head) {
+        const float *q = problem->q + head * depth;
+        const float *k = problem->k + head * problem->key_capacity * depth;
+        const float *v = problem->v + head * problem->key_capacity * value_depth;
+        float *out = problem->result + head * value_depth;
+
+        float maximum = -INFINITY;
+        for (size_t j = 0; j < keys; ++j) {
+            const float *key = k + j * depth;
+            float lanes[OCEAN_TENSOR_ATTENTION_LANES] = {0.0f};
+            size_t c = 0;
+            for (; c + OCEAN_TENSOR_ATTENTION_LANES <= depth; c += OCEAN_TENSOR_ATTENTION_LANES) {
+                OCEAN_TENSOR_SIMD
+                for (size_t lane = 0; lane < OCEAN_TENSOR_ATTENTION_LANES; ++lane) {
+                    lanes[lane] += q[c + lane] * key[c + lane];
+                }
+            }
+            float score = 0.0f;
+            for (size_t lane = 0; lane < OCEAN_TENSOR_ATTENTION_LANES; ++lane) score += lanes[lane];
+            for (; c < depth; ++c) score += q[c] * key[c];
+            score *= problem->scale;
+            scores[j] = score;
+            if (score > maximum) maximum = score;
+        }
+
+        float sum = 0.0f;
+        for (size_t c = 0; c < value_depth; ++c) out[c] = 0.0f;
+        for (size_t j = 0; j < keys; ++j) {
+            float weight = expf(scores[j] - maximum);
+            const float *value = v + j * value_depth;
+            sum += weight;
+            OCEAN_TENSOR_SIMD
+            for (size_t c = 0; c < value_depth; ++c) out[c] += weight * value[c];
+        }
+        float inverse = 1.0f / sum;
+        for (size_t c = 0; c < value_depth; ++c) out[c] *= inverse;
+        problem->log_sum_exp[head] = maximum + logf(sum);
+    }
+    free(scores);
+}
+
+static size_t ocean_tensor_attention_grain(const ocean_tensor_attention_problem *problem) {
+    size_t work = OCEAN_TENSOR_ATTENTION_ROWS * problem->keys
+        * (problem->depth + problem->value_depth);
+    size_t grain = work ? OCEAN_TENSOR_GEMM_PARALLEL_WORK / work : 1;
+    return grain ? grain : 1;
+}
+
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention_forward(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal,
+    ocean_tensor_handle_t *log_sum_exp_out
+) {
+    ocean_tensor_attention_problem problem;
+    ocean_tensor_handle_t packed[3];
+    ocean_tensor_attention_prepare(q, k, v, causal, &problem, packed);
+
+    size_t ndim = q->ndim;
+    size_t *shape = (size_t *)malloc(ndim * sizeof(size_t));
+    if (!shape) {
+        ocean_tensor_attention_release(q, k, v, packed);
+        ocean_tensor_fail("out of memory in scaled_dot_product_attention");
+    }
+    memcpy(shape, q->shape, ndim * sizeof(size_t));
+    shape[ndim - 1] = problem.value_depth;
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        shape, ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    ocean_tensor_handle_t log_sum_exp = ocean_tensor_alloc_uninitialized(
+        q->shape, ndim - 1, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    free(shape);
+
+    problem.result = (float *)result->cpu_data;
+    problem.log_sum_exp = (float *)log_sum_exp->cpu_data;
+    ocean_tensor_parallel_for(
+        problem.heads * problem.tiles, ocean_tensor_attention_grain(&problem),
+        ocean_tensor_attention_forward_tasks, &problem
+    );
+
+    ocean_tensor_attention_release(q, k, v, packed);
+    if (log_sum_exp_out) *log_sum_exp_out = log_sum_exp;
+    else ocean_tensor_release(log_sum_exp);
+    return result;
+}
+
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal
+) {
+    return ocean_tensor_scaled_dot_product_attention_forward(q, k, v, causal, NULL);
+}
+
+/* Checks a [..., capacity, width] KV cache against the [..., rows, width]
+   Tensor that reads or writes it; returns the number of heads.  The cache
+   lives on the CPU; the other Tensor may be on any device. */
+static size_t ocean_tensor_kv_cache_heads(
+    ocean_tensor_handle_t cache,
+    ocean_tensor_handle_t tensor,
+    size_t width
+) {
+    ocean_tensor_materialize(cache);
+    ocean_tensor_materialize(tensor);
+    if (cache->dtype != OCEAN_TENSOR_FLOAT32 || tensor->dtype != OCEAN_TENSOR_FLOAT32) {
+        ocean_tensor_fail("KV cache requires float32 Tensors");
+    }
+    if (cache->device != OCEAN_TENSOR_CPU || tensor->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_fail("KV cache decoding is CPU-only; keep the model on the CPU");
+    }
+    if (!ocean_tensor_is_contiguous(cache)) {
+        ocean_tensor_fail("KV cache storage must be contiguous");
+    }
+    size_t ndim = cache->ndim;
+    if (ndim < 2 || tensor->ndim != ndim || cache->shape[ndim - 1] != width) {
+        ocean_tensor_fail("KV cache expects [..., capacity, width] storage");
+    }
+    size_t heads = 1;
+    for (size_t axis = 0; axis + 2 < ndim; ++axis) {
+        if (cache->shape[axis] != tensor->shape[axis]) {
+            ocean_tensor_fail("KV cache batch dimensions must match");
+        }
+        heads *= cache->shape[axis];
+    }
+    return heads;
+}
+
+void ocean_tensor_kv_cache_write(
+    ocean_tensor_handle_t cache,
+    ocean_tensor_handle_t values,
+    size_t position
+) {
+    if (!cache || !values) ocean_tensor_fail("KV cache write requires non-null Tensors");
+    ocean_tensor_lazy_flush();
+    size_t width = values->ndim ? values->shape[values->ndim - 1] : 0;
+    size_t heads = ocean_tensor_kv_cache_heads(cache, values, width);
+    size_t capacity = cache->shape[cache->ndim - 2];
+    size_t rows = values->shape[values->ndim - 2];
+    if (position > capacity || rows > capacity - position) {
+        ocean_tensor_fail("KV cache is full");
+    }
+    if (!rows || !width || !heads) return;
+    ocean_tensor_handle_t packed = ocean_tensor_dense(values);
+    const float *source = (const float *)packed->cpu_data;
+    float *target = (float *)cache->cpu_data;
+    for (size_t head = 0; head < heads; ++head) {
+        memcpy(
+            target + (head * capacity + position) * width,
+            source + head * rows * width,
+            rows * width * sizeof(float)
+        );
+    }
+    if (packed != values) ocean_tensor_release(packed);
+}
+
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention_cached(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t cache_k,
+    ocean_tensor_handle_t cache_v,
+    size_t length
+) {
+    if (!q || !cache_k || !cache_v) {
+        ocean_tensor_fail("cached attention requires non-null Tensors");
+    }
+    size_t depth = q->ndim ? q->shape[q->ndim - 1] : 0;
+    size_t heads = ocean_tensor_kv_cache_heads(cache_k, q, depth);
+    size_t value_depth = cache_v->ndim ? cache_v->shape[cache_v->ndim - 1] : 0;
+    ocean_tensor_kv_cache_heads(cache_v, q, value_depth);
+    size_t ndim = q->ndim;
+    size_t capacity = cache_k->shape[ndim - 2];
+    size_t queries = q->shape[ndim - 2];
+    if (cache_v->shape[ndim - 2] != capacity) {
+        ocean_tensor_fail("KV cache keys and values must have the same capacity");
+    }
+    if (!depth || length > capacity || length < queries || !length) {
+        ocean_tensor_fail("cached attention length must cover the queries and fit the cache");
+    }
+
+    ocean_tensor_attention_problem problem;
+    memset(&problem, 0, sizeof(problem));
+    problem.heads = heads;
+    problem.queries = queries;
+    problem.keys = length;
+    problem.key_capacity = capacity;
+    problem.depth = depth;
+    problem.value_depth = value_depth;
+    problem.causal = true;
+    problem.offset = length - queries;
+    problem.tiles = (queries + OCEAN_TENSOR_ATTENTION_ROWS - 1) / OCEAN_TENSOR_ATTENTION_ROWS;
+    problem.scale = 1.0f / sqrtf((float)depth);
+
+    size_t *shape = (size_t *)malloc(ndim * sizeof(size_t));
+    float *log_sum_exp = (float *)malloc((heads * queries + 1) * sizeof(float));
+    if (!shape || !log_sum_exp) {
+        free(shape);
+        free(log_sum_exp);
+        ocean_tensor_fail("out of memory in cached attention");
+    }
+    memcpy(shape, q->shape, ndim * sizeof(size_t));
+    shape[ndim - 1] = value_depth;
+    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
+        shape, ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    free(shape);
+
+    ocean_tensor_handle_t packed = ocean_tensor_dense(q);
+    problem.q = (const float *)packed->cpu_data;
+    problem.k = (const float *)cache_k->cpu_data;
+    problem.v = (const float *)cache_v->cpu_data;
+    problem.result = (float *)result->cpu_data;
+    problem.log_sum_exp = log_sum_exp;
+    if (queries == 1) {
+        size_t work = length * (depth + value_depth);
+        size_t grain = work ? OCEAN_TENSOR_GEMM_PARALLEL_WORK / work : 1;
+        ocean_tensor_parallel_for(
+            problem.heads, grain ? grain : 1, ocean_tensor_attention_decode_tasks, &problem
+        );
+    } else {
+        ocean_tensor_parallel_for(
+            problem.heads * problem.tiles, ocean_tensor_attention_grain(&problem),
+            ocean_tensor_attention_forward_tasks, &problem
+        );
+    }
+
+    free(log_sum_exp);
+    if (packed != q) ocean_tensor_release(packed);
+    return result;
+}
+
+void ocean_tensor_scaled_dot_product_attention_backward(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    ocean_tensor_handle_t output,
+    ocean_tensor_handle_t log_sum_exp,
+    bool causal,
+    ocean_tensor_handle_t *grad_q,
+    ocean_tensor_handle_t *grad_k,
+    ocean_tensor_handle_t *grad_v
+) {
+    if (!upstream || !output || !log_sum_exp || !grad_q || !grad_k || !grad_v) {
+        ocean_tensor_fail("scaled_dot_product_attention backward requires non-null Tensors");
+    }
+    ocean_tensor_attention_problem problem;
+    ocean_tensor_handle_t packed[3];
+    ocean_tensor_attention_prepare(q, k, v, causal, &problem, packed);
+
+    ocean_tensor_handle_t saved[3] = {upstream, output, log_sum_exp};
+    size_t expected[3] = {
+        problem.heads * problem.queries * problem.value_depth,
+        problem.heads * problem.queries * problem.value_depth,
+        problem.heads * problem.queries,
+    };
+    ocean_tensor_handle_t dense[3];
+    for (int index = 0; index < 3; ++index) {
+        ocean_tensor_materialize(saved[index]);
+        if (saved[index]->dtype != OCEAN_TENSOR_FLOAT32
+            || saved[index]->device != OCEAN_TENSOR_CPU
+            || saved[index]->size != expected[index]) {
+            ocean_tensor_attention_release(q, k, v, packed);
+            ocean_tensor_fail("scaled_dot_product_attention backward received mismatched Tensors");
+        }
+    }
+    for (int index = 0; index < 3; ++index) dense[index] = ocean_tensor_dense(saved[index]);
+
+    float *delta = (float *)malloc((problem.heads * problem.queries + 1) * sizeof(float));
+    if (!delta) {
+        for (int index = 0; index < 3; ++index) {
+            if (dense[index] != saved[index]) ocean_tensor_release(dense[index]);
+        }
+        ocean_tensor_attention_release(q, k, v, packed);
+        ocean_tensor_fail("out of memory in scaled_dot_product_attention backward");
+    }
+    *grad_q = ocean_tensor_alloc_uninitialized(q->shape, q->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU);
+    *grad_k = ocean_tensor_alloc_uninitialized(k->shape, k->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU);
+    *grad_v = ocean_tensor_alloc_uninitialized(v->shape, v->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU);
+    problem.upstream = (const float *)dense[0]->cpu_data;
+    problem.output = (const float *)dense[1]->cpu_data;
+    problem.log_sum_exp = (float *)dense[2]->cpu_data;
+    problem.delta = delta;
+    problem.grad_q = (float *)(*grad_q)->cpu_data;
+    problem.grad_k = (float *)(*grad_k)->cpu_data;
+    problem.grad_v = (float *)(*grad_v)->cpu_data;
+
+    size_t grain = ocean_tensor_attention_grain(&problem);
+    ocean_tensor_parallel_for(
+        problem.heads * problem.tiles, grain, ocean_tensor_attention_query_tasks, &problem
+    );
+    size_t key_tiles = (problem.keys + OCEAN_TENSOR_ATTENTION_ROWS - 1)
+        / OCEAN_TENSOR_ATTENTION_ROWS;
+    ocean_tensor_parallel_for(
+        problem.heads * key_tiles, grain, ocean_tensor_attention_key_tasks, &problem
+    );
+
+    free(delta);
+    for (int index = 0; index < 3; ++index) {
+        if (dense[index] != saved[index]) ocean_tensor_release(dense[index]);
+    }
+    ocean_tensor_attention_release(q, k, v, packed);
+}
+
+/* Quantized inference GEMM: out[..., N] = input[..., K] x W[K, N] with W
+   stored transposed as one packed row per output column, so each output is
+   a contiguous dot product over K.  Ternary rows hold four 2-bit codes per
+   byte (0 -> 0, 1 -> +1, 2 -> -1, low bits first) and one float scale per
+   row; int8 rows hold one signed byte per weight and a per-row scale. */
+#define OCEAN_TENSOR_QUANTIZED_LANES 16
+/* Up to this many input rows, ternary matmul uses per-row lookup tables. */
+#define OCEAN_TENSOR_TERNARY_LOOKUP_ROWS 4
+
+typedef struct ocean_tensor_quantized_problem {
+    size_t rows;
+    size_t depth;
+    size_t outputs;
+    size_t row_bytes;
+    const float *input;
+    const int8_t *input_codes;
+    const float *input_scales;
+    const uint8_t *codes;
+    const float *scales;
+    float *result;
+    /* [rows][row_bytes][256]: the signed sum of each 4-input group for
+       every code byte, or NULL to decode rows into signs instead. */
+    const float *lookup;
+    float signs[256][4];
+} ocean_tensor_quantized_problem;
+
+/* Checks a float32 [K, N] weight and returns a dense CPU copy or itself. */
+static ocean_tensor_handle_t ocean_tensor_quantized_weight(
+    ocean_tensor_handle_t weight,
+    const char *operation
+) {
+    if (!weight) ocean_tensor_fail("quantized packing requires a non-null Tensor");
+    ocean_tensor_materialize(weight);
+    if (weight->dtype != OCEAN_TENSOR_FLOAT32 || weight->ndim != 2) {
+        fprintf(stderr, "%s expects a float32 [in_features, out_features] weight\n", operation);
+        ocean_tensor_fail("invalid quantized weight");
+    }
+    ocean_tensor_handle_t host = weight->device == OCEAN_TENSOR_CPU
+        ? weight : ocean_tensor_to(weight, "cpu");
+    ocean_tensor_handle_t dense = ocean_tensor_dense(host);
+    if (dense != host && host != weight) ocean_tensor_release(host);
+    return dense;
+}
+
+static ocean_tensor_handle_t ocean_tensor_quantized_scales(size_t outputs) {
+    size_t shape[1] = {outputs};
+    return ocean_tensor_alloc_uninitialized(shape, 1, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU);
+}
+
+/* The same mean-absolute-value scale as ocean_tensor_ternary_quantize. */
+static float ocean_tensor_ternary_scale(const float *values, size_t count) {
+    double sum_abs = 0.0;
+    for (size_t index = 0; index < count; ++index) sum_abs += fabs((double)values[index]);
+    float scale = count ? (float)(sum_abs / (double)count) : 0.0f;
+    return scale < 1.0e-8f ? 1.0e-8f : scale;
+}
+
+ocean_tensor_handle_t ocean_tensor_ternary_pack(ocean_tensor_handle_t weight) {
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_weight(weight, "ternary_pack");
+    size_t depth = dense->shape[0], outputs = dense->shape[1];
+    size_t row_bytes = (depth + 3) / 4;
+    size_t shape[2] = {outputs, row_bytes};
+    ocean_tensor_handle_t codes = ocean_tensor_zeros_nd(shape, 2, "uint8", "cpu");
+    const float *values = (const float *)dense->cpu_data;
+    float threshold = 0.5f * ocean_tensor_ternary_scale(values, dense->size);
+    uint8_t *packed = (uint8_t *)codes->cpu_data;
+    for (size_t i = 0; i < depth; ++i) {
+        for (size_t o = 0; o < outputs; ++o) {
+            float value = values[i * outputs + o];
+            unsigned code = value > threshold ? 1u : (value < -threshold ? 2u : 0u);
+            packed[o * row_bytes + i / 4] |= (uint8_t)(code << (2 * (i % 4)));
+        }
+    }
+    if (dense != weight) ocean_tensor_release(dense);
+    return codes;
+}
+
+ocean_tensor_handle_t ocean_tensor_ternary_scales(ocean_tensor_handle_t weight) {
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_weight(weight, "ternary_scales");
+    ocean_tensor_handle_t scales = ocean_tensor_quantized_scales(dense->shape[1]);
+    float scale = ocean_tensor_ternary_scale((const float *)dense->cpu_data, dense->size);
+    for (size_t o = 0; o < dense->shape[1]; ++o) ((float *)scales->cpu_data)[o] = scale;
+    if (dense != weight) ocean_tensor_release(dense);
+    return scales;
+}
+
+/* Symmetric per-output-column scale: the largest magnitude maps to 127. */
+static void ocean_tensor_int8_column_scales(const ocean_tensor_handle_t dense, float *scales) {
+    size_t depth = dense->shape[0], outputs = dense->shape[1];
+    const float *values = (const float *)dense->cpu_data;
+    for (size_t o = 0; o < outputs; ++o) scales[o] = 0.0f;
+    for (size_t i = 0; i < depth; ++i) {
+        for (size_t o = 0; o < outputs; ++o) {
+            float magnitude = fabsf(values[i * outputs + o]);
+            if (magnitude > scales[o]) scales[o] = magnitude;
+        }
+    }
+    for (size_t o = 0; o < outputs; ++o) {
+        scales[o] = scales[o] > 0.0f ? scales[o] / 127.0f : 1.0f;
+    }
+}
+
+ocean_tensor_handle_t ocean_tensor_int8_pack(ocean_tensor_handle_t weight) {
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_weight(weight, "int8_pack");
+    size_t depth = dense->shape[0], outputs = dense->shape[1];
+    float *scales = (float *)malloc((outputs + 1) * sizeof(float));
+    if (!scales) ocean_tensor_fail("out of memory in int8_pack");
+    ocean_tensor_int8_column_scales(dense, scales);
+    size_t shape[2] = {outputs, depth};
+    ocean_tensor_handle_t codes = ocean_tensor_alloc_uninitialized(
+        shape, 2, OCEAN_TENSOR_INT8, OCEAN_TENSOR_CPU
+    );
+    const float *values = (const float *)dense->cpu_data;
+    int8_t *packed = (int8_t *)codes->cpu_data;
+    for (size_t i = 0; i < depth; ++i) {
+        for (size_t o = 0; o < outputs; ++o) {
+            packed[o * depth + i] = (int8_t)lrintf(values[i * outputs + o] / scales[o]);
+        }
+    }
+    free(scales);
+    if (dense != weight) ocean_tensor_release(dense);
+    return codes;
+}
+
+ocean_tensor_handle_t ocean_tensor_int8_scales(ocean_tensor_handle_t weight) {
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_weight(weight, "int8_scales");
+    ocean_tensor_handle_t scales = ocean_tensor_quantized_scales(dense->shape[1]);
+    ocean_tensor_int8_column_scales(dense, (float *)scales->cpu_data);
+    if (dense != weight) ocean_tensor_release(dense);
+    return scales;
+}
+
+/* Few input rows (decoding): every packed byte selects a precomputed sum
+   of four signed inputs, so each output is additions only.  Otherwise each
+   weight row is decoded once into +-1/0 signs in a scratch row and summed
+   against every input row.  No weight is widened in memory either way. */
+static void ocean_tensor_ternary_matmul_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_quantized_problem *problem =
+        (const ocean_tensor_quantized_problem *)raw;
+    size_t depth = problem->depth;
+    size_t row_bytes = problem->row_bytes;
+    if (problem->lookup) {
+        for (size_t o = begin; o < end; ++o) {
+            const uint8_t *codes = problem->codes + o * row_bytes;
+            for (size_t m = 0; m < problem->rows; ++m) {
+                const float *table = problem->lookup + m * row_bytes * 256;
+                float sums[4] = {0.0f, 0.0f, 0.0f, 0.0f};
+                size_t b = 0;
+                for (; b + 4 <= row_bytes; b += 4) {
+                    sums[0] += table[b * 256 + codes[b]];
+                    sums[1] += table[(b + 1) * 256 + codes[b + 1]];
+                    sums[2] += table[(b + 2) * 256 + codes[b + 2]];
+                    sums[3] += table[(b + 3) * 256 + codes[b + 3]];
+                }
+                for (; b < row_bytes; ++b) sums[0] += table[b * 256 + codes[b]];
+                float sum = (sums[0] + sums[1]) + (sums[2] + sums[3]);
+                problem->result[m * problem->outputs + o] = sum * problem->scales[o];
+            }
+        }
+        return;
+    }
+
+    float *signs = (float *)malloc((problem->row_bytes * 4 + 1) * sizeof(float));
+    if (!signs) ocean_tensor_fail("out of memory in ternary matmul");
+
+    for (size_t o = begin; o < end; ++o) {
+        const uint8_t *codes = problem->codes + o * problem->row_bytes;
+        for (size_t b = 0; b < problem->row_bytes; ++b) {
+            memcpy(signs + 4 * b, problem->signs[codes[b]], 4 * sizeof(float));
+        }
+        for (size_t m = 0; m < problem->rows; ++m) {
+            const float *x = problem->input + m * depth;
+            float lanes[OCEAN_TENSOR_QUANTIZED_LANES] = {0.0f};
+            size_t i = 0;
+            for (; i + OCEAN_TENSOR_QUANTIZED_LANES <= depth; i += OCEAN_TENSOR_QUANTIZED_LANES) {
+                OCEAN_TENSOR_SIMD
+                for (size_t lane = 0; lane < OCEAN_TENSOR_QUANTIZED_LANES; ++lane) {
+                    lanes[lane] += signs[i + lane] * x[i + lane];
+                }
+            }
+            float sum = 0.0f;
+            for (size_t lane = 0; lane < OCEAN_TENSOR_QUANTIZED_LANES; ++lane) sum += lanes[lane];
+            for (; i < depth; ++i) sum += signs[i] * x[i];
+            problem->result[m * problem->outputs + o] = sum * problem->scales[o];
+        }
+    }
+    free(signs);
+}
+
+static void ocean_tensor_int8_matmul_tasks(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_quantized_problem *problem =
+        (const ocean_tensor_quantized_problem *)raw;
+    size_t depth = problem->depth;
+
+    for (size_t o = begin; o < end; ++o) {
+        const int8_t *w = (const int8_t *)problem->codes + o * depth;
+        for (size_t m = 0; m < problem->rows; ++m) {
+            const int8_t *x = problem->input_codes + m * depth;
+            int32_t lanes[OCEAN_TENSOR_QUANTIZED_LANES] = {0};
+            size_t i = 0;
+            for (; i + OCEAN_TENSOR_QUANTIZED_LANES <= depth; i += OCEAN_TENSOR_QUANTIZED_LANES) {
+                OCEAN_TENSOR_SIMD
+                for (size_t lane = 0; lane < OCEAN_TENSOR_QUANTIZED_LANES; ++lane) {
+                    lanes[lane] += (int32_t)((int16_t)w[i + lane] * (int16_t)x[i + lane]);
+                }
+            }
+            int32_t sum = 0;
+            for (size_t lane = 0; lane < OCEAN_TENSOR_QUANTIZED_LANES; ++lane) sum += lanes[lane];
+            for (; i < depth; ++i) sum += (int32_t)w[i] * (int32_t)x[i];
+            problem->result[m * problem->outputs + o] =
+                (float)sum * problem->input_scales[m] * problem->scales[o];
+        }
+    }
+}
+
+/* Validates input [..., K] against packed codes [N, row_bytes] and scales
+   [N], allocates the [..., N] result and fills the shared problem fields.
+   Returns the dense CPU input, which the caller releases if it differs. */
+static ocean_tensor_handle_t ocean_tensor_quantized_prepare(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t codes,
+    ocean_tensor_handle_t scales,
+    ocean_tensor_dtype code_dtype,
+    size_t values_per_byte,
+    ocean_tensor_quantized_problem *problem,
+    ocean_tensor_handle_t *result
+) {
+    if (!input || !codes || !scales) ocean_tensor_fail("quantized matmul requires non-null Tensors");
+    ocean_tensor_materialize(input);
+    ocean_tensor_materialize(codes);
+    ocean_tensor_materialize(scales);
+    if (input->dtype != OCEAN_TENSOR_FLOAT32 || input->ndim < 1) {
+        ocean_tensor_fail("quantized matmul expects a float32 input");
+    }
+    if (codes->dtype != code_dtype || codes->ndim != 2 || codes->device != OCEAN_TENSOR_CPU ||
+        !ocean_tensor_is_contiguous(codes)) {
+        ocean_tensor_fail("quantized matmul expects packed CPU codes from the matching pack()");
+    }
+    size_t depth = input->shape[input->ndim - 1];
+    size_t outputs = codes->shape[0];
+    if (codes->shape[1] != (depth + values_per_byte - 1) / values_per_byte) {
+        ocean_tensor_fail("quantized matmul input features do not match the packed weight");
+    }
+    if (scales->dtype != OCEAN_TENSOR_FLOAT32 || scales->device != OCEAN_TENSOR_CPU ||
+        scales->size != outputs || !ocean_tensor_is_contiguous(scales)) {
+        ocean_tensor_fail("quantized matmul expects one CPU float32 scale per output");
+    }
+
+    ocean_tensor_handle_t host = input->device == OCEAN_TENSOR_CPU
+        ? input : ocean_tensor_to(input, "cpu");
+    ocean_tensor_handle_t dense = ocean_tensor_dense(host);
+    if (dense != host && host != input) ocean_tensor_release(host);
+
+    size_t *shape = (size_t *)malloc(input->ndim * sizeof(size_t));
+    if (!shape) ocean_tensor_fail("out of memory in quantized matmul");
+    memcpy(shape, input->shape, input->ndim * sizeof(size_t));
+    shape[input->ndim - 1] = outputs;
+    *result = ocean_tensor_alloc_uninitialized(
+        shape, input->ndim, OCEAN_TENSOR_FLOAT32, OCEAN_TENSOR_CPU
+    );
+    free(shape);
+
+    problem->rows = depth ? dense->size / depth : 0;
+    problem->depth = depth;
+    problem->outputs = outputs;
+    problem->row_bytes = codes->shape[1];
+    problem->input = (const float *)dense->cpu_data;
+    problem->codes = (const uint8_t *)codes->cpu_data;
+    problem->scales = (const float *)scales->cpu_data;
+    problem->result = (float *)(*result)->cpu_data;
+    return dense;
+}
+
+/* Runs the tasks over output rows and returns the result on input's device. */
+static ocean_tensor_handle_t ocean_tensor_quantized_finish(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t dense,
+    ocean_tensor_quantized_problem *problem,
+    void (*tasks)(void *, size_t, size_t),
+    ocean_tensor_handle_t result
+) {
+    if (!problem->depth) {
+        memset(problem->result, 0, result->size * sizeof(float));
+    } else if (problem->rows) {
+        size_t work = problem->rows * problem->depth;
+        size_t grain = OCEAN_TENSOR_GEMM_PARALLEL_WORK / work;
+        ocean_tensor_parallel_for(problem->outputs, grain ? grain : 1, tasks, problem);
+    }
+    if (dense != input) ocean_tensor_release(dense);
+    if (input->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_handle_t moved = ocean_tensor_to(result, "gpu");
+        ocean_tensor_release(result);
+        result = moved;
+    }
+    return result;
+}
+
+ocean_tensor_handle_t ocean_tensor_matmul_ternary(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t codes,
+    ocean_tensor_handle_t scales
+) {
+    ocean_tensor_quantized_problem *problem =
+        (ocean_tensor_quantized_problem *)calloc(1, sizeof(*problem));
+    if (!problem) ocean_tensor_fail("out of memory in ternary matmul");
+    ocean_tensor_handle_t result = NULL;
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_prepare(
+        input, codes, scales, OCEAN_TENSOR_UINT8, 4, problem, &result
+    );
+    static const float values[4] = {0.0f, 1.0f, -1.0f, 0.0f};
+    for (size_t code = 0; code < 256; ++code) {
+        for (size_t lane = 0; lane < 4; ++lane) {
+            problem->signs[code][lane] = values[(code >> (2 * lane)) & 3u];
+        }
+    }
+
+    float *lookup = NULL;
+    size_t rows = problem->rows, depth = problem->depth, row_bytes = problem->row_bytes;
+    if (rows && rows <= OCEAN_TENSOR_TERNARY_LOOKUP_ROWS) {
+        lookup = (float *)malloc(rows * row_bytes * 256 * sizeof(float));
+        if (!lookup) ocean_tensor_fail("out of memory in ternary matmul");
+        for (size_t m = 0; m < rows; ++m) {
+            for (size_t b = 0; b < row_bytes; ++b) {
+                /* Per input of the group: its contribution for codes 0..3. */
+                float terms[4][4];
+                for (size_t lane = 0; lane < 4; ++lane) {
+                    size_t i = 4 * b + lane;
+                    float x = i < depth ? problem->input[m * depth + i] : 0.0f;
+                    terms[lane][0] = 0.0f;
+                    terms[lane][1] = x;
+                    terms[lane][2] = -x;
+                    terms[lane][3] = 0.0f;
+                }
+                float *table = lookup + (m * row_bytes + b) * 256;
+                for (size_t code = 0; code < 256; ++code) {
+                    table[code] = (terms[0][code & 3u] + terms[1][(code >> 2) & 3u])
+                        + (terms[2][(code >> 4) & 3u] + terms[3][code >> 6]);
+                }
+            }
+        }
+        problem->lookup = lookup;
+    }
+    result = ocean_tensor_quantized_finish(
+        input, dense, problem, ocean_tensor_ternary_matmul_tasks, result
+    );
+    free(lookup);
+    free(problem);
+    return result;
+}
+
+/* Activations are quantized per row on the fly (symmetric, largest
+   magnitude -> 127) so the inner products are int8 x int8 into int32. */
+ocean_tensor_handle_t ocean_tensor_matmul_int8(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t codes,
+    ocean_tensor_handle_t scales
+) {
+    ocean_tensor_quantized_problem *problem =
+        (ocean_tensor_quantized_problem *)calloc(1, sizeof(*problem));
+    if (!problem) ocean_tensor_fail("out of memory in int8 matmul");
+    ocean_tensor_handle_t result = NULL;
+    ocean_tensor_handle_t dense = ocean_tensor_quantized_prepare(
+        input, codes, scales, OCEAN_TENSOR_INT8, 1, problem, &result
+    );
+    size_t rows = problem->rows, depth = problem->depth;
+    int8_t *input_codes = (int8_t *)malloc(rows * depth + 1);
+    float *input_scales = (float *)malloc((rows + 1) * sizeof(float));
+    if (!input_codes || !input_scales) ocean_tensor_fail("out of memory in int8 matmul");
+    for (size_t m = 0; m < rows; ++m) {
+        const float *x = problem->input + m * depth;
+        float maximum = 0.0f;
+        for (size_t i = 0; i < depth; ++i) {
+            if (fabsf(x[i]) > maximum) maximum = fabsf(x[i]);
+        }
+        float scale = maximum > 0.0f ? maximum / 127.0f : 1.0f;
+        float inverse = 1.0f / scale;
+        for (size_t i = 0; i < depth; ++i) {
+            input_codes[m * depth + i] = (int8_t)lrintf(x[i] * inverse);
+        }
+        input_scales[m] = scale;
+    }
+    problem->input_codes = input_codes;
+    problem->input_scales = input_scales;
+    result = ocean_tensor_quantized_finish(
+        input, dense, problem, ocean_tensor_int8_matmul_tasks, result
+    );
+    free(input_codes);
+    free(input_scales);
+    free(problem);
+    return result;
+}
+
+static bool ocean_tensor_gemm_supported(const ocean_tensor_handle_t tensor) {
+    return tensor->dtype == OCEAN_TENSOR_FLOAT32
+        || tensor->dtype == OCEAN_TENSOR_FLOAT64;
+}
+
+/* Result shape and per-matrix element offsets of a batched, broadcasting
+   matmul over op(left) and op(right), where op swaps the two trailing axes
+   when the matching transpose flag is set.  Offsets are only computed when
+   there is work to do (non-empty result and k > 0). */
+typedef struct ocean_tensor_matmul_layout {
+    size_t m;
+    size_t n;
+    size_t k;
+    size_t batch;
+    size_t *a_offsets;
+    size_t *b_offsets;
+} ocean_tensor_matmul_layout;
+
+static ocean_tensor_handle_t ocean_tensor_matmul_prepare(
+    const ocean_tensor_handle_t left,
+    const ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right,
+    ocean_tensor_matmul_layout *layout
+) {
+    size_t left_ndim = left->ndim;
+    size_t right_ndim = right->ndim;
+    size_t out_ndim = left_ndim > right_ndim ? left_ndim : right_ndim;
+    size_t batch_ndim = out_ndim - 2;
+    size_t left_batch_ndim = left_ndim - 2;
+    size_t right_batch_ndim = right_ndim - 2;
+
+    layout->m = transpose_left
+        ? left->shape[left_ndim - 1] : left->shape[left_ndim - 2];
+    layout->k = transpose_left
+        ? left->shape[left_ndim - 2] : left->shape[left_ndim - 1];
+    layout->n = transpose_right
+        ? right->shape[right_ndim - 2] : right->shape[right_ndim - 1];
+    layout->batch = 1;
+    layout->a_offsets = NULL;
+    layout->b_offsets = NULL;
+
+    size_t *shape = (size_t *)malloc(out_ndim * sizeof(size_t));
+    if (!shape) ocean_tensor_fail("out of memory allocating matmul shape");
+    for (size_t axis = 0; axis < batch_ndim; ++axis) {
+        long long la = (long long)axis - (long long)(batch_ndim - left_batch_ndim);
+        long long ra = (long long)axis - (long long)(batch_ndim - right_batch_ndim);
+        size_t ld = la >= 0 ? left->shape[(size_t)la] : 1;
+        size_t rd = ra >= 0 ? right->shape[(size_t)ra] : 1;
+        if (ld != rd && ld != 1 && rd != 1) {
+            free(shape);
+            ocean_tensor_fail("batched matmul batch dimensions are not broadcastable");
+        }
+        shape[axis] = ld > rd ? ld : rd;
+        layout->batch *= shape[axis];
+    }
+    shape[out_ndim - 2] = layout->m;
+    shape[out_ndim - 1] = layout->n;
+    ocean_tensor_handle_t result = layout->k == 0
+        ? ocean_tensor_alloc_zeros(shape, out_ndim, left->dtype, OCEAN_TENSOR_CPU)
+        : ocean_tensor_alloc_uninitialized(shape, out_ndim, left->dtype, OCEAN_TENSOR_CPU);
+    if (layout->k == 0 || result->size == 0) {
+        free(shape);
+        return result;
+    }
+
+    layout->a_offsets = (size_t *)malloc(layout->batch * sizeof(size_t));
+    layout->b_offsets = (size_t *)malloc(layout->batch * sizeof(size_t));
+    if (!layout->a_offsets || !layout->b_offsets) {
+        free(shape);
+        free(layout->a_offsets);
+        free(layout->b_offsets);
+        ocean_tensor_fail("out of memory allocating batched matmul offsets");
+    }
+    size_t left_skip = batch_ndim - left_batch_ndim;
+    size_t right_skip = batch_ndim - right_batch_ndim;
+    for (size_t index = 0; index < layout->batch; ++index) {
+        size_t remaining = index;
+        size_t a_offset = 0;
+        size_t b_offset = 0;
+        for (size_t axis = batch_ndim; axis-- > 0;) {
+            size_t coordinate = remaining % shape[axis];
+            remaining /= shape[axis];
+            if (axis >= left_skip && left->shape[axis - left_skip] != 1) {
+                a_offset += coordinate * left->strides[axis - left_skip];
+            }
+            if (axis >= right_skip && right->shape[axis - right_skip] != 1) {
+                b_offset += coordinate * right->strides[axis - right_skip];
+            }
+        }
+        layout->a_offsets[index] = a_offset;
+        layout->b_offsets[index] = b_offset;
+    }
+    free(shape);
+    return result;
+}
+
+static void ocean_tensor_matmul_layout_free(ocean_tensor_matmul_layout *layout) {
+    free(layout->a_offsets);
+    free(layout->b_offsets);
+    layout->a_offsets = NULL;
+    layout->b_offsets = NULL;
+}
+
+static ocean_tensor_handle_t ocean_tensor_matmul_cpu_gemm(
+    const ocean_tensor_handle_t left,
+    const ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+) {
+    ocean_tensor_matmul_layout layout;
+    ocean_tensor_handle_t result = ocean_tensor_matmul_prepare(
+        left, right, transpose_left, transpose_right, &layout
+    );
+    if (!layout.a_offsets) return result;
+
+    size_t left_ndim = left->ndim;
+    size_t right_ndim = right->ndim;
+    ocean_tensor_gemm_problem problem = {
+        .a = left->cpu_data,
+        .b = right->cpu_data,
+        .c = result->cpu_data,
+        .m = layout.m,
+        .n = layout.n,
+        .k = layout.k,
+        .a_row_stride = transpose_left
+            ? left->strides[left_ndim - 1] : left->strides[left_ndim - 2],
+        .a_col_stride = transpose_left
+            ? left->strides[left_ndim - 2] : left->strides[left_ndim - 1],
+        .b_row_stride = transpose_right
+            ? right->strides[right_ndim - 1] : right->strides[right_ndim - 2],
+        .b_col_stride = transpose_right
+            ? right->strides[right_ndim - 2] : right->strides[right_ndim - 1],
+        .a_offsets = layout.a_offsets,
+        .b_offsets = layout.b_offsets,
+        .row_tiles = (layout.m + OCEAN_TENSOR_GEMM_MC - 1) / OCEAN_TENSOR_GEMM_MC,
+        .col_tiles = (layout.n + OCEAN_TENSOR_GEMM_NC - 1) / OCEAN_TENSOR_GEMM_NC,
+    };
+    size_t tiles = problem.row_tiles * problem.col_tiles;
+    size_t work_per_task = layout.m * layout.n * layout.k / tiles;
+    size_t grain = work_per_task >= OCEAN_TENSOR_GEMM_PARALLEL_WORK
+        ? 1 : OCEAN_TENSOR_GEMM_PARALLEL_WORK / (work_per_task ? work_per_task : 1);
+    ocean_tensor_parallel_for(
+        layout.batch * tiles,
+        grain,
+        left->dtype == OCEAN_TENSOR_FLOAT32
+            ? ocean_tensor_gemm_tasks_f32 : ocean_tensor_gemm_tasks_f64,
+        &problem
+    );
+
+    ocean_tensor_matmul_layout_free(&layout);
+    return result;
+}
+
+static ocean_tensor_handle_t ocean_tensor_matmul_cpu(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+) {
+    if (ocean_tensor_gemm_supported(left)) {
+        return ocean_tensor_matmul_cpu_gemm(left, right, false, false);
+    }
+
+    size_t shape[2] = {left->shape[0], right->shape[1]};
+    ocean_tensor_handle_t result = ocean_tensor_alloc_zeros(
+        shape, 2, left->dtype, OCEAN_TENSOR_CPU
+    );
+
+    for (size_t row = 0; row < left->shape[0]; ++row) {
+        for (size_t col = 0; col < right->shape[1]; ++col) {
+            long double sum = 0.0L;
+
+            for (size_t k = 0; k < left->shape[1]; ++k) {
+                size_t left_index =
+                    row * left->strides[0] + k * left->strides[1];
+                size_t right_index =
+                    k * right->strides[0] + col * right->strides[1];
+
+                sum += ocean_tensor_read_scalar(left, left_index)
+                    * ocean_tensor_read_scalar(right, right_index);
+            }
+
+            ocean_tensor_write_scalar(
+                result,
+                row * result->strides[0] + col * result->strides[1],
+                sum
+            );
+        }
+    }
 
     return result;
 }
@@ -5020,12 +8574,68 @@ ocean_tensor_handle_t ocean_tensor_transpose_dims(ocean_tensor_handle_t tensor,
     return result;
 }
 
-static ocean_tensor_handle_t ocean_tensor_reduce_dim_v02(ocean_tensor_handle_t tensor, int dim, bool keepdim, bool mean) {
-    if (!tensor) ocean_tensor_fail("Tensor reduction on null handle");
-    size_t axis = ocean_tensor_normalize_dim_v02(tensor, dim);
-    size_t out_ndim = keepdim ? tensor->ndim : (tensor->ndim > 1 ? tensor->ndim - 1 : 1);
-    size_t *shape = malloc(out_ndim * sizeof(size_t));
-    if (!shape) ocean_tensor_fail("out of memory allocating reduction shape");
+/* Float reductions view the input as [outer, axis, inner] and give each task
+   one outer row and a block of up to OCEAN_TENSOR_REDUCE_BLOCK inner columns.
+   Every output element still accumulates along the axis in order, so results
+   do not depend on the thread count. */
+#define OCEAN_TENSOR_REDUCE_BLOCK 1024
+
+typedef struct ocean_tensor_reduce_context {
+    const void *input;
+    void *output;
+    ocean_tensor_dtype dtype;
+    size_t axis_size;
+    size_t inner;
+    size_t blocks;
+    bool mean;
+} ocean_tensor_reduce_context;
+
+static void ocean_tensor_reduce_chunk(void *context, size_t begin, size_t end) {
+    const ocean_tensor_reduce_context *c =
+        (const ocean_tensor_reduce_context *)context;
+    for (size_t task = begin; task < end; ++task) {
+        size_t outer = task / c->blocks;
+        size_t first = (task % c->blocks) * OCEAN_TENSOR_REDUCE_BLOCK;
+        size_t last = first + OCEAN_TENSOR_REDUCE_BLOCK < c->inner
+            ? first + OCEAN_TENSOR_REDUCE_BLOCK : c->inner;
+        size_t width = last - first;
+        size_t source = outer * c->axis_size * c->inner + first;
+        size_t target = outer * c->inner + first;
+        if (c->dtype == OCEAN_TENSOR_FLOAT32) {
+            const float *input = (const float *)c->input + source;
+            float *out = (float *)c->output + target;
+            for (size_t k = 0; k < c->axis_size; ++k) {
+                const float *row = input + k * c->inner;
+                OCEAN_TENSOR_SIMD
+                for (size_t j = 0; j < width; ++j) out[j] += row[j];
+            }
+            if (c->mean && c->axis_size) {
+                float count = (float)c->axis_size;
+                for (size_t j = 0; j < width; ++j) out[j] /= count;
+            }
+        } else {
+            const double *input = (const double *)c->input + source;
+            double *out = (double *)c->output + target;
+            for (size_t k = 0; k < c->axis_size; ++k) {
+                const double *row = input + k * c->inner;
+                OCEAN_TENSOR_SIMD
+                for (size_t j = 0; j < width; ++j) out[j] += row[j];
+            }
+            if (c->mean && c->axis_size) {
+                double count = (double)c->axis_size;
+                for (size_t j = 0; j < width; ++j) out[j] /= count;
+            }
+        }
+    }
+}
+
+static ocean_tensor_handle_t ocean_tensor_reduce_dim_v02(ocean_tensor_handle_t tensor, int dim, bool keepdim, bool mean) {
+    if (!tensor) ocean_tensor_fail("Tensor reduction on null handle");
+    ocean_tensor_materialize(tensor);
+    size_t axis = ocean_tensor_normalize_dim_v02(tensor, dim);
+    size_t out_ndim = keepdim ? tensor->ndim : (tensor->ndim > 1 ? tensor->ndim - 1 : 1);
+    size_t *shape = malloc(out_ndim * sizeof(size_t));
+    if (!shape) ocean_tensor_fail("out of memory allocating reduction shape");
     if (keepdim) {
         for (size_t i=0;i<tensor->ndim;++i) shape[i] = i==axis ? 1 : tensor->shape[i];
     } else if (tensor->ndim == 1) {
@@ -5064,9 +8674,32 @@ static ocean_tensor_handle_t ocean_tensor_reduce_dim_v02(ocean_tensor_handle_t t
     }
 #endif
 
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU ? tensor : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     ocean_tensor_handle_t out = ocean_tensor_alloc_zeros(shape, out_ndim, tensor->dtype, OCEAN_TENSOR_CPU);
     free(shape);
+    if (cpu->dtype == OCEAN_TENSOR_FLOAT32 || cpu->dtype == OCEAN_TENSOR_FLOAT64) {
+        ocean_tensor_reduce_context context = {
+            .input = cpu->cpu_data,
+            .output = out->cpu_data,
+            .dtype = cpu->dtype,
+            .axis_size = cpu->shape[axis],
+            .inner = 1,
+            .mean = mean,
+        };
+        for (size_t i = axis + 1; i < cpu->ndim; ++i) context.inner *= cpu->shape[i];
+        context.blocks = (context.inner + OCEAN_TENSOR_REDUCE_BLOCK - 1)
+            / OCEAN_TENSOR_REDUCE_BLOCK;
+        size_t tasks = out->size ? out->size / context.inner * context.blocks : 0;
+        size_t work = context.axis_size
+            * (context.inner < OCEAN_TENSOR_REDUCE_BLOCK
+                ? context.inner : OCEAN_TENSOR_REDUCE_BLOCK);
+        size_t grain = work ? OCEAN_TENSOR_ELEMENTWISE_GRAIN / work : 1;
+        ocean_tensor_parallel_for(
+            tasks, grain ? grain : 1, ocean_tensor_reduce_chunk, &context
+        );
+        if (cpu != tensor) ocean_tensor_release(cpu);
+        return ocean_tensor_restore_device(tensor, out);
+    }
     size_t *coord = calloc(tensor->ndim, sizeof(size_t));
     if (!coord) ocean_tensor_fail("out of memory reducing Tensor");
 
@@ -5098,6 +8731,7 @@ ocean_tensor_handle_t ocean_tensor_softmax(
     int dim
 ) {
     if (!tensor) ocean_tensor_fail("Tensor.softmax on null handle");
+    ocean_tensor_materialize(tensor);
     if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
         ocean_tensor_fail("Tensor.softmax currently requires float32");
     }
@@ -5129,9 +8763,7 @@ ocean_tensor_handle_t ocean_tensor_softmax(
 #endif
 
     char *device = ocean_tensor_device(tensor);
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor
-        : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     size_t outer = 1;
     size_t inner = 1;
     for (size_t i = 0; i < axis; ++i) outer *= tensor->shape[i];
@@ -5188,6 +8820,7 @@ ocean_tensor_handle_t ocean_tensor_layer_norm(
     double epsilon
 ) {
     if (!tensor) ocean_tensor_fail("Tensor.layer_norm on null handle");
+    ocean_tensor_materialize(tensor);
     if (tensor->dtype != OCEAN_TENSOR_FLOAT32) {
         ocean_tensor_fail("Tensor.layer_norm currently requires float32");
     }
@@ -5222,9 +8855,7 @@ ocean_tensor_handle_t ocean_tensor_layer_norm(
 #endif
 
     char *device = ocean_tensor_device(tensor);
-    ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
-        ? tensor
-        : ocean_tensor_to(tensor, "cpu");
+    ocean_tensor_handle_t cpu = ocean_tensor_host(tensor);
     if (axis_size == 0) {
         if (cpu != tensor) ocean_tensor_release(cpu);
         free(device);
@@ -5295,6 +8926,8 @@ ocean_tensor_handle_t ocean_tensor_softmax_backward(
     ocean_tensor_handle_t output,
     int dim
 ) {
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(output);
     ocean_tensor_validate_backward_inputs(
         upstream, output,
         "Tensor.softmax backward requires matching Tensor shapes and devices"
@@ -5337,6 +8970,8 @@ ocean_tensor_handle_t ocean_tensor_layer_norm_backward(
     int dim,
     double epsilon
 ) {
+    ocean_tensor_materialize(upstream);
+    ocean_tensor_materialize(input);
     ocean_tensor_validate_backward_inputs(
         upstream, input,
         "Tensor.LayerNorm backward requires matching Tensor shapes and devices"
@@ -5404,6 +9039,202 @@ static void ocean_tensor_validate_optimizer_tensors(
                 ocean_tensor_fail("optimizer tensors must have matching device and shape");
             }
         }
+        /* Updated state is written in place; the gradient is only read
+           and gets packed by the caller when it is a strided view. */
+        if (i != 1 && !ocean_tensor_is_contiguous(tensors[i])) {
+            ocean_tensor_fail("optimizer updates require contiguous parameters");
+        }
+    }
+}
+
+/*
+ * CPU optimizer updates run as one flat pass over every element of a
+ * Parameter group.  Element e of the pass belongs to the Parameter whose
+ * [offsets[i], offsets[i + 1]) range holds it, so a chunk boundary can fall
+ * anywhere and each thread walks the Parameters its range overlaps.  AdamW
+ * moments are indexed by the same flat position, which lets a group keep
+ * them in one contiguous buffer.  Parameters without a gradient are skipped.
+ */
+typedef struct ocean_tensor_optimizer_context {
+    float **values;
+    const float **gradients;
+    const size_t *offsets;
+    size_t count;
+    float *first;
+    float *second;
+    double learning_rate;
+    double beta1;
+    double beta2;
+    double epsilon;
+    double weight_decay;
+    double bias_correction1;
+    double bias_correction2;
+} ocean_tensor_optimizer_context;
+
+static void ocean_tensor_sgd_f32(
+    float *values, const float *gradients, float rate, size_t size
+) {
+    OCEAN_TENSOR_SIMD
+    for (size_t i = 0; i < size; ++i) values[i] -= rate * gradients[i];
+}
+
+static void ocean_tensor_adamw_f32(
+    const ocean_tensor_optimizer_context *context,
+    float *values,
+    const float *gradients,
+    float *first,
+    float *second,
+    size_t size
+) {
+    double beta1 = context->beta1;
+    double beta2 = context->beta2;
+    double learning_rate = context->learning_rate;
+    double decay = learning_rate * context->weight_decay;
+    double bias_correction1 = context->bias_correction1;
+    double bias_correction2 = context->bias_correction2;
+    double epsilon = context->epsilon;
+    OCEAN_TENSOR_SIMD
+    for (size_t i = 0; i < size; ++i) {
+        double gradient_value = (double)gradients[i];
+        float first_value = (float)(
+            beta1 * (double)first[i] + (1.0 - beta1) * gradient_value
+        );
+        float second_value = (float)(
+            beta2 * (double)second[i]
+            + (1.0 - beta2) * gradient_value * gradient_value
+        );
+        first[i] = first_value;
+        second[i] = second_value;
+        double adaptive =
+            ((double)first_value / bias_correction1)
+            / (sqrt((double)second_value / bias_correction2) + epsilon);
+        values[i] = (float)(
+            (double)values[i] - decay * (double)values[i] - learning_rate * adaptive
+        );
+    }
+}
+
+static void ocean_tensor_optimizer_chunk(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_optimizer_context *context =
+        (const ocean_tensor_optimizer_context *)raw;
+    const size_t *offsets = context->offsets;
+
+    /* Last Parameter starting at or before `begin`. */
+    size_t low = 0, high = context->count;
+    while (high - low > 1) {
+        size_t middle = low + (high - low) / 2;
+        if (offsets[middle] <= begin) low = middle;
+        else high = middle;
+    }
+
+    for (size_t p = low; p < context->count && begin < end; ++p) {
+        if (offsets[p + 1] <= begin) continue;
+        size_t stop = offsets[p + 1] < end ? offsets[p + 1] : end;
+        size_t local = begin - offsets[p];
+        if (context->gradients[p]) {
+            if (context->first) {
+                ocean_tensor_adamw_f32(
+                    context, context->values[p] + local,
+                    context->gradients[p] + local,
+                    context->first + begin, context->second + begin,
+                    stop - begin
+                );
+            } else {
+                ocean_tensor_sgd_f32(
+                    context->values[p] + local, context->gradients[p] + local,
+                    (float)context->learning_rate, stop - begin
+                );
+            }
+        }
+        begin = stop;
+    }
+}
+
+/* moments is NULL for SGD, or {first, second} flat moment arrays holding
+   the Parameters back to back. */
+static void ocean_tensor_optimizer_update_cpu(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count,
+    float *const *moments,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+) {
+    if (count == 0) return;
+    float **values = (float **)malloc(count * sizeof(*values));
+    const float **gradient_data = (const float **)malloc(count * sizeof(*gradient_data));
+    ocean_tensor_handle_t *packed = (ocean_tensor_handle_t *)calloc(count, sizeof(*packed));
+    size_t *layout = (size_t *)malloc((count + 1) * sizeof(*layout));
+    if (!values || !gradient_data || !packed || !layout) {
+        free(values);
+        free(gradient_data);
+        free(packed);
+        free(layout);
+        ocean_tensor_fail("out of memory preparing optimizer update");
+    }
+
+    size_t total = 0;
+    for (size_t i = 0; i < count; ++i) {
+        ocean_tensor_materialize(parameters[i]);
+        values[i] = (float *)parameters[i]->cpu_data;
+        gradient_data[i] = NULL;
+        if (gradients[i]) {
+            /* The gradient is only read; strided views get packed. */
+            packed[i] = ocean_tensor_dense(gradients[i]);
+            gradient_data[i] = (const float *)packed[i]->cpu_data;
+        }
+        layout[i] = total;
+        total += parameters[i]->size;
+    }
+    layout[count] = total;
+
+    ocean_tensor_optimizer_context context = {
+        .values = values,
+        .gradients = gradient_data,
+        .offsets = layout,
+        .count = count,
+        .first = moments ? moments[0] : NULL,
+        .second = moments ? moments[1] : NULL,
+        .learning_rate = learning_rate,
+        .beta1 = beta1,
+        .beta2 = beta2,
+        .epsilon = epsilon,
+        .weight_decay = weight_decay,
+        .bias_correction1 = bias_correction1,
+        .bias_correction2 = bias_correction2,
+    };
+    ocean_tensor_parallel_for(
+        total, OCEAN_TENSOR_ELEMENTWISE_GRAIN, ocean_tensor_optimizer_chunk, &context
+    );
+
+    for (size_t i = 0; i < count; ++i) {
+        if (packed[i] && packed[i] != gradients[i]) ocean_tensor_release(packed[i]);
+    }
+    free(layout);
+    free(packed);
+    free(gradient_data);
+    free(values);
+}
+
+static void ocean_tensor_validate_adamw_arguments(
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+) {
+    if (learning_rate < 0.0 || beta1 < 0.0 || beta1 >= 1.0 ||
+        beta2 < 0.0 || beta2 >= 1.0 || epsilon <= 0.0 ||
+        weight_decay < 0.0 || bias_correction1 <= 0.0 ||
+        bias_correction2 <= 0.0) {
+        ocean_tensor_fail("invalid AdamW optimizer arguments");
     }
 }
 
@@ -5412,6 +9243,7 @@ void ocean_tensor_sgd_update(
     ocean_tensor_handle_t gradient,
     double learning_rate
 ) {
+    ocean_tensor_lazy_flush();
     ocean_tensor_validate_optimizer_tensors(parameter, gradient, NULL, NULL);
     if (learning_rate < 0.0) {
         ocean_tensor_fail("SGD learning rate must be non-negative");
@@ -5426,12 +9258,10 @@ void ocean_tensor_sgd_update(
         ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
     }
 #endif
-    float *values = (float *)parameter->cpu_data;
-    const float *gradients = (const float *)gradient->cpu_data;
-    float rate = (float)learning_rate;
-    for (size_t i = 0; i < parameter->size; ++i) {
-        values[i] -= rate * gradients[i];
-    }
+    ocean_tensor_optimizer_update_cpu(
+        &parameter, &gradient, 1, NULL, learning_rate,
+        0.0, 0.0, 0.0, 0.0, 1.0, 1.0
+    );
 }
 
 void ocean_tensor_adamw_update(
@@ -5447,15 +9277,14 @@ void ocean_tensor_adamw_update(
     double bias_correction1,
     double bias_correction2
 ) {
+    ocean_tensor_lazy_flush();
     ocean_tensor_validate_optimizer_tensors(
         parameter, gradient, first_moment, second_moment
     );
-    if (learning_rate < 0.0 || beta1 < 0.0 || beta1 >= 1.0 ||
-        beta2 < 0.0 || beta2 >= 1.0 || epsilon <= 0.0 ||
-        weight_decay < 0.0 || bias_correction1 <= 0.0 ||
-        bias_correction2 <= 0.0) {
-        ocean_tensor_fail("invalid AdamW optimizer arguments");
-    }
+    ocean_tensor_validate_adamw_arguments(
+        learning_rate, beta1, beta2, epsilon, weight_decay,
+        bias_correction1, bias_correction2
+    );
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
     if (parameter->device == OCEAN_TENSOR_GPU) {
         ocean_tensor_opencl_adamw_update(
@@ -5470,30 +9299,323 @@ void ocean_tensor_adamw_update(
         ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
     }
 #endif
-    float *values = (float *)parameter->cpu_data;
-    const float *gradients = (const float *)gradient->cpu_data;
-    float *first = (float *)first_moment->cpu_data;
-    float *second = (float *)second_moment->cpu_data;
-    for (size_t i = 0; i < parameter->size; ++i) {
-        float gradient_value = gradients[i];
-        float first_value = (float)(
-            beta1 * (double)first[i]
-            + (1.0 - beta1) * (double)gradient_value
-        );
-        float second_value = (float)(
-            beta2 * (double)second[i]
-            + (1.0 - beta2) * (double)gradient_value * (double)gradient_value
-        );
-        first[i] = first_value;
-        second[i] = second_value;
-        double adaptive =
-            ((double)first_value / bias_correction1)
-            / (sqrt((double)second_value / bias_correction2) + epsilon);
-        values[i] = (float)(
-            (double)values[i]
-            - learning_rate * weight_decay * (double)values[i]
-            - learning_rate * adaptive
-        );
+    ocean_tensor_optimizer_update_cpu(
+        &parameter, &gradient, 1, (float *[2]){
+            (float *)first_moment->cpu_data, (float *)second_moment->cpu_data
+        },
+        learning_rate, beta1, beta2, epsilon, weight_decay,
+        bias_correction1, bias_correction2
+    );
+}
+
+/* Checks a multi-tensor update and returns the element count it covers. */
+static size_t ocean_tensor_validate_optimizer_group(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count
+) {
+    if (count > 0 && (!parameters || !gradients)) {
+        ocean_tensor_fail("optimizer update received a null Tensor list");
+    }
+    size_t total = 0;
+    for (size_t i = 0; i < count; ++i) {
+        if (!parameters[i]) ocean_tensor_fail("optimizer update received a null Tensor");
+        if (parameters[i]->device != OCEAN_TENSOR_CPU) {
+            ocean_tensor_fail("multi-tensor optimizer updates require CPU Parameters");
+        }
+        if (gradients[i]) {
+            ocean_tensor_validate_optimizer_tensors(parameters[i], gradients[i], NULL, NULL);
+        } else if (parameters[i]->dtype != OCEAN_TENSOR_FLOAT32 ||
+                   !ocean_tensor_is_contiguous(parameters[i])) {
+            ocean_tensor_fail("optimizer updates require contiguous float32 parameters");
+        }
+        if (parameters[i]->size > SIZE_MAX - total) {
+            ocean_tensor_fail("optimizer Parameter group is too large");
+        }
+        total += parameters[i]->size;
+    }
+    return total;
+}
+
+void ocean_tensor_sgd_update_many(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count,
+    double learning_rate
+) {
+    ocean_tensor_lazy_flush();
+    ocean_tensor_validate_optimizer_group(parameters, gradients, count);
+    if (learning_rate < 0.0) {
+        ocean_tensor_fail("SGD learning rate must be non-negative");
+    }
+    ocean_tensor_optimizer_update_cpu(
+        parameters, gradients, count, NULL, learning_rate,
+        0.0, 0.0, 0.0, 0.0, 1.0, 1.0
+    );
+}
+
+void ocean_tensor_adamw_update_many(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count,
+    ocean_tensor_handle_t moments,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+) {
+    ocean_tensor_lazy_flush();
+    size_t total = ocean_tensor_validate_optimizer_group(parameters, gradients, count);
+    ocean_tensor_validate_adamw_arguments(
+        learning_rate, beta1, beta2, epsilon, weight_decay,
+        bias_correction1, bias_correction2
+    );
+    if (!moments || moments->device != OCEAN_TENSOR_CPU ||
+        moments->dtype != OCEAN_TENSOR_FLOAT32 ||
+        !ocean_tensor_is_contiguous(moments) || moments->size != 2 * total) {
+        ocean_tensor_fail("AdamW moments must be a contiguous CPU float32 Tensor of 2 * Parameter elements");
+    }
+    ocean_tensor_materialize(moments);
+    float *first = (float *)moments->cpu_data;
+    ocean_tensor_optimizer_update_cpu(
+        parameters, gradients, count, (float *[2]){first, first + total},
+        learning_rate, beta1, beta2, epsilon, weight_decay,
+        bias_correction1, bias_correction2
+    );
+}
+
+/*
+ * Row-sparse updates touch only the Parameter rows listed in `rows`.  A
+ * row's AdamW moments are not decayed on steps that skip it; last_steps
+ * records the step that last updated each row, and the decay (and weight
+ * decay) those skipped steps would have applied is caught up the next time
+ * the row is updated.  Rows are distinct, so chunks never share a row.
+ */
+typedef struct ocean_tensor_row_update_context {
+    ocean_tensor_optimizer_context optimizer;
+    float *values;
+    const int64_t *rows;
+    const float *gradients;
+    float *first;
+    float *second;
+    int64_t *last_steps;
+    int64_t step;
+    size_t dim;
+} ocean_tensor_row_update_context;
+
+static void ocean_tensor_row_update_chunk(void *raw, size_t begin, size_t end) {
+    const ocean_tensor_row_update_context *context =
+        (const ocean_tensor_row_update_context *)raw;
+    const ocean_tensor_optimizer_context *optimizer = &context->optimizer;
+    size_t dim = context->dim;
+
+    for (size_t i = begin; i < end; ++i) {
+        size_t row = (size_t)context->rows[i];
+        float *values = context->values + row * dim;
+        const float *gradients = context->gradients + i * dim;
+        if (!context->first) {
+            ocean_tensor_sgd_f32(values, gradients, (float)optimizer->learning_rate, dim);
+            continue;
+        }
+
+        float *first = context->first + row * dim;
+        float *second = context->second + row * dim;
+        int64_t skipped = context->step - context->last_steps[row] - 1;
+        if (skipped > 0) {
+            float first_decay = (float)pow(optimizer->beta1, (double)skipped);
+            float second_decay = (float)pow(optimizer->beta2, (double)skipped);
+            float weight_decay = (float)pow(
+                1.0 - optimizer->learning_rate * optimizer->weight_decay, (double)skipped
+            );
+            for (size_t feature = 0; feature < dim; ++feature) {
+                first[feature] *= first_decay;
+                second[feature] *= second_decay;
+                values[feature] *= weight_decay;
+            }
+        }
+        ocean_tensor_adamw_f32(optimizer, values, gradients, first, second, dim);
+        context->last_steps[row] = context->step;
+    }
+}
+
+static void ocean_tensor_update_rows(
+    ocean_tensor_handle_t parameter,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t gradients,
+    size_t count,
+    ocean_tensor_row_update_context *context
+) {
+    if (!parameter) ocean_tensor_fail("optimizer update received a null Tensor");
+    ocean_tensor_require_sparse_rows(rows, gradients, count);
+    ocean_tensor_materialize(parameter);
+    if (parameter->device != OCEAN_TENSOR_CPU || parameter->dtype != OCEAN_TENSOR_FLOAT32 ||
+        !ocean_tensor_is_contiguous(parameter) || parameter->ndim != 2 ||
+        parameter->shape[1] != gradients->shape[1]) {
+        ocean_tensor_fail("row-sparse updates require a contiguous CPU float32 [rows, dim] Parameter");
+    }
+    const int64_t *row_of = (const int64_t *)rows->cpu_data;
+    for (size_t i = 0; i < count; ++i) {
+        if (row_of[i] < 0 || (uint64_t)row_of[i] >= (uint64_t)parameter->shape[0]) {
+            ocean_tensor_fail("sparse gradient row is out of range");
+        }
+    }
+
+    context->values = (float *)parameter->cpu_data;
+    context->rows = row_of;
+    context->gradients = (const float *)gradients->cpu_data;
+    context->dim = parameter->shape[1];
+    size_t grain = OCEAN_TENSOR_ELEMENTWISE_GRAIN / (context->dim ? context->dim : 1);
+    ocean_tensor_parallel_for(count, grain, ocean_tensor_row_update_chunk, context);
+}
+
+void ocean_tensor_sgd_update_rows(
+    ocean_tensor_handle_t parameter,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t gradients,
+    size_t count,
+    double learning_rate
+) {
+    ocean_tensor_lazy_flush();
+    if (learning_rate < 0.0) {
+        ocean_tensor_fail("SGD learning rate must be non-negative");
+    }
+    ocean_tensor_row_update_context context = {
+        .optimizer = {.learning_rate = learning_rate},
+    };
+    ocean_tensor_update_rows(parameter, rows, gradients, count, &context);
+}
+
+void ocean_tensor_adamw_update_rows(
+    ocean_tensor_handle_t parameter,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t gradients,
+    size_t count,
+    ocean_tensor_handle_t first_moment,
+    size_t first_offset,
+    ocean_tensor_handle_t second_moment,
+    size_t second_offset,
+    ocean_tensor_handle_t last_steps,
+    int step,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+) {
+    ocean_tensor_lazy_flush();
+    ocean_tensor_validate_adamw_arguments(
+        learning_rate, beta1, beta2, epsilon, weight_decay,
+        bias_correction1, bias_correction2
+    );
+    if (!parameter || !first_moment || !second_moment || !last_steps) {
+        ocean_tensor_fail("optimizer update received a null Tensor");
+    }
+    ocean_tensor_materialize(first_moment);
+    ocean_tensor_materialize(second_moment);
+    ocean_tensor_materialize(last_steps);
+    ocean_tensor_handle_t moments[2] = {first_moment, second_moment};
+    size_t offsets[2] = {first_offset, second_offset};
+    for (int i = 0; i < 2; ++i) {
+        if (moments[i]->device != OCEAN_TENSOR_CPU ||
+            moments[i]->dtype != OCEAN_TENSOR_FLOAT32 ||
+            !ocean_tensor_is_contiguous(moments[i]) ||
+            offsets[i] > moments[i]->size ||
+            parameter->size > moments[i]->size - offsets[i]) {
+            ocean_tensor_fail("AdamW row moments must cover the Parameter in a contiguous CPU float32 Tensor");
+        }
+    }
+    if (last_steps->device != OCEAN_TENSOR_CPU || last_steps->dtype != OCEAN_TENSOR_INT64 ||
+        !ocean_tensor_is_contiguous(last_steps) || parameter->ndim != 2 ||
+        last_steps->size != parameter->shape[0]) {
+        ocean_tensor_fail("AdamW row steps must be a contiguous CPU int64 Tensor with one entry per row");
+    }
+    if (step <= 0) ocean_tensor_fail("AdamW step must be positive");
+
+    ocean_tensor_row_update_context context = {
+        .optimizer = {
+            .learning_rate = learning_rate,
+            .beta1 = beta1,
+            .beta2 = beta2,
+            .epsilon = epsilon,
+            .weight_decay = weight_decay,
+            .bias_correction1 = bias_correction1,
+            .bias_correction2 = bias_correction2,
+        },
+        .first = (float *)first_moment->cpu_data + first_offset,
+        .second = (float *)second_moment->cpu_data + second_offset,
+        .last_steps = (int64_t *)last_steps->cpu_data,
+        .step = step,
+    };
+    ocean_tensor_update_rows(parameter, rows, gradients, count, &context);
+}
+
+void ocean_tensor_copy_range(
+    ocean_tensor_handle_t destination,
+    size_t destination_offset,
+    ocean_tensor_handle_t source,
+    size_t source_offset,
+    size_t count
+) {
+    if (!destination || !source) ocean_tensor_fail("cannot copy a null Tensor range");
+    ocean_tensor_lazy_flush();
+    ocean_tensor_materialize(source);
+    if (destination->device != OCEAN_TENSOR_CPU || source->device != OCEAN_TENSOR_CPU ||
+        destination->dtype != source->dtype ||
+        !ocean_tensor_is_contiguous(destination) || !ocean_tensor_is_contiguous(source)) {
+        ocean_tensor_fail("copy_range requires contiguous CPU Tensors of one dtype");
+    }
+    if (destination_offset > destination->size ||
+        count > destination->size - destination_offset ||
+        source_offset > source->size || count > source->size - source_offset) {
+        ocean_tensor_fail("copy_range is out of bounds");
+    }
+    if (count == 0) return;
+    memmove(
+        (char *)destination->cpu_data + destination_offset * destination->item_size,
+        (const char *)source->cpu_data + source_offset * source->item_size,
+        count * destination->item_size
+    );
+}
+
+void ocean_tensor_accumulate_range(
+    ocean_tensor_handle_t destination,
+    const ocean_tensor_handle_t *sources,
+    size_t count,
+    const double *scales,
+    size_t begin,
+    size_t end
+) {
+    if (!destination) ocean_tensor_fail("cannot accumulate into a null Tensor");
+    ocean_tensor_lazy_flush();
+    if (destination->device != OCEAN_TENSOR_CPU ||
+        destination->dtype != OCEAN_TENSOR_FLOAT32 ||
+        !ocean_tensor_is_contiguous(destination)) {
+        ocean_tensor_fail("accumulate_range requires a contiguous CPU float32 destination");
+    }
+    if (begin > end || end > destination->size) {
+        ocean_tensor_fail("accumulate_range is out of bounds");
+    }
+    for (size_t source = 0; source < count; ++source) {
+        ocean_tensor_handle_t tensor = sources[source];
+        if (!tensor) continue;
+        if (tensor->device != OCEAN_TENSOR_CPU || tensor->dtype != OCEAN_TENSOR_FLOAT32 ||
+            !ocean_tensor_is_contiguous(tensor) || tensor->size != destination->size) {
+            ocean_tensor_fail("accumulate_range sources must match the destination");
+        }
+    }
+    if (begin == end) return;
+
+    float *target = (float *)destination->cpu_data;
+    for (size_t source = 0; source < count; ++source) {
+        if (!sources[source]) continue;
+        const float factor = (float)scales[source];
+        const float *values = (const float *)sources[source]->cpu_data;
+        for (size_t i = begin; i < end; ++i) target[i] += factor * values[i];
     }
 }
 
@@ -5537,42 +9659,54 @@ static ocean_tensor_handle_t ocean_tensor_matmul_nd_cpu_v02(ocean_tensor_handle_
 }
 
 
-ocean_tensor_handle_t ocean_tensor_matmul_transposed(
+/* Generic fallback for backends without a transposed kernel for a dtype:
+   materialize the transposes on the operands' device, then multiply. */
+static ocean_tensor_handle_t ocean_tensor_matmul_materialized_transposes(
     ocean_tensor_handle_t left,
     ocean_tensor_handle_t right,
     bool transpose_left,
     bool transpose_right
 ) {
-    if (!left || !right) {
-        ocean_tensor_fail("matmul does not accept null Tensors");
-    }
-    if (left->ndim < 2 || right->ndim < 2) {
-        ocean_tensor_fail("matmul expects Tensor rank >= 2");
-    }
-    if (left->dtype != right->dtype) {
-        ocean_tensor_fail("matmul requires matching Tensor dtypes");
-    }
-    if (left->device != right->device) {
-        ocean_tensor_fail("matmul requires Tensors on the same device");
-    }
+    ocean_tensor_handle_t transposed_left = transpose_left
+        ? ocean_tensor_transpose_dims(left, -2, -1) : ocean_tensor_copy(left);
+    ocean_tensor_handle_t transposed_right = transpose_right
+        ? ocean_tensor_transpose_dims(right, -2, -1) : ocean_tensor_copy(right);
+    ocean_tensor_handle_t result = ocean_tensor_matmul(
+        transposed_left,
+        transposed_right
+    );
+    ocean_tensor_release(transposed_left);
+    ocean_tensor_release(transposed_right);
+    return result;
+}
 
-    size_t left_inner = transpose_left
-        ? left->shape[left->ndim - 2]
-        : left->shape[left->ndim - 1];
-    size_t right_inner = transpose_right
-        ? right->shape[right->ndim - 1]
-        : right->shape[right->ndim - 2];
-    if (left_inner != right_inner) {
-        ocean_tensor_fail("matmul shape mismatch");
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_cpu(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+) {
+    if (ocean_tensor_gemm_supported(left)) {
+        return ocean_tensor_matmul_cpu_gemm(
+            left, right, transpose_left, transpose_right
+        );
     }
-
-    if (!transpose_left && !transpose_right) {
-        return ocean_tensor_matmul(left, right);
+    if (transpose_left || transpose_right) {
+        return ocean_tensor_matmul_materialized_transposes(
+            left, right, transpose_left, transpose_right
+        );
     }
+    return ocean_tensor_matmul_nd_cpu_v02(left, right);
+}
 
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_opencl(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+) {
 #ifdef OCEAN_TENSOR_ENABLE_OPENCL
-    if (left->device == OCEAN_TENSOR_GPU &&
-        left->dtype == OCEAN_TENSOR_FLOAT32) {
+    if (left->dtype == OCEAN_TENSOR_FLOAT32) {
         ocean_tensor_handle_t contiguous_left =
             ocean_tensor_is_contiguous(left)
             ? left : ocean_tensor_contiguous(left);
@@ -5589,59 +9723,179 @@ ocean_tensor_handle_t ocean_tensor_matmul_transposed(
         if (contiguous_right != right) ocean_tensor_release(contiguous_right);
         return result;
     }
-#endif
-
-    ocean_tensor_handle_t transposed_left = transpose_left
-        ? ocean_tensor_transpose_dims(left, -2, -1) : ocean_tensor_copy(left);
-    ocean_tensor_handle_t transposed_right = transpose_right
-        ? ocean_tensor_transpose_dims(right, -2, -1) : ocean_tensor_copy(right);
-    ocean_tensor_handle_t result = ocean_tensor_matmul(
-        transposed_left,
-        transposed_right
-    );
-    ocean_tensor_release(transposed_left);
-    ocean_tensor_release(transposed_right);
+    if (transpose_left || transpose_right) {
+        return ocean_tensor_matmul_materialized_transposes(
+            left, right, transpose_left, transpose_right
+        );
+    }
+    ocean_tensor_handle_t left_cpu = ocean_tensor_to(left, "cpu");
+    ocean_tensor_handle_t right_cpu = ocean_tensor_to(right, "cpu");
+    ocean_tensor_handle_t cpu_result = ocean_tensor_backend_for_device(
+        OCEAN_TENSOR_BACKEND_CPU
+    )->batched_matmul(left_cpu, right_cpu, false, false);
+    ocean_tensor_handle_t gpu_result = ocean_tensor_to(cpu_result, "gpu");
+    ocean_tensor_release(left_cpu);
+    ocean_tensor_release(right_cpu);
+    ocean_tensor_release(cpu_result);
+    return gpu_result;
+#else
+    (void)left;
+    (void)right;
+    (void)transpose_left;
+    (void)transpose_right;
+    ocean_tensor_fail("GPU backend is unavailable: rebuild with OpenCL support");
+    return NULL;
+#endif
+}
+
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+/* CBLAS needs a unit stride along one of the two trailing axes.  A matrix
+   whose rows are contiguous is passed as-is; one whose columns are
+   contiguous is passed as the transpose of a row-major matrix. */
+static bool ocean_tensor_blas_operand(
+    const ocean_tensor_handle_t tensor,
+    bool transpose,
+    enum CBLAS_TRANSPOSE *operation,
+    int *leading_dimension
+) {
+    size_t ndim = tensor->ndim;
+    size_t rows = tensor->shape[ndim - 2];
+    size_t cols = tensor->shape[ndim - 1];
+    size_t row_stride = tensor->strides[ndim - 2];
+    size_t col_stride = tensor->strides[ndim - 1];
+    size_t leading = 0;
+    if (col_stride == 1 && row_stride >= (cols ? cols : 1)) {
+        leading = row_stride;
+    } else if (row_stride == 1 && col_stride >= (rows ? rows : 1)) {
+        leading = col_stride;
+        transpose = !transpose;
+    } else {
+        return false;
+    }
+    if (leading > (size_t)INT_MAX) return false;
+    *operation = transpose ? CblasTrans : CblasNoTrans;
+    *leading_dimension = (int)leading;
+    return true;
+}
+
+static ocean_tensor_handle_t ocean_tensor_batched_matmul_blas(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+) {
+    enum CBLAS_TRANSPOSE left_operation;
+    enum CBLAS_TRANSPOSE right_operation;
+    int lda = 0;
+    int ldb = 0;
+    if (!ocean_tensor_gemm_supported(left) ||
+        !ocean_tensor_blas_operand(left, transpose_left, &left_operation, &lda) ||
+        !ocean_tensor_blas_operand(right, transpose_right, &right_operation, &ldb)) {
+        return ocean_tensor_cpu_backend.batched_matmul(
+            left, right, transpose_left, transpose_right
+        );
+    }
+
+    ocean_tensor_matmul_layout layout;
+    ocean_tensor_handle_t result = ocean_tensor_matmul_prepare(
+        left, right, transpose_left, transpose_right, &layout
+    );
+    if (!layout.a_offsets) return result;
+    if (layout.m > (size_t)INT_MAX || layout.n > (size_t)INT_MAX ||
+        layout.k > (size_t)INT_MAX) {
+        ocean_tensor_matmul_layout_free(&layout);
+        ocean_tensor_release(result);
+        return ocean_tensor_cpu_backend.batched_matmul(
+            left, right, transpose_left, transpose_right
+        );
+    }
+
+    int m = (int)layout.m;
+    int n = (int)layout.n;
+    int k = (int)layout.k;
+    size_t matrix = layout.m * layout.n;
+    for (size_t index = 0; index < layout.batch; ++index) {
+        if (left->dtype == OCEAN_TENSOR_FLOAT32) {
+            cblas_sgemm(
+                CblasRowMajor, left_operation, right_operation, m, n, k, 1.0f,
+                (const float *)left->cpu_data + layout.a_offsets[index], lda,
+                (const float *)right->cpu_data + layout.b_offsets[index], ldb,
+                0.0f, (float *)result->cpu_data + index * matrix, n
+            );
+        } else {
+            cblas_dgemm(
+                CblasRowMajor, left_operation, right_operation, m, n, k, 1.0,
+                (const double *)left->cpu_data + layout.a_offsets[index], lda,
+                (const double *)right->cpu_data + layout.b_offsets[index], ldb,
+                0.0, (double *)result->cpu_data + index * matrix, n
+            );
+        }
+    }
+    ocean_tensor_matmul_layout_free(&layout);
     return result;
 }
 
+static ocean_tensor_handle_t ocean_tensor_matmul_blas(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right
+) {
+    if (!ocean_tensor_gemm_supported(left)) {
+        return ocean_tensor_cpu_backend.matmul(left, right);
+    }
+    return ocean_tensor_batched_matmul_blas(left, right, false, false);
+}
+#endif
+
+ocean_tensor_handle_t ocean_tensor_matmul_transposed(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    bool transpose_left,
+    bool transpose_right
+) {
+    ocean_tensor_materialize(left);
+    ocean_tensor_materialize(right);
+    if (!left || !right) {
+        ocean_tensor_fail("matmul does not accept null Tensors");
+    }
+    if (left->ndim < 2 || right->ndim < 2) {
+        ocean_tensor_fail("matmul expects Tensor rank >= 2");
+    }
+    if (left->dtype != right->dtype) {
+        ocean_tensor_fail("matmul requires matching Tensor dtypes");
+    }
+    if (left->device != right->device) {
+        ocean_tensor_fail("matmul requires Tensors on the same device");
+    }
+
+    size_t left_inner = transpose_left
+        ? left->shape[left->ndim - 2]
+        : left->shape[left->ndim - 1];
+    size_t right_inner = transpose_right
+        ? right->shape[right->ndim - 1]
+        : right->shape[right->ndim - 2];
+    if (left_inner != right_inner) {
+        ocean_tensor_fail("matmul shape mismatch");
+    }
+
+    if (!transpose_left && !transpose_right) {
+        return ocean_tensor_matmul(left, right);
+    }
+    return ocean_tensor_backend_for_device(left->device)->batched_matmul(
+        left, right, transpose_left, transpose_right
+    );
+}
+
 ocean_tensor_handle_t ocean_tensor_matmul(ocean_tensor_handle_t left, ocean_tensor_handle_t right) {
     if (!left || !right) ocean_tensor_fail("matmul does not accept null Tensors");
+    ocean_tensor_materialize(left);
+    ocean_tensor_materialize(right);
     if (left->ndim < 2 || right->ndim < 2) ocean_tensor_fail("matmul expects Tensor rank >= 2");
     if (left->shape[left->ndim-1] != right->shape[right->ndim-2]) ocean_tensor_fail("matmul shape mismatch");
     if (left->dtype != right->dtype) ocean_tensor_fail("matmul requires matching Tensor dtypes");
     if (left->device != right->device) ocean_tensor_fail("matmul requires Tensors on the same device");
-    if (left->ndim == 2 && right->ndim == 2) return ocean_tensor_backend_for_device(left->device)->matmul(left,right);
-#ifdef OCEAN_TENSOR_ENABLE_OPENCL
-    if (left->device == OCEAN_TENSOR_GPU &&
-        left->dtype == OCEAN_TENSOR_FLOAT32) {
-        ocean_tensor_handle_t contiguous_left =
-            ocean_tensor_is_contiguous(left)
-            ? left : ocean_tensor_contiguous(left);
-        ocean_tensor_handle_t contiguous_right =
-            ocean_tensor_is_contiguous(right)
-            ? right : ocean_tensor_contiguous(right);
-        ocean_tensor_handle_t result = ocean_tensor_matmul_opencl_batched(
-            contiguous_left,
-            contiguous_right,
-            false,
-            false
-        );
-        if (contiguous_left != left) ocean_tensor_release(contiguous_left);
-        if (contiguous_right != right) ocean_tensor_release(contiguous_right);
-        return result;
-    }
-#endif
-    ocean_tensor_handle_t lc = left->device==OCEAN_TENSOR_CPU ? left : ocean_tensor_to(left,"cpu");
-    ocean_tensor_handle_t rc = right->device==OCEAN_TENSOR_CPU ? right : ocean_tensor_to(right,"cpu");
-    ocean_tensor_handle_t cpu=ocean_tensor_matmul_nd_cpu_v02(lc,rc);
-    if (lc != left) {
-        ocean_tensor_release(lc);
-    }
-    if (rc != right) {
-        ocean_tensor_release(rc);
-    }
-    if (left->device==OCEAN_TENSOR_CPU) return cpu;
-    ocean_tensor_handle_t out=ocean_tensor_to(cpu,"gpu"); ocean_tensor_release(cpu); return out;
+    const ocean_tensor_backend_ops *backend = ocean_tensor_backend_for_device(left->device);
+    if (left->ndim == 2 && right->ndim == 2) return backend->matmul(left,right);
+    return backend->batched_matmul(left, right, false, false);
 }
 
 static bool ocean_tensor_host_is_little_endian(void) {
@@ -5775,6 +10029,7 @@ void ocean_tensor_save_npy(
     const char *path
 ) {
     if (!tensor || !path) ocean_tensor_fail("Tensor.save_npy received invalid arguments");
+    ocean_tensor_materialize(tensor);
     if (tensor->ndim == 0) ocean_tensor_fail("cannot save a scalar Tensor as .npy");
 
     ocean_tensor_handle_t cpu = tensor->device == OCEAN_TENSOR_CPU
@@ -5992,14 +10247,14 @@ static size_t *ocean_tensor_npy_read_shape(
     return shape;
 }
 
-ocean_tensor_handle_t ocean_tensor_load_npy(
-    const char *path,
-    const char *device
+/* Reads the magic, version and header of an open .npy stream and leaves it
+   at the first payload byte.  Returns the malloc'd shape. */
+static size_t *ocean_tensor_npy_read_prelude(
+    FILE *stream,
+    ocean_tensor_dtype *dtype,
+    bool *swap,
+    size_t *ndim
 ) {
-    if (!path) ocean_tensor_fail("Tensor.load_npy requires a path");
-    FILE *stream = fopen(path, "rb");
-    if (!stream) ocean_tensor_fail("could not open .npy file for reading");
-
     unsigned char magic[6];
     unsigned char version[2];
     if (fread(magic, 1, sizeof(magic), stream) != sizeof(magic) ||
@@ -6049,12 +10304,23 @@ ocean_tensor_handle_t ocean_tensor_load_npy(
         fclose(stream);
         ocean_tensor_fail("Fortran-order .npy arrays are not supported yet");
     }
+    ocean_tensor_npy_read_descr(header, dtype, swap);
+    size_t *shape = ocean_tensor_npy_read_shape(header, ndim);
+    free(header);
+    return shape;
+}
+
+ocean_tensor_handle_t ocean_tensor_load_npy(
+    const char *path,
+    const char *device
+) {
+    if (!path) ocean_tensor_fail("Tensor.load_npy requires a path");
+    FILE *stream = fopen(path, "rb");
+    if (!stream) ocean_tensor_fail("could not open .npy file for reading");
     ocean_tensor_dtype dtype;
     bool swap = false;
-    ocean_tensor_npy_read_descr(header, &dtype, &swap);
     size_t ndim = 0;
-    size_t *shape = ocean_tensor_npy_read_shape(header, &ndim);
-    free(header);
+    size_t *shape = ocean_tensor_npy_read_prelude(stream, &dtype, &swap, &ndim);
 
     ocean_tensor_handle_t result = ocean_tensor_alloc_zeros(
         shape, ndim, dtype, OCEAN_TENSOR_CPU
@@ -6114,6 +10380,1160 @@ ocean_tensor_handle_t ocean_tensor_load_npy_typed(
     return result;
 }
 
+/* Storage record over the first `length` bytes of an open file.  The
+   mapping is private and writable on a read-only descriptor: pages are read
+   from the page cache on first touch, and writes copy the page instead of
+   reaching the file.  NULL when the file cannot be mapped. */
+static ocean_tensor_storage *ocean_tensor_storage_map(int descriptor, size_t length) {
+    void *mapping = mmap(NULL, length, PROT_READ | PROT_WRITE, MAP_PRIVATE, descriptor, 0);
+    if (mapping == MAP_FAILED) return NULL;
+    ocean_tensor_storage *storage = (ocean_tensor_storage *)malloc(sizeof(*storage));
+    if (!storage) {
+        munmap(mapping, length);
+        ocean_tensor_fail("out of memory allocating Tensor storage");
+    }
+    atomic_init(&storage->references, 1);
+    storage->data = mapping;
+    storage->bytes = length;
+    storage->mapped = true;
+    return storage;
+}
+
+ocean_tensor_handle_t ocean_tensor_load_npy_mmap(
+    const char *path,
+    const char *device
+) {
+    if (!path) ocean_tensor_fail("Tensor.load_npy_mmap requires a path");
+    FILE *stream = fopen(path, "rb");
+    if (!stream) ocean_tensor_fail("could not open .npy file for reading");
+    ocean_tensor_dtype dtype;
+    bool swap = false;
+    size_t ndim = 0;
+    size_t *shape = ocean_tensor_npy_read_prelude(stream, &dtype, &swap, &ndim);
+    long offset = ftell(stream);
+    struct stat status;
+    bool stat_ok = fstat(fileno(stream), &status) == 0;
+
+    ocean_tensor_handle_t result = ocean_tensor_alloc(
+        shape, ndim, dtype, OCEAN_TENSOR_BACKEND_CPU
+    );
+    free(shape);
+    size_t bytes = ocean_tensor_bytes(result);
+    if (offset < 0 || !stat_ok ||
+        (uint64_t)status.st_size < (uint64_t)offset + bytes) {
+        ocean_tensor_release(result);
+        fclose(stream);
+        ocean_tensor_fail("truncated .npy data");
+    }
+    /* Byte-swapped or misaligned payloads cannot be used in place, and an
+       empty one has nothing to map; those take the copying loader. */
+    if (swap || bytes == 0 || (size_t)offset % result->item_size != 0) {
+        ocean_tensor_release(result);
+        fclose(stream);
+        return ocean_tensor_load_npy(path, device);
+    }
+
+    ocean_tensor_storage *storage =
+        ocean_tensor_storage_map(fileno(stream), (size_t)offset + bytes);
+    fclose(stream);
+    if (!storage) {
+        ocean_tensor_release(result);
+        ocean_tensor_fail("could not memory-map .npy file");
+    }
+    result->storage = storage;
+    result->cpu_data = (unsigned char *)storage->data + offset;
+
+    if (device && strcmp(device, "cpu") == 0) return result;
+    ocean_tensor_handle_t moved = ocean_tensor_to(result, device);
+    ocean_tensor_release(result);
+    return moved;
+}
+
+ocean_tensor_handle_t ocean_tensor_load_npy_mmap_typed(
+    const char *path,
+    const char *device,
+    const char *expected_dtype
+) {
+    if (!expected_dtype) {
+        ocean_tensor_fail("Tensor.load_npy_mmap requires an expected dtype");
+    }
+    ocean_tensor_dtype expected = ocean_tensor_parse_dtype(expected_dtype);
+    ocean_tensor_handle_t result = ocean_tensor_load_npy_mmap(path, device);
+    if (result->dtype != expected) {
+        ocean_tensor_release(result);
+        ocean_tensor_fail(".npy dtype does not match Tensor[T]");
+    }
+    return result;
+}
+
+/* A raw file of host-order `dtype` elements (for example a token stream
+   written with ndarray.tofile) as a 1-D tensor over a private mapping. */
+ocean_tensor_handle_t ocean_tensor_load_bin_mmap(
+    const char *path,
+    const char *dtype,
+    const char *device
+) {
+    if (!path) ocean_tensor_fail("Tensor.load_bin_mmap requires a path");
+    ocean_tensor_dtype parsed = ocean_tensor_parse_dtype(dtype);
+    int descriptor = open(path, O_RDONLY);
+    if (descriptor < 0) ocean_tensor_fail("could not open binary file for reading");
+    struct stat status;
+    size_t item_size = ocean_tensor_dtype_size(parsed);
+    if (fstat(descriptor, &status) != 0 || status.st_size <= 0 ||
+        (uint64_t)status.st_size % item_size != 0) {
+        close(descriptor);
+        ocean_tensor_fail("binary file size is not a positive multiple of the dtype size");
+    }
+    size_t bytes = (size_t)status.st_size;
+    size_t shape[1] = {bytes / item_size};
+    ocean_tensor_handle_t result = ocean_tensor_alloc(
+        shape, 1, parsed, OCEAN_TENSOR_BACKEND_CPU
+    );
+    ocean_tensor_storage *storage = ocean_tensor_storage_map(descriptor, bytes);
+    close(descriptor);
+    if (!storage) {
+        ocean_tensor_release(result);
+        ocean_tensor_fail("could not memory-map binary file");
+    }
+    result->storage = storage;
+    result->cpu_data = storage->data;
+
+    if (device && strcmp(device, "cpu") == 0) return result;
+    ocean_tensor_handle_t moved = ocean_tensor_to(result, device);
+    ocean_tensor_release(result);
+    return moved;
+}
+
+bool ocean_tensor_is_mapped(ocean_tensor_handle_t tensor) {
+    if (!tensor) ocean_tensor_fail("Tensor is_mapped on null handle");
+    return tensor->device == OCEAN_TENSOR_BACKEND_CPU &&
+        tensor->storage && tensor->storage->mapped;
+}
+
+void ocean_tensor_madvise(ocean_tensor_handle_t tensor, const char *advice) {
+    if (!tensor) ocean_tensor_fail("Tensor madvise on null handle");
+    if (!advice) ocean_tensor_fail("Tensor.madvise requires an advice string");
+    int hint;
+    if (strcmp(advice, "normal") == 0) {
+        hint = POSIX_MADV_NORMAL;
+    } else if (strcmp(advice, "sequential") == 0) {
+        hint = POSIX_MADV_SEQUENTIAL;
+    } else if (strcmp(advice, "random") == 0) {
+        hint = POSIX_MADV_RANDOM;
+    } else if (strcmp(advice, "willneed") == 0) {
+        hint = POSIX_MADV_WILLNEED;
+    } else if (strcmp(advice, "dontneed") == 0) {
+        hint = POSIX_MADV_DONTNEED;
+    } else {
+        ocean_tensor_fail(
+            "Tensor.madvise expects normal, sequential, random, willneed or dontneed"
+        );
+    }
+    /* Heap Tensors have nothing to page in or out. */
+    if (!ocean_tensor_is_mapped(tensor) || tensor->size == 0) return;
+
+    /* The pages spanned by this handle's elements, which for a view may be
+       a small part of the mapping. */
+    size_t span = 1;
+    for (size_t axis = 0; axis < tensor->ndim; ++axis) {
+        span += (tensor->shape[axis] - 1) * tensor->strides[axis];
+    }
+    uintptr_t page = (uintptr_t)sysconf(_SC_PAGESIZE);
+    uintptr_t first = (uintptr_t)tensor->cpu_data;
+    uintptr_t last = first + span * tensor->item_size;
+    uintptr_t base = (uintptr_t)tensor->storage->data;
+    uintptr_t end = base + tensor->storage->bytes;
+    first -= first % page;
+    if (last > end) last = end;
+    if (posix_madvise((void *)first, last - first, hint) != 0) {
+        ocean_tensor_fail("Tensor.madvise failed");
+    }
+}
+
+/* Single-file checkpoints in the spirit of safetensors: the magic "OCEANCKP",
+   the header length as a little-endian u64, then a JSON header
+       {"name": {"dtype": "float32", "shape": [2, 3], "offset": 0, "bytes": 24}}
+   padded with spaces so the payload starts 64-byte aligned.  Offsets count
+   from the payload start and are 64-byte aligned as well, so a mapped
+   checkpoint backs Tensors in place.  Payloads are little-endian and
+   row-major. */
+#define OCEAN_TENSOR_CHECKPOINT_MAGIC "OCEANCKP"
+#define OCEAN_TENSOR_CHECKPOINT_PREFIX ((size_t)16)
+#define OCEAN_TENSOR_CHECKPOINT_ALIGN ((size_t)64)
+/* Bytes per parallel read or write task. */
+#define OCEAN_TENSOR_CHECKPOINT_CHUNK ((size_t)1 << 22)
+
+typedef struct ocean_tensor_checkpoint_entry {
+    char *name;
+    ocean_tensor_dtype dtype;
+    size_t ndim;
+    size_t *shape;
+    size_t offset;
+    size_t bytes;
+} ocean_tensor_checkpoint_entry;
+
+/* A queued copy between a Tensor and an entry's payload.  `host` is the
+   packed CPU buffer the I/O goes through: the Tensor itself when it is one,
+   otherwise a temporary. */
+typedef struct ocean_tensor_checkpoint_transfer {
+    size_t entry;
+    ocean_tensor_handle_t tensor;
+    ocean_tensor_handle_t host;
+} ocean_tensor_checkpoint_transfer;
+
+typedef struct ocean_tensor_checkpoint {
+    int id;
+    /* Open file of a checkpoint being read; -1 while one is being built. */
+    int descriptor;
+    /* File offset of the first payload byte. */
+    size_t payload;
+    /* Whole-file mapping, shared with the Tensors get() returns. */
+    ocean_tensor_storage *mapping;
+    ocean_tensor_checkpoint_entry *entries;
+    size_t entry_count;
+    size_t entry_capacity;
+    ocean_tensor_checkpoint_transfer *transfers;
+    size_t transfer_count;
+    size_t transfer_capacity;
+    struct ocean_tensor_checkpoint *next;
+} ocean_tensor_checkpoint;
+
+static ocean_tensor_checkpoint *ocean_tensor_checkpoints = NULL;
+static int ocean_tensor_checkpoint_next_id = 1;
+
+static ocean_tensor_checkpoint *ocean_tensor_checkpoint_find(int id) {
+    for (
+        ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoints;
+        checkpoint;
+        checkpoint = checkpoint->next
+    ) {
+        if (checkpoint->id == id) return checkpoint;
+    }
+    ocean_tensor_fail("checkpoint id is invalid");
+}
+
+static ocean_tensor_checkpoint *ocean_tensor_checkpoint_new(int descriptor) {
+    ocean_tensor_checkpoint *checkpoint =
+        (ocean_tensor_checkpoint *)calloc(1, sizeof(*checkpoint));
+    if (!checkpoint) ocean_tensor_fail("out of memory creating checkpoint");
+    checkpoint->id = ocean_tensor_checkpoint_next_id++;
+    checkpoint->descriptor = descriptor;
+    checkpoint->next = ocean_tensor_checkpoints;
+    ocean_tensor_checkpoints = checkpoint;
+    return checkpoint;
+}
+
+/* Index of the entry called `name`, or entry_count. */
+static size_t ocean_tensor_checkpoint_lookup(
+    const ocean_tensor_checkpoint *checkpoint,
+    const char *name
+) {
+    for (size_t entry = 0; entry < checkpoint->entry_count; ++entry) {
+        if (strcmp(checkpoint->entries[entry].name, name) == 0) return entry;
+    }
+    return checkpoint->entry_count;
+}
+
+static void ocean_tensor_checkpoint_add_entry(
+    ocean_tensor_checkpoint *checkpoint,
+    const char *name,
+    ocean_tensor_dtype dtype,
+    const size_t *shape,
+    size_t ndim,
+    size_t offset,
+    size_t bytes
+) {
+    if (ocean_tensor_checkpoint_lookup(checkpoint, name) != checkpoint->entry_count) {
+        ocean_tensor_fail("checkpoint Tensor names must be unique");
+    }
+    if (checkpoint->entry_count == checkpoint->entry_capacity) {
+        size_t capacity = checkpoint->entry_capacity ? checkpoint->entry_capacity * 2 : 16;
+        ocean_tensor_checkpoint_entry *entries = (ocean_tensor_checkpoint_entry *)realloc(
+            checkpoint->entries, capacity * sizeof(*entries)
+        );
+        if (!entries) ocean_tensor_fail("out of memory growing checkpoint index");
+        checkpoint->entries = entries;
+        checkpoint->entry_capacity = capacity;
+    }
+    ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[checkpoint->entry_count];
+    entry->name = strdup(name);
+    entry->shape = (size_t *)malloc(ndim * sizeof(size_t));
+    if (!entry->name || !entry->shape) ocean_tensor_fail("out of memory growing checkpoint index");
+    memcpy(entry->shape, shape, ndim * sizeof(size_t));
+    entry->dtype = dtype;
+    entry->ndim = ndim;
+    entry->offset = offset;
+    entry->bytes = bytes;
+    checkpoint->entry_count += 1;
+}
+
+static void ocean_tensor_checkpoint_queue(
+    ocean_tensor_checkpoint *checkpoint,
+    size_t entry,
+    ocean_tensor_handle_t tensor
+) {
+    if (checkpoint->transfer_count == checkpoint->transfer_capacity) {
+        size_t capacity = checkpoint->transfer_capacity ? checkpoint->transfer_capacity * 2 : 16;
+        ocean_tensor_checkpoint_transfer *transfers = (ocean_tensor_checkpoint_transfer *)realloc(
+            checkpoint->transfers, capacity * sizeof(*transfers)
+        );
+        if (!transfers) ocean_tensor_fail("out of memory queueing checkpoint Tensor");
+        checkpoint->transfers = transfers;
+        checkpoint->transfer_capacity = capacity;
+    }
+    ocean_tensor_checkpoint_transfer *transfer =
+        &checkpoint->transfers[checkpoint->transfer_count++];
+    transfer->entry = entry;
+    transfer->tensor = tensor;
+    transfer->host = NULL;
+}
+
+typedef struct ocean_tensor_checkpoint_io {
+    const ocean_tensor_checkpoint *checkpoint;
+    const ocean_tensor_checkpoint_transfer *transfers;
+    int descriptor;
+    bool writing;
+    /* Transfer and first payload byte of every chunk. */
+    size_t *chunk_transfer;
+    size_t *chunk_begin;
+    atomic_bool failed;
+} ocean_tensor_checkpoint_io;
+
+static void ocean_tensor_checkpoint_io_tasks(void *context, size_t begin, size_t end) {
+    ocean_tensor_checkpoint_io *io = (ocean_tensor_checkpoint_io *)context;
+    const ocean_tensor_checkpoint *checkpoint = io->checkpoint;
+    for (size_t chunk = begin; chunk < end; ++chunk) {
+        const ocean_tensor_checkpoint_transfer *transfer =
+            &io->transfers[io->chunk_transfer[chunk]];
+        const ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[transfer->entry];
+        size_t first = io->chunk_begin[chunk];
+        size_t length = entry->bytes - first;
+        if (length > OCEAN_TENSOR_CHECKPOINT_CHUNK) length = OCEAN_TENSOR_CHECKPOINT_CHUNK;
+        unsigned char *data = (unsigned char *)transfer->host->cpu_data + first;
+        size_t position = checkpoint->payload + entry->offset + first;
+        if (checkpoint->mapping && !io->writing) {
+            memcpy(data, (const unsigned char *)checkpoint->mapping->data + position, length);
+            continue;
+        }
+        while (length > 0) {
+            ssize_t done = io->writing
+                ? pwrite(io->descriptor, data, length, (off_t)position)
+                : pread(io->descriptor, data, length, (off_t)position);
+            if (done < 0 && errno == EINTR) continue;
+            if (done <= 0) {
+                atomic_store(&io->failed, true);
+                break;
+            }
+            data += done;
+            position += (size_t)done;
+            length -= (size_t)done;
+        }
+    }
+}
+
+/* Splits every transfer into chunks and moves them in parallel; false when
+   a read or write came up short. */
+static bool ocean_tensor_checkpoint_move(
+    const ocean_tensor_checkpoint *checkpoint,
+    const ocean_tensor_checkpoint_transfer *transfers,
+    size_t transfer_count,
+    int descriptor,
+    bool writing
+) {
+    size_t chunks = 0;
+    for (size_t index = 0; index < transfer_count; ++index) {
+        size_t bytes = checkpoint->entries[transfers[index].entry].bytes;
+        chunks += (bytes + OCEAN_TENSOR_CHECKPOINT_CHUNK - 1) / OCEAN_TENSOR_CHECKPOINT_CHUNK;
+    }
+    if (chunks == 0) return true;
+
+    ocean_tensor_checkpoint_io io;
+    io.checkpoint = checkpoint;
+    io.transfers = transfers;
+    io.descriptor = descriptor;
+    io.writing = writing;
+    io.chunk_transfer = (size_t *)malloc(chunks * sizeof(size_t));
+    io.chunk_begin = (size_t *)malloc(chunks * sizeof(size_t));
+    if (!io.chunk_transfer || !io.chunk_begin) {
+        ocean_tensor_fail("out of memory scheduling checkpoint I/O");
+    }
+    atomic_init(&io.failed, false);
+    size_t chunk = 0;
+    for (size_t index = 0; index < transfer_count; ++index) {
+        size_t bytes = checkpoint->entries[transfers[index].entry].bytes;
+        for (size_t first = 0; first < bytes; first += OCEAN_TENSOR_CHECKPOINT_CHUNK) {
+            io.chunk_transfer[chunk] = index;
+            io.chunk_begin[chunk] = first;
+            ++chunk;
+        }
+    }
+    ocean_tensor_parallel_for(chunks, 1, ocean_tensor_checkpoint_io_tasks, &io);
+    free(io.chunk_transfer);
+    free(io.chunk_begin);
+    return !atomic_load(&io.failed);
+}
+
+static bool ocean_tensor_checkpoint_write_all(int descriptor, const void *data, size_t bytes) {
+    const unsigned char *cursor = (const unsigned char *)data;
+    while (bytes > 0) {
+        ssize_t done = write(descriptor, cursor, bytes);
+        if (done < 0 && errno == EINTR) continue;
+        if (done <= 0) return false;
+        cursor += done;
+        bytes -= (size_t)done;
+    }
+    return true;
+}
+
+static bool ocean_tensor_checkpoint_read_all(int descriptor, void *data, size_t bytes) {
+    unsigned char *cursor = (unsigned char *)data;
+    while (bytes > 0) {
+        ssize_t done = read(descriptor, cursor, bytes);
+        if (done < 0 && errno == EINTR) continue;
+        if (done <= 0) return false;
+        cursor += done;
+        bytes -= (size_t)done;
+    }
+    return true;
+}
+
+static void ocean_tensor_checkpoint_skip(const char **cursor) {
+    while (isspace((unsigned char)**cursor)) ++*cursor;
+}
+
+static void ocean_tensor_checkpoint_expect(const char **cursor, char expected) {
+    ocean_tensor_checkpoint_skip(cursor);
+    if (**cursor != expected) ocean_tensor_fail("invalid checkpoint header");
+    ++*cursor;
+}
+
+/* Names are written without escapes, so none are accepted. */
+static char *ocean_tensor_checkpoint_string(const char **cursor) {
+    ocean_tensor_checkpoint_expect(cursor, '"');
+    const char *start = *cursor;
+    while (**cursor && **cursor != '"') {
+        if (**cursor == '\\') ocean_tensor_fail("checkpoint header strings cannot contain escapes");
+        ++*cursor;
+    }
+    if (**cursor != '"') ocean_tensor_fail("invalid checkpoint header");
+    size_t length = (size_t)(*cursor - start);
+    ++*cursor;
+    char *result = (char *)malloc(length + 1);
+    if (!result) ocean_tensor_fail("out of memory reading checkpoint header");
+    memcpy(result, start, length);
+    result[length] = '\0';
+    return result;
+}
+
+static size_t ocean_tensor_checkpoint_number(const char **cursor) {
+    ocean_tensor_checkpoint_skip(cursor);
+    if (!isdigit((unsigned char)**cursor)) ocean_tensor_fail("invalid checkpoint header");
+    errno = 0;
+    char *end = NULL;
+    unsigned long long value = strtoull(*cursor, &end, 10);
+    if (errno != 0 || value > SIZE_MAX) ocean_tensor_fail("checkpoint header number is too large");
+    *cursor = end;
+    return (size_t)value;
+}
+
+static void ocean_tensor_checkpoint_parse(
+    ocean_tensor_checkpoint *checkpoint,
+    const char *header
+) {
+    const char *cursor = header;
+    ocean_tensor_checkpoint_expect(&cursor, '{');
+    ocean_tensor_checkpoint_skip(&cursor);
+    bool more = *cursor != '}';
+    if (!more) ++cursor;
+    while (more) {
+        char *name = ocean_tensor_checkpoint_string(&cursor);
+        ocean_tensor_checkpoint_expect(&cursor, ':');
+        ocean_tensor_checkpoint_expect(&cursor, '{');
+        int dtype = -1;
+        size_t *shape = NULL;
+        size_t ndim = 0;
+        size_t offset = SIZE_MAX;
+        size_t bytes = SIZE_MAX;
+        bool fields = true;
+        while (fields) {
+            char *field = ocean_tensor_checkpoint_string(&cursor);
+            ocean_tensor_checkpoint_expect(&cursor, ':');
+            if (strcmp(field, "dtype") == 0) {
+                char *value = ocean_tensor_checkpoint_string(&cursor);
+                for (int candidate = 0; candidate <= OCEAN_TENSOR_FLOAT64; ++candidate) {
+                    if (strcmp(value, ocean_tensor_dtype_names[candidate]) == 0) dtype = candidate;
+                }
+                free(value);
+                if (dtype < 0) ocean_tensor_fail("unsupported checkpoint dtype");
+            } else if (strcmp(field, "shape") == 0) {
+                ocean_tensor_checkpoint_expect(&cursor, '[');
+                ocean_tensor_checkpoint_skip(&cursor);
+                while (*cursor != ']') {
+                    size_t *grown = (size_t *)realloc(shape, (ndim + 1) * sizeof(size_t));
+                    if (!grown) ocean_tensor_fail("out of memory reading checkpoint header");
+                    shape = grown;
+                    shape[ndim++] = ocean_tensor_checkpoint_number(&cursor);
+                    ocean_tensor_checkpoint_skip(&cursor);
+                    if (*cursor == ',') ++cursor;
+                    ocean_tensor_checkpoint_skip(&cursor);
+                }
+                ++cursor;
+            } else if (strcmp(field, "offset") == 0) {
+                offset = ocean_tensor_checkpoint_number(&cursor);
+            } else if (strcmp(field, "bytes") == 0) {
+                bytes = ocean_tensor_checkpoint_number(&cursor);
+            } else {
+                ocean_tensor_fail("unknown checkpoint header field");
+            }
+            free(field);
+            ocean_tensor_checkpoint_skip(&cursor);
+            fields = *cursor == ',';
+            if (fields) ++cursor;
+        }
+        ocean_tensor_checkpoint_expect(&cursor, '}');
+        if (dtype < 0 || ndim == 0 || offset == SIZE_MAX || bytes == SIZE_MAX) {
+            ocean_tensor_fail("checkpoint header entry is incomplete");
+        }
+        size_t elements = ocean_tensor_elements_from_shape(shape, ndim);
+        if (elements > SIZE_MAX / ocean_tensor_dtype_size((ocean_tensor_dtype)dtype) ||
+            elements * ocean_tensor_dtype_size((ocean_tensor_dtype)dtype) != bytes) {
+            ocean_tensor_fail("checkpoint entry size does not match its shape");
+        }
+        ocean_tensor_checkpoint_add_entry(
+            checkpoint, name, (ocean_tensor_dtype)dtype, shape, ndim, offset, bytes
+        );
+        free(name);
+        free(shape);
+        ocean_tensor_checkpoint_skip(&cursor);
+        more = *cursor == ',';
+        if (more) ++cursor;
+        else ocean_tensor_checkpoint_expect(&cursor, '}');
+    }
+    ocean_tensor_checkpoint_skip(&cursor);
+    if (*cursor) ocean_tensor_fail("invalid checkpoint header");
+}
+
+int ocean_tensor_checkpoint_create(void) {
+    return ocean_tensor_checkpoint_new(-1)->id;
+}
+
+int ocean_tensor_checkpoint_open(const char *path, bool mapped) {
+    if (!path) ocean_tensor_fail("Checkpoint.open requires a path");
+    int descriptor = open(path, O_RDONLY);
+    if (descriptor < 0) ocean_tensor_fail("could not open checkpoint for reading");
+    unsigned char prefix[OCEAN_TENSOR_CHECKPOINT_PREFIX];
+    struct stat status;
+    if (fstat(descriptor, &status) != 0 ||
+        !ocean_tensor_checkpoint_read_all(descriptor, prefix, sizeof(prefix)) ||
+        memcmp(prefix, OCEAN_TENSOR_CHECKPOINT_MAGIC, 8) != 0) {
+        close(descriptor);
+        ocean_tensor_fail("invalid checkpoint header");
+    }
+    uint64_t header_size = 0;
+    for (int byte = 7; byte >= 0; --byte) header_size = (header_size << 8) | prefix[8 + byte];
+    uint64_t file_size = (uint64_t)status.st_size;
+    if (header_size == 0 || header_size > 64u * 1024u * 1024u ||
+        header_size > file_size - sizeof(prefix)) {
+        close(descriptor);
+        ocean_tensor_fail("invalid checkpoint header size");
+    }
+    char *header = (char *)malloc((size_t)header_size + 1u);
+    if (!header) {
+        close(descriptor);
+        ocean_tensor_fail("out of memory reading checkpoint header");
+    }
+    if (!ocean_tensor_checkpoint_read_all(descriptor, header, (size_t)header_size)) {
+        free(header);
+        close(descriptor);
+        ocean_tensor_fail("truncated checkpoint header");
+    }
+    header[header_size] = '\0';
+
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_new(descriptor);
+    checkpoint->payload = sizeof(prefix) + (size_t)header_size;
+    ocean_tensor_checkpoint_parse(checkpoint, header);
+    free(header);
+    for (size_t index = 0; index < checkpoint->entry_count; ++index) {
+        const ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[index];
+        if (entry->offset > file_size - checkpoint->payload ||
+            entry->bytes > file_size - checkpoint->payload - entry->offset) {
+            ocean_tensor_fail("truncated checkpoint data");
+        }
+    }
+
+    if (mapped && file_size > 0) {
+        checkpoint->mapping = ocean_tensor_storage_map(descriptor, (size_t)file_size);
+        if (!checkpoint->mapping) ocean_tensor_fail("could not memory-map checkpoint");
+    }
+    return checkpoint->id;
+}
+
+void ocean_tensor_checkpoint_add(int id, const char *name, ocean_tensor_handle_t tensor) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    if (!name || !tensor) ocean_tensor_fail("Checkpoint.add requires a name and a Tensor");
+    if (checkpoint->descriptor < 0) {
+        for (const char *cursor = name; *cursor; ++cursor) {
+            if (*cursor == '"' || *cursor == '\\' || (unsigned char)*cursor < 0x20) {
+                ocean_tensor_fail(
+                    "checkpoint Tensor names cannot contain quotes, backslashes or control characters"
+                );
+            }
+        }
+        ocean_tensor_checkpoint_add_entry(
+            checkpoint, name, tensor->dtype, tensor->shape, tensor->ndim,
+            0, ocean_tensor_bytes(tensor)
+        );
+        ocean_tensor_checkpoint_queue(checkpoint, checkpoint->entry_count - 1, tensor);
+        return;
+    }
+
+    size_t index = ocean_tensor_checkpoint_lookup(checkpoint, name);
+    if (index == checkpoint->entry_count) {
+        ocean_tensor_fail("checkpoint has no Tensor with this name");
+    }
+    const ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[index];
+    bool matches = entry->dtype == tensor->dtype && entry->ndim == tensor->ndim;
+    for (size_t axis = 0; matches && axis < entry->ndim; ++axis) {
+        matches = entry->shape[axis] == tensor->shape[axis];
+    }
+    if (!matches) ocean_tensor_fail("checkpoint Tensor dtype or shape does not match");
+    ocean_tensor_checkpoint_queue(checkpoint, index, tensor);
+}
+
+void ocean_tensor_checkpoint_save(int id, const char *path) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    if (checkpoint->descriptor >= 0) {
+        ocean_tensor_fail("Checkpoint.save requires a checkpoint from create()");
+    }
+    if (!path) ocean_tensor_fail("Checkpoint.save requires a path");
+    if (!ocean_tensor_host_is_little_endian()) {
+        ocean_tensor_fail("checkpoints can only be written on little-endian hosts");
+    }
+
+    size_t capacity = 64;
+    for (size_t index = 0; index < checkpoint->entry_count; ++index) {
+        const ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[index];
+        capacity += strlen(entry->name) + 128 + entry->ndim * 24;
+    }
+    char *header = (char *)malloc(capacity + OCEAN_TENSOR_CHECKPOINT_ALIGN);
+    if (!header) ocean_tensor_fail("out of memory building checkpoint header");
+    size_t length = 0;
+    size_t offset = 0;
+    header[length++] = '{';
+    for (size_t index = 0; index < checkpoint->entry_count; ++index) {
+        ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[index];
+        offset = (offset + OCEAN_TENSOR_CHECKPOINT_ALIGN - 1) /
+            OCEAN_TENSOR_CHECKPOINT_ALIGN * OCEAN_TENSOR_CHECKPOINT_ALIGN;
+        entry->offset = offset;
+        offset += entry->bytes;
+        length += (size_t)snprintf(
+            header + length, capacity - length, "%s\"%s\": {\"dtype\": \"%s\", \"shape\": [",
+            index ? ", " : "", entry->name, ocean_tensor_dtype_names[entry->dtype]
+        );
+        for (size_t axis = 0; axis < entry->ndim; ++axis) {
+            length += (size_t)snprintf(
+                header + length, capacity - length, "%s%zu", axis ? ", " : "", entry->shape[axis]
+            );
+        }
+        length += (size_t)snprintf(
+            header + length, capacity - length, "], \"offset\": %zu, \"bytes\": %zu}",
+            entry->offset, entry->bytes
+        );
+    }
+    header[length++] = '}';
+    while ((OCEAN_TENSOR_CHECKPOINT_PREFIX + length) % OCEAN_TENSOR_CHECKPOINT_ALIGN != 0) {
+        header[length++] = ' ';
+    }
+    checkpoint->payload = OCEAN_TENSOR_CHECKPOINT_PREFIX + length;
+
+    unsigned char prefix[OCEAN_TENSOR_CHECKPOINT_PREFIX];
+    memcpy(prefix, OCEAN_TENSOR_CHECKPOINT_MAGIC, 8);
+    for (int byte = 0; byte < 8; ++byte) {
+        prefix[8 + byte] = (unsigned char)(((uint64_t)length >> (8 * byte)) & 0xffu);
+    }
+
+    /* Packed CPU copies first: GPU downloads and lazy evaluation stay on
+       this thread, only the file writes run in parallel. */
+    for (size_t index = 0; index < checkpoint->transfer_count; ++index) {
+        ocean_tensor_checkpoint_transfer *transfer = &checkpoint->transfers[index];
+        transfer->host = ocean_tensor_host(transfer->tensor);
+    }
+    int descriptor = open(path, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+    bool written = descriptor >= 0 &&
+        ocean_tensor_checkpoint_write_all(descriptor, prefix, sizeof(prefix)) &&
+        ocean_tensor_checkpoint_write_all(descriptor, header, length) &&
+        ftruncate(descriptor, (off_t)(checkpoint->payload + offset)) == 0 &&
+        ocean_tensor_checkpoint_move(
+            checkpoint, checkpoint->transfers, checkpoint->transfer_count, descriptor, true
+        );
+    if (descriptor >= 0 && close(descriptor) != 0) written = false;
+    free(header);
+    for (size_t index = 0; index < checkpoint->transfer_count; ++index) {
+        ocean_tensor_checkpoint_transfer *transfer = &checkpoint->transfers[index];
+        if (transfer->host != transfer->tensor) ocean_tensor_release(transfer->host);
+        transfer->host = NULL;
+    }
+    if (!written) ocean_tensor_fail("could not write checkpoint");
+}
+
+void ocean_tensor_checkpoint_load(int id) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    if (checkpoint->descriptor < 0) {
+        ocean_tensor_fail("Checkpoint.load requires a checkpoint from open()");
+    }
+    ocean_tensor_lazy_flush();
+    for (size_t index = 0; index < checkpoint->transfer_count; ++index) {
+        ocean_tensor_checkpoint_transfer *transfer = &checkpoint->transfers[index];
+        ocean_tensor_handle_t tensor = transfer->tensor;
+        ocean_tensor_materialize(tensor);
+        transfer->host = tensor->device == OCEAN_TENSOR_CPU && ocean_tensor_is_contiguous(tensor)
+            ? tensor
+            : ocean_tensor_alloc_uninitialized(
+                tensor->shape, tensor->ndim, tensor->dtype, OCEAN_TENSOR_CPU
+            );
+    }
+    bool loaded = ocean_tensor_checkpoint_move(
+        checkpoint, checkpoint->transfers, checkpoint->transfer_count,
+        checkpoint->descriptor, false
+    );
+    for (size_t index = 0; index < checkpoint->transfer_count; ++index) {
+        ocean_tensor_checkpoint_transfer *transfer = &checkpoint->transfers[index];
+        if (transfer->host != transfer->tensor) {
+            if (loaded) ocean_tensor_copy_into(transfer->tensor, transfer->host);
+            ocean_tensor_release(transfer->host);
+        }
+    }
+    checkpoint->transfer_count = 0;
+    if (!loaded) ocean_tensor_fail("truncated checkpoint data");
+}
+
+bool ocean_tensor_checkpoint_contains(int id, const char *name) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    if (!name) ocean_tensor_fail("Checkpoint.contains requires a name");
+    return ocean_tensor_checkpoint_lookup(checkpoint, name) != checkpoint->entry_count;
+}
+
+ocean_tensor_handle_t ocean_tensor_checkpoint_get(int id, const char *name, const char *device) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    if (checkpoint->descriptor < 0) {
+        ocean_tensor_fail("Checkpoint.get requires a checkpoint from open()");
+    }
+    if (!name) ocean_tensor_fail("Checkpoint.get requires a name");
+    size_t index = ocean_tensor_checkpoint_lookup(checkpoint, name);
+    if (index == checkpoint->entry_count) {
+        ocean_tensor_fail("checkpoint has no Tensor with this name");
+    }
+    const ocean_tensor_checkpoint_entry *entry = &checkpoint->entries[index];
+
+    ocean_tensor_handle_t result;
+    if (checkpoint->mapping) {
+        result = ocean_tensor_alloc(entry->shape, entry->ndim, entry->dtype, OCEAN_TENSOR_CPU);
+        result->storage = checkpoint->mapping;
+        atomic_fetch_add(&checkpoint->mapping->references, 1);
+        result->cpu_data =
+            (unsigned char *)checkpoint->mapping->data + checkpoint->payload + entry->offset;
+    } else {
+        result = ocean_tensor_alloc_uninitialized(
+            entry->shape, entry->ndim, entry->dtype, OCEAN_TENSOR_CPU
+        );
+        ocean_tensor_checkpoint_transfer transfer = {index, result, result};
+        if (!ocean_tensor_checkpoint_move(checkpoint, &transfer, 1, checkpoint->descriptor, false)) {
+            ocean_tensor_release(result);
+            ocean_tensor_fail("truncated checkpoint data");
+        }
+    }
+
+    if (!device || strcmp(device, "cpu") == 0) return result;
+    ocean_tensor_handle_t moved = ocean_tensor_to(result, device);
+    ocean_tensor_release(result);
+    return moved;
+}
+
+void ocean_tensor_checkpoint_release(int id) {
+    ocean_tensor_checkpoint *checkpoint = ocean_tensor_checkpoint_find(id);
+    ocean_tensor_checkpoint **cursor = &ocean_tensor_checkpoints;
+    while (*cursor != checkpoint) cursor = &(*cursor)->next;
+    *cursor = checkpoint->next;
+
+    /* Tensors from get() keep their own reference to the mapping. */
+    if (checkpoint->mapping) ocean_tensor_storage_release(checkpoint->mapping);
+    if (checkpoint->descriptor >= 0) close(checkpoint->descriptor);
+    for (size_t index = 0; index < checkpoint->entry_count; ++index) {
+        free(checkpoint->entries[index].name);
+        free(checkpoint->entries[index].shape);
+    }
+    free(checkpoint->entries);
+    free(checkpoint->transfers);
+    free(checkpoint);
+}
+
+/* Background batch loading.  A loader gathers batches from dense CPU
+   sources (typically memory-mapped datasets) on its own thread and keeps up
+   to `prefetch` of them ready in a ring, so next() only waits when the
+   training step outruns the gather.  Row sources [N, ...] are gathered with
+   one memcpy per row into [batch, ...] outputs that share a permutation;
+   a token stream is cut into windows, giving int64 inputs and targets
+   shifted by one token.  Every epoch drops the final partial batch. */
+#define OCEAN_TENSOR_LOADER_MAX_OUTPUTS 8
+
+typedef struct ocean_tensor_loader_slot {
+    ocean_tensor_handle_t outputs[OCEAN_TENSOR_LOADER_MAX_OUTPUTS];
+    uint64_t epoch;
+} ocean_tensor_loader_slot;
+
+typedef struct ocean_tensor_loader {
+    int id;
+    size_t batch_size;
+    bool shuffle;
+    uint64_t seed;
+    bool gpu;
+    ocean_tensor_handle_t sources[OCEAN_TENSOR_LOADER_MAX_OUTPUTS];
+    size_t source_count;
+    /* Tokens per window for a token stream; 0 for row sources. */
+    size_t window;
+    /* Rows or windows per epoch. */
+    size_t samples;
+    size_t output_count;
+    ocean_tensor_loader_slot *ring;
+    size_t capacity;
+    size_t head;
+    size_t ready_count;
+    /* Batch handed out by the last successful next(). */
+    ocean_tensor_loader_slot current;
+    uint64_t epoch;
+    double wait_seconds;
+    bool started;
+    bool stopping;
+    pthread_t thread;
+    pthread_mutex_t lock;
+    pthread_cond_t ready;
+    pthread_cond_t space;
+    struct ocean_tensor_loader *next;
+} ocean_tensor_loader;
+
+static ocean_tensor_loader *ocean_tensor_loaders = NULL;
+static int ocean_tensor_loader_next_id = 1;
+
+static ocean_tensor_loader *ocean_tensor_loader_find(int id) {
+    for (ocean_tensor_loader *loader = ocean_tensor_loaders; loader; loader = loader->next) {
+        if (loader->id == id) return loader;
+    }
+    ocean_tensor_fail("DataLoader id is invalid");
+}
+
+static double ocean_tensor_loader_seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+/* splitmix64 */
+static uint64_t ocean_tensor_loader_random(uint64_t *state) {
+    uint64_t value = (*state += 0x9e3779b97f4a7c15ull);
+    value = (value ^ (value >> 30)) * 0xbf58476d1ce4e5b9ull;
+    value = (value ^ (value >> 27)) * 0x94d049bb133111ebull;
+    return value ^ (value >> 31);
+}
+
+static int64_t ocean_tensor_loader_token(const void *data, ocean_tensor_dtype dtype, size_t index) {
+    switch (dtype) {
+        case OCEAN_TENSOR_INT8: return ((const int8_t *)data)[index];
+        case OCEAN_TENSOR_INT16: return ((const int16_t *)data)[index];
+        case OCEAN_TENSOR_INT32: return ((const int32_t *)data)[index];
+        case OCEAN_TENSOR_INT64: return ((const int64_t *)data)[index];
+        case OCEAN_TENSOR_UINT8: return ((const uint8_t *)data)[index];
+        case OCEAN_TENSOR_UINT16: return ((const uint16_t *)data)[index];
+        case OCEAN_TENSOR_UINT32: return ((const uint32_t *)data)[index];
+        default: return 0;
+    }
+}
+
+static void ocean_tensor_loader_gather(
+    const ocean_tensor_loader *loader,
+    const size_t *order,
+    ocean_tensor_loader_slot *slot
+) {
+    size_t batch = loader->batch_size;
+    if (loader->window) {
+        const ocean_tensor_handle_t tokens = loader->sources[0];
+        size_t window = loader->window;
+        size_t shape[2] = {batch, window};
+        ocean_tensor_handle_t inputs = ocean_tensor_alloc_uninitialized(
+            shape, 2, OCEAN_TENSOR_INT64, OCEAN_TENSOR_CPU
+        );
+        ocean_tensor_handle_t targets = ocean_tensor_alloc_uninitialized(
+            shape, 2, OCEAN_TENSOR_INT64, OCEAN_TENSOR_CPU
+        );
+        int64_t *input_data = (int64_t *)inputs->cpu_data;
+        int64_t *target_data = (int64_t *)targets->cpu_data;
+        for (size_t row = 0; row < batch; ++row) {
+            size_t start = order[row] * window;
+            int64_t *input_row = input_data + row * window;
+            if (tokens->dtype == OCEAN_TENSOR_INT64) {
+                const int64_t *source = (const int64_t *)tokens->cpu_data + start;
+                memcpy(input_row, source, window * sizeof(int64_t));
+                memcpy(target_data + row * window, source + 1, window * sizeof(int64_t));
+                continue;
+            }
+            for (size_t column = 0; column <= window; ++column) {
+                int64_t value = ocean_tensor_loader_token(
+                    tokens->cpu_data, tokens->dtype, start + column
+                );
+                if (column < window) input_row[column] = value;
+                if (column > 0) target_data[row * window + column - 1] = value;
+            }
+        }
+        slot->outputs[0] = inputs;
+        slot->outputs[1] = targets;
+        return;
+    }
+
+    for (size_t index = 0; index < loader->source_count; ++index) {
+        const ocean_tensor_handle_t source = loader->sources[index];
+        size_t row_bytes = ocean_tensor_bytes(source) / source->shape[0];
+        size_t *shape = (size_t *)malloc(source->ndim * sizeof(size_t));
+        if (!shape) ocean_tensor_fail("out of memory gathering DataLoader batch");
+        memcpy(shape, source->shape, source->ndim * sizeof(size_t));
+        shape[0] = batch;
+        ocean_tensor_handle_t output = ocean_tensor_alloc_uninitialized(
+            shape, source->ndim, source->dtype, OCEAN_TENSOR_CPU
+        );
+        free(shape);
+        unsigned char *destination = (unsigned char *)output->cpu_data;
+        const unsigned char *rows = (const unsigned char *)source->cpu_data;
+        for (size_t row = 0; row < batch; ++row) {
+            memcpy(destination + row * row_bytes, rows + order[row] * row_bytes, row_bytes);
+        }
+        slot->outputs[index] = output;
+    }
+}
+
+static void ocean_tensor_loader_release_slot(ocean_tensor_loader_slot *slot) {
+    for (size_t index = 0; index < OCEAN_TENSOR_LOADER_MAX_OUTPUTS; ++index) {
+        if (slot->outputs[index]) ocean_tensor_release(slot->outputs[index]);
+        slot->outputs[index] = NULL;
+    }
+}
+
+static void *ocean_tensor_loader_run(void *argument) {
+    ocean_tensor_loader *loader = (ocean_tensor_loader *)argument;
+    size_t *order = (size_t *)malloc(loader->samples * sizeof(size_t));
+    if (!order) ocean_tensor_fail("out of memory shuffling DataLoader samples");
+    size_t batches = loader->samples / loader->batch_size;
+    for (uint64_t epoch = 0;; ++epoch) {
+        for (size_t index = 0; index < loader->samples; ++index) order[index] = index;
+        if (loader->shuffle) {
+            uint64_t state = loader->seed ^ (epoch * 0xd1b54a32d192ed03ull);
+            for (size_t index = loader->samples - 1; index > 0; --index) {
+                size_t other = (size_t)(ocean_tensor_loader_random(&state) % (index + 1));
+                size_t swap = order[index];
+                order[index] = order[other];
+                order[other] = swap;
+            }
+        }
+        for (size_t batch = 0; batch < batches; ++batch) {
+            ocean_tensor_loader_slot slot;
+            memset(&slot, 0, sizeof(slot));
+            slot.epoch = epoch;
+            ocean_tensor_loader_gather(loader, order + batch * loader->batch_size, &slot);
+
+            pthread_mutex_lock(&loader->lock);
+            while (loader->ready_count == loader->capacity && !loader->stopping) {
+                pthread_cond_wait(&loader->space, &loader->lock);
+            }
+            if (loader->stopping) {
+                pthread_mutex_unlock(&loader->lock);
+                ocean_tensor_loader_release_slot(&slot);
+                free(order);
+                return NULL;
+            }
+            size_t tail = (loader->head + loader->ready_count) % loader->capacity;
+            loader->ring[tail] = slot;
+            loader->ready_count += 1;
+            pthread_cond_signal(&loader->ready);
+            pthread_mutex_unlock(&loader->lock);
+        }
+    }
+}
+
+int ocean_tensor_loader_create(
+    int batch_size,
+    int prefetch,
+    bool shuffle,
+    int seed,
+    const char *device
+) {
+    if (batch_size < 1) ocean_tensor_fail("DataLoader batch size must be positive");
+    if (prefetch < 1) ocean_tensor_fail("DataLoader prefetch depth must be positive");
+    ocean_tensor_loader *loader = (ocean_tensor_loader *)calloc(1, sizeof(*loader));
+    ocean_tensor_loader_slot *ring =
+        (ocean_tensor_loader_slot *)calloc((size_t)prefetch, sizeof(*ring));
+    if (!loader || !ring) {
+        free(loader);
+        free(ring);
+        ocean_tensor_fail("out of memory creating DataLoader");
+    }
+    loader->batch_size = (size_t)batch_size;
+    loader->shuffle = shuffle;
+    loader->seed = (uint64_t)(uint32_t)seed;
+    loader->gpu = ocean_tensor_parse_device(device) == OCEAN_TENSOR_GPU;
+    loader->ring = ring;
+    loader->capacity = (size_t)prefetch;
+    pthread_mutex_init(&loader->lock, NULL);
+    pthread_cond_init(&loader->ready, NULL);
+    pthread_cond_init(&loader->space, NULL);
+    loader->id = ocean_tensor_loader_next_id++;
+    loader->next = ocean_tensor_loaders;
+    ocean_tensor_loaders = loader;
+    return loader->id;
+}
+
+/* The loader keeps its own dense CPU copy of `source`, so the caller may
+   keep writing the Tensor while the loader thread gathers from it.  A
+   mapped source is kept by reference instead: copying it would read the
+   whole file up front. */
+static ocean_tensor_handle_t ocean_tensor_loader_source(
+    ocean_tensor_loader *loader,
+    ocean_tensor_handle_t source
+) {
+    if (!source) ocean_tensor_fail("DataLoader source is null");
+    if (loader->started) ocean_tensor_fail("DataLoader sources must be added before next()");
+    if (loader->source_count == OCEAN_TENSOR_LOADER_MAX_OUTPUTS) {
+        ocean_tensor_fail("DataLoader has too many sources");
+    }
+    if (source->device != OCEAN_TENSOR_CPU) {
+        ocean_tensor_fail("DataLoader sources must be on the CPU");
+    }
+    ocean_tensor_handle_t dense = ocean_tensor_dense(source);
+    ocean_tensor_handle_t kept = dense != source
+        ? dense
+        : ocean_tensor_is_mapped(source) ? ocean_tensor_alias(source) : ocean_tensor_copy(source);
+    loader->sources[loader->source_count++] = kept;
+    return kept;
+}
+
+void ocean_tensor_loader_add_rows(int id, ocean_tensor_handle_t source) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    if (loader->window) ocean_tensor_fail("DataLoader cannot mix rows and token windows");
+    ocean_tensor_handle_t kept = ocean_tensor_loader_source(loader, source);
+    if (loader->source_count > 1 && kept->shape[0] != loader->samples) {
+        ocean_tensor_fail("DataLoader row sources must have the same number of rows");
+    }
+    loader->samples = kept->shape[0];
+    loader->output_count = loader->source_count;
+}
+
+void ocean_tensor_loader_add_windows(int id, ocean_tensor_handle_t tokens, int length) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    if (loader->source_count) ocean_tensor_fail("DataLoader already has a source");
+    if (length < 1) ocean_tensor_fail("DataLoader window length must be positive");
+    if (!tokens || tokens->ndim != 1) ocean_tensor_fail("DataLoader token stream must be 1-D");
+    switch (tokens->dtype) {
+        case OCEAN_TENSOR_INT8: case OCEAN_TENSOR_INT16: case OCEAN_TENSOR_INT32:
+        case OCEAN_TENSOR_INT64: case OCEAN_TENSOR_UINT8: case OCEAN_TENSOR_UINT16:
+        case OCEAN_TENSOR_UINT32:
+            break;
+        default:
+            ocean_tensor_fail("DataLoader token stream must have an integer dtype");
+    }
+    ocean_tensor_handle_t kept = ocean_tensor_loader_source(loader, tokens);
+    loader->window = (size_t)length;
+    loader->samples = kept->size > 0 ? (kept->size - 1) / loader->window : 0;
+    loader->output_count = 2;
+}
+
+int ocean_tensor_loader_batches(int id) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    return (int)(loader->samples / loader->batch_size);
+}
+
+bool ocean_tensor_loader_next(int id) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    if (!loader->started) {
+        if (loader->source_count == 0) ocean_tensor_fail("DataLoader has no source");
+        if (loader->samples < loader->batch_size) {
+            ocean_tensor_fail("DataLoader source is smaller than one batch");
+        }
+        if (pthread_create(&loader->thread, NULL, ocean_tensor_loader_run, loader) != 0) {
+            ocean_tensor_fail("could not start DataLoader thread");
+        }
+        loader->started = true;
+    }
+    ocean_tensor_loader_release_slot(&loader->current);
+
+    pthread_mutex_lock(&loader->lock);
+    if (loader->ready_count == 0) {
+        double start = ocean_tensor_loader_seconds();
+        while (loader->ready_count == 0) pthread_cond_wait(&loader->ready, &loader->lock);
+        loader->wait_seconds += ocean_tensor_loader_seconds() - start;
+    }
+    ocean_tensor_loader_slot *slot = &loader->ring[loader->head];
+    /* The first batch of a new epoch is left in the ring: this call ends the
+       epoch and the next one returns it. */
+    if (slot->epoch != loader->epoch) {
+        loader->epoch = slot->epoch;
+        pthread_mutex_unlock(&loader->lock);
+        return false;
+    }
+    loader->current = *slot;
+    memset(slot, 0, sizeof(*slot));
+    loader->head = (loader->head + 1) % loader->capacity;
+    loader->ready_count -= 1;
+    pthread_cond_signal(&loader->space);
+    pthread_mutex_unlock(&loader->lock);
+
+    if (loader->gpu) {
+        for (size_t index = 0; index < loader->output_count; ++index) {
+            ocean_tensor_handle_t moved = ocean_tensor_to(loader->current.outputs[index], "gpu");
+            ocean_tensor_release(loader->current.outputs[index]);
+            loader->current.outputs[index] = moved;
+        }
+    }
+    return true;
+}
+
+ocean_tensor_handle_t ocean_tensor_loader_get(int id, int output) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    if (output < 0 || (size_t)output >= loader->output_count) {
+        ocean_tensor_fail("DataLoader output index is out of range");
+    }
+    ocean_tensor_handle_t result = loader->current.outputs[output];
+    if (!result) ocean_tensor_fail("DataLoader.get needs a batch from next(), once per output");
+    loader->current.outputs[output] = NULL;
+    return result;
+}
+
+double ocean_tensor_loader_wait_seconds(int id) {
+    return ocean_tensor_loader_find(id)->wait_seconds;
+}
+
+void ocean_tensor_loader_release(int id) {
+    ocean_tensor_loader *loader = ocean_tensor_loader_find(id);
+    ocean_tensor_loader **cursor = &ocean_tensor_loaders;
+    while (*cursor != loader) cursor = &(*cursor)->next;
+    *cursor = loader->next;
+
+    if (loader->started) {
+        pthread_mutex_lock(&loader->lock);
+        loader->stopping = true;
+        pthread_cond_broadcast(&loader->space);
+        pthread_mutex_unlock(&loader->lock);
+        pthread_join(loader->thread, NULL);
+    }
+    for (size_t index = 0; index < loader->capacity; ++index) {
+        ocean_tensor_loader_release_slot(&loader->ring[index]);
+    }
+    ocean_tensor_loader_release_slot(&loader->current);
+    for (size_t index = 0; index < loader->source_count; ++index) {
+        ocean_tensor_release(loader->sources[index]);
+    }
+    pthread_mutex_destroy(&loader->lock);
+    pthread_cond_destroy(&loader->ready);
+    pthread_cond_destroy(&loader->space);
+    free(loader->ring);
+    free(loader);
+}
+
 int ocean_tensor_shape(ocean_tensor_handle_t tensor, int axis) {
     if (!tensor) ocean_tensor_fail("shape() does not accept a null Tensor");
     if (axis < 0 || (size_t)axis >= tensor->ndim) {
@@ -6180,7 +11600,11 @@ char *ocean_tensor_device_info(ocean_tensor_handle_t tensor) {
 #endif
     const char *name = tensor->device == OCEAN_TENSOR_GPU
         ? "OpenCL GPU (not initialized)"
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+        : "CPU (BLAS)";
+#else
         : "CPU";
+#endif
     char *result = (char *)malloc(strlen(name) + 1);
     if (!result) ocean_tensor_fail("out of memory copying device info");
     strcpy(result, name);
@@ -6194,6 +11618,11 @@ uint64_t ocean_tensor_identity(ocean_tensor_handle_t tensor) {
 
 void ocean_tensor_release(ocean_tensor_handle_t tensor) {
     if (!tensor) return;
+    if (tensor->pending) {
+        ocean_tensor_lazy_forget(tensor);
+        ocean_tensor_lazy_node_release(tensor->pending);
+        tensor->pending = NULL;
+    }
     ocean_tensor_backend_for_device(tensor->device)->release(tensor);
     free(tensor->shape);
     free(tensor->strides);
@@ -6205,6 +11634,7 @@ ocean_tensor_handle_t ocean_tensor_permute(
     const int *axes,
     size_t ndim
 ) {
+    ocean_tensor_materialize(tensor);
     if (!tensor) {
         ocean_tensor_fail("Tensor.permute requires a Tensor");
     }
@@ -6280,43 +11710,21 @@ static ocean_tensor_handle_t ocean_tensor_permute_cpu(
     size_t ndim
 ) {
     size_t *shape = (size_t *)malloc(ndim * sizeof(size_t));
-    if (!shape) ocean_tensor_fail("out of memory in CPU Tensor.permute shape");
+    size_t *strides = (size_t *)malloc(ndim * sizeof(size_t));
+    if (!shape || !strides) {
+        free(shape);
+        free(strides);
+        ocean_tensor_fail("out of memory in CPU Tensor.permute shape");
+    }
     for (size_t axis = 0; axis < ndim; ++axis) {
         shape[axis] = tensor->shape[(size_t)axes[axis]];
+        strides[axis] = tensor->strides[(size_t)axes[axis]];
     }
 
-    ocean_tensor_handle_t result = ocean_tensor_alloc_uninitialized(
-        shape, ndim, tensor->dtype, OCEAN_TENSOR_CPU
+    ocean_tensor_handle_t result = ocean_tensor_view(
+        tensor, shape, strides, ndim, 0
     );
     free(shape);
-
-    size_t *coordinates = (size_t *)calloc(
-        ndim == 0 ? 1 : ndim, sizeof(size_t)
-    );
-    if (!coordinates) {
-        ocean_tensor_release(result);
-        ocean_tensor_fail("out of memory in CPU Tensor.permute coordinates");
-    }
-
-    for (size_t output_index = 0; output_index < result->size; ++output_index) {
-        size_t remaining = output_index;
-        size_t input_index = 0;
-
-        for (size_t axis = ndim; axis-- > 0;) {
-            size_t extent = result->shape[axis];
-            size_t coordinate = extent == 0 ? 0 : remaining % extent;
-            remaining = extent == 0 ? 0 : remaining / extent;
-            coordinates[axis] = coordinate;
-            input_index += coordinate * tensor->strides[(size_t)axes[axis]];
-        }
-
-        ocean_tensor_write_scalar(
-            result,
-            output_index,
-            ocean_tensor_read_scalar(tensor, input_index)
-        );
-    }
-
-    free(coordinates);
+    free(strides);
     return result;
 }
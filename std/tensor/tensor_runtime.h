@@ -12,6 +12,39 @@ typedef struct ocean_tensor_handle *ocean_tensor_handle_t;
 _Noreturn void ocean_tensor_fail(const char *message);
 void ocean_tensor_validate_list_length(size_t actual, size_t expected);
 
+/* CPU kernel parallelism.  The default comes from OCEAN_TENSOR_NUM_THREADS
+   or the number of online CPUs; set_num_threads(0) restores it. */
+void ocean_tensor_set_num_threads(int threads);
+int ocean_tensor_get_num_threads(void);
+/* Whether kernels called from the current thread may split work across
+   the CPU worker threads.  Threads that already run one of many concurrent
+   jobs (data-parallel workers) turn it off to avoid oversubscription. */
+void ocean_tensor_set_thread_parallelism(bool enabled);
+
+/* CPU storage cache.  Released Tensor storage is kept for reuse up to a byte
+   limit (OCEAN_TENSOR_CACHE_LIMIT, default 1G; 0 disables caching).  Live
+   and peak count bytes held by Tensors, cached counts idle blocks. */
+void ocean_tensor_set_cache_limit(size_t bytes);
+size_t ocean_tensor_get_cache_limit(void);
+void ocean_tensor_empty_cache(void);
+size_t ocean_tensor_memory_live_bytes(void);
+size_t ocean_tensor_memory_peak_bytes(void);
+size_t ocean_tensor_memory_cached_bytes(void);
+void ocean_tensor_reset_peak_memory(void);
+char *ocean_tensor_memory_stats(void);
+/* A second peak counter for measuring one phase, such as backward(), without
+   disturbing the process-wide peak above.  It is per thread: live bytes at
+   the reset plus the calling thread's highest net allocation since, so
+   phases on concurrent threads do not disturb each other. */
+size_t ocean_tensor_memory_window_peak_bytes(void);
+void ocean_tensor_reset_window_peak_memory(void);
+
+/* Lazy elementwise fusion.  While enabled, float32 CPU elementwise, scalar,
+   relu and gelu results are recorded and evaluated in one fused pass when
+   their data is first read. */
+void ocean_tensor_set_lazy_enabled(bool enabled);
+bool ocean_tensor_lazy_enabled(void);
+
 ocean_tensor_handle_t ocean_tensor_zeros(int rows, int cols, const char *device);
 ocean_tensor_handle_t ocean_tensor_zeros_nd(
     const size_t *shape, size_t ndim, const char *dtype, const char *device
@@ -24,6 +57,22 @@ ocean_tensor_handle_t ocean_tensor_from_cpu_strided(
     const char *dtype,
     const char *device
 );
+/* Bulk transfer between a Tensor and `count` packed host elements of
+   `dtype` in row-major order, converting when the dtypes differ.  `count`
+   must equal the Tensor's size.  A matching dtype is one memcpy for packed
+   CPU Tensors; other Tensors are staged through one packed host copy. */
+void ocean_tensor_copy_from_buffer(
+    ocean_tensor_handle_t tensor,
+    const void *data,
+    size_t count,
+    const char *dtype
+);
+void ocean_tensor_copy_to_buffer(
+    ocean_tensor_handle_t tensor,
+    void *data,
+    size_t count,
+    const char *dtype
+);
 ocean_tensor_handle_t ocean_tensor_load_npy(
     const char *path,
     const char *device
@@ -33,12 +82,99 @@ ocean_tensor_handle_t ocean_tensor_load_npy_typed(
     const char *device,
     const char *expected_dtype
 );
+/* Zero-copy load: the CPU Tensor's storage is a private mapping of the file,
+   so pages are read lazily on first touch, processes loading the same file
+   share its page-cache copy, and writes copy the page without reaching the
+   file.  Byte-swapped or misaligned payloads fall back to a copying load.
+   The mapping is released with the last handle or view using it. */
+ocean_tensor_handle_t ocean_tensor_load_npy_mmap(
+    const char *path,
+    const char *device
+);
+ocean_tensor_handle_t ocean_tensor_load_npy_mmap_typed(
+    const char *path,
+    const char *device,
+    const char *expected_dtype
+);
+/* Raw host-order elements of `dtype` as a 1-D Tensor over a private
+   mapping of the whole file. */
+ocean_tensor_handle_t ocean_tensor_load_bin_mmap(
+    const char *path,
+    const char *dtype,
+    const char *device
+);
+bool ocean_tensor_is_mapped(ocean_tensor_handle_t tensor);
+/* Paging hint for the pages holding a mapped Tensor's elements: "normal",
+   "sequential", "random", "willneed" or "dontneed".  No-op for heap
+   Tensors. */
+void ocean_tensor_madvise(ocean_tensor_handle_t tensor, const char *advice);
+/* Single-file checkpoints: a JSON index of name -> dtype, shape and offset
+   followed by 64-byte aligned row-major payloads.  A checkpoint from
+   create() collects named Tensors with add() and writes them with save().
+   One from open() queues destinations with add() and fills them with
+   load(); get() returns one Tensor, a view of the file when it was opened
+   mapped.  Only the entries asked for are read, and save() and load() split
+   their payloads across the worker threads.  add() borrows the Tensor
+   until the next save() or load(). */
+int ocean_tensor_checkpoint_create(void);
+int ocean_tensor_checkpoint_open(const char *path, bool mapped);
+void ocean_tensor_checkpoint_add(int id, const char *name, ocean_tensor_handle_t tensor);
+void ocean_tensor_checkpoint_save(int id, const char *path);
+void ocean_tensor_checkpoint_load(int id);
+bool ocean_tensor_checkpoint_contains(int id, const char *name);
+ocean_tensor_handle_t ocean_tensor_checkpoint_get(int id, const char *name, const char *device);
+void ocean_tensor_checkpoint_release(int id);
+/* Background batch loading.  A loader gathers shuffled batches from dense
+   CPU sources on its own thread, keeping up to `prefetch` of them ready.
+   Row sources [N, ...] share one permutation and each yields a [batch, ...]
+   output; a 1-D integer token stream is cut into windows of `length` and
+   yields int64 inputs and targets shifted by one token.  next() returns
+   false once at the end of every epoch; get() hands over each output of
+   the current batch once.  The final partial batch is dropped.  Sources
+   are copied when added, except mapped ones, which are read in place and
+   must not be written until the loader is released. */
+int ocean_tensor_loader_create(
+    int batch_size,
+    int prefetch,
+    bool shuffle,
+    int seed,
+    const char *device
+);
+void ocean_tensor_loader_add_rows(int id, ocean_tensor_handle_t source);
+void ocean_tensor_loader_add_windows(int id, ocean_tensor_handle_t tokens, int length);
+int ocean_tensor_loader_batches(int id);
+bool ocean_tensor_loader_next(int id);
+ocean_tensor_handle_t ocean_tensor_loader_get(int id, int output);
+double ocean_tensor_loader_wait_seconds(int id);
+void ocean_tensor_loader_release(int id);
 void ocean_tensor_save_npy(
     ocean_tensor_handle_t tensor,
     const char *path
 );
 ocean_tensor_handle_t ocean_tensor_copy(ocean_tensor_handle_t tensor);
 ocean_tensor_handle_t ocean_tensor_ternary_quantize(ocean_tensor_handle_t tensor);
+/* Packed inference weights for a float32 [in_features, out_features]
+   matmul weight, stored as one row per output feature on the CPU.  Ternary
+   codes are uint8 [out, ceil(in / 4)] at 2 bits per weight with the same
+   scale and threshold as ternary_quantize; int8 codes are int8 [out, in]
+   with a symmetric per-output scale.  The *_scales functions return the
+   matching float32 [out] scales.  matmul_ternary and matmul_int8 compute
+   input[..., in] x W on the CPU (int8 quantizes each input row and
+   accumulates in int32) and return the result on the input's device. */
+ocean_tensor_handle_t ocean_tensor_ternary_pack(ocean_tensor_handle_t weight);
+ocean_tensor_handle_t ocean_tensor_ternary_scales(ocean_tensor_handle_t weight);
+ocean_tensor_handle_t ocean_tensor_int8_pack(ocean_tensor_handle_t weight);
+ocean_tensor_handle_t ocean_tensor_int8_scales(ocean_tensor_handle_t weight);
+ocean_tensor_handle_t ocean_tensor_matmul_ternary(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t codes,
+    ocean_tensor_handle_t scales
+);
+ocean_tensor_handle_t ocean_tensor_matmul_int8(
+    ocean_tensor_handle_t input,
+    ocean_tensor_handle_t codes,
+    ocean_tensor_handle_t scales
+);
 ocean_tensor_handle_t ocean_tensor_gelu(ocean_tensor_handle_t tensor);
 ocean_tensor_handle_t ocean_tensor_gelu_backward(
     ocean_tensor_handle_t upstream,
@@ -54,6 +190,31 @@ ocean_tensor_handle_t ocean_tensor_embedding_backward(
     size_t vocab,
     size_t dim
 );
+/* Row-sparse Embedding gradients (CPU).  The gradient is `count` distinct
+   table rows listed in `rows` (int64 [capacity]) with their sums in the
+   matching rows of `values` (float32 [capacity, dim]).  `slots` (int64
+   [vocab], -1 when absent) maps a table row to its slot.  backward_rows adds
+   the upstream rows in and returns the new count; reset clears `slots` for
+   the listed rows; scatter_add_rows adds the rows into a dense Tensor. */
+size_t ocean_tensor_embedding_backward_rows(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t indices,
+    ocean_tensor_handle_t slots,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t values,
+    size_t count
+);
+void ocean_tensor_embedding_rows_reset(
+    ocean_tensor_handle_t slots,
+    ocean_tensor_handle_t rows,
+    size_t count
+);
+void ocean_tensor_scatter_add_rows(
+    ocean_tensor_handle_t destination,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t values,
+    size_t count
+);
 ocean_tensor_handle_t ocean_tensor_cross_entropy_forward(
     ocean_tensor_handle_t logits,
     ocean_tensor_handle_t targets,
@@ -64,6 +225,74 @@ ocean_tensor_handle_t ocean_tensor_cross_entropy_backward(
     ocean_tensor_handle_t probabilities,
     ocean_tensor_handle_t targets
 );
+/* Fused log-softmax + NLL for CPU logits [..., V].  Rows are streamed in
+   vocab blocks with an online max/sum and split across threads; no
+   probabilities Tensor is built.  forward returns the mean loss [1, 1] and,
+   when log_normalizers_out is given, each row's log-sum-exp (float64
+   [rows]).  backward recomputes the probabilities from the logits and those
+   log-normalizers, block by block, as it writes the gradient. */
+ocean_tensor_handle_t ocean_tensor_cross_entropy_fused(
+    ocean_tensor_handle_t logits,
+    ocean_tensor_handle_t targets,
+    ocean_tensor_handle_t *log_normalizers_out
+);
+ocean_tensor_handle_t ocean_tensor_cross_entropy_fused_backward(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t logits,
+    ocean_tensor_handle_t targets,
+    ocean_tensor_handle_t log_normalizers
+);
+/* softmax(q k^T / sqrt(d)) v for CPU float32 q [..., Tq, d], k [..., Tk, d]
+   and v [..., Tk, dv] with matching leading axes.  The score matrix is never
+   materialized: keys are streamed in blocks with an online softmax, in
+   parallel over batch x heads x query tiles.  With `causal`, query i sees
+   keys j <= i + Tk - Tq.  forward also returns each query's log-sum-exp
+   ([..., Tq]), from which backward recomputes the probabilities. */
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal
+);
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention_forward(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    bool causal,
+    ocean_tensor_handle_t *log_sum_exp_out
+);
+/* Incremental decoding over a preallocated KV cache: contiguous CPU float32
+   [..., capacity, d] keys and [..., capacity, dv] values.  kv_cache_write
+   copies values [..., T, width] into rows [position, position + T).
+   attention_cached attends q [..., Tq, d] causally to the first `length`
+   cached rows, the queries being the last Tq of them; it reads the cache in
+   place and needs no mask.  Both are CPU-only: the cache, the written rows
+   and q must all be CPU Tensors, otherwise they fail rather than copy
+   across devices every step.  Inference only: nothing is recorded for
+   autograd. */
+void ocean_tensor_kv_cache_write(
+    ocean_tensor_handle_t cache,
+    ocean_tensor_handle_t values,
+    size_t position
+);
+ocean_tensor_handle_t ocean_tensor_scaled_dot_product_attention_cached(
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t cache_k,
+    ocean_tensor_handle_t cache_v,
+    size_t length
+);
+void ocean_tensor_scaled_dot_product_attention_backward(
+    ocean_tensor_handle_t upstream,
+    ocean_tensor_handle_t q,
+    ocean_tensor_handle_t k,
+    ocean_tensor_handle_t v,
+    ocean_tensor_handle_t output,
+    ocean_tensor_handle_t log_sum_exp,
+    bool causal,
+    ocean_tensor_handle_t *grad_q,
+    ocean_tensor_handle_t *grad_k,
+    ocean_tensor_handle_t *grad_v
+);
 void ocean_tensor_copy_into(ocean_tensor_handle_t destination, ocean_tensor_handle_t source);
 ocean_tensor_handle_t ocean_tensor_to(ocean_tensor_handle_t tensor, const char *device);
 ocean_tensor_handle_t ocean_tensor_matmul(
@@ -86,6 +315,35 @@ ocean_tensor_handle_t ocean_tensor_scalar(
     double scalar,
     int operation
 );
+/* Destination-passing variants: `out` must already have the result shape,
+   dtype and device, and may be one of the inputs for an in-place update. */
+void ocean_tensor_binary_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    int operation
+);
+void ocean_tensor_scalar_into(
+    ocean_tensor_handle_t out,
+    ocean_tensor_handle_t tensor,
+    double scalar,
+    int operation
+);
+/* Elementwise float32 math; POW raises every element to `scalar`. */
+enum {
+    OCEAN_TENSOR_UNARY_EXP = 0,
+    OCEAN_TENSOR_UNARY_LOG = 1,
+    OCEAN_TENSOR_UNARY_SQRT = 2,
+    OCEAN_TENSOR_UNARY_POW = 3,
+};
+ocean_tensor_handle_t ocean_tensor_unary(
+    ocean_tensor_handle_t tensor,
+    int operation,
+    double scalar
+);
+ocean_tensor_handle_t ocean_tensor_relu(ocean_tensor_handle_t tensor);
+void ocean_tensor_relu_into(ocean_tensor_handle_t out, ocean_tensor_handle_t tensor);
+void ocean_tensor_gelu_into(ocean_tensor_handle_t out, ocean_tensor_handle_t tensor);
 ocean_tensor_handle_t ocean_tensor_reshape(
     ocean_tensor_handle_t tensor,
     const size_t *shape,
@@ -118,6 +376,12 @@ double ocean_tensor_min(ocean_tensor_handle_t tensor);
 double ocean_tensor_item(ocean_tensor_handle_t tensor);
 char *ocean_tensor_dtype_name(ocean_tensor_handle_t tensor);
 bool ocean_tensor_is_contiguous(ocean_tensor_handle_t tensor);
+/* True unless another handle (a view, or the Tensor a view came from) shares
+   this Tensor's storage, i.e. in-place writes are visible only through it. */
+bool ocean_tensor_owns_storage(ocean_tensor_handle_t tensor);
+/* A second CPU handle over the same elements, shape and strides. */
+ocean_tensor_handle_t ocean_tensor_alias(ocean_tensor_handle_t tensor);
+bool ocean_tensor_shares_storage(ocean_tensor_handle_t left, ocean_tensor_handle_t right);
 ocean_tensor_handle_t ocean_tensor_contiguous(ocean_tensor_handle_t tensor);
 void ocean_tensor_fill(ocean_tensor_handle_t tensor, double value);
 double ocean_tensor_get_nd(
@@ -229,6 +493,18 @@ void ocean_tensor_set_nd_f32(
 void ocean_tensor_set_nd_f64(
     ocean_tensor_handle_t tensor, const size_t *indices, size_t ndim, double value
 );
+/* Element storage of a CPU Tensor for compiled range loops that index it
+   directly.  Fills `shape` and the element `strides` of its `rank` axes and
+   returns the first element when the Tensor is a CPU Tensor of that rank and
+   `dtype` whose last axis is unit-stride; otherwise returns NULL, zeroes both
+   arrays, and the loop keeps the checked accessors. */
+void *ocean_tensor_loop_data(
+    ocean_tensor_handle_t tensor,
+    size_t rank,
+    const char *dtype,
+    size_t *shape,
+    size_t *strides
+);
 double ocean_tensor_get_2d(ocean_tensor_handle_t tensor, int row, int col);
 void ocean_tensor_set_2d(ocean_tensor_handle_t tensor, int row, int col, double value);
 
@@ -285,4 +561,78 @@ void ocean_tensor_adamw_update(
     double bias_correction2
 );
 
+/* Multi-tensor CPU updates: one parallel pass over every element of a
+   Parameter group.  A NULL gradient skips its Parameter.  AdamW moments are
+   a single float32 Tensor of 2 * (total Parameter elements): first moments
+   for the Parameters back to back, then second moments in the same order. */
+void ocean_tensor_sgd_update_many(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count,
+    double learning_rate
+);
+void ocean_tensor_adamw_update_many(
+    const ocean_tensor_handle_t *parameters,
+    const ocean_tensor_handle_t *gradients,
+    size_t count,
+    ocean_tensor_handle_t moments,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+);
+/* Row-sparse CPU updates of a [rows, dim] Parameter from a row-sparse
+   gradient.  AdamW moments for the Parameter start at the given offsets;
+   last_steps (int64 [rows]) holds the step that last updated each row, and
+   a row's moment and weight decay over the steps it skipped is applied when
+   it is next updated. */
+void ocean_tensor_sgd_update_rows(
+    ocean_tensor_handle_t parameter,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t gradients,
+    size_t count,
+    double learning_rate
+);
+void ocean_tensor_adamw_update_rows(
+    ocean_tensor_handle_t parameter,
+    ocean_tensor_handle_t rows,
+    ocean_tensor_handle_t gradients,
+    size_t count,
+    ocean_tensor_handle_t first_moment,
+    size_t first_offset,
+    ocean_tensor_handle_t second_moment,
+    size_t second_offset,
+    ocean_tensor_handle_t last_steps,
+    int step,
+    double learning_rate,
+    double beta1,
+    double beta2,
+    double epsilon,
+    double weight_decay,
+    double bias_correction1,
+    double bias_correction2
+);
+/* destination[i] += sum(scales[s] * sources[s][i]) for i in [begin, end).
+   All are contiguous CPU float32 Tensors of one size; NULL sources are
+   skipped. */
+void ocean_tensor_accumulate_range(
+    ocean_tensor_handle_t destination,
+    const ocean_tensor_handle_t *sources,
+    size_t count,
+    const double *scales,
+    size_t begin,
+    size_t end
+);
+/* Copies count elements between flat positions of contiguous CPU Tensors. */
+void ocean_tensor_copy_range(
+    ocean_tensor_handle_t destination,
+    size_t destination_offset,
+    ocean_tensor_handle_t source,
+    size_t source_offset,
+    size_t count
+);
+
 #endif
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_backward_releases_saved_tensors_as_it_goes(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "autograd_backward_memory.c"
+    binary = tmp_path / "autograd_backward_memory"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define LAYERS 16
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd backward memory failed: %s\n", message);
+    exit(1);
+}
+
+int main(void) {
+    size_t shape[2] = {256, 256};
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t x = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    size_t bytes = ocean_tensor_memory_live_bytes() - baseline;
+    for (size_t i = 0; i < 256 * 256; ++i) {
+        ocean_tensor_set_flat(x, i, 0.5 + 0.001 * (double)(i % 97));
+    }
+    ocean_tensor_handle_t w = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    ocean_tensor_fill(w, 1.01);
+    ocean_autograd_set_requires_grad(x, true);
+    ocean_autograd_set_requires_grad(w, true);
+
+    /* Each layer saves both mul operands and the relu input. */
+    ocean_tensor_handle_t hidden = x;
+    for (int layer = 0; layer < LAYERS; ++layer) {
+        ocean_tensor_handle_t scaled = ocean_autograd_binary(hidden, w, 2);
+        ocean_tensor_handle_t activated = ocean_autograd_relu(scaled);
+        ocean_tensor_release(scaled);
+        if (hidden != x) ocean_tensor_release(hidden);
+        hidden = activated;
+    }
+    ocean_tensor_handle_t rows = ocean_autograd_sum_dim(hidden, 1, false);
+    ocean_tensor_handle_t loss = ocean_autograd_sum_dim(rows, 0, false);
+    ocean_tensor_release(rows);
+    ocean_tensor_release(hidden);
+
+    size_t before = ocean_tensor_memory_live_bytes();
+    if (before < baseline + (2 + 3 * LAYERS) * bytes) fail("saved activations");
+    ocean_autograd_backward(loss);
+    size_t peak = ocean_autograd_backward_peak_bytes();
+    size_t after = ocean_tensor_memory_live_bytes();
+
+    /* Holding every intermediate gradient until the end would need about
+       2 * LAYERS extra Tensors; early release keeps only a handful. */
+    printf("before=%zu peak=%zu after=%zu tensor=%zu\n", before, peak, after, bytes);
+    if (peak < before) fail("peak below the starting live bytes");
+    if (peak > before + 6 * bytes) fail("backward held released intermediates");
+    if (after > baseline + 5 * bytes) fail("saved tensors outlived backward");
+
+    ocean_tensor_handle_t dx = ocean_autograd_grad_copy(x);
+    ocean_tensor_handle_t dw = ocean_autograd_grad_copy(w);
+    double expected_dx = pow(1.01, LAYERS);
+    double expected_dw = LAYERS * ocean_tensor_get_flat(x, 5) * pow(1.01, LAYERS - 1);
+    if (fabs(ocean_tensor_get_flat(dx, 5) - expected_dx) > 1e-4) fail("input gradient");
+    if (fabs(ocean_tensor_get_flat(dw, 5) - expected_dw) > 1e-3) fail("weight gradient");
+
+    ocean_tensor_release(dw);
+    ocean_tensor_release(dx);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(w);
+    ocean_tensor_release(x);
+
+    puts("autograd backward memory: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "autograd backward memory: OK" in result.stdout
+
+
+def test_window_peak_is_per_thread(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_window_peak.c"
+    binary = tmp_path / "tensor_window_peak"
+
+    source.write_text(
+        r"""
+#include <pthread.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "window peak failed: %s\n", message);
+    exit(1);
+}
+
+/* Resets its own window and allocates far more than the main thread. */
+static void *other_phase(void *argument) {
+    (void)argument;
+    size_t shape[1] = {4 << 20};
+    ocean_tensor_reset_window_peak_memory();
+    size_t start = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t large = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_tensor_release(large);
+    if (ocean_tensor_memory_window_peak_bytes() < start + (16u << 20)) fail("worker window");
+    return NULL;
+}
+
+int main(void) {
+    size_t shape[1] = {1 << 18};
+    ocean_tensor_reset_window_peak_memory();
+    size_t start = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t small = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_tensor_release(small);
+
+    pthread_t thread;
+    if (pthread_create(&thread, NULL, other_phase, NULL) != 0) fail("pthread_create");
+    pthread_join(thread, NULL);
+
+    size_t peak = ocean_tensor_memory_window_peak_bytes();
+    printf("start=%zu peak=%zu\n", start, peak);
+    if (peak < start + (1u << 20)) fail("another thread reset this window");
+    if (peak > start + (2u << 20)) fail("another thread's allocation reached this window");
+    puts("window peak: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "window peak: OK" in result.stdout
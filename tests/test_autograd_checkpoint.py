@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_checkpointed_segments_match_eager_with_lower_peak(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "autograd_checkpoint.c"
+    binary = tmp_path / "autograd_checkpoint"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdbool.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define BLOCKS 8
+#define ROWS 64
+#define WIDTH 32
+#define HIDDEN 128
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd checkpoint failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t parameter(size_t rows, size_t cols, double seed) {
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros(rows, cols, "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, 0.2 * sin(seed + 0.31 * (double)i));
+    }
+    ocean_autograd_set_requires_grad(tensor, true);
+    return tensor;
+}
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+/* x + W2 gelu(LayerNorm(x) W1 + b) with a softmax mixing rows, per block. */
+static ocean_tensor_handle_t block(ocean_tensor_handle_t x, ocean_tensor_handle_t *p) {
+    ocean_tensor_handle_t normalized = ocean_autograd_layer_norm(x, -1, 1e-5);
+    ocean_tensor_handle_t projected = ocean_autograd_matmul(normalized, p[0]);
+    ocean_tensor_handle_t shifted = ocean_autograd_binary(projected, p[1], 0);
+    ocean_tensor_handle_t activated = ocean_autograd_gelu(shifted);
+    ocean_tensor_handle_t transposed = ocean_autograd_transpose_dims(normalized, 0, 1);
+    ocean_tensor_handle_t scores = ocean_autograd_matmul(normalized, transposed);
+    ocean_tensor_handle_t weights = ocean_autograd_softmax(scores, 1);
+    ocean_tensor_handle_t mixed = ocean_autograd_matmul(weights, activated);
+    ocean_tensor_handle_t down = ocean_autograd_matmul(mixed, p[2]);
+    ocean_tensor_handle_t output = ocean_autograd_binary(x, down, 0);
+    ocean_tensor_release(normalized);
+    ocean_tensor_release(projected);
+    ocean_tensor_release(shifted);
+    ocean_tensor_release(activated);
+    ocean_tensor_release(transposed);
+    ocean_tensor_release(scores);
+    ocean_tensor_release(weights);
+    ocean_tensor_release(mixed);
+    ocean_tensor_release(down);
+    return output;
+}
+
+static double step(
+    ocean_tensor_handle_t input, ocean_tensor_handle_t (*p)[3], bool checkpointed,
+    size_t *peak, ocean_tensor_handle_t *input_grad
+) {
+    size_t before = ocean_tensor_memory_live_bytes();
+    ocean_tensor_reset_peak_memory();
+    ocean_tensor_handle_t leaf = ocean_tensor_copy(input);
+    ocean_autograd_set_requires_grad(leaf, true);
+    ocean_tensor_handle_t hidden = leaf;
+    for (int b = 0; b < BLOCKS; ++b) {
+        if (checkpointed) ocean_autograd_checkpoint_begin();
+        ocean_tensor_handle_t next = block(hidden, p[b]);
+        if (checkpointed) ocean_autograd_checkpoint_end(next);
+        if (hidden != leaf) ocean_tensor_release(hidden);
+        hidden = next;
+    }
+    ocean_tensor_handle_t rows = ocean_autograd_sum_dim(hidden, 1, false);
+    ocean_tensor_handle_t loss = ocean_autograd_mean_dim(rows, 0, false);
+    ocean_autograd_backward(loss);
+    *peak = ocean_tensor_memory_peak_bytes() - before;
+    double value = ocean_tensor_item(loss);
+    *input_grad = ocean_autograd_grad_copy(leaf);
+    ocean_autograd_set_requires_grad(leaf, false);
+    ocean_tensor_release(leaf);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(rows);
+    ocean_tensor_release(hidden);
+    return value;
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t eager[BLOCKS][3];
+    ocean_tensor_handle_t saved[BLOCKS][3];
+    for (int b = 0; b < BLOCKS; ++b) {
+        eager[b][0] = parameter(WIDTH, HIDDEN, 0.3 + b);
+        eager[b][1] = parameter(1, HIDDEN, 1.7 + b);
+        eager[b][2] = parameter(HIDDEN, WIDTH, 2.9 + b);
+        saved[b][0] = parameter(WIDTH, HIDDEN, 0.3 + b);
+        saved[b][1] = parameter(1, HIDDEN, 1.7 + b);
+        saved[b][2] = parameter(HIDDEN, WIDTH, 2.9 + b);
+    }
+    ocean_tensor_handle_t input = parameter(ROWS, WIDTH, 5.3);
+    ocean_autograd_set_requires_grad(input, false);
+
+    size_t eager_peak = 0, checkpoint_peak = 0;
+    ocean_tensor_handle_t eager_input_grad = NULL, checkpoint_input_grad = NULL;
+    double start = seconds();
+    double eager_loss = step(input, eager, false, &eager_peak, &eager_input_grad);
+    double eager_time = seconds() - start;
+    start = seconds();
+    double checkpoint_loss = step(input, saved, true, &checkpoint_peak, &checkpoint_input_grad);
+    double checkpoint_time = seconds() - start;
+
+    if (fabs(eager_loss - checkpoint_loss) > 1e-6) fail("loss differs from eager");
+    if (!eager_input_grad || !checkpoint_input_grad) fail("input gradient missing");
+    for (size_t i = 0; i < ocean_tensor_size(eager_input_grad); ++i) {
+        double expected = ocean_tensor_get_flat(eager_input_grad, i);
+        if (fabs(expected - ocean_tensor_get_flat(checkpoint_input_grad, i)) > 1e-5 * (1.0 + fabs(expected))) {
+            fail("checkpointed input gradient differs from eager");
+        }
+    }
+    ocean_tensor_release(eager_input_grad);
+    ocean_tensor_release(checkpoint_input_grad);
+    for (int b = 0; b < BLOCKS; ++b) {
+        for (int k = 0; k < 3; ++k) {
+            ocean_tensor_handle_t left = ocean_autograd_grad_copy(eager[b][k]);
+            ocean_tensor_handle_t right = ocean_autograd_grad_copy(saved[b][k]);
+            if (!left || !right) fail("parameter gradient missing");
+            for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+                double expected = ocean_tensor_get_flat(left, i);
+                if (fabs(expected - ocean_tensor_get_flat(right, i)) > 1e-5 * (1.0 + fabs(expected))) {
+                    fprintf(stderr, "block %d parameter %d index %zu\n", b, k, i);
+                    fail("checkpointed gradient differs from eager");
+                }
+            }
+            ocean_tensor_release(left);
+            ocean_tensor_release(right);
+        }
+    }
+
+    printf("eager peak: %zu bytes, checkpoint peak: %zu bytes\n", eager_peak, checkpoint_peak);
+    printf("checkpoint/eager time: %.2f\n", checkpoint_time / eager_time);
+    if (checkpoint_peak * 2 > eager_peak) fail("checkpointing did not cut the activation peak");
+
+    /* A segment that records nothing leaves its output untouched. */
+    ocean_autograd_checkpoint_begin();
+    ocean_autograd_checkpoint_end(input);
+
+    ocean_tensor_release(input);
+    for (int b = 0; b < BLOCKS; ++b) {
+        for (int k = 0; k < 3; ++k) {
+            ocean_autograd_set_requires_grad(eager[b][k], false);
+            ocean_autograd_set_requires_grad(saved[b][k], false);
+            ocean_tensor_release(eager[b][k]);
+            ocean_tensor_release(saved[b][k]);
+        }
+    }
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("autograd checkpoint: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    print(result.stdout)
+    assert "autograd checkpoint: OK" in result.stdout
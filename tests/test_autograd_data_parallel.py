@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(_MODEL + code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def _run(binary: Path) -> str:
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    print(result.stdout)
+    return result.stdout
+
+
+# A two-layer classifier; every worker trains a replica on its rows of the batch.
+_MODEL = r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define WORKERS 4
+#define PARAMETERS 4
+#define ROWS 64
+#define WIDTH 24
+#define HIDDEN 48
+#define CLASSES 10
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd data parallel failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t parameter(size_t rows, size_t cols, double seed) {
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros(rows, cols, "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, 0.3 * sin(seed + 0.41 * (double)i));
+    }
+    ocean_autograd_set_requires_grad(tensor, true);
+    return tensor;
+}
+
+static void make_parameters(ocean_tensor_handle_t *p) {
+    p[0] = parameter(WIDTH, HIDDEN, 0.2);
+    p[1] = parameter(1, HIDDEN, 1.1);
+    p[2] = parameter(HIDDEN, CLASSES, 2.3);
+    p[3] = parameter(1, CLASSES, 3.7);
+}
+
+static void write_batch(ocean_tensor_handle_t x, ocean_tensor_handle_t y, int step) {
+    size_t rows = ocean_tensor_size(y);
+    for (size_t i = 0; i < rows * WIDTH; ++i) {
+        ocean_tensor_set_flat(x, i, cos(0.05 * (double)i + (double)step));
+    }
+    for (size_t i = 0; i < rows; ++i) {
+        ocean_tensor_set_flat(y, i, (double)((i * 3 + (size_t)step) % CLASSES));
+    }
+}
+
+static ocean_tensor_handle_t loss_of(
+    ocean_tensor_handle_t *p, ocean_tensor_handle_t x, ocean_tensor_handle_t y
+) {
+    ocean_tensor_handle_t mixed = ocean_autograd_matmul(x, p[0]);
+    ocean_tensor_handle_t shifted = ocean_autograd_binary(mixed, p[1], 0);
+    ocean_tensor_handle_t hidden = ocean_autograd_gelu(shifted);
+    ocean_tensor_handle_t scores = ocean_autograd_matmul(hidden, p[2]);
+    ocean_tensor_handle_t logits = ocean_autograd_binary(scores, p[3], 0);
+    ocean_tensor_handle_t loss = ocean_autograd_cross_entropy(logits, y);
+    ocean_tensor_release(mixed);
+    ocean_tensor_release(shifted);
+    ocean_tensor_release(hidden);
+    ocean_tensor_release(scores);
+    ocean_tensor_release(logits);
+    return loss;
+}
+
+"""
+
+
+def test_data_parallel_gradients_match_full_batch(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_data_parallel",
+        r"""
+typedef struct worker_context {
+    ocean_tensor_handle_t replicas[PARAMETERS];
+    ocean_tensor_handle_t x;
+    ocean_tensor_handle_t y;
+    double loss;
+} worker_context;
+
+static void *train_step(void *argument) {
+    worker_context *context = (worker_context *)argument;
+    if (ocean_autograd_data_parallel_worker() < 0) fail("worker index");
+    ocean_tensor_handle_t loss = loss_of(context->replicas, context->x, context->y);
+    ocean_autograd_backward(loss);
+    context->loss = ocean_tensor_item(loss);
+    ocean_tensor_release(loss);
+    return NULL;
+}
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    size_t target_shape[1] = {ROWS};
+    ocean_tensor_handle_t x = ocean_tensor_zeros(ROWS, WIDTH, "cpu");
+    ocean_tensor_handle_t y = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+    ocean_tensor_handle_t eager[PARAMETERS];
+    ocean_tensor_handle_t master[PARAMETERS];
+    make_parameters(eager);
+    make_parameters(master);
+
+    /* Each worker reads a view of its rows of the shared batch Tensors. */
+    int group = ocean_autograd_data_parallel_create(WORKERS);
+    worker_context contexts[WORKERS];
+    for (int k = 0; k < PARAMETERS; ++k) ocean_autograd_data_parallel_add_parameter(group, master[k]);
+    for (int w = 0; w < WORKERS; ++w) {
+        make_parameters(contexts[w].replicas);
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_tensor_fill(contexts[w].replicas[k], 0.0);
+            ocean_autograd_data_parallel_add_replica(group, w, contexts[w].replicas[k]);
+        }
+        int begin = w * ROWS / WORKERS, end = (w + 1) * ROWS / WORKERS;
+        contexts[w].x = ocean_tensor_slice(x, 0, begin, end, 1);
+        contexts[w].y = ocean_tensor_slice(y, 0, begin, end, 1);
+        ocean_autograd_data_parallel_set_context(group, w, &contexts[w]);
+    }
+    if (ocean_autograd_data_parallel_worker() != -1) fail("main thread is not a worker");
+
+    for (int step = 0; step < 4; ++step) {
+        write_batch(x, y, step);
+        ocean_tensor_handle_t loss = loss_of(eager, x, y);
+        ocean_autograd_backward(loss);
+        ocean_autograd_data_parallel_run(group, train_step);
+
+        double mean = 0.0;
+        for (int w = 0; w < WORKERS; ++w) mean += contexts[w].loss / WORKERS;
+        if (fabs(mean - ocean_tensor_item(loss)) > 1e-5) fail("shard losses differ from the batch loss");
+        ocean_tensor_release(loss);
+
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_tensor_handle_t left = ocean_autograd_grad_copy(eager[k]);
+            ocean_tensor_handle_t right = ocean_autograd_grad_copy(master[k]);
+            for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+                if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > 1e-5) {
+                    fprintf(stderr, "step %d parameter %d index %zu\n", step, k, i);
+                    fail("all-reduced gradient differs from the full batch");
+                }
+            }
+            ocean_tensor_release(left);
+            ocean_tensor_release(right);
+            ocean_autograd_sgd_step(eager[k], 0.3);
+            ocean_autograd_sgd_step(master[k], 0.3);
+            ocean_autograd_zero_grad(eager[k]);
+            ocean_autograd_zero_grad(master[k]);
+        }
+    }
+
+    /* Replica gradients live in the workers' autograd state, not here. */
+    if (ocean_autograd_has_grad(contexts[0].replicas[0])) fail("replica gradient leaked to main");
+
+    double start = seconds();
+    for (int step = 0; step < 20; ++step) {
+        ocean_tensor_handle_t loss = loss_of(eager, x, y);
+        ocean_autograd_backward(loss);
+        ocean_tensor_release(loss);
+    }
+    double serial = seconds() - start;
+    start = seconds();
+    for (int step = 0; step < 20; ++step) ocean_autograd_data_parallel_run(group, train_step);
+    double parallel = seconds() - start;
+    printf("serial/data-parallel step time: %.2f\n", serial / parallel);
+
+    ocean_autograd_data_parallel_release(group);
+    for (int w = 0; w < WORKERS; ++w) {
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_autograd_set_requires_grad(contexts[w].replicas[k], false);
+            ocean_tensor_release(contexts[w].replicas[k]);
+        }
+        ocean_tensor_release(contexts[w].x);
+        ocean_tensor_release(contexts[w].y);
+    }
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_autograd_set_requires_grad(eager[k], false);
+        ocean_autograd_set_requires_grad(master[k], false);
+        ocean_tensor_release(eager[k]);
+        ocean_tensor_release(master[k]);
+    }
+    ocean_tensor_release(x);
+    ocean_tensor_release(y);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("autograd data parallel: OK");
+    return 0;
+}
+""",
+    )
+
+    assert "autograd data parallel: OK" in _run(binary)
+
+
+def test_data_parallel_replay_matches_full_batch(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_data_parallel_replay",
+        r"""
+static void check_gradients(ocean_tensor_handle_t *eager, ocean_tensor_handle_t *master, int step) {
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_tensor_handle_t left = ocean_autograd_grad_copy(eager[k]);
+        ocean_tensor_handle_t right = ocean_autograd_grad_copy(master[k]);
+        for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+            if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > 1e-5) {
+                fprintf(stderr, "step %d parameter %d index %zu\n", step, k, i);
+                fail("all-reduced gradient differs from the full batch");
+            }
+        }
+        ocean_tensor_release(left);
+        ocean_tensor_release(right);
+        ocean_autograd_sgd_step(eager[k], 0.3);
+        ocean_autograd_sgd_step(master[k], 0.3);
+        ocean_autograd_zero_grad(eager[k]);
+        ocean_autograd_zero_grad(master[k]);
+    }
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    size_t target_shape[1] = {ROWS};
+    ocean_tensor_handle_t x = ocean_tensor_zeros(ROWS, WIDTH, "cpu");
+    ocean_tensor_handle_t y = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+    ocean_tensor_handle_t eager[PARAMETERS];
+    ocean_tensor_handle_t master[PARAMETERS];
+    ocean_tensor_handle_t replicas[WORKERS][PARAMETERS];
+    ocean_tensor_handle_t shards[WORKERS][2];
+    ocean_tensor_handle_t losses[WORKERS];
+    int tapes[WORKERS];
+    make_parameters(eager);
+    make_parameters(master);
+    write_batch(x, y, 0);
+
+    /* Each replica's step is captured once on the main thread; the workers
+       replay those tapes concurrently. */
+    int group = ocean_autograd_data_parallel_create(WORKERS);
+    for (int k = 0; k < PARAMETERS; ++k) ocean_autograd_data_parallel_add_parameter(group, master[k]);
+    for (int w = 0; w < WORKERS; ++w) {
+        make_parameters(replicas[w]);
+        int begin = w * ROWS / WORKERS, end = (w + 1) * ROWS / WORKERS;
+        shards[w][0] = ocean_tensor_slice(x, 0, begin, end, 1);
+        shards[w][1] = ocean_tensor_slice(y, 0, begin, end, 1);
+        tapes[w] = ocean_autograd_capture_begin();
+        losses[w] = loss_of(replicas[w], shards[w][0], shards[w][1]);
+        ocean_autograd_backward(losses[w]);
+        ocean_autograd_capture_end(tapes[w]);
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_autograd_data_parallel_add_replica(group, w, replicas[w][k]);
+        }
+        ocean_autograd_data_parallel_set_tape(group, w, tapes[w]);
+    }
+
+    for (int step = 0; step < 4; ++step) {
+        write_batch(x, y, step);
+        ocean_tensor_handle_t loss = loss_of(eager, x, y);
+        ocean_autograd_backward(loss);
+        ocean_autograd_data_parallel_replay(group);
+
+        double mean = 0.0;
+        for (int w = 0; w < WORKERS; ++w) mean += ocean_tensor_item(losses[w]) / WORKERS;
+        if (fabs(mean - ocean_tensor_item(loss)) > 1e-5) fail("replayed losses differ from the batch loss");
+        ocean_tensor_release(loss);
+        check_gradients(eager, master, step);
+    }
+
+    ocean_autograd_data_parallel_release(group);
+    for (int w = 0; w < WORKERS; ++w) {
+        ocean_autograd_release_tape(tapes[w]);
+        ocean_tensor_release(losses[w]);
+        ocean_tensor_release(shards[w][0]);
+        ocean_tensor_release(shards[w][1]);
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_autograd_set_requires_grad(replicas[w][k], false);
+            ocean_tensor_release(replicas[w][k]);
+        }
+    }
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_autograd_set_requires_grad(eager[k], false);
+        ocean_autograd_set_requires_grad(master[k], false);
+        ocean_tensor_release(eager[k]);
+        ocean_tensor_release(master[k]);
+    }
+    ocean_tensor_release(x);
+    ocean_tensor_release(y);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("autograd data parallel replay: OK");
+    return 0;
+}
+""",
+    )
+
+    assert "autograd data parallel replay: OK" in _run(binary)
+
+
+def test_data_parallel_uneven_split_matches_full_batch(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_data_parallel_uneven",
+        r"""
+#define UNEVEN_ROWS 10
+
+typedef struct worker_context {
+    ocean_tensor_handle_t replicas[PARAMETERS];
+    ocean_tensor_handle_t x;
+    ocean_tensor_handle_t y;
+    double loss;
+} worker_context;
+
+static void *train_step(void *argument) {
+    worker_context *context = (worker_context *)argument;
+    ocean_tensor_handle_t loss = loss_of(context->replicas, context->x, context->y);
+    ocean_autograd_backward(loss);
+    context->loss = ocean_tensor_item(loss);
+    ocean_tensor_release(loss);
+    return NULL;
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    size_t target_shape[1] = {UNEVEN_ROWS};
+    ocean_tensor_handle_t x = ocean_tensor_zeros(UNEVEN_ROWS, WIDTH, "cpu");
+    ocean_tensor_handle_t y = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+    ocean_tensor_handle_t eager[PARAMETERS];
+    ocean_tensor_handle_t master[PARAMETERS];
+    make_parameters(eager);
+    make_parameters(master);
+
+    /* 10 rows over 4 workers: shards of 2, 3, 2 and 3 rows. */
+    int group = ocean_autograd_data_parallel_create(WORKERS);
+    worker_context contexts[WORKERS];
+    for (int k = 0; k < PARAMETERS; ++k) ocean_autograd_data_parallel_add_parameter(group, master[k]);
+    for (int w = 0; w < WORKERS; ++w) {
+        make_parameters(contexts[w].replicas);
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_autograd_data_parallel_add_replica(group, w, contexts[w].replicas[k]);
+        }
+        int begin = w * UNEVEN_ROWS / WORKERS, end = (w + 1) * UNEVEN_ROWS / WORKERS;
+        contexts[w].x = ocean_tensor_slice(x, 0, begin, end, 1);
+        contexts[w].y = ocean_tensor_slice(y, 0, begin, end, 1);
+        ocean_autograd_data_parallel_set_context(group, w, &contexts[w]);
+        ocean_autograd_data_parallel_set_rows(group, w, (size_t)(end - begin));
+    }
+
+    for (int step = 0; step < 3; ++step) {
+        write_batch(x, y, step);
+        ocean_tensor_handle_t loss = loss_of(eager, x, y);
+        ocean_autograd_backward(loss);
+        ocean_autograd_data_parallel_run(group, train_step);
+
+        double mean = 0.0;
+        for (int w = 0; w < WORKERS; ++w) {
+            mean += contexts[w].loss * (double)ocean_tensor_size(contexts[w].y) / UNEVEN_ROWS;
+        }
+        if (fabs(mean - ocean_tensor_item(loss)) > 1e-5) fail("weighted shard losses differ");
+        ocean_tensor_release(loss);
+
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_tensor_handle_t left = ocean_autograd_grad_copy(eager[k]);
+            ocean_tensor_handle_t right = ocean_autograd_grad_copy(master[k]);
+            for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+                if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > 1e-5) {
+                    fprintf(stderr, "step %d parameter %d index %zu\n", step, k, i);
+                    fail("uneven all-reduced gradient differs from the full batch");
+                }
+            }
+            ocean_tensor_release(left);
+            ocean_tensor_release(right);
+            ocean_autograd_sgd_step(eager[k], 0.3);
+            ocean_autograd_sgd_step(master[k], 0.3);
+            ocean_autograd_zero_grad(eager[k]);
+            ocean_autograd_zero_grad(master[k]);
+        }
+    }
+
+    ocean_autograd_data_parallel_release(group);
+    for (int w = 0; w < WORKERS; ++w) {
+        for (int k = 0; k < PARAMETERS; ++k) {
+            ocean_autograd_set_requires_grad(contexts[w].replicas[k], false);
+            ocean_tensor_release(contexts[w].replicas[k]);
+        }
+        ocean_tensor_release(contexts[w].x);
+        ocean_tensor_release(contexts[w].y);
+    }
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_autograd_set_requires_grad(eager[k], false);
+        ocean_autograd_set_requires_grad(master[k], false);
+        ocean_tensor_release(eager[k]);
+        ocean_tensor_release(master[k]);
+    }
+    ocean_tensor_release(x);
+    ocean_tensor_release(y);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("autograd data parallel uneven: OK");
+    return 0;
+}
+""",
+    )
+
+    assert "autograd data parallel uneven: OK" in _run(binary)
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+_COMMON = r"""
+#include <math.h>
+#include <stdbool.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "fused attention failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t filled(size_t batch, size_t heads, size_t rows, size_t cols, double seed) {
+    size_t shape[4] = {batch, heads, rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 4, "float32", "cpu");
+    for (size_t i = 0; i < batch * heads * rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, sin(seed + 0.61 * (double)i) * (1.0 + 0.5 * cos(0.07 * (double)i)));
+    }
+    return tensor;
+}
+
+/* softmax(q k^T / sqrt(d) + mask) v from the existing autograd operations. */
+static ocean_tensor_handle_t composed(
+    ocean_tensor_handle_t q, ocean_tensor_handle_t k, ocean_tensor_handle_t v, bool causal
+) {
+    size_t queries = (size_t)ocean_tensor_shape(q, 2);
+    size_t keys = (size_t)ocean_tensor_shape(k, 2);
+    ocean_tensor_handle_t kt = ocean_autograd_transpose_dims(k, 2, 3);
+    ocean_tensor_handle_t scores = ocean_autograd_matmul(q, kt);
+    ocean_tensor_handle_t scaled = ocean_autograd_scalar(
+        scores, sqrt((double)ocean_tensor_shape(q, 3)), 3
+    );
+    ocean_tensor_handle_t mask = ocean_tensor_zeros(queries, keys, "cpu");
+    if (causal) {
+        for (size_t i = 0; i < queries; ++i) {
+            for (size_t j = i + keys - queries + 1; j < keys; ++j) {
+                ocean_tensor_set_flat(mask, i * keys + j, -1e9);
+            }
+        }
+    }
+    ocean_tensor_handle_t masked = ocean_autograd_binary(scaled, mask, 0);
+    ocean_tensor_handle_t weights = ocean_autograd_softmax(masked, 3);
+    ocean_tensor_handle_t output = ocean_autograd_matmul(weights, v);
+    ocean_tensor_release(kt);
+    ocean_tensor_release(scores);
+    ocean_tensor_release(scaled);
+    ocean_tensor_release(mask);
+    ocean_tensor_release(masked);
+    ocean_tensor_release(weights);
+    return output;
+}
+"""
+
+
+def test_fused_attention_matches_composed_attention(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_fused_attention",
+        _COMMON
+        + r"""
+static void expect_close(ocean_tensor_handle_t left, ocean_tensor_handle_t right, const char *what) {
+    if (ocean_tensor_size(left) != ocean_tensor_size(right)) fail(what);
+    for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+        if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > 2e-5) {
+            fprintf(stderr, "%s index %zu: %f vs %f\n", what, i,
+                    ocean_tensor_get_flat(left, i), ocean_tensor_get_flat(right, i));
+            fail("fused result differs from composed attention");
+        }
+    }
+}
+
+/* Sequence lengths straddle the query tile and key block sizes. */
+static void check(size_t queries, size_t keys, bool causal) {
+    ocean_tensor_handle_t inputs[2][3];
+    ocean_tensor_handle_t outputs[2];
+    for (int path = 0; path < 2; ++path) {
+        inputs[path][0] = filled(2, 3, queries, 8, 0.1);
+        inputs[path][1] = filled(2, 3, keys, 8, 1.7);
+        inputs[path][2] = filled(2, 3, keys, 12, 2.9);
+        for (int i = 0; i < 3; ++i) ocean_autograd_set_requires_grad(inputs[path][i], true);
+        outputs[path] = path == 0
+            ? composed(inputs[path][0], inputs[path][1], inputs[path][2], causal)
+            : ocean_autograd_scaled_dot_product_attention(
+                inputs[path][0], inputs[path][1], inputs[path][2], causal
+            );
+    }
+    expect_close(outputs[0], outputs[1], "output");
+
+    ocean_tensor_handle_t target = filled(2, 3, queries, 12, 4.3);
+    for (int path = 0; path < 2; ++path) {
+        ocean_tensor_handle_t loss = ocean_autograd_mse_loss(outputs[path], target);
+        ocean_autograd_backward(loss);
+        ocean_tensor_release(loss);
+    }
+    const char *names[3] = {"dq", "dk", "dv"};
+    for (int i = 0; i < 3; ++i) {
+        ocean_tensor_handle_t left = ocean_autograd_grad_copy(inputs[0][i]);
+        ocean_tensor_handle_t right = ocean_autograd_grad_copy(inputs[1][i]);
+        expect_close(left, right, names[i]);
+        ocean_tensor_release(left);
+        ocean_tensor_release(right);
+    }
+
+    ocean_tensor_release(target);
+    for (int path = 0; path < 2; ++path) {
+        ocean_tensor_release(outputs[path]);
+        for (int i = 0; i < 3; ++i) {
+            ocean_autograd_set_requires_grad(inputs[path][i], false);
+            ocean_tensor_release(inputs[path][i]);
+        }
+    }
+}
+
+static void check_thread_count_invariance(void) {
+    ocean_tensor_handle_t q = filled(2, 4, 150, 16, 0.3);
+    ocean_tensor_handle_t k = filled(2, 4, 150, 16, 1.1);
+    ocean_tensor_handle_t v = filled(2, 4, 150, 16, 2.2);
+    ocean_tensor_handle_t upstream = filled(2, 4, 150, 16, 3.3);
+    ocean_tensor_handle_t results[2][4];
+    for (int run = 0; run < 2; ++run) {
+        ocean_tensor_set_num_threads(run == 0 ? 1 : 4);
+        ocean_tensor_handle_t lse = NULL;
+        results[run][0] = ocean_tensor_scaled_dot_product_attention_forward(q, k, v, true, &lse);
+        ocean_tensor_scaled_dot_product_attention_backward(
+            upstream, q, k, v, results[run][0], lse, true,
+            &results[run][1], &results[run][2], &results[run][3]
+        );
+        ocean_tensor_release(lse);
+    }
+    ocean_tensor_set_num_threads(0);
+    for (int i = 0; i < 4; ++i) {
+        for (size_t index = 0; index < ocean_tensor_size(results[0][i]); ++index) {
+            if (ocean_tensor_get_flat(results[0][i], index)
+                != ocean_tensor_get_flat(results[1][i], index)) {
+                fail("result depends on the thread count");
+            }
+        }
+        ocean_tensor_release(results[0][i]);
+        ocean_tensor_release(results[1][i]);
+    }
+    ocean_tensor_release(upstream);
+    ocean_tensor_release(q);
+    ocean_tensor_release(k);
+    ocean_tensor_release(v);
+}
+
+/* A captured step replays through the fused node. */
+static void check_replay(void) {
+    ocean_tensor_handle_t q = filled(1, 2, 40, 8, 0.5);
+    ocean_tensor_handle_t k = filled(1, 2, 40, 8, 1.5);
+    ocean_tensor_handle_t v = filled(1, 2, 40, 8, 2.5);
+    ocean_tensor_handle_t target = filled(1, 2, 40, 8, 3.5);
+    ocean_autograd_set_requires_grad(q, true);
+
+    int tape = ocean_autograd_capture_begin();
+    ocean_tensor_handle_t output = ocean_autograd_scaled_dot_product_attention(q, k, v, true);
+    ocean_tensor_handle_t loss = ocean_autograd_mse_loss(output, target);
+    ocean_autograd_backward(loss);
+    ocean_autograd_capture_end(tape);
+
+    ocean_tensor_handle_t fresh = filled(1, 2, 40, 8, 7.5);
+    ocean_tensor_copy_into(q, fresh);
+    ocean_autograd_zero_grad(q);
+    ocean_autograd_replay(tape);
+    ocean_tensor_handle_t replayed = ocean_autograd_grad_copy(q);
+
+    ocean_autograd_set_requires_grad(fresh, true);
+    ocean_tensor_handle_t eager_output = ocean_autograd_scaled_dot_product_attention(fresh, k, v, true);
+    ocean_tensor_handle_t eager_loss = ocean_autograd_mse_loss(eager_output, target);
+    ocean_autograd_backward(eager_loss);
+    ocean_tensor_handle_t eager = ocean_autograd_grad_copy(fresh);
+    if (fabs(ocean_tensor_item(loss) - ocean_tensor_item(eager_loss)) > 1e-6) {
+        fail("replayed loss differs from eager");
+    }
+    expect_close(eager, replayed, "replayed dq");
+
+    ocean_tensor_release(eager);
+    ocean_tensor_release(replayed);
+    ocean_tensor_release(eager_loss);
+    ocean_tensor_release(eager_output);
+    ocean_autograd_release_tape(tape);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(output);
+    ocean_autograd_set_requires_grad(fresh, false);
+    ocean_autograd_set_requires_grad(q, false);
+    ocean_tensor_release(fresh);
+    ocean_tensor_release(target);
+    ocean_tensor_release(q);
+    ocean_tensor_release(k);
+    ocean_tensor_release(v);
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    check(77, 77, true);
+    check(77, 77, false);
+    check(5, 77, true);
+    check(130, 9, false);
+    check_thread_count_invariance();
+    check_replay();
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("fused attention: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "fused attention: OK" in result.stdout
+
+
+def test_fused_attention_memory_and_speed(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_fused_attention_benchmark",
+        _COMMON
+        + r"""
+#define HEADS 4
+#define SEQUENCE 512
+#define DEPTH 64
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+static double step(bool fused, ocean_tensor_handle_t *inputs, ocean_tensor_handle_t target,
+                   size_t *peak_out) {
+    size_t before = ocean_tensor_memory_live_bytes();
+    double start = seconds();
+    ocean_tensor_handle_t output = fused
+        ? ocean_autograd_scaled_dot_product_attention(inputs[0], inputs[1], inputs[2], true)
+        : composed(inputs[0], inputs[1], inputs[2], true);
+    *peak_out = ocean_tensor_memory_live_bytes() - before;
+    ocean_tensor_handle_t loss = ocean_autograd_mse_loss(output, target);
+    ocean_autograd_backward(loss);
+    double elapsed = seconds() - start;
+    ocean_tensor_release(loss);
+    ocean_tensor_release(output);
+    for (int i = 0; i < 3; ++i) ocean_autograd_zero_grad(inputs[i]);
+    return elapsed;
+}
+
+int main(void) {
+    ocean_tensor_handle_t inputs[3] = {
+        filled(1, HEADS, SEQUENCE, DEPTH, 0.2),
+        filled(1, HEADS, SEQUENCE, DEPTH, 1.2),
+        filled(1, HEADS, SEQUENCE, DEPTH, 2.2),
+    };
+    ocean_tensor_handle_t target = filled(1, HEADS, SEQUENCE, DEPTH, 3.2);
+    for (int i = 0; i < 3; ++i) ocean_autograd_set_requires_grad(inputs[i], true);
+
+    double composed_time = 1e30, fused_time = 1e30;
+    size_t composed_bytes = 0, fused_bytes = 0;
+    for (int round = 0; round < 3; ++round) {
+        double elapsed = step(false, inputs, target, &composed_bytes);
+        if (elapsed < composed_time) composed_time = elapsed;
+        elapsed = step(true, inputs, target, &fused_bytes);
+        if (elapsed < fused_time) fused_time = elapsed;
+    }
+
+    /* The fused node keeps q, k, v and the output plus one float per query;
+       the composed graph keeps several HEADS x T x T score matrices. */
+    size_t linear = (size_t)HEADS * SEQUENCE * (4 * DEPTH + 1) * sizeof(float);
+    size_t scores = (size_t)HEADS * SEQUENCE * SEQUENCE * sizeof(float);
+    printf("composed attention step: %.1f ms, %zu bytes kept by forward\n",
+           composed_time * 1e3, composed_bytes);
+    printf("fused attention step: %.1f ms, %zu bytes kept by forward\n",
+           fused_time * 1e3, fused_bytes);
+    if (fused_bytes > linear + (size_t)HEADS * SEQUENCE * DEPTH * sizeof(float)) {
+        fail("fused forward kept more than O(T) state per head");
+    }
+    if (composed_bytes < 2 * scores) fail("composed baseline unexpectedly small");
+    if (!(fused_time < composed_time)) fail("fused attention was not faster");
+
+    for (int i = 0; i < 3; ++i) {
+        ocean_autograd_set_requires_grad(inputs[i], false);
+        ocean_tensor_release(inputs[i]);
+    }
+    ocean_tensor_release(target);
+    puts("fused attention benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    print(result.stdout)
+    assert "fused attention benchmark: OK" in result.stdout
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_fused_cross_entropy_matches_reference_and_keeps_no_probabilities(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_fused_cross_entropy",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+/* Three vocab blocks, the last one partial. */
+#define ROWS 37
+#define VOCAB 2500
+
+static void fail(const char *message) {
+    fprintf(stderr, "fused cross-entropy failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t make_logits(size_t rows, size_t vocab) {
+    size_t shape[2] = {rows, vocab};
+    ocean_tensor_handle_t logits = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < rows * vocab; ++i) {
+        /* Large offsets on some rows exercise the running-maximum rescale. */
+        double offset = (i / vocab) % 3 == 0 ? 40.0 * (double)((i % vocab) > vocab / 2) : 0.0;
+        ocean_tensor_set_flat(logits, i, 4.0 * sin(0.37 * (double)i) + offset);
+    }
+    return logits;
+}
+
+static ocean_tensor_handle_t make_targets(size_t rows, size_t vocab) {
+    size_t shape[1] = {rows};
+    ocean_tensor_handle_t targets = ocean_tensor_zeros_nd(shape, 1, "int64", "cpu");
+    for (size_t row = 0; row < rows; ++row) {
+        ocean_tensor_set_flat(targets, row, (double)((row * 977) % vocab));
+    }
+    return targets;
+}
+
+static void check_reference(void) {
+    ocean_tensor_handle_t logits = make_logits(ROWS, VOCAB);
+    ocean_tensor_handle_t targets = make_targets(ROWS, VOCAB);
+    ocean_autograd_set_requires_grad(logits, true);
+
+    ocean_tensor_handle_t loss = ocean_autograd_cross_entropy(logits, targets);
+    ocean_autograd_backward(loss);
+    ocean_tensor_handle_t grad = ocean_autograd_grad_copy(logits);
+
+    double total = 0.0;
+    for (size_t row = 0; row < ROWS; ++row) {
+        double maximum = -INFINITY;
+        for (size_t cls = 0; cls < VOCAB; ++cls) {
+            double value = ocean_tensor_get_flat(logits, row * VOCAB + cls);
+            if (value > maximum) maximum = value;
+        }
+        double sum = 0.0;
+        for (size_t cls = 0; cls < VOCAB; ++cls) {
+            sum += exp(ocean_tensor_get_flat(logits, row * VOCAB + cls) - maximum);
+        }
+        double log_normalizer = maximum + log(sum);
+        size_t target = (size_t)ocean_tensor_get_flat(targets, row);
+        total += log_normalizer - ocean_tensor_get_flat(logits, row * VOCAB + target);
+        for (size_t cls = 0; cls < VOCAB; ++cls) {
+            double expected =
+                exp(ocean_tensor_get_flat(logits, row * VOCAB + cls) - log_normalizer);
+            if (cls == target) expected -= 1.0;
+            expected /= (double)ROWS;
+            if (fabs(ocean_tensor_get_flat(grad, row * VOCAB + cls) - expected) > 1e-6) {
+                fprintf(stderr, "row %zu class %zu\n", row, cls);
+                fail("gradient differs from reference");
+            }
+        }
+    }
+    if (fabs(ocean_tensor_item(loss) - total / ROWS) > 1e-4) fail("loss differs from reference");
+
+    /* The materializing kernel agrees. */
+    ocean_tensor_handle_t probabilities = NULL;
+    ocean_tensor_handle_t materialized =
+        ocean_tensor_cross_entropy_forward(logits, targets, &probabilities);
+    if (fabs(ocean_tensor_item(materialized) - ocean_tensor_item(loss)) > 1e-4) {
+        fail("fused loss differs from materialized loss");
+    }
+
+    ocean_tensor_release(materialized);
+    ocean_tensor_release(probabilities);
+    ocean_tensor_release(grad);
+    ocean_tensor_release(loss);
+    ocean_autograd_set_requires_grad(logits, false);
+    ocean_tensor_release(logits);
+    ocean_tensor_release(targets);
+}
+
+static void run(ocean_tensor_handle_t logits, ocean_tensor_handle_t targets, double *loss_out,
+                ocean_tensor_handle_t *grad_out) {
+    ocean_tensor_handle_t normalizers = NULL;
+    ocean_tensor_handle_t loss = ocean_tensor_cross_entropy_fused(logits, targets, &normalizers);
+    ocean_tensor_handle_t upstream = ocean_tensor_zeros(1, 1, "cpu");
+    ocean_tensor_fill(upstream, 1.0);
+    *loss_out = ocean_tensor_item(loss);
+    *grad_out = ocean_tensor_cross_entropy_fused_backward(upstream, logits, targets, normalizers);
+    ocean_tensor_release(upstream);
+    ocean_tensor_release(normalizers);
+    ocean_tensor_release(loss);
+}
+
+static void check_thread_count_invariance(void) {
+    ocean_tensor_handle_t logits = make_logits(ROWS, VOCAB);
+    ocean_tensor_handle_t targets = make_targets(ROWS, VOCAB);
+    double serial_loss, parallel_loss;
+    ocean_tensor_handle_t serial_grad, parallel_grad;
+    ocean_tensor_set_num_threads(1);
+    run(logits, targets, &serial_loss, &serial_grad);
+    ocean_tensor_set_num_threads(4);
+    run(logits, targets, &parallel_loss, &parallel_grad);
+    ocean_tensor_set_num_threads(0);
+
+    if (serial_loss != parallel_loss) fail("loss depends on the thread count");
+    for (size_t i = 0; i < ROWS * VOCAB; ++i) {
+        if (ocean_tensor_get_flat(serial_grad, i) != ocean_tensor_get_flat(parallel_grad, i)) {
+            fail("gradient depends on the thread count");
+        }
+    }
+    ocean_tensor_release(serial_grad);
+    ocean_tensor_release(parallel_grad);
+    ocean_tensor_release(logits);
+    ocean_tensor_release(targets);
+}
+
+/* Backward uses the logits as they were in forward, not as they are now. */
+static void check_mutated_logits(void) {
+    ocean_tensor_handle_t logits = make_logits(ROWS, VOCAB);
+    ocean_tensor_handle_t reference = make_logits(ROWS, VOCAB);
+    ocean_tensor_handle_t targets = make_targets(ROWS, VOCAB);
+    ocean_autograd_set_requires_grad(logits, true);
+    ocean_autograd_set_requires_grad(reference, true);
+
+    ocean_tensor_handle_t loss = ocean_autograd_cross_entropy(logits, targets);
+    ocean_tensor_handle_t expected_loss = ocean_autograd_cross_entropy(reference, targets);
+    ocean_tensor_fill(logits, 0.0);
+    ocean_autograd_backward(loss);
+    ocean_autograd_backward(expected_loss);
+    ocean_tensor_handle_t grad = ocean_autograd_grad_copy(logits);
+    ocean_tensor_handle_t expected = ocean_autograd_grad_copy(reference);
+    for (size_t i = 0; i < ROWS * VOCAB; ++i) {
+        if (ocean_tensor_get_flat(grad, i) != ocean_tensor_get_flat(expected, i)) {
+            fail("gradient read logits written after forward");
+        }
+    }
+
+    ocean_tensor_release(grad);
+    ocean_tensor_release(expected);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(expected_loss);
+    ocean_autograd_set_requires_grad(logits, false);
+    ocean_autograd_set_requires_grad(reference, false);
+    ocean_tensor_release(logits);
+    ocean_tensor_release(reference);
+    ocean_tensor_release(targets);
+}
+
+static void check_saved_state(void) {
+    size_t rows = 256, vocab = 32000;
+    ocean_tensor_handle_t logits = make_logits(rows, vocab);
+    ocean_tensor_handle_t targets = make_targets(rows, vocab);
+    ocean_autograd_set_requires_grad(logits, true);
+
+    size_t before = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t loss = ocean_autograd_cross_entropy(logits, targets);
+    size_t saved = ocean_tensor_memory_live_bytes() - before;
+    size_t logits_bytes = rows * vocab * sizeof(float);
+    printf("saved for backward: %zu bytes (logits: %zu bytes)\n", saved, logits_bytes);
+    /* The logits copy (its allocation rounded up to a size class), and no
+       probabilities beside it. */
+    if (saved < logits_bytes) fail("forward did not copy the logits");
+    if ((saved - logits_bytes) * 8 > logits_bytes) fail("forward kept a second vocab-sized buffer");
+
+    ocean_autograd_backward(loss);
+    if (!ocean_autograd_has_grad(logits)) fail("logits received no gradient");
+    ocean_tensor_release(loss);
+    ocean_autograd_set_requires_grad(logits, false);
+    ocean_tensor_release(logits);
+    ocean_tensor_release(targets);
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    check_reference();
+    check_thread_count_invariance();
+    check_mutated_logits();
+    check_saved_state();
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("fused cross-entropy: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "fused cross-entropy: OK" in result.stdout
+
+
+def test_fused_cross_entropy_benchmark(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_fused_cross_entropy_benchmark",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define ROWS 256
+#define VOCAB 32000
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+int main(void) {
+    size_t shape[2] = {ROWS, VOCAB};
+    size_t target_shape[1] = {ROWS};
+    ocean_tensor_handle_t logits = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t targets = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+    for (size_t i = 0; i < (size_t)ROWS * VOCAB; ++i) {
+        ocean_tensor_set_flat(logits, i, 3.0 * sin(0.11 * (double)i));
+    }
+    for (size_t row = 0; row < ROWS; ++row) {
+        ocean_tensor_set_flat(targets, row, (double)((row * 7919) % VOCAB));
+    }
+    ocean_tensor_handle_t upstream = ocean_tensor_zeros(1, 1, "cpu");
+    ocean_tensor_fill(upstream, 1.0);
+
+    double materialized = 1e30, fused = 1e30;
+    double materialized_loss = 0.0, fused_loss = 0.0;
+    for (int round = 0; round < 3; ++round) {
+        double start = seconds();
+        ocean_tensor_handle_t probabilities = NULL;
+        ocean_tensor_handle_t loss = ocean_tensor_cross_entropy_forward(logits, targets, &probabilities);
+        ocean_tensor_handle_t grad = ocean_tensor_cross_entropy_backward(upstream, probabilities, targets);
+        double elapsed = seconds() - start;
+        if (elapsed < materialized) materialized = elapsed;
+        materialized_loss = ocean_tensor_item(loss);
+        ocean_tensor_release(grad);
+        ocean_tensor_release(probabilities);
+        ocean_tensor_release(loss);
+
+        start = seconds();
+        ocean_tensor_handle_t normalizers = NULL;
+        loss = ocean_tensor_cross_entropy_fused(logits, targets, &normalizers);
+        grad = ocean_tensor_cross_entropy_fused_backward(upstream, logits, targets, normalizers);
+        elapsed = seconds() - start;
+        if (elapsed < fused) fused = elapsed;
+        fused_loss = ocean_tensor_item(loss);
+        ocean_tensor_release(grad);
+        ocean_tensor_release(normalizers);
+        ocean_tensor_release(loss);
+    }
+
+    printf("materialized forward+backward: %.1f ms\n", materialized * 1e3);
+    printf("fused forward+backward: %.1f ms\n", fused * 1e3);
+    if (fabs(materialized_loss - fused_loss) > 1e-4) {
+        fprintf(stderr, "losses differ: %f %f\n", materialized_loss, fused_loss);
+        return 1;
+    }
+
+    ocean_tensor_release(upstream);
+    ocean_tensor_release(logits);
+    ocean_tensor_release(targets);
+    puts("fused cross-entropy benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "fused cross-entropy benchmark: OK" in result.stdout
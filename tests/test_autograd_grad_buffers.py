@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_gradients_accumulate_in_place_into_persistent_buffers(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "autograd_grad_buffers.c"
+    binary = tmp_path / "autograd_grad_buffers"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd grad buffers failed: %s\n", message);
+    exit(1);
+}
+
+/* loss = sum(w * 2) + sum(w^T * 3)^T-shaped + sum(w): every use of w adds a
+   contribution, one of them a transpose view of its upstream gradient. */
+static void step(ocean_tensor_handle_t w) {
+    ocean_tensor_handle_t doubled = ocean_autograd_scalar(w, 2.0, 2);
+    ocean_tensor_handle_t flipped = ocean_autograd_transpose(w);
+    ocean_tensor_handle_t tripled = ocean_autograd_scalar(flipped, 3.0, 2);
+    ocean_tensor_handle_t back = ocean_autograd_transpose(tripled);
+    ocean_tensor_handle_t partial = ocean_autograd_binary(doubled, back, 0);
+    ocean_tensor_handle_t total = ocean_autograd_binary(partial, w, 0);
+    ocean_tensor_handle_t rows = ocean_autograd_sum_dim(total, 1, false);
+    ocean_tensor_handle_t loss = ocean_autograd_sum_dim(rows, 0, false);
+    ocean_autograd_backward(loss);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(rows);
+    ocean_tensor_release(total);
+    ocean_tensor_release(partial);
+    ocean_tensor_release(back);
+    ocean_tensor_release(tripled);
+    ocean_tensor_release(flipped);
+    ocean_tensor_release(doubled);
+}
+
+static void expect_grad(ocean_tensor_handle_t w, double value, const char *what) {
+    ocean_tensor_handle_t grad = ocean_autograd_grad_copy(w);
+    for (size_t i = 0; i < ocean_tensor_size(grad); ++i) {
+        if (fabs(ocean_tensor_get_flat(grad, i) - value) > 1e-5) fail(what);
+    }
+    ocean_tensor_release(grad);
+}
+
+int main(void) {
+    ocean_tensor_handle_t w = ocean_tensor_zeros(3, 5, "cpu");
+    ocean_tensor_fill(w, 0.25);
+    ocean_autograd_set_requires_grad(w, true);
+
+    step(w);
+    expect_grad(w, 6.0, "first backward");
+    step(w);
+    expect_grad(w, 12.0, "accumulating backward");
+
+    /* zero_grad() keeps a zero-filled buffer; steady-state steps then
+       allocate no gradient storage that outlives backward(). */
+    ocean_autograd_zero_grad(w);
+    if (!ocean_autograd_has_grad(w)) fail("zero_grad dropped the buffer");
+    expect_grad(w, 0.0, "zero_grad");
+    size_t live = ocean_tensor_memory_live_bytes();
+    for (int i = 0; i < 3; ++i) {
+        ocean_autograd_zero_grad(w);
+        step(w);
+        if (ocean_tensor_memory_live_bytes() != live) fail("gradient storage grew");
+    }
+    expect_grad(w, 6.0, "steady-state step");
+
+    /* clear_grad() makes the gradient absent but parks its buffer. */
+    ocean_autograd_clear_grad(w);
+    if (ocean_autograd_has_grad(w)) fail("clear_grad left a gradient");
+    if (ocean_tensor_memory_live_bytes() != live) fail("clear_grad freed the buffer");
+    step(w);
+    expect_grad(w, 6.0, "backward after clear_grad");
+    if (ocean_tensor_memory_live_bytes() != live) fail("parked buffer was not reused");
+
+    /* The optimizer reads the accumulated buffer. */
+    ocean_autograd_sgd_step(w, 0.01);
+    if (fabs(ocean_tensor_get_flat(w, 7) - (0.25 - 0.06)) > 1e-6) fail("SGD after accumulation");
+
+    ocean_autograd_set_requires_grad(w, false);
+    ocean_tensor_release(w);
+    puts("autograd grad buffers: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "autograd grad buffers: OK" in result.stdout
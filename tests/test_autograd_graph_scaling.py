@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_autograd_graph_construction_and_backward_scale_linearly(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "autograd_scaling.c"
+    binary = tmp_path / "autograd_scaling"
+
+    source.write_text(
+        r"""
+#define _POSIX_C_SOURCE 199309L
+
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd graph scaling failed: %s\n", message);
+    exit(1);
+}
+
+static double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+/* Records `nodes` scalar ops, each of which looks up its input's metadata. */
+static ocean_tensor_handle_t chain(ocean_tensor_handle_t x, int nodes) {
+    ocean_tensor_handle_t current = ocean_autograd_scalar(x, 1.0, 2);
+    for (int i = 1; i < nodes; ++i) {
+        ocean_tensor_handle_t next = ocean_autograd_scalar(current, i % 2 ? 0.5 : 2.0, 2);
+        ocean_tensor_release(current);
+        current = next;
+    }
+    return current;
+}
+
+static double build_seconds(int nodes) {
+    size_t shape[1] = {1};
+    ocean_tensor_handle_t x = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_autograd_set_requires_grad(x, true);
+    double start = now();
+    ocean_tensor_handle_t y = chain(x, nodes);
+    double elapsed = now() - start;
+    ocean_tensor_release(y);
+    ocean_tensor_release(x);
+    return elapsed;
+}
+
+/* A chain this deep would overflow a recursive traversal. */
+static double backward_seconds(int nodes) {
+    size_t shape[1] = {1};
+    ocean_tensor_handle_t x = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_tensor_fill(x, 3.0);
+    ocean_autograd_set_requires_grad(x, true);
+    ocean_tensor_handle_t y = chain(x, nodes);
+    double start = now();
+    ocean_autograd_backward(y);
+    double elapsed = now() - start;
+    ocean_tensor_handle_t grad = ocean_autograd_grad_copy(x);
+    if (fabs(ocean_tensor_get_flat(grad, 0) - 1.0) > 1e-6) fail("deep chain gradient");
+    ocean_tensor_release(grad);
+    ocean_tensor_release(y);
+    ocean_tensor_release(x);
+    return elapsed;
+}
+
+int main(void) {
+    /* Metadata from each graph stays registered, so every build runs
+       against a registry at least as large as the graph itself. */
+    double small = build_seconds(25000);
+    double large = build_seconds(100000);
+    printf("25k nodes: %.4fs, 100k nodes: %.4fs\n", small, large);
+    if (large > 10.0 * small + 0.05) fail("graph construction is superlinear");
+
+    small = backward_seconds(25001);
+    large = backward_seconds(100001);
+    printf("backward 25k nodes: %.4fs, 100k nodes: %.4fs\n", small, large);
+    if (large > 10.0 * small + 0.05) fail("backward is superlinear");
+
+    /* Shared inputs are visited once and receive every contribution. */
+    size_t shape[1] = {1};
+    ocean_tensor_handle_t x = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_tensor_fill(x, 3.0);
+    ocean_autograd_set_requires_grad(x, true);
+    ocean_tensor_handle_t square = ocean_autograd_binary(x, x, 2);
+    ocean_tensor_handle_t y = ocean_autograd_binary(square, x, 0);
+    ocean_autograd_backward(y);
+    ocean_tensor_handle_t grad = ocean_autograd_grad_copy(x);
+    if (fabs(ocean_tensor_get_flat(grad, 0) - 7.0) > 1e-6) fail("shared input gradient");
+    ocean_tensor_release(grad);
+    ocean_tensor_release(y);
+    ocean_tensor_release(square);
+    ocean_tensor_release(x);
+
+    puts("autograd graph scaling: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "autograd graph scaling: OK" in result.stdout
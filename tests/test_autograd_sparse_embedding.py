@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_sparse_embedding_gradients_and_updates(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_sparse_embedding",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define VOCAB 40
+#define WIDTH 6
+
+static void fail(const char *message) {
+    fprintf(stderr, "sparse embedding gradients failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t parameter(size_t rows, size_t cols, double seed) {
+    size_t shape[2] = {rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, 0.3 * sin(seed + 0.37 * (double)i));
+    }
+    ocean_autograd_set_requires_grad(tensor, true);
+    return tensor;
+}
+
+/* Tokens repeat within a batch and only part of the table is looked up. */
+static ocean_tensor_handle_t batch(int step, size_t stride) {
+    size_t shape[2] = {3, 5};
+    ocean_tensor_handle_t tokens = ocean_tensor_zeros_nd(shape, 2, "int64", "cpu");
+    for (size_t i = 0; i < 15; ++i) {
+        ocean_tensor_set_flat(tokens, i, (double)((i * stride + (size_t)step * 7) % VOCAB));
+    }
+    return tokens;
+}
+
+static ocean_tensor_handle_t loss_of(
+    ocean_tensor_handle_t table,
+    ocean_tensor_handle_t projection,
+    ocean_tensor_handle_t tokens,
+    bool tied
+) {
+    size_t flat_shape[2] = {15, WIDTH};
+    ocean_tensor_handle_t hidden = ocean_autograd_embedding(table, tokens);
+    ocean_tensor_handle_t flat = ocean_autograd_reshape(hidden, flat_shape, 2);
+    ocean_tensor_handle_t mixed = ocean_autograd_matmul(flat, projection);
+    ocean_tensor_handle_t activated = ocean_autograd_gelu(mixed);
+    ocean_tensor_handle_t logits = activated;
+    ocean_tensor_handle_t transposed = NULL;
+    if (tied) {
+        /* Output projection tied to the table: a dense use of it. */
+        transposed = ocean_autograd_transpose_dims(table, 0, 1);
+        logits = ocean_autograd_matmul(activated, transposed);
+    }
+    ocean_tensor_handle_t rows = ocean_autograd_sum_dim(logits, 1, false);
+    ocean_tensor_handle_t squared = ocean_autograd_pow(rows, 2.0);
+    ocean_tensor_handle_t loss = ocean_autograd_mean_dim(squared, 0, false);
+    ocean_tensor_release(squared);
+    ocean_tensor_release(rows);
+    if (tied) {
+        ocean_tensor_release(logits);
+        ocean_tensor_release(transposed);
+    }
+    ocean_tensor_release(activated);
+    ocean_tensor_release(mixed);
+    ocean_tensor_release(flat);
+    ocean_tensor_release(hidden);
+    return loss;
+}
+
+static void expect_close(
+    ocean_tensor_handle_t left, ocean_tensor_handle_t right, double tolerance, const char *message
+) {
+    if (ocean_tensor_size(left) != ocean_tensor_size(right)) fail(message);
+    for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+        if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > tolerance) {
+            fprintf(stderr, "index %zu: %.9g vs %.9g\n", i,
+                    ocean_tensor_get_flat(left, i), ocean_tensor_get_flat(right, i));
+            fail(message);
+        }
+    }
+}
+
+static void expect_grads_match(ocean_tensor_handle_t dense, ocean_tensor_handle_t sparse) {
+    ocean_tensor_handle_t left = ocean_autograd_grad_copy(dense);
+    ocean_tensor_handle_t right = ocean_autograd_grad_copy(sparse);
+    expect_close(left, right, 1e-6, "gradient differs from the dense gradient");
+    ocean_tensor_release(left);
+    ocean_tensor_release(right);
+}
+
+static void check_rows(void) {
+    ocean_tensor_handle_t dense = parameter(VOCAB, WIDTH, 0.1);
+    ocean_tensor_handle_t sparse = parameter(VOCAB, WIDTH, 0.1);
+    ocean_tensor_handle_t projection = parameter(WIDTH, WIDTH, 0.7);
+    ocean_autograd_set_sparse_grad(sparse, true);
+
+    /* Two lookups accumulate into one row-sparse gradient. */
+    for (int step = 0; step < 2; ++step) {
+        ocean_tensor_handle_t tokens = batch(step, 3);
+        ocean_tensor_handle_t left = loss_of(dense, projection, tokens, false);
+        ocean_tensor_handle_t right = loss_of(sparse, projection, tokens, false);
+        ocean_autograd_backward(left);
+        ocean_autograd_backward(right);
+        ocean_tensor_release(left);
+        ocean_tensor_release(right);
+        ocean_tensor_release(tokens);
+    }
+    expect_grads_match(dense, sparse);
+
+    ocean_tensor_handle_t rows = ocean_autograd_sparse_grad_rows(sparse);
+    ocean_tensor_handle_t values = ocean_autograd_sparse_grad_values(sparse);
+    ocean_tensor_handle_t full = ocean_autograd_grad_copy(dense);
+    bool seen[VOCAB] = {false};
+    for (size_t i = 0; i < ocean_tensor_size(rows); ++i) {
+        size_t row = (size_t)ocean_tensor_get_flat(rows, i);
+        if (seen[row]) fail("row listed twice");
+        seen[row] = true;
+        for (size_t k = 0; k < WIDTH; ++k) {
+            if (ocean_tensor_get_flat(values, i * WIDTH + k) !=
+                ocean_tensor_get_flat(full, row * WIDTH + k)) {
+                fail("row values differ from the dense gradient");
+            }
+        }
+    }
+    for (size_t row = 0; row < VOCAB; ++row) {
+        if (seen[row]) continue;
+        for (size_t k = 0; k < WIDTH; ++k) {
+            if (ocean_tensor_get_flat(full, row * WIDTH + k) != 0.0) fail("touched row missing");
+        }
+    }
+    if (ocean_tensor_size(rows) >= VOCAB) fail("every row was kept");
+    ocean_tensor_release(rows);
+    ocean_tensor_release(values);
+    ocean_tensor_release(full);
+
+    ocean_autograd_zero_grad(sparse);
+    if (ocean_autograd_has_grad(sparse)) fail("zero_grad kept sparse rows");
+
+    /* A tied output projection makes the table's gradient dense. */
+    ocean_autograd_zero_grad(dense);
+    ocean_autograd_zero_grad(projection);
+    ocean_tensor_handle_t tokens = batch(5, 3);
+    ocean_tensor_handle_t left = loss_of(dense, projection, tokens, true);
+    ocean_tensor_handle_t right = loss_of(sparse, projection, tokens, true);
+    ocean_autograd_backward(left);
+    ocean_autograd_backward(right);
+    expect_grads_match(dense, sparse);
+    ocean_tensor_release(left);
+    ocean_tensor_release(right);
+    ocean_tensor_release(tokens);
+
+    ocean_autograd_set_requires_grad(dense, false);
+    ocean_autograd_set_requires_grad(sparse, false);
+    ocean_autograd_set_requires_grad(projection, false);
+    ocean_tensor_release(dense);
+    ocean_tensor_release(sparse);
+    ocean_tensor_release(projection);
+}
+
+/* Staged SGD and AdamW with row-sparse tables against dense ones.  With
+   `stride` 3 every row is looked up each step, where lazy AdamW must equal
+   dense AdamW; otherwise SGD must still match, since rows without gradient
+   do not move. */
+static void check_optimizer(bool adamw, size_t stride) {
+    ocean_tensor_handle_t dense[2] = {parameter(VOCAB, WIDTH, 0.1), parameter(WIDTH, 4, 0.7)};
+    ocean_tensor_handle_t sparse[2] = {parameter(VOCAB, WIDTH, 0.1), parameter(WIDTH, 4, 0.7)};
+    ocean_autograd_set_sparse_grad(sparse[0], true);
+    int dense_state = adamw ? ocean_autograd_adamw_create() : ocean_autograd_sgd_create();
+    int sparse_state = adamw ? ocean_autograd_adamw_create() : ocean_autograd_sgd_create();
+
+    for (int step = 0; step < 6; ++step) {
+        ocean_tensor_handle_t tokens = ocean_tensor_zeros_nd((size_t[]){8, 5}, 2, "int64", "cpu");
+        for (size_t i = 0; i < 40; ++i) {
+            ocean_tensor_set_flat(tokens, i, (double)((i * stride + (size_t)step) % VOCAB));
+        }
+        size_t flat_shape[2] = {40, WIDTH};
+        for (int side = 0; side < 2; ++side) {
+            ocean_tensor_handle_t *p = side ? sparse : dense;
+            ocean_tensor_handle_t hidden = ocean_autograd_embedding(p[0], tokens);
+            ocean_tensor_handle_t flat = ocean_autograd_reshape(hidden, flat_shape, 2);
+            ocean_tensor_handle_t mixed = ocean_autograd_matmul(flat, p[1]);
+            ocean_tensor_handle_t squared = ocean_autograd_pow(mixed, 2.0);
+            ocean_tensor_handle_t rows = ocean_autograd_sum_dim(squared, 1, false);
+            ocean_tensor_handle_t loss = ocean_autograd_mean_dim(rows, 0, false);
+            ocean_autograd_backward(loss);
+            ocean_tensor_release(loss);
+            ocean_tensor_release(rows);
+            ocean_tensor_release(squared);
+            ocean_tensor_release(mixed);
+            ocean_tensor_release(flat);
+            ocean_tensor_release(hidden);
+
+            int state = side ? sparse_state : dense_state;
+            for (int k = 0; k < 2; ++k) ocean_autograd_optimizer_stage(state, p[k]);
+            if (adamw) ocean_autograd_adamw_step_staged(state, 0.05, 0.9, 0.99, 1e-8, 0.1);
+            else ocean_autograd_sgd_step_staged(state, 0.1);
+            for (int k = 0; k < 2; ++k) ocean_autograd_zero_grad(p[k]);
+        }
+        ocean_tensor_release(tokens);
+    }
+
+    for (int k = 0; k < 2; ++k) {
+        expect_close(dense[k], sparse[k], 1e-6, "sparse update differs from the dense one");
+        ocean_autograd_set_requires_grad(dense[k], false);
+        ocean_autograd_set_requires_grad(sparse[k], false);
+        ocean_tensor_release(dense[k]);
+        ocean_tensor_release(sparse[k]);
+    }
+}
+
+/* A row skipped by a step catches up on that step's moment and weight
+   decay when it is next updated; untouched rows stay put. */
+/* In-place row writes run after pending lazy reads of their destination. */
+static void check_lazy_scatter(void) {
+    size_t table_shape[2] = {4, 3};
+    size_t value_shape[2] = {2, 3};
+    size_t row_shape[1] = {2};
+    ocean_tensor_handle_t table = ocean_tensor_zeros_nd(table_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t values = ocean_tensor_zeros_nd(value_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t rows = ocean_tensor_zeros_nd(row_shape, 1, "int64", "cpu");
+    ocean_tensor_fill(values, 2.0);
+    ocean_tensor_set_flat(rows, 0, 1.0);
+    ocean_tensor_set_flat(rows, 1, 3.0);
+
+    ocean_tensor_set_lazy_enabled(true);
+    ocean_tensor_handle_t pending = ocean_tensor_scalar(table, 1.0, 0);
+    ocean_tensor_scatter_add_rows(table, rows, values, 2);
+    if (ocean_tensor_get_flat(pending, 3) != 1.0) fail("scatter_add_rows overtook a lazy read");
+    if (ocean_tensor_get_flat(table, 3) != 2.0) fail("scatter_add_rows result");
+
+    ocean_tensor_handle_t slots = ocean_tensor_zeros_nd(table_shape, 1, "int64", "cpu");
+    ocean_tensor_fill(slots, 5.0);
+    ocean_tensor_embedding_rows_reset(slots, rows, 2);
+    ocean_tensor_set_lazy_enabled(false);
+    if (ocean_tensor_get_flat(slots, 1) != -1.0) fail("embedding_rows_reset result");
+
+    ocean_tensor_release(slots);
+    ocean_tensor_release(pending);
+    ocean_tensor_release(rows);
+    ocean_tensor_release(values);
+    ocean_tensor_release(table);
+}
+
+static void check_lazy_adamw(void) {
+    const double lr = 0.05, beta1 = 0.9, beta2 = 0.99, epsilon = 1e-8, decay = 0.1;
+    ocean_tensor_handle_t table = parameter(4, 1, 0.3);
+    ocean_autograd_set_sparse_grad(table, true);
+    int state = ocean_autograd_adamw_create();
+    size_t token_shape[1] = {1};
+    ocean_tensor_handle_t tokens = ocean_tensor_zeros_nd(token_shape, 1, "int64", "cpu");
+    float start[4], value = 0.0f, first = 0.0f, second = 0.0f;
+    for (size_t row = 0; row < 4; ++row) start[row] = (float)ocean_tensor_get_flat(table, row);
+    value = start[1];
+
+    /* Row 1 at steps 1 and 3, row 2 at step 2; rows 0 and 3 never. */
+    const int looked_up[3] = {1, 2, 1};
+    for (int step = 1; step <= 3; ++step) {
+        ocean_tensor_set_flat(tokens, 0, looked_up[step - 1]);
+        ocean_tensor_handle_t hidden = ocean_autograd_embedding(table, tokens);
+        ocean_tensor_handle_t scaled = ocean_autograd_scalar(hidden, 3.0 + step, 2);
+        ocean_tensor_handle_t loss = ocean_autograd_sum_dim(scaled, 0, false);
+        ocean_autograd_backward(loss);
+        ocean_tensor_release(loss);
+        ocean_tensor_release(scaled);
+        ocean_tensor_release(hidden);
+        ocean_autograd_optimizer_stage(state, table);
+        ocean_autograd_adamw_step_staged(state, lr, beta1, beta2, epsilon, decay);
+        ocean_autograd_zero_grad(table);
+
+        if (looked_up[step - 1] != 1) continue;
+        if (step == 3) {
+            first = (float)(first * beta1);
+            second = (float)(second * beta2);
+            value = (float)(value * (1.0 - lr * decay));
+        }
+        double gradient = 3.0 + step;
+        first = (float)(beta1 * first + (1.0 - beta1) * gradient);
+        second = (float)(beta2 * second + (1.0 - beta2) * gradient * gradient);
+        double adaptive = (first / (1.0 - pow(beta1, step)))
+            / (sqrt(second / (1.0 - pow(beta2, step))) + epsilon);
+        value = (float)(value - lr * decay * value - lr * adaptive);
+    }
+
+    if (fabs(ocean_tensor_get_flat(table, 1) - value) > 1e-6) fail("lazy AdamW catch-up");
+    if (ocean_tensor_get_flat(table, 0) != start[0] || ocean_tensor_get_flat(table, 3) != start[3]) {
+        fail("untouched rows moved");
+    }
+    ocean_tensor_release(tokens);
+    ocean_autograd_set_requires_grad(table, false);
+    ocean_tensor_release(table);
+}
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+/* A large table looked up by one batch: gradient memory and AdamW step
+   time, dense against row-sparse. */
+static void benchmark(void) {
+    ocean_tensor_handle_t tables[2];
+    double step_time[2];
+    size_t gradient_bytes[2];
+    size_t token_shape[1] = {512};
+    ocean_tensor_handle_t tokens = ocean_tensor_zeros_nd(token_shape, 1, "int64", "cpu");
+    for (size_t i = 0; i < 512; ++i) ocean_tensor_set_flat(tokens, i, (double)((i * 977) % 50000));
+
+    for (int side = 0; side < 2; ++side) {
+        size_t shape[2] = {50000, 64};
+        tables[side] = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+        ocean_tensor_fill(tables[side], 0.01);
+        ocean_autograd_set_requires_grad(tables[side], true);
+        if (side) ocean_autograd_set_sparse_grad(tables[side], true);
+        int state = ocean_autograd_adamw_create();
+        step_time[side] = 1e30;
+
+        for (int step = 0; step < 6; ++step) {
+            size_t before = ocean_tensor_memory_live_bytes();
+            ocean_tensor_handle_t hidden = ocean_autograd_embedding(tables[side], tokens);
+            ocean_tensor_handle_t rows = ocean_autograd_sum_dim(hidden, 1, false);
+            ocean_tensor_handle_t loss = ocean_autograd_mean_dim(rows, 0, false);
+            ocean_tensor_release(hidden);
+            ocean_tensor_release(rows);
+            ocean_autograd_clear_grad(tables[side]);
+            ocean_autograd_backward(loss);
+            ocean_tensor_release(loss);
+            if (step == 0) gradient_bytes[side] = ocean_tensor_memory_live_bytes() - before;
+
+            double start = seconds();
+            ocean_autograd_optimizer_stage(state, tables[side]);
+            ocean_autograd_adamw_step_staged(state, 0.01, 0.9, 0.999, 1e-8, 0.01);
+            double elapsed = seconds() - start;
+            if (step > 0 && elapsed < step_time[side]) step_time[side] = elapsed;
+        }
+    }
+
+    printf("dense gradient: %zu bytes, AdamW step %.1f us\n", gradient_bytes[0], step_time[0] * 1e6);
+    printf("sparse gradient: %zu bytes, AdamW step %.1f us\n", gradient_bytes[1], step_time[1] * 1e6);
+    if (gradient_bytes[1] * 10 > gradient_bytes[0]) fail("sparse gradient is not small");
+    if (!(step_time[1] < step_time[0])) fail("sparse AdamW step was not faster");
+
+    for (int side = 0; side < 2; ++side) {
+        ocean_autograd_set_requires_grad(tables[side], false);
+        ocean_tensor_release(tables[side]);
+    }
+    ocean_tensor_release(tokens);
+}
+
+int main(void) {
+    check_rows();
+    check_optimizer(false, 8);
+    check_optimizer(true, 3);
+    check_lazy_adamw();
+    check_lazy_scatter();
+    benchmark();
+    puts("sparse embedding gradients: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "sparse embedding gradients: OK" in result.stdout
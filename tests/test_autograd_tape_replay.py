@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_replayed_steps_match_eager_training(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_tape_replay",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define PARAMETERS 5
+#define VOCAB 11
+#define WIDTH 8
+#define HIDDEN 12
+
+static void fail(const char *message) {
+    fprintf(stderr, "autograd tape replay failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t parameter(size_t rows, size_t cols, double seed) {
+    size_t shape[2] = {rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, 0.3 * sin(seed + 0.37 * (double)i));
+    }
+    ocean_autograd_set_requires_grad(tensor, true);
+    return tensor;
+}
+
+static void write_batch(ocean_tensor_handle_t tokens, ocean_tensor_handle_t targets, int step) {
+    for (size_t i = 0; i < 24; ++i) {
+        ocean_tensor_set_flat(tokens, i, (double)((i * 7 + (size_t)step * 3) % VOCAB));
+        ocean_tensor_set_flat(targets, i, (double)((i * 5 + (size_t)step) % VOCAB));
+    }
+}
+
+/* Embedding, matmul, broadcast add/sub, GELU, mean, pow/sqrt, attention-style
+   softmax over a transposed view, LayerNorm and cross-entropy. */
+static ocean_tensor_handle_t forward(
+    ocean_tensor_handle_t *p, ocean_tensor_handle_t tokens, ocean_tensor_handle_t targets
+) {
+    size_t flat_shape[2] = {24, WIDTH};
+    ocean_tensor_handle_t t[18];
+    t[0] = ocean_autograd_embedding(p[0], tokens);
+    t[1] = ocean_autograd_reshape(t[0], flat_shape, 2);
+    t[2] = ocean_autograd_matmul(t[1], p[1]);
+    t[3] = ocean_autograd_binary(t[2], p[2], 0);
+    t[4] = ocean_autograd_gelu(t[3]);
+    t[5] = ocean_autograd_mean_dim(t[4], 1, true);
+    t[6] = ocean_autograd_binary(t[4], t[5], 1);
+    t[7] = ocean_autograd_pow(t[6], 2.0);
+    t[8] = ocean_autograd_scalar(t[7], 1.0, 0);
+    t[9] = ocean_autograd_sqrt(t[8]);
+    t[10] = ocean_autograd_transpose_dims(t[9], 0, 1);
+    t[11] = ocean_autograd_matmul(t[9], t[10]);
+    t[12] = ocean_autograd_scalar(t[11], 0.1, 2);
+    t[13] = ocean_autograd_softmax(t[12], 1);
+    t[14] = ocean_autograd_matmul(t[13], t[9]);
+    t[15] = ocean_autograd_binary(t[14], t[6], 2);
+    t[16] = ocean_autograd_layer_norm(t[15], -1, 1e-5);
+    t[17] = ocean_autograd_matmul(t[16], p[3]);
+    ocean_tensor_handle_t shifted = ocean_autograd_binary(t[17], p[4], 0);
+    ocean_tensor_handle_t loss = ocean_autograd_cross_entropy(shifted, targets);
+    ocean_tensor_release(shifted);
+    for (int i = 0; i < 18; ++i) ocean_tensor_release(t[i]);
+    return loss;
+}
+
+static void make_parameters(ocean_tensor_handle_t *p) {
+    p[0] = parameter(VOCAB, WIDTH, 0.1);
+    p[1] = parameter(WIDTH, HIDDEN, 0.7);
+    p[2] = parameter(1, HIDDEN, 1.3);
+    p[3] = parameter(HIDDEN, VOCAB, 2.9);
+    p[4] = parameter(1, VOCAB, 4.1);
+}
+
+static void compare_and_step(ocean_tensor_handle_t *eager, ocean_tensor_handle_t *replayed) {
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_tensor_handle_t left = ocean_autograd_grad_copy(eager[k]);
+        ocean_tensor_handle_t right = ocean_autograd_grad_copy(replayed[k]);
+        for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+            if (fabs(ocean_tensor_get_flat(left, i) - ocean_tensor_get_flat(right, i)) > 1e-6) {
+                fprintf(stderr, "parameter %d index %zu\n", k, i);
+                fail("replayed gradient differs from eager");
+            }
+        }
+        ocean_tensor_release(left);
+        ocean_tensor_release(right);
+        ocean_autograd_sgd_step(eager[k], 0.5);
+        ocean_autograd_sgd_step(replayed[k], 0.5);
+        ocean_autograd_zero_grad(eager[k]);
+        ocean_autograd_zero_grad(replayed[k]);
+    }
+}
+
+int main(void) {
+    size_t batch_shape[2] = {4, 6};
+    size_t target_shape[1] = {24};
+    ocean_tensor_handle_t eager[PARAMETERS];
+    ocean_tensor_handle_t replayed[PARAMETERS];
+    make_parameters(eager);
+    make_parameters(replayed);
+
+    /* The replayed model reads its batch from these two Tensors. */
+    ocean_tensor_handle_t tokens = ocean_tensor_zeros_nd(batch_shape, 2, "int64", "cpu");
+    ocean_tensor_handle_t targets = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+    write_batch(tokens, targets, 0);
+
+    int tape = ocean_autograd_capture_begin();
+    ocean_tensor_handle_t loss = forward(replayed, tokens, targets);
+    ocean_autograd_backward(loss);
+    ocean_autograd_capture_end(tape);
+
+    size_t steady_live = 0;
+    for (int step = 0; step < 8; ++step) {
+        ocean_tensor_handle_t step_tokens = ocean_tensor_zeros_nd(batch_shape, 2, "int64", "cpu");
+        ocean_tensor_handle_t step_targets = ocean_tensor_zeros_nd(target_shape, 1, "int64", "cpu");
+        write_batch(step_tokens, step_targets, step);
+        ocean_tensor_handle_t eager_loss = forward(eager, step_tokens, step_targets);
+        ocean_autograd_backward(eager_loss);
+
+        if (step > 0) {
+            write_batch(tokens, targets, step);
+            ocean_autograd_replay(tape);
+        }
+        if (fabs(ocean_tensor_item(eager_loss) - ocean_tensor_item(loss)) > 1e-6) {
+            fail("replayed loss differs from eager");
+        }
+        ocean_tensor_release(eager_loss);
+        ocean_tensor_release(step_tokens);
+        ocean_tensor_release(step_targets);
+        compare_and_step(eager, replayed);
+
+        /* Buffers are planned by the capture; replays reuse them. */
+        if (step == 2) steady_live = ocean_tensor_memory_live_bytes();
+        if (step > 2 && ocean_tensor_memory_live_bytes() != steady_live) {
+            fail("replay allocated persistent storage");
+        }
+    }
+
+    /* Captured intermediates are plain Tensors once the tape owns the graph. */
+    if (ocean_autograd_requires_grad(loss)) fail("loss still tracked after capture");
+
+    ocean_autograd_release_tape(tape);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(tokens);
+    ocean_tensor_release(targets);
+    for (int k = 0; k < PARAMETERS; ++k) {
+        ocean_tensor_release(eager[k]);
+        ocean_tensor_release(replayed[k]);
+    }
+    puts("autograd tape replay: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "autograd tape replay: OK" in result.stdout
+
+
+def test_replay_removes_per_step_graph_overhead(tmp_path):
+    binary = _build(
+        tmp_path,
+        "autograd_tape_benchmark",
+        r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define LAYERS 60
+#define STEPS 40
+
+/* Small Tensors and many operations: per-step cost is mostly bookkeeping. */
+static ocean_tensor_handle_t weights[LAYERS];
+
+static ocean_tensor_handle_t step_loss(ocean_tensor_handle_t input) {
+    ocean_tensor_handle_t hidden = ocean_tensor_copy(input);
+    for (int layer = 0; layer < LAYERS; ++layer) {
+        ocean_tensor_handle_t mixed = ocean_autograd_matmul(hidden, weights[layer]);
+        ocean_tensor_handle_t shifted = ocean_autograd_scalar(mixed, 0.01, 0);
+        ocean_tensor_handle_t activated = ocean_autograd_gelu(shifted);
+        ocean_tensor_release(mixed);
+        ocean_tensor_release(shifted);
+        ocean_tensor_release(hidden);
+        hidden = activated;
+    }
+    ocean_tensor_handle_t rows = ocean_autograd_sum_dim(hidden, 1, false);
+    ocean_tensor_handle_t loss = ocean_autograd_mean_dim(rows, 0, false);
+    ocean_tensor_release(rows);
+    ocean_tensor_release(hidden);
+    return loss;
+}
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+int main(void) {
+    for (int layer = 0; layer < LAYERS; ++layer) {
+        weights[layer] = ocean_tensor_zeros(4, 4, "cpu");
+        for (size_t i = 0; i < 16; ++i) {
+            ocean_tensor_set_flat(weights[layer], i, (i % 5 == 0) ? 0.9 : 0.02);
+        }
+        ocean_autograd_set_requires_grad(weights[layer], true);
+    }
+    ocean_tensor_handle_t input = ocean_tensor_zeros(4, 4, "cpu");
+    ocean_tensor_fill(input, 0.5);
+
+    double eager = 1e30, replay = 1e30;
+    for (int round = 0; round < 5; ++round) {
+        double start = seconds();
+        for (int step = 0; step < STEPS; ++step) {
+            ocean_tensor_handle_t loss = step_loss(input);
+            ocean_autograd_backward(loss);
+            ocean_tensor_release(loss);
+        }
+        double elapsed = (seconds() - start) / STEPS;
+        if (elapsed < eager) eager = elapsed;
+    }
+
+    int tape = ocean_autograd_capture_begin();
+    ocean_tensor_handle_t loss = step_loss(input);
+    ocean_autograd_backward(loss);
+    ocean_autograd_capture_end(tape);
+    for (int round = 0; round < 5; ++round) {
+        double start = seconds();
+        for (int step = 0; step < STEPS; ++step) ocean_autograd_replay(tape);
+        double elapsed = (seconds() - start) / STEPS;
+        if (elapsed < replay) replay = elapsed;
+    }
+
+    printf("eager step: %.1f us\n", eager * 1e6);
+    printf("replay step: %.1f us\n", replay * 1e6);
+    if (!(replay < eager)) {
+        fprintf(stderr, "replay was not faster than eager\n");
+        return 1;
+    }
+
+    ocean_autograd_release_tape(tape);
+    ocean_tensor_release(loss);
+    ocean_tensor_release(input);
+    for (int layer = 0; layer < LAYERS; ++layer) ocean_tensor_release(weights[layer]);
+    puts("autograd tape benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "autograd tape benchmark: OK" in result.stdout
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def test_module_checkpoint_v01_ocean(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/checkpoint_v01.oc"
+    c_path = tmp_path / "checkpoint_v01.generated.c"
+    binary = tmp_path / "checkpoint_v01"
+
+    compile_pipeline(
+        source.parent,
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary)
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+
+    stdout = result.stdout
+    before = next(
+        float(line.split("=", 1)[1])
+        for line in stdout.splitlines()
+        if line.startswith("difference before load =")
+    )
+    assert before > 1e-3
+    assert "difference after load = 0.000000" in stdout
+    assert "contains parameters.0 = 1" in stdout
+    assert "contains parameters.999 = 0" in stdout
+    assert "mapped entry = 1" in stdout
+    assert "entry difference = 0.000000" in stdout
+    assert "[ok] Ocean checkpoint v0.1" in stdout
+    assert (tmp_path / "transformer_block.ckpt").read_bytes()[:8] == b"OCEANCKP"
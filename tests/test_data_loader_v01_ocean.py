@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def test_data_loader_v01_ocean(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/data_loader_v01.oc"
+    c_path = tmp_path / "data_loader_v01.generated.c"
+    binary = tmp_path / "data_loader_v01"
+
+    compile_pipeline(
+        source.parent,
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary)
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+
+    stdout = result.stdout
+    assert "batches per epoch = 8" in stdout
+    assert "batches trained = 160" in stdout
+    assert "loss decreased = 1" in stdout
+    assert "token batches per epoch = 2" in stdout
+    assert "targets shifted = 1" in stdout
+    assert "[ok] Ocean data loader v0.1" in stdout
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def test_fused_attention_v01_ocean(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/fused_attention_v01.oc"
+    c_path = tmp_path / "fused_attention_v01.generated.c"
+    binary = tmp_path / "fused_attention_v01"
+
+    compile_pipeline(
+        source.parent,
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(
+        c_path,
+        binary,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "[ok] Ocean fused attention v0.1" in result.stdout
+    assert "q has grad = 1" in result.stdout.lower()
+    assert "k has grad = 1" in result.stdout.lower()
+    assert "v has grad = 1" in result.stdout.lower()
+    assert "attended shape = 1 5 8" in result.stdout
+
+    differences = [
+        float(line.split("=", 1)[1])
+        for line in result.stdout.splitlines()
+        if "difference =" in line
+    ]
+    assert len(differences) == 2
+    assert all(abs(value) < 1e-5 for value in differences)
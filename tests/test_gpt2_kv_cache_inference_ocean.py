@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def test_gpt2_kv_cache_inference_ocean(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/gpt2_kv_cache_inference.oc"
+    c_path = tmp_path / "gpt2_kv_cache_inference.generated.c"
+    binary = tmp_path / "gpt2_kv_cache_inference"
+
+    compile_pipeline(
+        source.parent,
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(
+        c_path,
+        binary,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    print(result.stdout)
+    assert "[ok] Ocean GPT2 KV-cache inference" in result.stdout
+    assert "generated tokens = 256" in result.stdout
+    assert "token mismatches = 0" in result.stdout
+
+    speedup = next(
+        float(line.split("=", 1)[1])
+        for line in result.stdout.splitlines()
+        if line.startswith("speedup =")
+    )
+    assert speedup > 3.0
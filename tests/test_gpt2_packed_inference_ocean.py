@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def test_gpt2_packed_inference_ocean(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/gpt2_packed_inference.oc"
+    c_path = tmp_path / "gpt2_packed_inference.generated.c"
+    binary = tmp_path / "gpt2_packed_inference"
+
+    compile_pipeline(
+        source.parent,
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(
+        c_path,
+        binary,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    print(result.stdout)
+    assert "[ok] Ocean GPT2 packed inference" in result.stdout
+    assert "ternary token mismatches = 0" in result.stdout
+    assert "int8 generated length = 64" in result.stdout
+
+    difference = next(
+        float(line.split("=", 1)[1])
+        for line in result.stdout.splitlines()
+        if line.startswith("ternary relative logit difference =")
+    )
+    assert difference < 1e-4
@@ -33,3 +33,41 @@ def test_affine_layernorm_v01_ocean(tmp_path):
     assert "gamma grad = 1" in stdout
     assert "beta grad = 1" in stdout
     assert "[ok] ocean affine layernorm v0.1" in stdout
+
+
+def test_layernorm_gamma_starts_at_one(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "layernorm_init.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+import <std/ml/nn.oc>
+
+
+def main() -> int:
+    var norm: LayerNorm = LayerNorm(4, 0.00001)
+    var gamma: Tensor[float32] = norm.gamma.tensor()
+    var beta: Tensor[float32] = norm.beta.tensor()
+    var gamma_sum: float64 = gamma.sum()
+    var beta_sum: float64 = beta.sum()
+    print("gamma sum =", gamma_sum)
+    print("beta sum =", beta_sum)
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "layernorm_init.generated.c"
+    binary = tmp_path / "layernorm_init"
+
+    compile_pipeline(root, source, c_path, quiet=True)
+    compile_c(c_path, binary)
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "gamma sum = 4.000000" in result.stdout
+    assert "beta sum = 0.000000" in result.stdout
@@ -308,6 +308,7 @@ ocean_Matrix* ocean_create_Matrix(int rows, int cols) {
     obj->rows = rows;
     obj->cols = cols;
     obj->size = rows * cols;
+    obj->data = ocean_create_list_int(4);
     return obj;
 }
 
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import shlex
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def openblas_available():
+    if shutil.which("pkg-config") is None:
+        return False
+    probe = subprocess.run(["pkg-config", "--exists", "openblas"], check=False)
+    return probe.returncode == 0
+
+
+GEMM_SOURCE = r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "CPU GEMM failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t filled(
+    const size_t *shape, size_t ndim, const char *dtype, double seed
+) {
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, ndim, dtype, "cpu");
+    size_t size = ocean_tensor_size(tensor);
+    for (size_t i = 0; i < size; ++i) {
+        ocean_tensor_set_flat(tensor, i, sin(seed + 0.37 * (double)i));
+    }
+    return tensor;
+}
+
+/* result[b, i, j] = sum_k op(left)[b, i, k] * op(right)[b, k, j] for a
+   shared batch of `batch` matrices (right may be unbatched). */
+static void check(
+    ocean_tensor_handle_t left,
+    ocean_tensor_handle_t right,
+    ocean_tensor_handle_t result,
+    size_t batch, size_t m, size_t n, size_t k,
+    bool right_batched, bool transpose_left, bool transpose_right,
+    double tolerance
+) {
+    for (size_t b = 0; b < batch; ++b) {
+        for (size_t i = 0; i < m; ++i) {
+            for (size_t j = 0; j < n; ++j) {
+                double sum = 0.0;
+                for (size_t p = 0; p < k; ++p) {
+                    size_t li = b * m * k + (transpose_left ? p * m + i : i * k + p);
+                    size_t rb = right_batched ? b * k * n : 0;
+                    size_t ri = rb + (transpose_right ? j * k + p : p * n + j);
+                    sum += ocean_tensor_get_flat(left, li)
+                        * ocean_tensor_get_flat(right, ri);
+                }
+                double actual = ocean_tensor_get_flat(result, (b * m + i) * n + j);
+                if (fabs(actual - sum) > tolerance) {
+                    fprintf(stderr, "[%zu,%zu,%zu] %.9g != %.9g\n", b, i, j, actual, sum);
+                    fail("value mismatch");
+                }
+            }
+        }
+    }
+}
+
+static void run_case(const char *dtype, double tolerance) {
+    /* Sizes straddle the 4x16 microkernel tile and the 64/256 blocks. */
+    const size_t m = 67, n = 261, k = 300;
+
+    size_t a_shape[2] = {m, k};
+    size_t b_shape[2] = {k, n};
+    ocean_tensor_handle_t a = filled(a_shape, 2, dtype, 0.1);
+    ocean_tensor_handle_t b = filled(b_shape, 2, dtype, 0.7);
+    ocean_tensor_handle_t c = ocean_tensor_matmul(a, b);
+    check(a, b, c, 1, m, n, k, false, false, false, tolerance);
+    ocean_tensor_release(c);
+
+    size_t at_shape[2] = {k, m};
+    size_t bt_shape[2] = {n, k};
+    ocean_tensor_handle_t at = filled(at_shape, 2, dtype, 0.3);
+    ocean_tensor_handle_t bt = filled(bt_shape, 2, dtype, 0.9);
+    c = ocean_tensor_matmul_transposed(at, bt, true, true);
+    check(at, bt, c, 1, m, n, k, false, true, true, tolerance);
+    ocean_tensor_release(c);
+    c = ocean_tensor_matmul_transposed(a, bt, false, true);
+    check(a, bt, c, 1, m, n, k, false, false, true, tolerance);
+    ocean_tensor_release(c);
+
+    /* Batched left operand against a broadcast 2D right operand. */
+    size_t batched_shape[3] = {3, m, k};
+    ocean_tensor_handle_t batched = filled(batched_shape, 3, dtype, 1.3);
+    c = ocean_tensor_matmul(batched, b);
+    if (ocean_tensor_ndim(c) != 3 || ocean_tensor_shape(c, 0) != 3) {
+        fail("batched result shape");
+    }
+    check(batched, b, c, 3, m, n, k, false, false, false, tolerance);
+    ocean_tensor_release(c);
+
+    ocean_tensor_release(batched);
+    ocean_tensor_release(bt);
+    ocean_tensor_release(at);
+    ocean_tensor_release(b);
+    ocean_tensor_release(a);
+}
+
+int main(void) {
+    ocean_tensor_set_num_threads(1);
+    run_case("float32", 1e-3);
+    run_case("float64", 1e-9);
+
+    ocean_tensor_set_num_threads(3);
+    if (ocean_tensor_get_num_threads() != 3) fail("thread count was not applied");
+    run_case("float32", 1e-3);
+    run_case("float64", 1e-9);
+
+    size_t empty_shape[2] = {4, 0};
+    size_t right_shape[2] = {0, 5};
+    ocean_tensor_handle_t left = ocean_tensor_zeros_nd(empty_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t right = ocean_tensor_zeros_nd(right_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t product = ocean_tensor_matmul(left, right);
+    if (ocean_tensor_sum(product) != 0.0 || ocean_tensor_size(product) != 20) {
+        fail("zero-depth matmul must produce zeros");
+    }
+    ocean_tensor_release(product);
+    ocean_tensor_release(right);
+    ocean_tensor_release(left);
+
+    ocean_tensor_set_num_threads(0);
+    if (ocean_tensor_get_num_threads() < 1) fail("default thread count");
+
+#ifdef OCEAN_TENSOR_ENABLE_BLAS
+    size_t info_shape[2] = {1, 1};
+    ocean_tensor_handle_t probe = ocean_tensor_zeros_nd(info_shape, 2, "float32", "cpu");
+    char *info = ocean_tensor_device_info(probe);
+    if (strcmp(info, "CPU (BLAS)") != 0) fail("BLAS build must report CPU (BLAS)");
+    free(info);
+    ocean_tensor_release(probe);
+
+    /* int32 has no BLAS routine and must use the built-in fallback. */
+    size_t int_shape[2] = {2, 2};
+    ocean_tensor_handle_t ints = ocean_tensor_zeros_nd(int_shape, 2, "int32", "cpu");
+    for (size_t i = 0; i < 4; ++i) ocean_tensor_set_flat(ints, i, (double)(i + 1));
+    ocean_tensor_handle_t squared = ocean_tensor_matmul(ints, ints);
+    if (ocean_tensor_get_flat(squared, 0) != 7.0 || ocean_tensor_get_flat(squared, 3) != 22.0) {
+        fail("int32 fallback matmul");
+    }
+    ocean_tensor_release(squared);
+    ocean_tensor_release(ints);
+#endif
+
+    puts("CPU GEMM: OK");
+    return 0;
+}
+"""
+
+
+def build_and_run(tmp_path, extra_flags):
+    source = tmp_path / "matmul_gemm.c"
+    binary = tmp_path / "matmul_gemm"
+    source.write_text(GEMM_SOURCE, encoding="utf-8")
+
+    compile_flags = [flag for flag in extra_flags if not flag.startswith("-l")]
+    link_flags = [flag for flag in extra_flags if flag.startswith("-l")]
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            *compile_flags,
+            f"-I{ROOT}",
+            str(source),
+            str(ROOT / "std/tensor/tensor_runtime.c"),
+            *link_flags,
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    return subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_cpu_gemm_matches_reference_for_transposes_batches_and_threads(tmp_path):
+    result = build_and_run(tmp_path, [])
+    assert "CPU GEMM: OK" in result.stdout
+
+
+@pytest.mark.skipif(
+    not openblas_available(),
+    reason="OpenBLAS development package is unavailable",
+)
+def test_blas_backend_matches_reference(tmp_path):
+    blas_flags = shlex.split(
+        subprocess.check_output(
+            ["pkg-config", "--cflags", "--libs", "openblas"], text=True
+        )
+    )
+    result = build_and_run(tmp_path, ["-DOCEAN_TENSOR_ENABLE_BLAS", *blas_flags])
+    assert "CPU GEMM: OK" in result.stdout
+
+
+def test_compile_c_links_blas_only_when_requested(tmp_path, monkeypatch):
+    from main import compile_c, compile_pipeline
+
+    source = tmp_path / "blas_opt_in.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+
+def main() -> int:
+    var a: Tensor[float32] = Tensor.zeros(2, 2, "cpu")
+    var b: Tensor[float32] = a.matmul(a)
+    print(b.device_info())
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "blas_opt_in.c"
+    compile_pipeline(str(ROOT), source, c_path, quiet=True)
+
+    monkeypatch.delenv("OCEAN_TENSOR_BLAS", raising=False)
+    command = compile_c(c_path, tmp_path / "default")
+    assert "-DOCEAN_TENSOR_ENABLE_BLAS" not in command
+    result = subprocess.run(
+        [str(tmp_path / "default")], check=True, capture_output=True, text=True
+    )
+    assert "CPU (BLAS)" not in result.stdout
+
+    if openblas_available():
+        monkeypatch.setenv("OCEAN_TENSOR_BLAS", "1")
+        command = compile_c(c_path, tmp_path / "blas")
+        assert "-DOCEAN_TENSOR_ENABLE_BLAS" in command
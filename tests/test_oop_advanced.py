@@ -49,6 +49,63 @@ def main() -> int:
     assert compile_and_run(source, tmp_path) == "7\n9\n"
 
 
+def test_oop_constructor_runs_statements_between_field_assignments(tmp_path):
+    source = """
+class Counter:
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+
+    def increment(self, amount: int) -> int:
+        self.value = self.value + amount
+        return self.value
+
+class Tally:
+    def __init__(self, steps: int) -> None:
+        self.counter: Counter = Counter(0)
+        self.counter.increment(10)
+        self.odd: int = 0
+        for i in range(steps):
+            if i % 2 == 1:
+                self.odd = self.odd + 1
+
+def main() -> int:
+    var tally: Tally = Tally(5)
+    print(tally.counter.value)
+    print(tally.odd)
+    return 0
+"""
+
+    assert compile_and_run(source, tmp_path) == "10\n2\n"
+
+
+def test_oop_constructor_appends_to_empty_list_field(tmp_path):
+    source = """
+class Config:
+    def __init__(self, layers: int) -> None:
+        self.layers: int = layers
+
+class Stack:
+    def __init__(self, config: Config) -> None:
+        self.sizes: list[int] = []
+        for layer in range(config.layers):
+            self.sizes.append(layer * 10)
+
+    def add(self, size: int) -> int:
+        self.sizes.append(size)
+        var sizes: list[int] = self.sizes
+        return len(sizes)
+
+def main() -> int:
+    var config: Config = Config(3)
+    var stack: Stack = Stack(config)
+    print(stack.sizes[2])
+    print(stack.add(7))
+    return 0
+"""
+
+    assert compile_and_run(source, tmp_path) == "20\n4\n"
+
+
 def test_oop_metadata_has_one_canonical_class_model():
     source = """
 class Counter:
@@ -124,6 +181,28 @@ def main() -> int:
     )
 
 
+def test_oop_inherited_method_receives_arguments(tmp_path):
+    source = """
+class Base:
+    def __init__(self) -> None:
+        self.value: int = 7
+
+    def scaled(self, factor: int, offset: int) -> int:
+        return factor * 5 + offset
+
+class Child(Base):
+    def __init__(self) -> None:
+        pass
+
+def main() -> int:
+    var child: Child = Child()
+    print(child.scaled(3, 2))
+    return 0
+"""
+
+    assert compile_and_run(source, tmp_path) == "17\n"
+
+
 def test_oop_rejects_multiple_inheritance():
     source = """
 class Left:
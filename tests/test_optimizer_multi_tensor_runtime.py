@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_multi_tensor_optimizers_match_per_parameter_updates(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "optimizer_multi_tensor.c"
+    binary = tmp_path / "optimizer_multi_tensor"
+
+    source.write_text(
+        r"""
+#define _POSIX_C_SOURCE 199309L
+
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+#include "std/tensor/autograd_runtime.h"
+
+#define PARAMETERS 300
+
+static void fail(const char *message) {
+    fprintf(stderr, "multi-tensor optimizer failed: %s\n", message);
+    exit(1);
+}
+
+static double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+/* Sizes straddle the parallel grain; one in seven Parameters gets no grad. */
+static void make(ocean_tensor_handle_t *parameters) {
+    for (int p = 0; p < PARAMETERS; ++p) {
+        int cols = p % 50 == 0 ? 70000 : 1 + (p * 37) % 3000;
+        parameters[p] = ocean_tensor_zeros(1, cols, "cpu");
+        for (int i = 0; i < cols; ++i) {
+            ocean_tensor_set_2d(parameters[p], 0, i, sin(0.1 * p + 0.01 * i));
+        }
+        ocean_autograd_set_requires_grad(parameters[p], true);
+    }
+}
+
+static void backward(ocean_tensor_handle_t *parameters) {
+    for (int p = 0; p < PARAMETERS; ++p) {
+        ocean_autograd_zero_grad(parameters[p]);
+        if (p % 7 == 3) continue;
+        ocean_tensor_handle_t target =
+            ocean_tensor_zeros(1, (int)ocean_tensor_size(parameters[p]), "cpu");
+        ocean_tensor_handle_t loss = ocean_autograd_mse_loss(parameters[p], target);
+        ocean_autograd_backward(loss);
+        ocean_tensor_release(loss);
+        ocean_tensor_release(target);
+    }
+}
+
+static void same(ocean_tensor_handle_t *left, ocean_tensor_handle_t *right, const char *what) {
+    for (int p = 0; p < PARAMETERS; ++p) {
+        size_t size = ocean_tensor_size(left[p]);
+        for (size_t i = 0; i < size; ++i) {
+            if (ocean_tensor_get_flat_f32(left[p], i) != ocean_tensor_get_flat_f32(right[p], i)) {
+                fprintf(stderr, "parameter %d index %zu\n", p, i);
+                fail(what);
+            }
+        }
+    }
+}
+
+int main(void) {
+    ocean_tensor_handle_t reference[PARAMETERS];
+    ocean_tensor_handle_t fused[PARAMETERS];
+    make(reference);
+    make(fused);
+
+    int reference_id = ocean_autograd_adamw_create();
+    int fused_id = ocean_autograd_adamw_create();
+    double per_parameter = 0.0, multi_tensor = 0.0;
+    for (int step = 0; step < 4; ++step) {
+        backward(reference);
+        backward(fused);
+
+        double start = now();
+        int current = ocean_autograd_adamw_begin_step(reference_id);
+        for (int p = 0; p < PARAMETERS; ++p) {
+            ocean_autograd_adamw_step(
+                reference_id, current, reference[p], 0.01, 0.9, 0.999, 1e-8, 0.01
+            );
+        }
+        if (step == 1 || step == 2) per_parameter += now() - start;
+
+        /* The last step stages in reverse order, so the flat moment layout
+           is rebuilt and must carry every Parameter's moments over. */
+        start = now();
+        for (int p = 0; p < PARAMETERS; ++p) {
+            int index = step == 3 ? PARAMETERS - 1 - p : p;
+            ocean_autograd_optimizer_stage(fused_id, fused[index]);
+        }
+        ocean_autograd_adamw_step_staged(fused_id, 0.01, 0.9, 0.999, 1e-8, 0.01);
+        if (step == 1 || step == 2) multi_tensor += now() - start;
+
+        same(reference, fused, "AdamW multi-tensor step differs");
+    }
+    /* Steady-state steps only: steps 0 and 3 also build moment buffers. */
+    printf("AdamW over %d Parameters: per-parameter %.4fs, multi-tensor %.4fs\n",
+           PARAMETERS, per_parameter, multi_tensor);
+
+    int sgd_id = ocean_autograd_sgd_create();
+    for (int step = 0; step < 2; ++step) {
+        backward(reference);
+        backward(fused);
+        for (int p = 0; p < PARAMETERS; ++p) ocean_autograd_sgd_step(reference[p], 0.05);
+        for (int p = 0; p < PARAMETERS; ++p) ocean_autograd_optimizer_stage(sgd_id, fused[p]);
+        ocean_autograd_sgd_step_staged(sgd_id, 0.05);
+        same(reference, fused, "SGD multi-tensor step differs");
+    }
+
+    for (int p = 0; p < PARAMETERS; ++p) {
+        ocean_tensor_release(reference[p]);
+        ocean_tensor_release(fused[p]);
+    }
+    puts("multi-tensor optimizer: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/autograd_runtime.c"),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "multi-tensor optimizer: OK" in result.stdout
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_buffer_transfer_converts_and_handles_views(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_bulk_transfer",
+        r"""
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "bulk transfer failed: %s\n", message);
+    exit(1);
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    size_t shape[2] = {3, 4};
+    ocean_tensor_handle_t matrix = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+
+    float values[12];
+    for (int index = 0; index < 12; ++index) values[index] = 0.5f * (float)index;
+    ocean_tensor_copy_from_buffer(matrix, values, 12, "float32");
+    if (ocean_tensor_get_flat(matrix, 7) != 3.5) fail("packed copy differs");
+
+    /* A strided view is written and read in its own row-major order. */
+    ocean_tensor_handle_t columns = ocean_tensor_slice(matrix, 1, 1, 4, 2);
+    double wide[6] = {-1.0, -2.0, -3.0, -4.0, -5.0, -6.0};
+    ocean_tensor_copy_from_buffer(columns, wide, 6, "float64");
+    if (ocean_tensor_get_flat(matrix, 1) != -1.0 || ocean_tensor_get_flat(matrix, 3) != -2.0 ||
+        ocean_tensor_get_flat(matrix, 11) != -6.0) {
+        fail("strided destination differs");
+    }
+    if (ocean_tensor_get_flat(matrix, 2) != 1.0) fail("write reached outside the view");
+    int32_t counts[6];
+    ocean_tensor_copy_to_buffer(columns, counts, 6, "int32");
+    for (int index = 0; index < 6; ++index) {
+        if (counts[index] != -(index + 1)) fail("converted read differs");
+    }
+
+    float round_trip[12];
+    ocean_tensor_copy_to_buffer(matrix, round_trip, 12, "float32");
+    if (round_trip[0] != 0.0f || round_trip[1] != -1.0f || round_trip[10] != 5.0f) {
+        fail("packed read differs");
+    }
+
+    size_t empty_shape[1] = {0};
+    ocean_tensor_handle_t empty = ocean_tensor_zeros_nd(empty_shape, 1, "int64", "cpu");
+    ocean_tensor_copy_from_buffer(empty, NULL, 0, "int64");
+    ocean_tensor_copy_to_buffer(empty, NULL, 0, "int64");
+
+    ocean_tensor_release(empty);
+    ocean_tensor_release(columns);
+    ocean_tensor_release(matrix);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("bulk transfer: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "bulk transfer: OK" in result.stdout
+
+
+def test_list_transfer_benchmark_against_indexing(tmp_path):
+    source = tmp_path / "tensor_bulk_benchmark.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+import <std/time/time.oc>
+
+def main() -> int:
+    var count: int = 10000000
+    var values: list[float32] = []
+    var index: int = 0
+    while index < count:
+        values.append(index % 1000)
+        index = index + 1
+
+    var start: float64 = Time.monotonic()
+    var tensor: Tensor[float32] = Tensor.from_list(values, "cpu")
+    var from_list: float64 = Time.monotonic() - start
+    var to_list_start: float64 = Time.monotonic()
+    var back: list[float32] = tensor.to_list()
+    var to_list: float64 = Time.monotonic() - to_list_start
+    var copy_start: float64 = Time.monotonic()
+    tensor.copy_from(values)
+    var copy_from: float64 = Time.monotonic() - copy_start
+
+    # The same load written element by element, on a tenth of the data.
+    var indexed: Tensor[float32] = Tensor.zeros(count / 10, "cpu")
+    var indexed_start: float64 = Time.monotonic()
+    index = 0
+    while index < count / 10:
+        indexed[index] = values[index]
+        index = index + 1
+    var per_element: float64 = (Time.monotonic() - indexed_start) * 10.0
+
+    var last: float64 = back[count - 1]
+    print("last =", last)
+    var from_list_ms: float64 = from_list * 1000.0
+    var to_list_ms: float64 = to_list * 1000.0
+    var copy_from_ms: float64 = copy_from * 1000.0
+    var per_element_ms: float64 = per_element * 1000.0
+    print("from_list ms =", from_list_ms)
+    print("to_list ms =", to_list_ms)
+    print("copy_from ms =", copy_from_ms)
+    print("indexed writes ms =", per_element_ms)
+    print("bulk faster =", from_list * 4.0 < per_element)
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_bulk_benchmark.generated.c"
+    binary_path = tmp_path / "tensor_bulk_benchmark"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "last = 999.000000" in result.stdout
+    assert "bulk faster = 1" in result.stdout
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_tensor_storage_cache_reuses_blocks_and_reports_stats(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_cache.c"
+    binary = tmp_path / "tensor_cache"
+
+    source.write_text(
+        r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "Tensor cache failed: %s\n", message);
+    exit(1);
+}
+
+int main(void) {
+    ocean_tensor_set_cache_limit((size_t)1 << 20);
+    if (ocean_tensor_get_cache_limit() != ((size_t)1 << 20)) fail("limit");
+    ocean_tensor_reset_peak_memory();
+    size_t baseline = ocean_tensor_memory_live_bytes();
+
+    /* 100 float32 = 400 bytes, rounded up to the 448-byte class. */
+    size_t shape[2] = {10, 10};
+    ocean_tensor_handle_t first = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    if (ocean_tensor_memory_live_bytes() - baseline != 448) fail("size class");
+    ocean_tensor_fill(first, 7.0);
+    ocean_tensor_release(first);
+    if (ocean_tensor_memory_cached_bytes() != 448) fail("block was not cached");
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("live after release");
+
+    /* A recycled dirty block must still come back zeroed. */
+    ocean_tensor_handle_t second = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    if (ocean_tensor_memory_cached_bytes() != 0) fail("block was not reused");
+    if (ocean_tensor_sum(second) != 0.0) fail("recycled zeros are dirty");
+    if (ocean_tensor_memory_peak_bytes() - baseline != 448) fail("peak");
+
+    /* Blocks larger than the limit bypass the cache. */
+    size_t big_shape[1] = {(size_t)1 << 19};
+    ocean_tensor_handle_t big = ocean_tensor_zeros_nd(big_shape, 1, "float32", "cpu");
+    if (ocean_tensor_sum(big) != 0.0) fail("fresh zeros");
+    ocean_tensor_release(big);
+    if (ocean_tensor_memory_cached_bytes() != 0) fail("oversized block cached");
+
+    ocean_tensor_release(second);
+    char *stats = ocean_tensor_memory_stats();
+    if (!strstr(stats, "cached=448")) fail("stats string");
+    free(stats);
+
+    ocean_tensor_empty_cache();
+    if (ocean_tensor_memory_cached_bytes() != 0) fail("empty_cache");
+
+    ocean_tensor_handle_t third = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    ocean_tensor_set_cache_limit(0);
+    ocean_tensor_release(third);
+    if (ocean_tensor_memory_cached_bytes() != 0) fail("zero limit must disable caching");
+
+    puts("Tensor cache: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "Tensor cache: OK" in result.stdout
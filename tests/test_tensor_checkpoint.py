@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import struct
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_checkpoint_round_trip_subset_and_mapped_views(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_checkpoint",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "checkpoint failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t make(size_t rows, size_t cols, const char *dtype, double seed) {
+    size_t shape[2] = {rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 2, dtype, "cpu");
+    for (size_t i = 0; i < ocean_tensor_size(tensor); ++i) {
+        ocean_tensor_set_flat(tensor, i, round(100.0 * sin(seed + 0.37 * (double)i)));
+    }
+    return tensor;
+}
+
+static void same(ocean_tensor_handle_t left, ocean_tensor_handle_t right, const char *message) {
+    if (ocean_tensor_size(left) != ocean_tensor_size(right)) fail(message);
+    for (size_t i = 0; i < ocean_tensor_size(left); ++i) {
+        if (ocean_tensor_get_flat(left, i) != ocean_tensor_get_flat(right, i)) fail(message);
+    }
+}
+
+int main(int argc, char **argv) {
+    if (argc != 2) fail("usage: tensor_checkpoint path");
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t weight = make(37, 19, "float32", 0.1);
+    ocean_tensor_handle_t bias = make(1, 19, "float64", 0.7);
+    ocean_tensor_handle_t table = make(5, 3, "int16", 1.3);
+    ocean_tensor_handle_t large = make(1100, 1024, "float32", 2.1);
+    /* A strided source is packed before it is written. */
+    ocean_tensor_handle_t columns = ocean_tensor_slice(weight, 1, 1, 19, 3);
+
+    int writer = ocean_tensor_checkpoint_create();
+    ocean_tensor_checkpoint_add(writer, "layer.weight", weight);
+    ocean_tensor_checkpoint_add(writer, "layer.bias", bias);
+    ocean_tensor_checkpoint_add(writer, "table", table);
+    ocean_tensor_checkpoint_add(writer, "large", large);
+    ocean_tensor_checkpoint_add(writer, "columns", columns);
+    ocean_tensor_checkpoint_save(writer, argv[1]);
+    ocean_tensor_checkpoint_release(writer);
+
+    /* Load a subset into existing Tensors, one of them a strided view. */
+    int reader = ocean_tensor_checkpoint_open(argv[1], false);
+    if (!ocean_tensor_checkpoint_contains(reader, "table")) fail("missing entry");
+    if (ocean_tensor_checkpoint_contains(reader, "missing")) fail("phantom entry");
+    size_t weight_shape[2] = {37, 19};
+    size_t wide_shape[2] = {5, 6};
+    ocean_tensor_handle_t loaded_weight = ocean_tensor_zeros_nd(weight_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t wide = ocean_tensor_zeros_nd(wide_shape, 2, "int16", "cpu");
+    ocean_tensor_handle_t loaded_table = ocean_tensor_slice(wide, 1, 0, 6, 2);
+    ocean_tensor_checkpoint_add(reader, "layer.weight", loaded_weight);
+    ocean_tensor_checkpoint_add(reader, "table", loaded_table);
+    /* A pending lazy read of a destination runs before load() overwrites it. */
+    ocean_tensor_set_lazy_enabled(true);
+    ocean_tensor_handle_t pending = ocean_tensor_scalar(loaded_weight, 1.0, 0);
+    ocean_tensor_checkpoint_load(reader);
+    if (ocean_tensor_get_flat(pending, 0) != 1.0) fail("load overtook a pending lazy read");
+    ocean_tensor_set_lazy_enabled(false);
+    ocean_tensor_release(pending);
+    same(loaded_weight, weight, "loaded weight differs");
+    same(loaded_table, table, "strided destination differs");
+    if (ocean_tensor_get_flat(wide, 1) != 0.0) fail("load wrote outside the view");
+    ocean_tensor_handle_t read_large = ocean_tensor_checkpoint_get(reader, "large", "cpu");
+    same(read_large, large, "large Tensor differs");
+    ocean_tensor_handle_t read_columns = ocean_tensor_checkpoint_get(reader, "columns", "cpu");
+    same(read_columns, columns, "packed view differs");
+    if (ocean_tensor_is_mapped(read_large)) fail("unmapped checkpoint returned a mapping");
+    ocean_tensor_checkpoint_release(reader);
+
+    /* Mapped Tensors are views of the file that outlive the checkpoint. */
+    size_t live = ocean_tensor_memory_live_bytes();
+    int mapped = ocean_tensor_checkpoint_open(argv[1], true);
+    ocean_tensor_handle_t mapped_bias = ocean_tensor_checkpoint_get(mapped, "layer.bias", "cpu");
+    ocean_tensor_handle_t mapped_large = ocean_tensor_checkpoint_get(mapped, "large", "cpu");
+    ocean_tensor_checkpoint_release(mapped);
+    if (ocean_tensor_memory_live_bytes() != live) fail("mapped get allocated storage");
+    if (!ocean_tensor_is_mapped(mapped_large)) fail("mapped get copied the Tensor");
+    same(mapped_bias, bias, "mapped bias differs");
+    same(mapped_large, large, "mapped large Tensor differs");
+    ocean_tensor_release(mapped_bias);
+    ocean_tensor_release(mapped_large);
+
+    ocean_tensor_release(read_large);
+    ocean_tensor_release(read_columns);
+    ocean_tensor_release(loaded_weight);
+    ocean_tensor_release(loaded_table);
+    ocean_tensor_release(wide);
+    ocean_tensor_release(columns);
+    ocean_tensor_release(weight);
+    ocean_tensor_release(bias);
+    ocean_tensor_release(table);
+    ocean_tensor_release(large);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("checkpoint: OK");
+    return 0;
+}
+""",
+    )
+    path = tmp_path / "model.ckpt"
+
+    result = subprocess.run(
+        [str(binary), str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "checkpoint: OK" in result.stdout
+    data = path.read_bytes()
+    assert data[:8] == b"OCEANCKP"
+    header_size = struct.unpack_from("<Q", data, 8)[0]
+    payload = 16 + header_size
+    assert payload % 64 == 0
+    index = json.loads(data[16:payload])
+    assert list(index) == ["layer.weight", "layer.bias", "table", "large", "columns"]
+    assert index["layer.bias"] == {
+        "dtype": "float64", "shape": [1, 19], "offset": 2816, "bytes": 152
+    }
+    assert index["columns"]["shape"] == [37, 6]
+    assert all(entry["offset"] % 64 == 0 for entry in index.values())
+    assert len(data) == payload + index["columns"]["offset"] + index["columns"]["bytes"]
+
+
+def test_checkpoint_benchmark_against_npy_files(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_checkpoint_benchmark",
+        r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define TENSORS 192
+#define ROWS 256
+#define COLS 256
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+int main(int argc, char **argv) {
+    if (argc != 2) return 1;
+    size_t shape[2] = {ROWS, COLS};
+    ocean_tensor_handle_t tensors[TENSORS];
+    ocean_tensor_handle_t targets[TENSORS];
+    char names[TENSORS][32];
+    char paths[TENSORS][4096];
+    for (int index = 0; index < TENSORS; ++index) {
+        tensors[index] = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+        targets[index] = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+        ocean_tensor_fill(tensors[index], (double)index);
+        snprintf(names[index], sizeof(names[index]), "parameters.%d", index);
+        snprintf(paths[index], sizeof(paths[index]), "%s/%d.npy", argv[1], index);
+    }
+    char checkpoint[4096];
+    snprintf(checkpoint, sizeof(checkpoint), "%s/model.ckpt", argv[1]);
+
+    /* One .npy per parameter, copied into the model as the examples do. */
+    double start = seconds();
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_save_npy(tensors[index], paths[index]);
+    }
+    double npy_save = seconds() - start;
+    start = seconds();
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_handle_t loaded = ocean_tensor_load_npy(paths[index], "cpu");
+        ocean_tensor_copy_into(targets[index], loaded);
+        ocean_tensor_release(loaded);
+    }
+    double npy_load = seconds() - start;
+
+    start = seconds();
+    int writer = ocean_tensor_checkpoint_create();
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_checkpoint_add(writer, names[index], tensors[index]);
+    }
+    ocean_tensor_checkpoint_save(writer, checkpoint);
+    ocean_tensor_checkpoint_release(writer);
+    double checkpoint_save = seconds() - start;
+
+    start = seconds();
+    int reader = ocean_tensor_checkpoint_open(checkpoint, false);
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_checkpoint_add(reader, names[index], targets[index]);
+    }
+    ocean_tensor_checkpoint_load(reader);
+    ocean_tensor_checkpoint_release(reader);
+    double checkpoint_load = seconds() - start;
+    if (ocean_tensor_get_flat(targets[TENSORS - 1], ROWS * COLS - 1) != TENSORS - 1) return 1;
+
+    /* Opening mapped and taking views reads nothing up front. */
+    start = seconds();
+    int mapped = ocean_tensor_checkpoint_open(checkpoint, true);
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_handle_t view = ocean_tensor_checkpoint_get(mapped, names[index], "cpu");
+        ocean_tensor_release(view);
+    }
+    ocean_tensor_checkpoint_release(mapped);
+    double mapped_open = seconds() - start;
+
+    printf("npy files: save %.1f ms, load %.1f ms\n", npy_save * 1e3, npy_load * 1e3);
+    printf("checkpoint: save %.1f ms, load %.1f ms, mapped %.2f ms\n",
+           checkpoint_save * 1e3, checkpoint_load * 1e3, mapped_open * 1e3);
+    if (!(checkpoint_load < npy_load)) {
+        fprintf(stderr, "checkpoint load was not faster than per-file loads\n");
+        return 1;
+    }
+    if (!(mapped_open * 10 < npy_load)) {
+        fprintf(stderr, "mapped checkpoint open was not much faster than per-file loads\n");
+        return 1;
+    }
+
+    for (int index = 0; index < TENSORS; ++index) {
+        ocean_tensor_release(tensors[index]);
+        ocean_tensor_release(targets[index]);
+    }
+    puts("checkpoint benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary), str(tmp_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "checkpoint benchmark: OK" in result.stdout
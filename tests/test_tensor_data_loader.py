@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_loader_epochs_rows_and_token_windows(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_data_loader",
+        r"""
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define ROWS 100
+#define COLS 7
+#define BATCH 8
+#define EPOCHS 3
+
+static void fail(const char *message) {
+    fprintf(stderr, "data loader failed: %s\n", message);
+    exit(1);
+}
+
+int main(int argc, char **argv) {
+    if (argc != 2) fail("usage: tensor_data_loader path");
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    size_t wide_shape[2] = {ROWS, COLS * 2};
+    size_t label_shape[1] = {ROWS};
+    ocean_tensor_handle_t wide = ocean_tensor_zeros_nd(wide_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t labels = ocean_tensor_zeros_nd(label_shape, 1, "int16", "cpu");
+    for (size_t row = 0; row < ROWS; ++row) {
+        for (size_t col = 0; col < COLS * 2; ++col) {
+            ocean_tensor_set_flat(wide, row * COLS * 2 + col, (double)(row * 100 + col));
+        }
+        ocean_tensor_set_flat(labels, row, (double)row);
+    }
+    /* A strided source: the even columns. */
+    ocean_tensor_handle_t features = ocean_tensor_slice(wide, 1, 0, COLS * 2, 2);
+
+    int loader = ocean_tensor_loader_create(BATCH, 3, true, 11, "cpu");
+    ocean_tensor_loader_add_rows(loader, features);
+    ocean_tensor_loader_add_rows(loader, labels);
+    ocean_tensor_release(features);
+    /* In-memory sources are copied: this write never reaches a batch. */
+    ocean_tensor_fill(labels, -1.0);
+    if (ocean_tensor_loader_batches(loader) != ROWS / BATCH) fail("wrong batch count");
+
+    int first_rows[ROWS / BATCH * BATCH];
+    bool orders_differ = false;
+    for (int epoch = 0; epoch < EPOCHS; ++epoch) {
+        int seen[ROWS] = {0};
+        int count = 0;
+        while (ocean_tensor_loader_next(loader)) {
+            ocean_tensor_handle_t x = ocean_tensor_loader_get(loader, 0);
+            ocean_tensor_handle_t y = ocean_tensor_loader_get(loader, 1);
+            if (ocean_tensor_shape(x, 0) != BATCH || ocean_tensor_shape(x, 1) != COLS) {
+                fail("wrong feature batch shape");
+            }
+            if (ocean_tensor_ndim(y) != 1 || ocean_tensor_shape(y, 0) != BATCH) {
+                fail("wrong label batch shape");
+            }
+            for (int b = 0; b < BATCH; ++b) {
+                int row = (int)ocean_tensor_get_flat(y, (size_t)b);
+                if (row < 0 || row >= ROWS || seen[row]++) fail("row repeated within an epoch");
+                for (int col = 0; col < COLS; ++col) {
+                    double value = ocean_tensor_get_flat(x, (size_t)(b * COLS + col));
+                    if (value != (double)(row * 100 + col * 2)) fail("gathered row differs");
+                }
+                if (epoch == 0) first_rows[count] = row;
+                else if (first_rows[count] != row) orders_differ = true;
+                ++count;
+            }
+            ocean_tensor_release(x);
+            ocean_tensor_release(y);
+        }
+        if (count != ROWS / BATCH * BATCH) fail("epoch did not cover every full batch");
+    }
+    if (!orders_differ) fail("epochs repeated the same order");
+
+    /* Release with batches still queued and one not taken. */
+    if (!ocean_tensor_loader_next(loader)) fail("next epoch did not start");
+    ocean_tensor_loader_release(loader);
+
+    /* Token windows over a raw uint16 file. */
+    FILE *stream = fopen(argv[1], "wb");
+    if (!stream) fail("could not write tokens");
+    uint16_t tokens[1001];
+    for (int index = 0; index < 1001; ++index) tokens[index] = (uint16_t)(index * 37 % 50021);
+    fwrite(tokens, sizeof(tokens[0]), 1001, stream);
+    fclose(stream);
+    ocean_tensor_handle_t stream_tensor = ocean_tensor_load_bin_mmap(argv[1], "uint16", "cpu");
+    if (!ocean_tensor_is_mapped(stream_tensor) || ocean_tensor_size(stream_tensor) != 1001) {
+        fail("binary file was not mapped");
+    }
+    int windows = ocean_tensor_loader_create(4, 2, false, 0, "cpu");
+    ocean_tensor_loader_add_windows(windows, stream_tensor, 10);
+    ocean_tensor_release(stream_tensor);
+    if (ocean_tensor_loader_batches(windows) != 25) fail("wrong window batch count");
+    int batches = 0;
+    while (ocean_tensor_loader_next(windows)) {
+        ocean_tensor_handle_t inputs = ocean_tensor_loader_get(windows, 0);
+        ocean_tensor_handle_t targets = ocean_tensor_loader_get(windows, 1);
+        char *dtype = ocean_tensor_dtype_name(inputs);
+        if (strcmp(dtype, "int64") != 0) fail("inputs are not int64");
+        free(dtype);
+        for (int b = 0; b < 4; ++b) {
+            for (int t = 0; t < 10; ++t) {
+                int start = (batches * 4 + b) * 10;
+                if (ocean_tensor_get_flat(inputs, (size_t)(b * 10 + t)) != tokens[start + t] ||
+                    ocean_tensor_get_flat(targets, (size_t)(b * 10 + t)) != tokens[start + t + 1]) {
+                    fail("token window differs");
+                }
+            }
+        }
+        ocean_tensor_release(inputs);
+        ocean_tensor_release(targets);
+        ++batches;
+    }
+    if (batches != 25) fail("token epoch has the wrong length");
+    ocean_tensor_loader_release(windows);
+
+    ocean_tensor_release(wide);
+    ocean_tensor_release(labels);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("data loader: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary), str(tmp_path / "tokens.bin")],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "data loader: OK" in result.stdout
+
+
+def test_prefetch_hides_batch_gathering(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_data_loader_benchmark",
+        r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define ROWS 2048
+#define COLS 4096
+#define BATCH 256
+#define BATCHES (ROWS / BATCH)
+#define EPOCHS 2
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+/* Stands in for a training step that takes longer than a gather and leaves
+   the CPU free, like one running on the GPU. */
+static void compute(void) {
+    struct timespec step = {0, 4000000};
+    nanosleep(&step, NULL);
+}
+
+int main(void) {
+    size_t shape[2] = {ROWS, COLS};
+    ocean_tensor_handle_t data = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    ocean_tensor_fill(data, 1.0);
+    const float *rows = (const float *)malloc(sizeof(float) * ROWS * COLS);
+    float *source = (float *)rows;
+    for (size_t index = 0; index < (size_t)ROWS * COLS; ++index) source[index] = 1.0f;
+
+    /* Gathering each shuffled batch on the training thread. */
+    double gather = 0.0;
+    double start = seconds();
+    unsigned state = 5;
+    for (int batch = 0; batch < BATCHES * EPOCHS; ++batch) {
+        double step = seconds();
+        float *output = (float *)malloc(sizeof(float) * BATCH * COLS);
+        for (int row = 0; row < BATCH; ++row) {
+            state = state * 1103515245u + 12345u;
+            memcpy(output + (size_t)row * COLS, rows + (size_t)(state % ROWS) * COLS,
+                   sizeof(float) * COLS);
+        }
+        gather += seconds() - step;
+        compute();
+        free(output);
+    }
+    double synchronous = seconds() - start;
+
+    int loader = ocean_tensor_loader_create(BATCH, 2, true, 5, "cpu");
+    ocean_tensor_loader_add_rows(loader, data);
+    start = seconds();
+    int batches = 0;
+    double first = 0.0;
+    for (int epoch = 0; epoch < EPOCHS; ++epoch) {
+        while (ocean_tensor_loader_next(loader)) {
+            if (batches == 0) first = ocean_tensor_loader_wait_seconds(loader);
+            ocean_tensor_handle_t x = ocean_tensor_loader_get(loader, 0);
+            compute();
+            ocean_tensor_release(x);
+            ++batches;
+        }
+    }
+    double prefetched = seconds() - start;
+    double waited = ocean_tensor_loader_wait_seconds(loader);
+    ocean_tensor_loader_release(loader);
+
+    printf("synchronous: %.1f ms total, %.1f ms gathering\n", synchronous * 1e3, gather * 1e3);
+    printf("prefetched: %.1f ms total, %.1f ms waiting, %.1f ms of it for the first batch\n",
+           prefetched * 1e3, waited * 1e3, first * 1e3);
+    if (batches != BATCHES * EPOCHS) {
+        fprintf(stderr, "wrong number of batches\n");
+        return 1;
+    }
+    /* After the first batch the gathers overlap the training steps. */
+    if (!((waited - first) * 4 < gather)) {
+        fprintf(stderr, "prefetching did not hide the gather\n");
+        return 1;
+    }
+
+    free(source);
+    ocean_tensor_release(data);
+    puts("data loader benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "data loader benchmark: OK" in result.stdout
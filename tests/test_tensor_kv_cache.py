@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_cached_decoding_matches_full_causal_attention(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_kv_cache",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define BATCH 2
+#define HEADS 3
+#define STEPS 45
+#define PREFILL 7
+#define CAPACITY 64
+#define DEPTH 16
+
+static void fail(const char *message) {
+    fprintf(stderr, "KV cache failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t make(size_t rows, size_t depth, double seed) {
+    size_t shape[4] = {BATCH, HEADS, rows, depth};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 4, "float32", "cpu");
+    for (size_t i = 0; i < ocean_tensor_size(tensor); ++i) {
+        ocean_tensor_set_flat(tensor, i, sin(seed + 0.31 * (double)i));
+    }
+    return tensor;
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t q = make(STEPS, DEPTH, 0.2);
+    ocean_tensor_handle_t k = make(STEPS, DEPTH, 1.1);
+    ocean_tensor_handle_t v = make(STEPS, DEPTH, 2.3);
+    ocean_tensor_handle_t expected = ocean_tensor_scaled_dot_product_attention(q, k, v, true);
+
+    size_t cache_shape[4] = {BATCH, HEADS, CAPACITY, DEPTH};
+    ocean_tensor_handle_t cache_k = ocean_tensor_zeros_nd(cache_shape, 4, "float32", "cpu");
+    ocean_tensor_handle_t cache_v = ocean_tensor_zeros_nd(cache_shape, 4, "float32", "cpu");
+
+    /* A prompt chunk, then one token at a time; the chunks are strided views. */
+    size_t length = 0;
+    while (length < STEPS) {
+        size_t rows = length == 0 ? PREFILL : 1;
+        ocean_tensor_handle_t q_step = ocean_tensor_slice(q, 2, (int)length,
+                                                          (int)(length + rows), 1);
+        ocean_tensor_handle_t k_step = ocean_tensor_slice(k, 2, (int)length,
+                                                          (int)(length + rows), 1);
+        ocean_tensor_handle_t v_step = ocean_tensor_slice(v, 2, (int)length,
+                                                          (int)(length + rows), 1);
+        ocean_tensor_kv_cache_write(cache_k, k_step, length);
+        ocean_tensor_kv_cache_write(cache_v, v_step, length);
+        length += rows;
+        ocean_tensor_handle_t output =
+            ocean_tensor_scaled_dot_product_attention_cached(q_step, cache_k, cache_v, length);
+        for (size_t head = 0; head < BATCH * HEADS; ++head) {
+            for (size_t r = 0; r < rows; ++r) {
+                for (size_t c = 0; c < DEPTH; ++c) {
+                    double got = ocean_tensor_get_flat(output, (head * rows + r) * DEPTH + c);
+                    double want = ocean_tensor_get_flat(
+                        expected, (head * STEPS + length - rows + r) * DEPTH + c);
+                    if (fabs(got - want) > 1e-5) fail("cached output differs from full attention");
+                }
+            }
+        }
+        ocean_tensor_release(output);
+        ocean_tensor_release(q_step);
+        ocean_tensor_release(k_step);
+        ocean_tensor_release(v_step);
+    }
+
+    /* A pending lazy read of the cache sees it as it was before a write. */
+    ocean_tensor_set_lazy_enabled(true);
+    double before = ocean_tensor_get_flat(cache_k, 0);
+    ocean_tensor_handle_t shifted = ocean_tensor_scalar(cache_k, 1.0, 0);
+    ocean_tensor_handle_t first = ocean_tensor_slice(v, 2, 0, 1, 1);
+    ocean_tensor_kv_cache_write(cache_k, first, 0);
+    if (fabs(ocean_tensor_get_flat(shifted, 0) - (before + 1.0)) > 1e-6) {
+        fail("KV cache write overtook a pending lazy read");
+    }
+    ocean_tensor_set_lazy_enabled(false);
+    ocean_tensor_release(first);
+    ocean_tensor_release(shifted);
+
+    ocean_tensor_release(expected);
+    ocean_tensor_release(q);
+    ocean_tensor_release(k);
+    ocean_tensor_release(v);
+    ocean_tensor_release(cache_k);
+    ocean_tensor_release(cache_v);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("KV cache: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "KV cache: OK" in result.stdout
+
+
+def test_cached_decoding_benchmark(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_kv_cache_benchmark",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define HEADS 12
+#define TOKENS 512
+#define DEPTH 64
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+int main(void) {
+    size_t shape[4] = {1, HEADS, TOKENS, DEPTH};
+    size_t row_shape[4] = {1, HEADS, 1, DEPTH};
+    ocean_tensor_handle_t cache_k = ocean_tensor_zeros_nd(shape, 4, "float32", "cpu");
+    ocean_tensor_handle_t cache_v = ocean_tensor_zeros_nd(shape, 4, "float32", "cpu");
+    ocean_tensor_handle_t row = ocean_tensor_zeros_nd(row_shape, 4, "float32", "cpu");
+    for (size_t i = 0; i < ocean_tensor_size(row); ++i) {
+        ocean_tensor_set_flat(row, i, sin(0.17 * (double)i));
+    }
+
+    /* Decode TOKENS tokens with the cache, timing early and late steps. */
+    double start = seconds(), early = 0.0, late = 0.0;
+    for (size_t length = 1; length <= TOKENS; ++length) {
+        double step = seconds();
+        ocean_tensor_kv_cache_write(cache_k, row, length - 1);
+        ocean_tensor_kv_cache_write(cache_v, row, length - 1);
+        ocean_tensor_handle_t output =
+            ocean_tensor_scaled_dot_product_attention_cached(row, cache_k, cache_v, length);
+        ocean_tensor_release(output);
+        step = seconds() - step;
+        if (length <= 64) early += step;
+        if (length > TOKENS - 64) late += step;
+    }
+    double cached = seconds() - start;
+
+    /* Recomputing causal attention over the whole prefix for every token. */
+    start = seconds();
+    for (size_t length = 1; length <= TOKENS; ++length) {
+        ocean_tensor_handle_t prefix_k = ocean_tensor_slice(cache_k, 2, 0, (int)length, 1);
+        ocean_tensor_handle_t prefix_v = ocean_tensor_slice(cache_v, 2, 0, (int)length, 1);
+        ocean_tensor_handle_t output =
+            ocean_tensor_scaled_dot_product_attention(prefix_k, prefix_k, prefix_v, true);
+        ocean_tensor_release(output);
+        ocean_tensor_release(prefix_k);
+        ocean_tensor_release(prefix_v);
+    }
+    double recomputed = seconds() - start;
+
+    printf("cached decode: %.0f tokens/s\n", TOKENS / cached);
+    printf("recomputed prefix: %.0f tokens/s\n", TOKENS / recomputed);
+    printf("first 64 tokens: %.1f us/token, last 64 tokens: %.1f us/token\n",
+           early / 64 * 1e6, late / 64 * 1e6);
+    if (!(cached * 4 < recomputed)) {
+        fprintf(stderr, "cached decode was not several times faster\n");
+        return 1;
+    }
+
+    ocean_tensor_release(row);
+    ocean_tensor_release(cache_k);
+    ocean_tensor_release(cache_v);
+    puts("KV cache benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "KV cache benchmark: OK" in result.stdout
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_lazy_elementwise_chains_fuse_and_match_eager(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_lazy.c"
+    binary = tmp_path / "tensor_lazy"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "Tensor lazy fusion failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t filled(size_t rows, size_t cols, double seed) {
+    size_t shape[2] = {rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, sin(seed + 0.01 * (double)i) * 3.0);
+    }
+    return tensor;
+}
+
+/* gelu(relu(x * w + b) / 2 - x) */
+static ocean_tensor_handle_t chain(
+    ocean_tensor_handle_t x, ocean_tensor_handle_t w, ocean_tensor_handle_t b
+) {
+    ocean_tensor_handle_t product = ocean_tensor_binary(x, w, 2);
+    ocean_tensor_handle_t shifted = ocean_tensor_binary(product, b, 0);
+    ocean_tensor_handle_t rectified = ocean_tensor_relu(shifted);
+    ocean_tensor_handle_t halved = ocean_tensor_scalar(rectified, 2.0, 3);
+    ocean_tensor_handle_t centered = ocean_tensor_binary(halved, x, 1);
+    ocean_tensor_handle_t result = ocean_tensor_gelu(centered);
+    ocean_tensor_release(product);
+    ocean_tensor_release(shifted);
+    ocean_tensor_release(rectified);
+    ocean_tensor_release(halved);
+    ocean_tensor_release(centered);
+    return result;
+}
+
+static void same(ocean_tensor_handle_t left, ocean_tensor_handle_t right, const char *what) {
+    size_t size = ocean_tensor_size(left);
+    if (size != ocean_tensor_size(right)) fail(what);
+    for (size_t i = 0; i < size; ++i) {
+        if (ocean_tensor_get_flat_f32(left, i) != ocean_tensor_get_flat_f32(right, i)) {
+            fail(what);
+        }
+    }
+}
+
+int main(void) {
+    ocean_tensor_set_num_threads(3);
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    const size_t rows = 61, cols = 97;
+    ocean_tensor_handle_t x = filled(rows, cols, 0.1);
+    size_t bytes = ocean_tensor_memory_live_bytes() - baseline;
+    ocean_tensor_handle_t w = filled(rows, cols, 0.7);
+    ocean_tensor_handle_t b = filled(rows, cols, 1.9);
+
+    ocean_tensor_handle_t eager = chain(x, w, b);
+
+    if (ocean_tensor_lazy_enabled()) fail("lazy mode must default to off");
+    ocean_tensor_set_lazy_enabled(true);
+    size_t before = ocean_tensor_memory_live_bytes();
+    ocean_tensor_reset_peak_memory();
+    ocean_tensor_handle_t lazy = chain(x, w, b);
+    if (ocean_tensor_memory_live_bytes() != before) fail("recording allocated storage");
+    if (ocean_tensor_shape(lazy, 1) != cols) fail("pending shape");
+    same(eager, lazy, "fused chain differs from eager kernels");
+    if (ocean_tensor_memory_live_bytes() != before + bytes) fail("fused result size");
+    if (ocean_tensor_memory_peak_bytes() != before + bytes) fail("intermediates were allocated");
+
+    /* Shared subexpressions and strided operands. */
+    ocean_tensor_handle_t xt = ocean_tensor_transpose(x);
+    ocean_tensor_handle_t square = ocean_tensor_binary(xt, xt, 2);
+    ocean_tensor_handle_t twice = ocean_tensor_binary(square, square, 0);
+    size_t index[2] = {5, 7};
+    double expected = 2.0 * (double)(ocean_tensor_get_2d(x, 7, 5) * ocean_tensor_get_2d(x, 7, 5));
+    if (fabs(ocean_tensor_get_nd(twice, index, 2) - expected) > 1e-4) fail("shared operand");
+
+    /* Writes flush pending expressions so they see the old values. */
+    ocean_tensor_handle_t incremented = ocean_tensor_scalar(w, 1.0, 0);
+    double old_value = ocean_tensor_get_flat(w, 3);
+    ocean_tensor_fill(w, 0.0);
+    if (fabs(ocean_tensor_get_flat(incremented, 3) - (old_value + 1.0)) > 1e-6) {
+        fail("write did not flush a pending expression");
+    }
+
+    /* Long chains are split into bounded programs. */
+    ocean_tensor_handle_t total = ocean_tensor_copy(b);
+    for (int step = 0; step < 200; ++step) {
+        ocean_tensor_handle_t next = ocean_tensor_scalar(total, 0.5, 0);
+        ocean_tensor_release(total);
+        total = next;
+    }
+    if (fabs(ocean_tensor_get_flat(total, 0) - (ocean_tensor_get_flat(b, 0) + 100.0)) > 1e-3) {
+        fail("long chain");
+    }
+
+    /* Pending Tensors released unread never allocate. */
+    ocean_tensor_handle_t unused = ocean_tensor_binary(x, b, 0);
+    ocean_tensor_release(unused);
+
+    ocean_tensor_set_lazy_enabled(false);
+    ocean_tensor_release(total);
+    ocean_tensor_release(incremented);
+    ocean_tensor_release(twice);
+    ocean_tensor_release(square);
+    ocean_tensor_release(xt);
+    ocean_tensor_release(lazy);
+    ocean_tensor_release(eager);
+    ocean_tensor_release(b);
+    ocean_tensor_release(w);
+    ocean_tensor_release(x);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+
+    puts("Tensor lazy fusion: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "Tensor lazy fusion: OK" in result.stdout
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import re
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def _compile(tmp_path: Path, name: str, code: str, cflags: list[str] | None = None):
+    source = tmp_path / f"{name}.oc"
+    source.write_text(code, encoding="utf-8")
+    c_path = tmp_path / f"{name}.generated.c"
+    binary_path = tmp_path / name
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path, cflags=cflags)
+    return c_path.read_text(encoding="utf-8"), binary_path
+
+
+def test_range_loop_indexing_uses_direct_access_with_checked_fallback(tmp_path):
+    generated, binary = _compile(
+        tmp_path,
+        "tensor_loop_indexing",
+        """
+import <std/tensor/tensor.oc>
+
+
+def smooth(a: &Tensor[float64], out: &mut Tensor[float64], n: int) -> None:
+    for i in range(1, n - 1):
+        out[i] = a[i - 1] + a[i] + a[i + 1]
+    return None
+
+
+def mirror(m: &mut Tensor[float64], n: int) -> None:
+    for i in range(n):
+        for j in range(i + 1, n):
+            m[j, i] = m[i, j] + 1.0
+    for k in range(n - 1, -1, -1):
+        m[k, k] += 100.0
+    return None
+
+
+def count(values: &mut Tensor[int32], n: int) -> None:
+    for i in range(0, n, 2):
+        values[i] += i
+        var total: float64 = values.sum()
+    return None
+
+
+def main() -> int:
+    var n: int = 6
+    var a: Tensor[float64] = Tensor.zeros(n, "cpu")
+    var out: Tensor[float64] = Tensor.zeros(n, "cpu")
+    for i in range(n):
+        a[i] = i * 1.0
+    smooth(a, out, n)
+    var smoothed: float64 = out.sum()
+    print("smoothed =", smoothed)
+
+    var m: Tensor[float64] = Tensor.zeros(n, n, "cpu")
+    mirror(m, n)
+    var mirrored: float64 = m.sum()
+    print("mirrored =", mirrored)
+    # Every other column: the last axis is strided, so the checked path runs.
+    var columns: Tensor[float64] = m.slice(1, 0, n, 2)
+    mirror(columns, 3)
+    var strided: float64 = m.sum()
+    print("strided =", strided)
+
+    var values: Tensor[int32] = Tensor.zeros(n, "cpu")
+    count(values, n)
+    var counted: float64 = values.sum()
+    print("counted =", counted)
+
+    # Past the end the prologue declines and the checked accessor fails.
+    smooth(a, out, n + 3)
+    return 0
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "smoothed = 30.000000" in result.stdout
+    assert "mirrored = 615.000000" in result.stdout
+    assert "strided = 816.000000" in result.stdout
+    assert "counted = 6.000000" in result.stdout
+    assert result.returncode != 0
+    assert "Tensor flat index is out of bounds" in result.stderr
+
+    # Both Tensors of smooth, the two loops of mirror and main's fill loop go
+    # direct; count hands its Tensor to a method inside the loop and keeps
+    # the accessors.
+    assert generated.count("ocean_tensor_loop_data(") == 5
+    assert '(int32_t *)ocean_tensor_loop_data(' not in generated
+    assert "[(size_t)(i - 1)]" in generated
+    assert "_stride0 + (size_t)i]" in generated
+
+
+def test_nested_qualifying_loops_unswitch_only_the_innermost(tmp_path):
+    generated, binary = _compile(
+        tmp_path,
+        "tensor_loop_indexing_nest",
+        """
+import <std/tensor/tensor.oc>
+
+
+def nest(a: &mut Tensor[float64], b: &mut Tensor[float64], c: &mut Tensor[float64], n: int) -> None:
+    for i in range(n):
+        a[i] += 1.0
+        for j in range(n):
+            b[j] += 1.0
+            for k in range(n):
+                c[k] += 1.0
+    return None
+
+
+def main() -> int:
+    var n: int = 4
+    var a: Tensor[float64] = Tensor.zeros(n, "cpu")
+    var b: Tensor[float64] = Tensor.zeros(n, "cpu")
+    var c: Tensor[float64] = Tensor.zeros(n, "cpu")
+    nest(a, b, c, n)
+    var total: float64 = a.sum() + b.sum() + c.sum()
+    print("total =", total)
+    return 0
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "total = 84.000000" in result.stdout
+    # One prologue per loop level, not one per copy of every enclosing loop.
+    nest = generated[generated.index("ocean_nest(ocean_Tensor*") :]
+    nest = nest[: nest.index("\n}\n")]
+    assert nest.count("ocean_tensor_loop_data(") == 3
+    assert len(re.findall(r"if \(ocean_tensor_loop_[0-9]+\) \{", nest)) == 1
+
+
+def test_range_loop_indexing_benchmark(tmp_path):
+    generated, binary = _compile(
+        tmp_path,
+        "tensor_loop_indexing_benchmark",
+        """
+import <std/tensor/tensor.oc>
+import <std/time/time.oc>
+
+
+def matmul(a: &Tensor[float32], b: &Tensor[float32], c: &mut Tensor[float32], n: int) -> None:
+    for i in range(n):
+        for j in range(n):
+            var acc: float32 = 0.0
+            for k in range(n):
+                acc += a[i, k] * b[k, j]
+            c[i, j] = acc
+    return None
+
+
+def main() -> int:
+    var n: int = 192
+    var a: Tensor[float32] = Tensor.zeros(n, n, "cpu")
+    var b: Tensor[float32] = Tensor.zeros(n, n, "cpu")
+    var c: Tensor[float32] = Tensor.zeros(n, n, "cpu")
+    a.fill(1.0)
+    b.fill(2.0)
+    # The same values as every other column of a wider Tensor, which keeps
+    # the per-element accessors.
+    var wide: Tensor[float32] = Tensor.zeros(n, 2 * n, "cpu")
+    wide.fill(2.0)
+    var strided: Tensor[float32] = wide.slice(1, 0, 2 * n, 2)
+
+    var start: float64 = Time.monotonic()
+    matmul(a, b, c, n)
+    var direct: float64 = Time.monotonic() - start
+    var direct_sum: float64 = c.sum()
+    var checked_start: float64 = Time.monotonic()
+    matmul(a, strided, c, n)
+    var checked: float64 = Time.monotonic() - checked_start
+    var checked_sum: float64 = c.sum()
+
+    var direct_ms: float64 = direct * 1000.0
+    var checked_ms: float64 = checked * 1000.0
+    print("sums match =", direct_sum == checked_sum)
+    print("direct matmul ms =", direct_ms)
+    print("checked matmul ms =", checked_ms)
+    return 0
+""",
+        cflags=["-std=c11", "-O2"],
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "ocean_tensor_loop_data(" in generated
+    assert "sums match = 1" in result.stdout
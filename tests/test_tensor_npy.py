@@ -102,3 +102,68 @@ def main() -> int:
     integer_header_size = struct.unpack_from("<H", integers, 8)[0]
     integer_payload_offset = 10 + integer_header_size
     assert struct.unpack_from("<4i", integers, integer_payload_offset) == (1, 2, 3, 4)
+
+
+def test_tensor_npy_mmap_loads_in_place_and_copies_on_write(tmp_path):
+    values = [0.25 * index for index in range(12)]
+    write_npy(
+        tmp_path / "weights.npy",
+        "<f4",
+        (3, 4),
+        struct.pack("<12f", *values),
+        version=(1, 0),
+    )
+    write_npy(
+        tmp_path / "big_endian.npy",
+        ">i2",
+        (2,),
+        struct.pack(">2h", -12, 300),
+        version=(1, 0),
+    )
+    original = (tmp_path / "weights.npy").read_bytes()
+    source = tmp_path / "tensor_npy_mmap.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    var weights: Tensor[float32] = Tensor.load_npy_mmap("weights.npy", "cpu")
+    weights.madvise("willneed")
+    print(weights.is_mapped())
+    print(weights.shape(0))
+    print(weights.shape(1))
+    print(weights[2, 3])
+    var row: Tensor[float32] = weights.slice(0, 1, 2, 1)
+    row.madvise("sequential")
+    print(row.is_mapped())
+    weights[0, 0] = 7.0
+    print(weights[0, 0])
+    var big_endian: Tensor[int16] = Tensor.load_npy_mmap("big_endian.npy", "cpu")
+    print(big_endian.is_mapped())
+    print(big_endian[1])
+    var copied: Tensor[float32] = Tensor.load_npy("weights.npy", "cpu")
+    print(copied.is_mapped())
+    print(copied[0, 0])
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_npy_mmap.generated.c"
+    binary_path = tmp_path / "tensor_npy_mmap"
+    repository_root = Path(__file__).resolve().parents[1]
+
+    compile_pipeline(str(repository_root), source, c_path, quiet=True)
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+
+    assert result.stdout.splitlines() == [
+        "1", "3", "4", "2.750000", "1", "7.000000",
+        "0", "300.000000", "0", "0.000000",
+    ]
+    assert (tmp_path / "weights.npy").read_bytes() == original
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import struct
+import subprocess
+from pathlib import Path
+
+
+ROWS = 8192
+COLS = 4096
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def _write_weights(path: Path) -> None:
+    header = (
+        "{'descr': '<f4', 'fortran_order': False, 'shape': "
+        f"({ROWS}, {COLS}), }}"
+    ).encode("ascii")
+    header += b" " * ((64 - (10 + len(header) + 1) % 64) % 64) + b"\n"
+    row = struct.pack(f"<{COLS}f", *(float(column % 97) for column in range(COLS)))
+    with path.open("wb") as stream:
+        stream.write(b"\x93NUMPY\x01\x00")
+        stream.write(struct.pack("<H", len(header)))
+        stream.write(header)
+        for _ in range(ROWS):
+            stream.write(row)
+
+
+def test_mapped_npy_load_is_lazy_and_shares_the_file(tmp_path):
+    weights = tmp_path / "weights.npy"
+    _write_weights(weights)
+    original = weights.read_bytes()
+    binary = _build(
+        tmp_path,
+        "tensor_npy_mmap",
+        r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define ROWS 8192
+#define COLS 4096
+
+static void fail(const char *message) {
+    fprintf(stderr, "mapped load failed: %s\n", message);
+    exit(1);
+}
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+/* Resident set size in bytes. */
+static double resident(void) {
+    long pages = 0, resident_pages = 0;
+    FILE *statm = fopen("/proc/self/statm", "r");
+    if (!statm || fscanf(statm, "%ld %ld", &pages, &resident_pages) != 2) {
+        fail("could not read /proc/self/statm");
+    }
+    fclose(statm);
+    return (double)resident_pages * 4096.0;
+}
+
+static int mappings_of(const char *path) {
+    char line[4096];
+    int count = 0;
+    FILE *maps = fopen("/proc/self/maps", "r");
+    if (!maps) fail("could not read /proc/self/maps");
+    while (fgets(line, sizeof(line), maps)) {
+        if (strstr(line, path)) ++count;
+    }
+    fclose(maps);
+    return count;
+}
+
+static double checksum(ocean_tensor_handle_t tensor) {
+    double total = 0.0;
+    for (size_t row = 0; row < ROWS; row += 511) {
+        for (size_t column = 0; column < COLS; column += 7) {
+            total += ocean_tensor_get_flat(tensor, row * COLS + column);
+        }
+    }
+    return total;
+}
+
+int main(int argc, char **argv) {
+    if (argc != 2) fail("usage: tensor_npy_mmap weights.npy");
+    const char *path = argv[1];
+    double bytes = (double)ROWS * COLS * 4.0;
+
+    double rss = resident();
+    double start = seconds();
+    ocean_tensor_handle_t copied = ocean_tensor_load_npy(path, "cpu");
+    double copied_seconds = seconds() - start;
+    double copied_rss = resident() - rss;
+    if (ocean_tensor_is_mapped(copied)) fail("load_npy returned a mapped Tensor");
+
+    size_t live = ocean_tensor_memory_live_bytes();
+    rss = resident();
+    start = seconds();
+    ocean_tensor_handle_t mapped = ocean_tensor_load_npy_mmap(path, "cpu");
+    double mapped_seconds = seconds() - start;
+    double mapped_rss = resident() - rss;
+    if (!ocean_tensor_is_mapped(mapped)) fail("load_npy_mmap did not map the file");
+    if (ocean_tensor_memory_live_bytes() != live) fail("mapped load allocated heap storage");
+    if (mappings_of(path) != 1) fail("file is not mapped exactly once");
+    if (ocean_tensor_shape(mapped, 0) != ROWS || ocean_tensor_shape(mapped, 1) != COLS) {
+        fail("wrong shape");
+    }
+
+    ocean_tensor_madvise(mapped, "random");
+    if (checksum(mapped) != checksum(copied)) fail("mapped data differs from the copy");
+
+    /* Views keep the mapping alive; writes stay private to the process. */
+    ocean_tensor_handle_t row = ocean_tensor_slice(mapped, 0, 3, 4, 1);
+    ocean_tensor_madvise(row, "willneed");
+    ocean_tensor_release(mapped);
+    if (mappings_of(path) != 1) fail("view lost its mapping");
+    if (ocean_tensor_get_flat(row, 96) != 96.0) fail("view reads wrong data");
+    ocean_tensor_set_flat(row, 0, -1.0);
+    if (ocean_tensor_get_flat(row, 0) != -1.0) fail("copy-on-write store was lost");
+    ocean_tensor_release(row);
+    if (mappings_of(path) != 0) fail("mapping outlived its last handle");
+
+    ocean_tensor_release(copied);
+    printf("load_npy: %.1f ms, %.0f MB resident\n", copied_seconds * 1e3, copied_rss / 1e6);
+    printf("load_npy_mmap: %.3f ms, %.1f MB resident\n", mapped_seconds * 1e3, mapped_rss / 1e6);
+    if (!(copied_rss > bytes / 2)) fail("copying load did not populate its buffer");
+    if (!(mapped_rss < bytes / 16)) fail("mapped load paged in the file eagerly");
+    if (!(mapped_seconds * 10 < copied_seconds)) fail("mapped load was not much faster");
+    puts("mapped npy: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary), str(weights)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "mapped npy: OK" in result.stdout
+    assert weights.read_bytes() == original
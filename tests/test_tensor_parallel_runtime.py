@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_parallel_elementwise_and_reduction_kernels_match_serial(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_parallel.c"
+    binary = tmp_path / "tensor_parallel"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define CASES 13
+
+static void fail(const char *message) {
+    fprintf(stderr, "Tensor parallel kernels failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t filled(
+    const size_t *shape, size_t ndim, const char *dtype, double seed
+) {
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, ndim, dtype, "cpu");
+    size_t size = ocean_tensor_size(tensor);
+    for (size_t i = 0; i < size; ++i) {
+        ocean_tensor_set_flat(tensor, i, 2.5 + sin(seed + 0.013 * (double)i));
+    }
+    return tensor;
+}
+
+/* Sizes are above the parallel grain so several threads take part. */
+static void run(ocean_tensor_handle_t *results, const char *dtype) {
+    size_t shape[3] = {6, 97, 131};
+    size_t row_shape[1] = {131};
+    size_t bias_shape[3] = {1, 1, 131};
+    size_t one_shape[1] = {1};
+    ocean_tensor_handle_t x = filled(shape, 3, dtype, 0.1);
+    ocean_tensor_handle_t y = filled(shape, 3, dtype, 0.9);
+    ocean_tensor_handle_t row = filled(row_shape, 1, dtype, 2.3);
+    ocean_tensor_handle_t bias = filled(bias_shape, 3, dtype, 3.1);
+    ocean_tensor_handle_t one = filled(one_shape, 1, dtype, 4.7);
+
+    results[0] = ocean_tensor_binary(x, y, 0);
+    results[1] = ocean_tensor_binary(x, y, 3);
+    results[2] = ocean_tensor_binary(x, row, 0);
+    results[3] = ocean_tensor_binary(bias, x, 1);
+    results[4] = ocean_tensor_binary(x, one, 2);
+    results[5] = ocean_tensor_scalar(x, 0.25, 2);
+    results[6] = ocean_tensor_sum_dim(x, 0, false);
+    results[7] = ocean_tensor_mean_dim(x, 1, true);
+    results[8] = ocean_tensor_sum_dim(x, -1, false);
+    ocean_tensor_handle_t in_place = ocean_tensor_copy(x);
+    ocean_tensor_binary_into(in_place, in_place, row, 2);
+    results[9] = in_place;
+    if (dtype[5] == '3') {
+        results[10] = ocean_tensor_unary(x, OCEAN_TENSOR_UNARY_EXP, 0.0);
+        results[11] = ocean_tensor_unary(x, OCEAN_TENSOR_UNARY_LOG, 0.0);
+        results[12] = ocean_tensor_unary(x, OCEAN_TENSOR_UNARY_POW, 1.5);
+    } else {
+        results[10] = ocean_tensor_copy(x);
+        results[11] = ocean_tensor_copy(x);
+        results[12] = ocean_tensor_copy(x);
+    }
+
+    ocean_tensor_release(one);
+    ocean_tensor_release(bias);
+    ocean_tensor_release(row);
+    ocean_tensor_release(y);
+    ocean_tensor_release(x);
+}
+
+static void check(const char *dtype) {
+    ocean_tensor_handle_t serial[CASES];
+    ocean_tensor_handle_t parallel[CASES];
+    ocean_tensor_set_num_threads(1);
+    run(serial, dtype);
+    ocean_tensor_set_num_threads(4);
+    run(parallel, dtype);
+
+    for (int c = 0; c < CASES; ++c) {
+        size_t size = ocean_tensor_size(serial[c]);
+        if (size != ocean_tensor_size(parallel[c])) fail("result size");
+        for (size_t i = 0; i < size; ++i) {
+            if (ocean_tensor_get_flat(serial[c], i) != ocean_tensor_get_flat(parallel[c], i)) {
+                fprintf(stderr, "%s case %d index %zu\n", dtype, c, i);
+                fail("parallel result differs from serial");
+            }
+        }
+    }
+
+    /* Spot-check the fast paths against the definition. */
+    size_t shape[3] = {6, 97, 131};
+    size_t row_shape[1] = {131};
+    ocean_tensor_handle_t x = filled(shape, 3, dtype, 0.1);
+    ocean_tensor_handle_t row = filled(row_shape, 1, dtype, 2.3);
+    size_t index = 5 * 97 * 131 + 40 * 131 + 77;
+    double expected = ocean_tensor_get_flat(x, index) + ocean_tensor_get_flat(row, 77);
+    if (fabs(ocean_tensor_get_flat(parallel[2], index) - expected) > 1e-5) fail("row bias");
+    double column = 0.0;
+    for (size_t k = 0; k < 97; ++k) column += ocean_tensor_get_flat(x, 3 * 97 * 131 + k * 131 + 9);
+    size_t mean_index[3] = {3, 0, 9};
+    if (fabs(ocean_tensor_get_nd(parallel[7], mean_index, 3) - column / 97.0) > 1e-4) {
+        fail("mean over a middle axis");
+    }
+    ocean_tensor_release(row);
+    ocean_tensor_release(x);
+
+    for (int c = 0; c < CASES; ++c) {
+        ocean_tensor_release(serial[c]);
+        ocean_tensor_release(parallel[c]);
+    }
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    check("float32");
+    check("float64");
+    check("int32");
+    if (ocean_tensor_get_num_threads() != 4) fail("thread count");
+    ocean_tensor_set_num_threads(0);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("Tensor parallel kernels: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O3",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "Tensor parallel kernels: OK" in result.stdout
+
+
+def test_parallel_pool_serves_concurrent_callers(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_parallel_pool.c"
+    binary = tmp_path / "tensor_parallel_pool"
+
+    source.write_text(
+        r"""
+#include <pthread.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+#define CALLERS 3
+#define ROUNDS 400
+#define SIZE 70000
+
+static void fail(const char *message) {
+    fprintf(stderr, "Tensor parallel pool failed: %s\n", message);
+    exit(1);
+}
+
+/* Each caller adds into its own Tensor; whichever caller owns the pool fans
+   out and the others run inline, so every sum must still be exact. */
+static void *caller(void *argument) {
+    ocean_tensor_handle_t x = (ocean_tensor_handle_t)argument;
+    size_t shape[1] = {SIZE};
+    ocean_tensor_handle_t one = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    ocean_tensor_fill(one, 1.0);
+    for (int round = 0; round < ROUNDS; ++round) ocean_tensor_binary_into(x, x, one, 0);
+    ocean_tensor_release(one);
+    return NULL;
+}
+
+int main(void) {
+    size_t shape[1] = {SIZE};
+    ocean_tensor_handle_t sums[CALLERS + 1];
+    pthread_t threads[CALLERS];
+    ocean_tensor_set_num_threads(4);
+    for (int c = 0; c <= CALLERS; ++c) {
+        sums[c] = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+    }
+    for (int c = 0; c < CALLERS; ++c) {
+        if (pthread_create(&threads[c], NULL, caller, sums[c]) != 0) fail("pthread_create");
+    }
+    caller(sums[CALLERS]);
+    for (int c = 0; c < CALLERS; ++c) pthread_join(threads[c], NULL);
+
+    for (int c = 0; c <= CALLERS; ++c) {
+        for (size_t i = 0; i < SIZE; i += 997) {
+            if (ocean_tensor_get_flat(sums[c], i) != (double)ROUNDS) fail("lost update");
+        }
+        if (ocean_tensor_get_flat(sums[c], SIZE - 1) != (double)ROUNDS) fail("last element");
+        ocean_tensor_release(sums[c]);
+    }
+
+    /* Shrinking and growing the thread count reuses the same pool. */
+    int counts[2] = {2, 8};
+    for (int k = 0; k < 2; ++k) {
+        ocean_tensor_set_num_threads(counts[k]);
+        ocean_tensor_handle_t sum = ocean_tensor_zeros_nd(shape, 1, "float32", "cpu");
+        caller(sum);
+        if (ocean_tensor_get_flat(sum, SIZE / 2) != (double)ROUNDS) fail("resized pool");
+        ocean_tensor_release(sum);
+    }
+    ocean_tensor_set_num_threads(0);
+    puts("Tensor parallel pool: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert "Tensor parallel pool: OK" in result.stdout
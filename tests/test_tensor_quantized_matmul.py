@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def _build(tmp_path: Path, name: str, code: str) -> Path:
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / f"{name}.c"
+    binary = tmp_path / name
+    source.write_text(code, encoding="utf-8")
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+    return binary
+
+
+def test_packed_matmuls_match_float_references(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_quantized_matmul",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+/* K is not a multiple of four or of the 16-lane blocks. */
+#define ROWS 5
+#define DEPTH 83
+#define OUTPUTS 37
+
+static void fail(const char *message) {
+    fprintf(stderr, "quantized matmul failed: %s\n", message);
+    exit(1);
+}
+
+static ocean_tensor_handle_t make(size_t rows, size_t cols, double seed) {
+    size_t shape[2] = {rows, cols};
+    ocean_tensor_handle_t tensor = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < rows * cols; ++i) {
+        ocean_tensor_set_flat(tensor, i, sin(seed + 0.37 * (double)i) * (1.0 + (double)(i % 7)));
+    }
+    return tensor;
+}
+
+static void check_ternary(ocean_tensor_handle_t input, ocean_tensor_handle_t weight) {
+    /* Exactly the float matmul against the ternary_quantize weight. */
+    ocean_tensor_handle_t quantized = ocean_tensor_ternary_quantize(weight);
+    ocean_tensor_handle_t expected = ocean_tensor_matmul(input, quantized);
+    ocean_tensor_handle_t codes = ocean_tensor_ternary_pack(weight);
+    ocean_tensor_handle_t scales = ocean_tensor_ternary_scales(weight);
+    if (ocean_tensor_size(codes) != OUTPUTS * ((DEPTH + 3) / 4)) fail("ternary codes are not 2-bit");
+    ocean_tensor_handle_t got = ocean_tensor_matmul_ternary(input, codes, scales);
+    for (size_t i = 0; i < ocean_tensor_size(expected); ++i) {
+        double want = ocean_tensor_get_flat(expected, i);
+        if (fabs(ocean_tensor_get_flat(got, i) - want) > 1e-4 * (1.0 + fabs(want))) {
+            fail("ternary result differs from the quantized float matmul");
+        }
+    }
+    ocean_tensor_release(got);
+    ocean_tensor_release(scales);
+    ocean_tensor_release(codes);
+    ocean_tensor_release(expected);
+    ocean_tensor_release(quantized);
+}
+
+static void check_int8(ocean_tensor_handle_t input, ocean_tensor_handle_t weight) {
+    /* Within int8 rounding of the full-precision matmul: each product is off
+       by at most half a step of either operand, relative to sum |x| |w|. */
+    ocean_tensor_handle_t expected = ocean_tensor_matmul(input, weight);
+    ocean_tensor_handle_t codes = ocean_tensor_int8_pack(weight);
+    ocean_tensor_handle_t scales = ocean_tensor_int8_scales(weight);
+    ocean_tensor_handle_t got = ocean_tensor_matmul_int8(input, codes, scales);
+    double worst = 0.0;
+    for (size_t m = 0; m < ROWS; ++m) {
+        for (size_t o = 0; o < OUTPUTS; ++o) {
+            double magnitude = 0.0;
+            for (size_t k = 0; k < DEPTH; ++k) {
+                magnitude += fabs(ocean_tensor_get_flat(input, m * DEPTH + k)
+                                  * ocean_tensor_get_flat(weight, k * OUTPUTS + o));
+            }
+            double diff = fabs(ocean_tensor_get_flat(got, m * OUTPUTS + o)
+                               - ocean_tensor_get_flat(expected, m * OUTPUTS + o));
+            if (diff / magnitude > worst) worst = diff / magnitude;
+        }
+    }
+    printf("int8 worst error relative to sum |x| |w|: %g\n", worst);
+    if (worst > 0.01) fail("int8 result is too far from the float matmul");
+    ocean_tensor_release(got);
+    ocean_tensor_release(scales);
+    ocean_tensor_release(codes);
+    ocean_tensor_release(expected);
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+    ocean_tensor_handle_t input = make(ROWS, DEPTH, 0.3);
+    ocean_tensor_handle_t weight = make(DEPTH, OUTPUTS, 1.7);
+    check_ternary(input, weight);
+    check_int8(input, weight);
+
+    /* Decoding-sized inputs take the lookup-table path. */
+    ocean_tensor_handle_t single = ocean_tensor_slice(input, 0, 0, 1, 1);
+    check_ternary(single, weight);
+    ocean_tensor_release(single);
+
+    /* Leading dimensions and strided inputs are flattened into rows. */
+    ocean_tensor_handle_t base = make(DEPTH, ROWS, 2.9);
+    ocean_tensor_handle_t transposed = ocean_tensor_transpose(base);
+    ocean_tensor_handle_t codes = ocean_tensor_int8_pack(weight);
+    ocean_tensor_handle_t scales = ocean_tensor_int8_scales(weight);
+    ocean_tensor_handle_t strided = ocean_tensor_matmul_int8(transposed, codes, scales);
+    ocean_tensor_handle_t contiguous_input = ocean_tensor_copy(transposed);
+    ocean_tensor_handle_t contiguous = ocean_tensor_matmul_int8(contiguous_input, codes, scales);
+    for (size_t i = 0; i < ROWS * OUTPUTS; ++i) {
+        if (ocean_tensor_get_flat(strided, i) != ocean_tensor_get_flat(contiguous, i)) {
+            fail("strided input gives a different result");
+        }
+    }
+
+    ocean_tensor_release(contiguous);
+    ocean_tensor_release(contiguous_input);
+    ocean_tensor_release(strided);
+    ocean_tensor_release(scales);
+    ocean_tensor_release(codes);
+    ocean_tensor_release(transposed);
+    ocean_tensor_release(base);
+    ocean_tensor_release(weight);
+    ocean_tensor_release(input);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+    puts("quantized matmul: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "quantized matmul: OK" in result.stdout
+
+
+def test_packed_matmul_benchmark(tmp_path):
+    binary = _build(
+        tmp_path,
+        "tensor_quantized_matmul_benchmark",
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+/* One decoding step through a GPT-2 small MLP projection. */
+#define DEPTH 768
+#define OUTPUTS 3072
+#define REPEATS 50
+
+static double seconds(void) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (double)now.tv_sec + (double)now.tv_nsec * 1e-9;
+}
+
+typedef ocean_tensor_handle_t (*packed_matmul)(
+    ocean_tensor_handle_t, ocean_tensor_handle_t, ocean_tensor_handle_t
+);
+
+static double time_packed(packed_matmul matmul, ocean_tensor_handle_t input,
+                          ocean_tensor_handle_t codes, ocean_tensor_handle_t scales) {
+    double best = 1e30;
+    for (int round = 0; round < 3; ++round) {
+        double start = seconds();
+        for (int repeat = 0; repeat < REPEATS; ++repeat) {
+            ocean_tensor_release(matmul(input, codes, scales));
+        }
+        double elapsed = (seconds() - start) / REPEATS;
+        if (elapsed < best) best = elapsed;
+    }
+    return best;
+}
+
+int main(void) {
+    size_t input_shape[2] = {1, DEPTH};
+    size_t weight_shape[2] = {DEPTH, OUTPUTS};
+    ocean_tensor_handle_t input = ocean_tensor_zeros_nd(input_shape, 2, "float32", "cpu");
+    ocean_tensor_handle_t weight = ocean_tensor_zeros_nd(weight_shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < DEPTH; ++i) ocean_tensor_set_flat(input, i, sin(0.3 * (double)i));
+    for (size_t i = 0; i < (size_t)DEPTH * OUTPUTS; ++i) {
+        ocean_tensor_set_flat(weight, i, 0.02 * sin(0.71 * (double)i));
+    }
+
+    double dense = 1e30;
+    for (int round = 0; round < 3; ++round) {
+        double start = seconds();
+        for (int repeat = 0; repeat < REPEATS; ++repeat) {
+            ocean_tensor_release(ocean_tensor_matmul(input, weight));
+        }
+        double elapsed = (seconds() - start) / REPEATS;
+        if (elapsed < dense) dense = elapsed;
+    }
+
+    ocean_tensor_handle_t ternary_codes = ocean_tensor_ternary_pack(weight);
+    ocean_tensor_handle_t ternary_scales = ocean_tensor_ternary_scales(weight);
+    ocean_tensor_handle_t int8_codes = ocean_tensor_int8_pack(weight);
+    ocean_tensor_handle_t int8_scales = ocean_tensor_int8_scales(weight);
+    double ternary = time_packed(ocean_tensor_matmul_ternary, input, ternary_codes, ternary_scales);
+    double int8 = time_packed(ocean_tensor_matmul_int8, input, int8_codes, int8_scales);
+
+    size_t float_bytes = (size_t)DEPTH * OUTPUTS * sizeof(float);
+    printf("float32 weight: %zu bytes, %.1f us\n", float_bytes, dense * 1e6);
+    printf("ternary weight: %zu bytes, %.1f us\n", ocean_tensor_size(ternary_codes), ternary * 1e6);
+    printf("int8 weight: %zu bytes, %.1f us\n", ocean_tensor_size(int8_codes), int8 * 1e6);
+    if (ocean_tensor_size(ternary_codes) * 16 != float_bytes ||
+        ocean_tensor_size(int8_codes) * 4 != float_bytes) {
+        fprintf(stderr, "packed weights have the wrong size\n");
+        return 1;
+    }
+    if (!(ternary < dense) || !(int8 < dense)) {
+        fprintf(stderr, "packed matmul was not faster than float32\n");
+        return 1;
+    }
+
+    ocean_tensor_release(ternary_codes);
+    ocean_tensor_release(ternary_scales);
+    ocean_tensor_release(int8_codes);
+    ocean_tensor_release(int8_scales);
+    ocean_tensor_release(weight);
+    ocean_tensor_release(input);
+    puts("quantized matmul benchmark: OK");
+    return 0;
+}
+""",
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    print(result.stdout)
+    assert "quantized matmul benchmark: OK" in result.stdout
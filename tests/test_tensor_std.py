@@ -99,6 +99,75 @@ def main() -> int:
     assert result.stdout.splitlines() == ["2", "2", "3.000000"]
 
 
+def test_standard_tensor_bulk_list_transfer(tmp_path):
+    source = tmp_path / "tensor_bulk_list.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    var first: list[float64] = [1.5, 2.5, 3.5]
+    var second: list[float64] = [4.5, 5.5, 6.5]
+    var rows: list[list[float64]] = [first, second]
+    var narrowed: Tensor[float32] = Tensor.from_list(rows, "cpu")
+    print(narrowed[1, 2])
+    var flat: list[float32] = narrowed.to_list()
+    print(len(flat))
+    var last: float64 = flat[5]
+    print(last)
+
+    var counts: list[int] = [7, 8, 9]
+    var wide: Tensor[int64] = Tensor.from_list(counts, "cpu")
+    var copied: list[int64] = wide.to_list()
+    var middle: int64 = copied[1]
+    print(middle)
+
+    var buffer: list[float32] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    narrowed.copy_to(buffer)
+    var value: float64 = buffer[3]
+    print(value)
+    buffer[3] = 10.0
+    narrowed.copy_from(buffer)
+    print(narrowed[1, 0])
+
+    var raw: array[int] = [4, 5, 6]
+    wide.copy_from(raw)
+    print(wide[2])
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_bulk_list.generated.c"
+    binary_path = tmp_path / "tensor_bulk_list"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "6.500000",
+        "6",
+        "6.500000",
+        "8",
+        "4.500000",
+        "10.000000",
+        "6",
+    ]
+    generated = c_path.read_text(encoding="utf-8")
+    assert "ocean_tensor_copy_to_buffer" in generated
+    assert "ocean_tensor_copy_from_buffer" in generated
+
+
 def test_standard_tensor_operations_and_metadata(tmp_path):
     source = tmp_path / "tensor_operations.oc"
     source.write_text(
@@ -151,8 +220,8 @@ def main() -> int:
         "10.000000",
         "4.000000",
         "32.000000",
-        "3.000000",
-        "4.000000",
+        "9.000000",
+        "9.000000",
         "8.000000",
         "22.000000",
         "13.000000",
@@ -160,6 +229,229 @@ def main() -> int:
     ]
 
 
+def test_standard_tensor_inplace_and_out_operations(tmp_path):
+    source = tmp_path / "tensor_inplace.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    var values: Tensor[float32] = Tensor.from_list([[1.0, -2.0], [3.0, -4.0]], "cpu")
+    var other: Tensor[float32] = Tensor.from_list([[1.0, 1.0], [2.0, 2.0]], "cpu")
+    var bias: Tensor[float32] = Tensor.from_list([[10.0, 20.0]], "cpu")
+    var out: Tensor[float32] = Tensor.zeros(2, 2, "cpu")
+    values.add_(other)
+    print(values.get(1, 0))
+    values.mul_scalar_(2.0)
+    print(values.get(0, 0))
+    values.relu_()
+    print(values.get(0, 1))
+    values.add_(bias)
+    print(values.get(0, 1))
+    values.mul_out(other, out)
+    print(out.get(1, 0))
+    values.sub_scalar_out(1.0, out)
+    print(out.get(1, 1))
+    out.fill_(0.5)
+    values.copy_(out)
+    print(values.sum())
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_inplace.generated.c"
+    binary_path = tmp_path / "tensor_inplace"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "5.000000",
+        "4.000000",
+        "0.000000",
+        "20.000000",
+        "40.000000",
+        "19.000000",
+        "2.000000",
+    ]
+
+
+def test_standard_tensor_inplace_rejects_autograd_tracked_tensor(tmp_path):
+    source = tmp_path / "tensor_inplace_grad.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    var weight: Tensor[float32] = Tensor.from_list([[1.0, 2.0]], "cpu")
+    weight.requires_grad_(True)
+    Tensor.set_grad_enabled(False)
+    weight.mul_scalar_(2.0)
+    Tensor.set_grad_enabled(True)
+    print(weight.get(0, 1))
+    weight.add_scalar_(1.0)
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_inplace_grad.generated.c"
+    binary_path = tmp_path / "tensor_inplace_grad"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert result.stdout.splitlines() == ["4.000000"]
+    assert "in-place operation on a Tensor that requires grad" in result.stderr
+
+
+def test_standard_tensor_memory_stats_and_empty_cache(tmp_path):
+    source = tmp_path / "tensor_memory.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    Tensor.set_cache_limit(1048576)
+    var values: Tensor[float32] = Tensor.zeros(4, 4, "cpu")
+    values.release()
+    print(Tensor.memory_stats())
+    Tensor.empty_cache()
+    print(Tensor.memory_stats())
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_memory.generated.c"
+    binary_path = tmp_path / "tensor_memory"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "live=0 peak=64 cached=64",
+        "live=0 peak=64 cached=0",
+    ]
+
+
+def test_standard_tensor_thread_count_controls(tmp_path):
+    source = tmp_path / "tensor_threads.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    Tensor.set_num_threads(2)
+    print(Tensor.get_num_threads())
+    var values: Tensor[float32] = Tensor.from_list([[1.0, 4.0], [9.0, 16.0]], "cpu")
+    var roots: Tensor[float32] = values.sqrt()
+    print(roots.sum())
+    Tensor.set_num_threads(0)
+    print(Tensor.get_num_threads() >= 1)
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_threads.generated.c"
+    binary_path = tmp_path / "tensor_threads"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == ["2", "10.000000", "1"]
+
+
+def test_standard_tensor_lazy_fusion_matches_eager(tmp_path):
+    source = tmp_path / "tensor_lazy.oc"
+    source.write_text(
+        """
+import <std/tensor/tensor.oc>
+
+def main() -> int:
+    var left: Tensor[float32] = Tensor.from_list([[1.0, -2.0], [3.0, -4.0]], "cpu")
+    var right: Tensor[float32] = Tensor.from_list([[0.5, 0.5], [2.0, 2.0]], "cpu")
+    Tensor.set_lazy_enabled(True)
+    var product: Tensor[float32] = left.mul(right)
+    var shifted: Tensor[float32] = product.add_scalar(1.0)
+    var activated: Tensor[float32] = shifted.relu()
+    print(activated.get(1, 0))
+    print(activated.sum())
+    print(Tensor.lazy_enabled())
+    Tensor.set_lazy_enabled(False)
+    print(Tensor.lazy_enabled())
+    return 0
+""",
+        encoding="utf-8",
+    )
+    c_path = tmp_path / "tensor_lazy.generated.c"
+    binary_path = tmp_path / "tensor_lazy"
+
+    compile_pipeline(
+        str(Path(__file__).resolve().parents[1]),
+        source,
+        c_path,
+        quiet=True,
+    )
+    compile_c(c_path, binary_path)
+    result = subprocess.run(
+        [str(binary_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "7.000000",
+        "8.500000",
+        "1",
+        "0",
+    ]
+
+
 def test_standard_tensor_typed_flat_indexing_preserves_int64(tmp_path):
     source = tmp_path / "tensor_typed_index.oc"
     source.write_text(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_tensor_views_share_storage_and_feed_kernels(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "tensor_views.c"
+    binary = tmp_path / "tensor_views"
+
+    source.write_text(
+        r"""
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "std/tensor/tensor_runtime.h"
+
+static void fail(const char *message) {
+    fprintf(stderr, "Tensor views failed: %s\n", message);
+    exit(1);
+}
+
+static double at(ocean_tensor_handle_t tensor, size_t row, size_t col) {
+    size_t indices[2] = {row, col};
+    return ocean_tensor_get_nd(tensor, indices, 2);
+}
+
+int main(void) {
+    size_t baseline = ocean_tensor_memory_live_bytes();
+
+    /* base[i, j] = 4 * i + j */
+    size_t shape[2] = {3, 4};
+    ocean_tensor_handle_t base = ocean_tensor_zeros_nd(shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < 12; ++i) ocean_tensor_set_flat(base, i, (double)i);
+    size_t allocated = ocean_tensor_memory_live_bytes();
+
+    ocean_tensor_handle_t transposed = ocean_tensor_transpose(base);
+    ocean_tensor_handle_t row = ocean_tensor_row(base, 1);
+    ocean_tensor_handle_t column = ocean_tensor_column(base, 2);
+    ocean_tensor_handle_t stepped = ocean_tensor_slice(base, 1, 1, 4, 2);
+    ocean_tensor_handle_t flat = ocean_tensor_reshape_2d(base, 2, 6);
+    if (ocean_tensor_memory_live_bytes() != allocated) fail("views allocated storage");
+
+    if (!ocean_tensor_is_contiguous(row) || !ocean_tensor_is_contiguous(flat)) {
+        fail("row and reshape views should stay packed");
+    }
+    if (ocean_tensor_is_contiguous(transposed) || ocean_tensor_is_contiguous(column)) {
+        fail("transpose and column views are strided");
+    }
+    if (at(transposed, 3, 1) != 7.0 || ocean_tensor_get_flat(row, 3) != 7.0) {
+        fail("view element lookup");
+    }
+    if (ocean_tensor_get_flat(column, 2) != 10.0) fail("column flat lookup");
+    if (at(stepped, 2, 1) != 11.0 || ocean_tensor_shape(stepped, 1) != 2) {
+        fail("stepped slice");
+    }
+    if (at(flat, 1, 0) != 6.0) fail("reshape view");
+
+    /* Writes through a view land in the shared storage. */
+    ocean_tensor_set_flat(column, 0, 100.0);
+    if (at(base, 0, 2) != 100.0 || at(transposed, 2, 0) != 100.0) {
+        fail("write through view");
+    }
+    ocean_tensor_fill(column, -1.0);
+    if (ocean_tensor_sum(base) != 66.0 - 18.0 - 3.0) fail("strided fill");
+
+    /* Kernels accept strided operands. */
+    ocean_tensor_handle_t doubled = ocean_tensor_binary(column, column, 0);
+    if (ocean_tensor_get_flat(doubled, 1) != -2.0) fail("binary on a strided view");
+    ocean_tensor_scalar_into(column, column, 3.0, 2);
+    if (at(base, 2, 2) != -3.0 || at(base, 1, 1) != 5.0) fail("out= into a strided view");
+    ocean_tensor_handle_t column_sums = ocean_tensor_sum_dim(transposed, 1, false);
+    if (ocean_tensor_get_flat(column_sums, 2) != -9.0) fail("reduction over a view");
+    ocean_tensor_release(column_sums);
+
+    size_t right_shape[2] = {3, 2};
+    ocean_tensor_handle_t right = ocean_tensor_zeros_nd(right_shape, 2, "float32", "cpu");
+    for (size_t i = 0; i < 6; ++i) ocean_tensor_set_flat(right, i, (double)(i + 1));
+    ocean_tensor_handle_t product = ocean_tensor_matmul(transposed, right);
+    for (size_t i = 0; i < 4; ++i) {
+        for (size_t j = 0; j < 2; ++j) {
+            double expected = 0.0;
+            for (size_t k = 0; k < 3; ++k) expected += at(base, k, i) * at(right, k, j);
+            if (fabs(at(product, i, j) - expected) > 1e-4) fail("matmul on a transposed view");
+        }
+    }
+
+    /* contiguous() materializes an independent packed copy. */
+    ocean_tensor_handle_t packed = ocean_tensor_contiguous(transposed);
+    if (!ocean_tensor_is_contiguous(packed) || at(packed, 3, 1) != 7.0) fail("contiguous");
+    ocean_tensor_set_flat(packed, 0, 55.0);
+    if (at(base, 0, 0) != 0.0) fail("contiguous copy aliases its source");
+
+    /* Views keep the storage alive after the source handle is released. */
+    ocean_tensor_release(base);
+    if (at(transposed, 3, 2) != 11.0) fail("view outlived storage");
+
+    ocean_tensor_release(packed);
+    ocean_tensor_release(product);
+    ocean_tensor_release(right);
+    ocean_tensor_release(doubled);
+    ocean_tensor_release(flat);
+    ocean_tensor_release(stepped);
+    ocean_tensor_release(column);
+    ocean_tensor_release(row);
+    ocean_tensor_release(transposed);
+    if (ocean_tensor_memory_live_bytes() != baseline) fail("storage leaked");
+
+    puts("Tensor views: OK");
+    return 0;
+}
+""",
+        encoding="utf-8",
+    )
+
+    subprocess.run(
+        [
+            "gcc",
+            "-std=c11",
+            "-O2",
+            "-Wall",
+            "-Wextra",
+            "-Wpedantic",
+            "-Werror",
+            "-pthread",
+            f"-I{root}",
+            str(source),
+            str(root / "std/tensor/tensor_runtime.c"),
+            "-lm",
+            "-o",
+            str(binary),
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "Tensor views: OK" in result.stdout
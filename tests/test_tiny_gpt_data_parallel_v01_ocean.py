@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+import re
+import subprocess
+from pathlib import Path
+
+from main import compile_c, compile_pipeline
+
+
+def _value(pattern: str, stdout: str) -> float:
+    match = re.search(pattern, stdout)
+    assert match is not None, stdout
+    return float(match.group(1))
+
+
+def test_tiny_gpt_data_parallel_v01_training(tmp_path):
+    root = Path(__file__).resolve().parents[1]
+    source = root / "examples/ML/tiny_gpt_data_parallel_v01.oc"
+    c_path = tmp_path / "tiny_gpt_data_parallel_v01.generated.c"
+    binary = tmp_path / "tiny_gpt_data_parallel_v01"
+
+    compile_pipeline(source.parent, source, c_path, quiet=True)
+    compile_c(c_path, binary)
+
+    result = subprocess.run(
+        [str(binary)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    stdout = result.stdout.lower()
+
+    initial = _value(r"initial loss\s*=\s*([0-9eE+.\-]+)", stdout)
+    final = _value(r"final loss\s*=\s*([0-9eE+.\-]+)", stdout)
+
+    assert math.isfinite(initial)
+    assert math.isfinite(final)
+
+    # The master model only ever sees gradients averaged from the workers.
+    assert final < initial * 0.70, (initial, final, stdout)
+
+    assert "workers = 4" in stdout
+    assert "token embedding grad = 1" in stdout
+    assert "lm head grad = 1" in stdout
+    assert "[ok] ocean tinygpt data parallel v0.1" in stdout